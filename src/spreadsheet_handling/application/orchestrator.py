@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping, TypeAlias
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Mapping, TypeAlias
 
 import logging
 
-from ..domain.pipeline_cleanup import execute_final_domain_cleanup
-from ..io_backends.router import get_loader, get_saver
+from ..core.copy_on_write import copy_on_write
+from ..domain.pipeline_cleanup import (
+    KEEP_FRAMES_KEY,
+    PIPELINE_CLEANUP_KEY,
+    configure_pipeline_cleanup,
+    execute_final_domain_cleanup,
+)
+from ..io_backends.lazy_frames import LazyFrames
+from ..io_backends.router import get_lazy_loader, get_loader, get_saver
 from ..pipeline.execution import run_pipeline
 from ..pipeline.persistence_boundary import project_meta_to_persistable_contract
+from ..pipeline.profiling import StepProfiler
+from ..pipeline.scheduling import declared_frames, merge_step_result, step_footprint
+from ..pipeline.step_cache import StepCache
 from ..pipeline.types import BoundStep, Frames
 
 log = logging.getLogger("sheets.orchestrator")
@@ -49,9 +60,101 @@ def _load_frames(inp: IODesc, *, header_levels: int = 1) -> Frames:
         loader = get_loader(inp.kind)
     except ValueError as exc:
         raise ValueError(f"Unsupported input kind: {inp.kind!r}") from exc
+    if (inp.options or {}).get("lazy"):
+        try:
+            loader = get_lazy_loader(inp.kind)
+        except ValueError as exc:
+            raise ValueError(f"Input kind {inp.kind!r} does not support lazy loading") from exc
     return loader(inp.path, options=inp.options, header_levels=header_levels)
 
 
+_CLEANUP_TARGET = f"{configure_pipeline_cleanup.__module__}:{configure_pipeline_cleanup.__qualname__}"
+
+
+def _frame_names(value: Any) -> set[str]:
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, Iterable) and not isinstance(value, Mapping):
+        return {name for name in value if isinstance(name, str)}
+    return set()
+
+
+def _unused_sheets(frames: LazyFrames, steps: list[BoundStep]) -> list[str]:
+    """Unloaded sheets that no step touches and keep-mode cleanup discards.
+
+    Only decidable when every step declares its frames (``frame_inputs``) and
+    the pipeline configures a ``keep_frames`` list; otherwise nothing is
+    skipped. Removing such a sheet up front cannot change the result: no step
+    reads it and the final cleanup would drop it anyway.
+    """
+    meta = frames.get("_meta")
+    if isinstance(meta, Mapping) and PIPELINE_CLEANUP_KEY in meta:
+        return []
+    keep = _declared_keep_frames(steps)
+    if keep is None:
+        return []
+    used: set[str] = set()
+    for step in steps:
+        frame_inputs = getattr(step, "frame_inputs", None)
+        if frame_inputs is None:
+            return []
+        used |= declared_frames(step, frame_inputs)
+    return [name for name in frames.pending() if name not in used and name not in keep]
+
+
+def _drop_unused_sheets(frames: LazyFrames, steps: list[BoundStep]) -> None:
+    unused = _unused_sheets(frames, steps)
+    for name in unused:
+        del frames[name]
+    log.info("orchestrate: skipping %d unused sheet(s)", len(unused))
+
+
+def _with_declared_inputs(step: BoundStep) -> BoundStep:
+    """``step`` fed only the frames it declares, so other lazy sheets stay unread.
+
+    The result is merged back like a scheduled step's (see
+    ``pipeline.scheduling``); steps without a declared footprint see every
+    frame.
+    """
+    footprint = step_footprint(step)
+    if footprint is None:
+        return step
+    names = {resource[1] for resource in footprint.reads if resource[0] == "frame"}
+
+    def run(frames: Frames) -> Frames:
+        declared = {name: frames[name] for name in frames if name in names or name == "_meta"}
+        return merge_step_result(frames, declared, step.fn(declared), step, footprint)
+
+    return replace(step, fn=run)
+
+
+def _prepare_lazy_run(frames: LazyFrames, steps: list[BoundStep]) -> list[BoundStep]:
+    _drop_unused_sheets(frames, steps)
+    return [_with_declared_inputs(step) for step in steps]
+
+
+def _declared_keep_frames(steps: list[BoundStep]) -> set[str] | None:
+    for step in steps:
+        config = getattr(step, "config", {})
+        if config.get("target") == _CLEANUP_TARGET and config.get(KEEP_FRAMES_KEY) is not None:
+            return _frame_names(config[KEEP_FRAMES_KEY])
+    return None
+
+
+def _project_persistable_meta(frames: Frames) -> Frames:
+    meta = frames.get("_meta")
+    if isinstance(meta, dict):
+        frames = frames.copy()
+        frames["_meta"] = project_meta_to_persistable_contract(meta)
+    return frames
+
+
+def _phase(profiler: StepProfiler | None, name: str, fn: Callable[[Any], Any], frames: Any) -> Any:
+    if profiler is None:
+        return fn(frames)
+    return profiler.measure(name, "phase", fn, frames)
+
+
 def _save_frames(out: IODesc, frames: Frames) -> None:
     try:
         saver = get_saver(out.kind)
@@ -60,6 +163,30 @@ def _save_frames(out: IODesc, frames: Frames) -> None:
     saver(frames, out.path, options=out.options)
 
 
+def _write_output(out: IODesc, frames: Frames, profiler: StepProfiler | None) -> Frames:
+    # Final domain cleanup: execute pending explicit cleanup commands
+    # (_meta.pipeline_cleanup) and consume them. Carrier-neutral; runs for
+    # every output kind, immediately before the persistence boundary. Like
+    # the persistence boundary below, this is part of the orchestrator's
+    # macro flow, not a configurable pipeline step. It executes only
+    # explicit drop/keep declarations and never infers cleanup from
+    # lifecycle roles. See
+    # src/spreadsheet_handling/domain/pipeline_cleanup.py.
+    frames = _phase(profiler, "cleanup", execute_final_domain_cleanup, frames)
+
+    # Persistence boundary: project runtime _meta onto its persistable
+    # contract before any backend writes anything. Carrier-neutral; runs for
+    # every output kind. The boundary is part of the orchestrator's macro
+    # flow, not a configurable pipeline step. See
+    # docs/semantic_model/08_lifecycle_and_update_semantics.adoc and
+    # src/spreadsheet_handling/pipeline/persistence_boundary.py.
+    frames = _phase(profiler, "persistence_boundary", _project_persistable_meta, frames)
+
+    log.info("orchestrate: writing output kind=%s path=%s", out.kind, out.path)
+    _phase(profiler, "save", partial(_save_frames, out), frames)
+    return frames
+
+
 # ---------------------------
 # Public API
 # ---------------------------
@@ -71,25 +198,43 @@ def orchestrate(
     output: IODescriptorLike,
     steps: Iterable[BoundStep] | None = None,
     header_levels: int = 1,
+    profiler: StepProfiler | None = None,
+    cache: StepCache | None = None,
+    workers: int | None = None,
 ) -> Frames:
     """
     Unified execution engine for sheets-run and reference shortcut commands.
 
-    - Loads frames from 'input' backend (csv_dir | json_dir | yaml_dir | xml_dir | xlsx | ods | calc).
+    - Loads frames from 'input' backend (csv_dir | json_dir | jsonl_dir | yaml_dir | xml_dir | parquet_dir | feather_dir | sqlite | xlsx | ods | calc).
+      With input option ``lazy: true`` (directory kinds and sqlite) sheets
+      are read on first access: steps that declare their frames see only
+      those, and sheets that no step touches and a ``keep_frames`` cleanup
+      discards are never read.
     - Runs the given 'steps' (pure Frames→Frames, optional).
     - Writes frames to 'output' backend.
+    - Loads, runs and writes with pandas copy-on-write enabled (see
+      ``core.copy_on_write``); the caller's pandas options are restored.
     - Returns the final frames for in-process reuse/testing.
 
     Parameters
     ----------
     input : Mapping[str, Any]
-        { kind: "csv_dir"|"json_dir"|"yaml_dir"|"xml_dir"|"xlsx"|"ods"|"calc", path: str, options?: {...} }
+        { kind: "csv_dir"|"json_dir"|"jsonl_dir"|"yaml_dir"|"xml_dir"|"parquet_dir"|"feather_dir"|"sqlite"|"xlsx"|"ods"|"calc", path: str, options?: {...} }
     output : Mapping[str, Any]
-        { kind: "csv_dir"|"json_dir"|"yaml_dir"|"xml_dir"|"xlsx"|"ods"|"calc", path: str, options?: {...} }
+        { kind: "csv_dir"|"json_dir"|"jsonl_dir"|"yaml_dir"|"xml_dir"|"parquet_dir"|"feather_dir"|"sqlite"|"xlsx"|"ods"|"calc", path: str, options?: {...} }
     steps : Iterable[BoundStep] | None
         List of bound steps (use factories from pipeline to build them).
     header_levels : int
         Desired header levels on read; 1 by default.
+    profiler : StepProfiler | None
+        Records the load, cleanup, persistence-boundary and save phases and
+        every step (see ``pipeline.profiling``).
+    cache : StepCache | None
+        Replays cached step results instead of running the steps (see
+        ``pipeline.step_cache``).
+    workers : int | None
+        Runs steps with disjoint declared footprints concurrently on that
+        many threads (see ``pipeline.scheduling``); linear by default.
 
     Raises
     ------
@@ -98,35 +243,14 @@ def orchestrate(
     inp = _coerce_io(input, "input")
     out = _coerce_io(output, "output")
 
-    log.info("orchestrate: loading input kind=%s path=%s", inp.kind, inp.path)
-    frames = _load_frames(inp, header_levels=header_levels)
-
-    if steps:
-        step_list = list(steps)
-        log.info("orchestrate: running %d step(s)", len(step_list))
-        frames = run_pipeline(frames, step_list)
+    with copy_on_write():
+        log.info("orchestrate: loading input kind=%s path=%s", inp.kind, inp.path)
+        frames = _phase(profiler, "load", lambda _: _load_frames(inp, header_levels=header_levels), None)
 
-    # Final domain cleanup: execute pending explicit cleanup commands
-    # (_meta.pipeline_cleanup) and consume them. Carrier-neutral; runs for
-    # every output kind, immediately before the persistence boundary. Like
-    # the persistence boundary below, this is part of the orchestrator's
-    # macro flow, not a configurable pipeline step. It executes only
-    # explicit drop/keep declarations and never infers cleanup from
-    # lifecycle roles. See
-    # src/spreadsheet_handling/domain/pipeline_cleanup.py.
-    frames = execute_final_domain_cleanup(frames)
-
-    # Persistence boundary: project runtime _meta onto its persistable
-    # contract before any backend writes anything. Carrier-neutral; runs for
-    # every output kind. The boundary is part of the orchestrator's macro
-    # flow, not a configurable pipeline step. See
-    # docs/semantic_model/08_lifecycle_and_update_semantics.adoc and
-    # src/spreadsheet_handling/pipeline/persistence_boundary.py.
-    meta = frames.get("_meta")
-    if isinstance(meta, dict):
-        frames = dict(frames)
-        frames["_meta"] = project_meta_to_persistable_contract(meta)
-
-    log.info("orchestrate: writing output kind=%s path=%s", out.kind, out.path)
-    _save_frames(out, frames)
-    return frames
+        if steps:
+            step_list = list(steps)
+            if isinstance(frames, LazyFrames):
+                step_list = _prepare_lazy_run(frames, step_list)
+            log.info("orchestrate: running %d step(s)", len(step_list))
+            frames = run_pipeline(frames, step_list, profiler=profiler, cache=cache, workers=workers)
+        return _write_output(out, frames, profiler)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
-from typing import Any, Dict, Optional
+import sys
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
 
 import yaml
 import os
 
 from spreadsheet_handling.application.orchestrator import orchestrate
 from spreadsheet_handling.pipeline import (
+    StepCache,
+    StepProfiler,
     build_steps_from_config,
     build_steps_from_yaml,
 )
@@ -109,6 +114,132 @@ def _get_pipeline_specs_or_die(
     raise SystemExit(f"Unknown pipeline '{name}'. Available: {list(pipelines)}")
 
 
+def _emit_profile(profiler: StepProfiler, json_path: str | None) -> None:
+    print(profiler.format_table(), file=sys.stderr)
+    if json_path:
+        Path(json_path).write_text(profiler.to_json() + "\n", encoding="utf-8")
+
+
+class _ExecutionOptions(NamedTuple):
+    profiler: StepProfiler | None
+    cache: StepCache | None
+    workers: int | None
+
+
+def _add_execution_arguments(parser: argparse.ArgumentParser) -> None:
+    """Profiling, step cache and step scheduling options."""
+    # profiling options
+    parser.add_argument(
+        "--profile-steps",
+        action="store_true",
+        help="Time every step and the load/cleanup/save phases; print a table to stderr.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Write the step profile as JSON to PATH (implies --profile-steps).",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also trace allocations per step with tracemalloc (implies --profile-steps; slows the run).",
+    )
+
+    # step result cache
+    parser.add_argument(
+        "--step-cache",
+        metavar="DIR",
+        help="Replay cached results of unchanged steps from DIR and store new ones there.",
+    )
+    parser.add_argument(
+        "--step-cache-max-mb",
+        type=int,
+        default=1024,
+        help="Evict least recently used step results beyond this size (default: 1024).",
+    )
+
+    # step scheduling
+    parser.add_argument(
+        "--step-workers",
+        type=int,
+        metavar="N",
+        help="Run steps that touch disjoint frames concurrently on N threads (default: linear).",
+    )
+
+
+def _execution_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> _ExecutionOptions:
+    """Validate the execution options before any input is loaded and build them."""
+    profile = bool(args.profile_steps or args.profile_json or args.profile_memory)
+    if args.step_workers is not None and args.step_workers < 1:
+        parser.error("--step-workers must be at least 1")
+    if args.step_workers is not None and args.step_workers > 1:
+        if profile:
+            parser.error("--step-workers cannot be combined with --profile-steps/--profile-json/--profile-memory")
+        if args.step_cache:
+            parser.error("--step-workers cannot be combined with --step-cache")
+    return _ExecutionOptions(
+        profiler=StepProfiler(trace_allocations=args.profile_memory) if profile else None,
+        cache=(
+            StepCache(args.step_cache, max_bytes=args.step_cache_max_mb * 1024 * 1024)
+            if args.step_cache
+            else None
+        ),
+        workers=args.step_workers,
+    )
+
+
+def _resolve_io(config: Dict[str, Any], args: argparse.Namespace) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Input and output specs from the config, with CLI overrides applied."""
+    # 1) start with whatever is in the config (or empty)
+    io_cfg = _select_io_config(config, args.profile) if config else {}
+
+    # 2) build working dicts
+    inp = dict((io_cfg.get("input") or {}))
+    out = dict((io_cfg.get("output") or {}))
+
+    # 3) apply CLI overrides (these should always win)
+    if args.in_kind:
+        inp["kind"] = args.in_kind
+    if args.in_path:
+        inp["path"] = args.in_path
+    if args.out_kind:
+        out["kind"] = args.out_kind
+    if args.out_path:
+        out["path"] = args.out_path
+
+    # 4) validate *after* overrides
+    missing = [k for k in ("kind", "path") if k not in inp] + [
+        f"out.{k}" for k in ("kind", "path") if k not in out
+    ]
+    if missing:
+        raise SystemExit(
+            "Missing I/O configuration. Provide --config/--steps with 'io', or add CLI overrides."
+        )
+    return inp, out
+
+
+def _run(
+    execution: _ExecutionOptions,
+    inp: Dict[str, Any],
+    out: Dict[str, Any],
+    steps: list[Any],
+    *,
+    profile_json: str | None,
+) -> None:
+    # Run via unified orchestrator
+    with execution.profiler or contextlib.nullcontext():
+        orchestrate(
+            input=inp,
+            output=out,
+            steps=steps or None,
+            profiler=execution.profiler,
+            cache=execution.cache,
+            workers=execution.workers,
+        )
+    if execution.profiler is not None:
+        _emit_profile(execution.profiler, profile_json)
+
+
 # ---------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------
@@ -152,36 +283,15 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
     parser.add_argument("--debug", action="store_true", help="Show full tracebacks on errors")
 
+    _add_execution_arguments(parser)
+
     args = parser.parse_args(argv)
+    execution = _execution_options(parser, args)
     setup_logging(args.verbose)
 
     config = _load_config(args)
 
-    # 1) start with whatever is in the config (or empty)
-    io_cfg = _select_io_config(config, args.profile) if config else {}
-
-    # 2) build working dicts
-    inp = dict((io_cfg.get("input") or {}))
-    out = dict((io_cfg.get("output") or {}))
-
-    # 3) apply CLI overrides (these should always win)
-    if args.in_kind:
-        inp["kind"] = args.in_kind
-    if args.in_path:
-        inp["path"] = args.in_path
-    if args.out_kind:
-        out["kind"] = args.out_kind
-    if args.out_path:
-        out["path"] = args.out_path
-
-    # 4) validate *after* overrides
-    missing = [k for k in ("kind", "path") if k not in inp] + [
-        f"out.{k}" for k in ("kind", "path") if k not in out
-    ]
-    if missing:
-        raise SystemExit(
-            "Missing I/O configuration. Provide --config/--steps with 'io', or add CLI overrides."
-        )
+    inp, out = _resolve_io(config, args)
 
     # Build steps
     steps = _select_pipeline_steps(
@@ -191,8 +301,9 @@ def main(argv: Optional[list[str]] = None) -> int:
         profile=args.profile,
     )
 
-    # Run via unified orchestrator
-    orchestrate(input=inp, output=out, steps=steps or None)
+    if execution.workers is not None and not steps:
+        parser.error("--step-workers needs pipeline steps to schedule")
+    _run(execution, inp, out, steps, profile_json=args.profile_json)
 
     log.info("Done. Wrote output to %s", out["path"])
     return 0
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+
+import pandas as pd
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def copy_on_write_enabled() -> bool:
+    """True when pandas defers copies until a frame is actually written."""
+    if _PANDAS_MAJOR >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def copy_on_write() -> AbstractContextManager[object]:
+    """
+    Context in which pandas 2.x runs in copy-on-write mode (always on from pandas 3).
+
+    Steps pass unchanged frames through by reference, so with copy-on-write
+    a frame that is only read is never duplicated, and a step that writes to
+    a frame it received copies just the columns it touches. The option is
+    restored on exit, so callers embedding the package keep their own pandas
+    settings.
+    """
+    if copy_on_write_enabled():
+        return nullcontext()
+    return pd.option_context("mode.copy_on_write", True)
+
+
+def detached(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame that can be modified without affecting ``df``.
+
+    Under copy-on-write this is a shallow copy sharing ``df``'s data until
+    either side writes; otherwise it is a deep copy.
+    """
+    return df.copy(deep=not copy_on_write_enabled())
@@ -6,6 +6,7 @@ from typing import Any, Callable, Dict, Iterable, List, NamedTuple
 import pandas as pd
 
 from ..frame_keys import iter_data_frames
+from .copy_on_write import detached
 
 # Use the shared indexing helpers.
 from .indexing import level0_series as _series_from_first_level
@@ -288,7 +289,7 @@ def apply_fk_helpers(
         return df
 
     first_cols = _first_level_columns(df)
-    new_df = df.copy()
+    new_df = detached(df)
 
     for fk in fk_defs:
         # Support FKDef and legacy dict inputs.
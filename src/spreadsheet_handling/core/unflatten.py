@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable, NamedTuple, Sequence
 
 import pandas as pd
 
@@ -10,22 +10,112 @@ def is_empty_header(x: str | None) -> bool:
     return s == "" or s.lower() in ("nan", "none") or s.startswith("Unnamed:")
 
 
-def set_nested(d: dict[str, Any], segs: list[str], value: Any) -> None:
+def is_blank_value(v: Any) -> bool:
+    return v is None or (isinstance(v, str) and v.strip() == "")
+
+
+def set_nested(
+    d: dict[str, Any],
+    segs: Sequence[str],
+    value: Any,
+    *,
+    replace_scalars: bool = False,
+) -> None:
+    """Store ``value`` under the path ``segs``, creating parent dicts.
+
+    A parent that already holds a scalar (headers ``a`` and ``a.b``) raises
+    TypeError unless ``replace_scalars`` lets the nested value replace it.
+    """
     cur = d
-    for i, s in enumerate(segs):
-        last = i == len(segs) - 1
-        if last:
-            cur[s] = value
-        else:
-            cur = cur.setdefault(s, {})
+    for s in segs[:-1]:
+        nxt = cur.setdefault(s, {})
+        if not isinstance(nxt, dict):
+            if not replace_scalars:
+                raise TypeError(f"Cannot nest {'.'.join(segs)!r}: {s!r} already holds a value")
+            nxt = cur[s] = {}
+        cur = nxt
+    cur[segs[-1]] = value
+
+
+class ColumnPlan(NamedTuple):
+    """Frame columns that produce output and the nested path each one writes to."""
+
+    positions: list[int]
+    paths: list[tuple[str, ...]]
+
+
+def plan_nested_columns(columns: Iterable[Any], *, split_dotted: bool = False) -> ColumnPlan:
+    """Resolve header paths once per frame.
+
+    Empty header segments are dropped; columns without a path or whose path
+    starts with a helper segment (``_``) are skipped. ``split_dotted`` further
+    splits segments on ``.`` (dotted-path headers).
+    """
+    positions: list[int] = []
+    paths: list[tuple[str, ...]] = []
+    for position, col in enumerate(columns):
+        parts = col if isinstance(col, tuple) else (col,)
+        segs = [str(s) for s in parts if not is_empty_header(s)]
+        if split_dotted and segs:
+            segs = ".".join(segs).split(".")
+        if not segs or segs[0].startswith("_"):
+            continue
+        positions.append(position)
+        paths.append(tuple(segs))
+    return ColumnPlan(positions, paths)
+
+
+def frame_column_values(df: pd.DataFrame, positions: Sequence[int]) -> list[list[Any]]:
+    """Pull columns by position as Python lists without per-row ``Series``.
+
+    Columns are read one at a time. Each is cast to the dtype the frame's
+    interleaved array would have, so a numeric frame yields the same (upcast)
+    values the row-wise writers saw through ``iterrows``.
+    """
+    common = df.iloc[:0].to_numpy().dtype
+    values: list[list[Any]] = []
+    for position in positions:
+        column = df.iloc[:, position]
+        if column.dtype != common:
+            column = column.astype(common)
+        # ``Series.tolist`` keeps datetimes as Timestamps, as rows carry them.
+        values.append(column.tolist())
+    return values
+
+
+def build_nested_records(
+    df: pd.DataFrame,
+    plan: ColumnPlan,
+    *,
+    drop_empty: bool = False,
+    replace_scalars: bool = False,
+) -> list[dict[str, Any]]:
+    """Assemble one nested dict per row, column by column.
+
+    Blank cells (``None`` / whitespace-only strings) are omitted. Every record
+    receives its keys in column order, exactly as a row-wise build would.
+    Conflicting paths are handled as in ``set_nested``.
+    """
+    records: list[dict[str, Any]] = [{} for _ in range(len(df))]
+    for path, values in zip(plan.paths, frame_column_values(df, plan.positions)):
+        if len(path) == 1:
+            key = path[0]
+            for record, value in zip(records, values):
+                if not is_blank_value(value):
+                    record[key] = value
+            continue
+        for record, value in zip(records, values):
+            if not is_blank_value(value):
+                set_nested(record, path, value, replace_scalars=replace_scalars)
+    if drop_empty:
+        return [record for record in records if record]
+    return records
 
 
 def row_to_obj(paths: list[str | None], values: list[Any]) -> dict[str, Any]:
-    obj = {}
+    obj: dict[str, Any] = {}
     for p, v in zip(paths, values):
-        if v is None:
-            continue
-        if isinstance(v, str) and v.strip() == "":
+        if p is None or is_blank_value(v):
             continue
         segs = p.split(".")
         if segs and segs[0].startswith("_"):  # do not write helper columns back
@@ -35,23 +125,7 @@ def row_to_obj(paths: list[str | None], values: list[Any]) -> dict[str, Any]:
 
 
 def df_to_objects(df: pd.DataFrame) -> list[dict[str, Any]]:
-    # Build header paths and skip empty/Unnamed cells.
-    paths = []
-    for col in df.columns:
-        segs = [str(s) for s in col if not is_empty_header(s)]
-        if not segs:  # ignore columns with completely empty headers
-            paths.append(None)
-        else:
-            paths.append(".".join(segs))
-    # Drop columns without paths.
-    keep = [i for i, p in enumerate(paths) if p is not None]
-    df2 = df.iloc[:, keep]
-    paths2 = [paths[i] for i in keep]
-
-    out = []
-    for _, row in df2.iterrows():
-        obj = row_to_obj(paths2, row.values.tolist())
-        if obj:
-            out.append(obj)
-    return out
-
+    # Header paths skip empty/Unnamed cells and helper columns; rows without
+    # any value are dropped.
+    plan = plan_nested_columns(df.columns, split_dotted=True)
+    return build_nested_records(df, plan, drop_empty=True)
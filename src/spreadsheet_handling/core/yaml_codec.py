@@ -0,0 +1,35 @@
+"""YAML codec with the libyaml fast path for data files.
+
+``safe_load`` parses with PyYAML's ``CSafeLoader`` (libyaml scanner and
+parser) when PyYAML was built against libyaml, and falls back to the
+pure-Python ``SafeLoader`` otherwise. Both loaders construct values with the
+same ``SafeConstructor``, so the loaded data is identical; syntax errors raise
+the same ``yaml.YAMLError`` subclasses, only with terser messages.
+
+There is deliberately no C dump path. libyaml's emitter escapes characters
+outside the BMP (emoji) even with ``allow_unicode=True``, writes empty and
+long mapping keys as explicit ``?`` keys and drops the ``...`` end marker of
+scalar documents, so ``CSafeDumper`` output is not byte-identical to
+``yaml.safe_dump``.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+LIBYAML_AVAILABLE: bool = _SafeLoader is not yaml.SafeLoader
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Drop-in for ``yaml.safe_load`` that uses libyaml when available."""
+    return yaml.load(stream, Loader=_SafeLoader)  # noqa: S506 - safe loader class
+
+
+__all__ = ["LIBYAML_AVAILABLE", "safe_load"]
@@ -17,6 +17,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.domain._cell_primitives import _is_empty_cell
 
 _WHERE_PREDICATES = {"equals", "in", "non_empty", "is_null", "not_null"}
@@ -54,7 +55,7 @@ def _apply_where(
     frame_name: str,
 ) -> pd.DataFrame:
     if where is None:
-        return source.copy()
+        return detached(source)
     if not isinstance(where, Mapping):
         raise TypeError("where must be a mapping with `column` plus one supported predicate")
 
@@ -101,4 +102,4 @@ def _apply_where(
             mask = ~mask
     else:  # pragma: no cover - guarded above
         raise AssertionError(predicate)
-    return source.loc[mask].copy()
+    return detached(source.loc[mask])
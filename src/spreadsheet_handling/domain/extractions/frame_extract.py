@@ -7,6 +7,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.domain._where_predicates import (
     _apply_where,
     _duplicate_column_names,
@@ -74,11 +75,11 @@ def _project_columns(
     frame_name: str,
 ) -> pd.DataFrame:
     if columns is None:
-        return source.copy()
+        return detached(source)
 
     selected = _string_list(columns, "columns")
     _ensure_columns(source, selected, frame_name=frame_name, field_name="columns")
-    return source.loc[:, selected].copy()
+    return detached(source.loc[:, selected])
 
 
 def _rename_columns(
@@ -112,7 +113,7 @@ def _add_constants(
     if not isinstance(constants, Mapping):
         raise TypeError("constants must be a mapping of output column names to scalar values")
 
-    result = source.copy()
+    result = detached(source)
     for column, value in constants.items():
         if not isinstance(column, str) or not column.strip():
             raise ValueError("constant column names must be non-empty strings")
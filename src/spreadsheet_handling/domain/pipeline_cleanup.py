@@ -241,7 +241,7 @@ def execute_final_domain_cleanup(frames: Frames) -> Frames:
     # such a workbook is written again.
     _fail_on_workbook_view_conflicts(meta, set(drop_names) & removal)
 
-    out: Frames = {key: value for key, value in frames.items() if key not in removal}
+    out: Frames = {key: frames[key] for key in frames if key not in removal}
     new_meta = dict(meta)
     del new_meta[PIPELINE_CLEANUP_KEY]
     out["_meta"] = new_meta
@@ -4,6 +4,7 @@ from typing import Any
 
 import pandas as pd
 
+from ...core.copy_on_write import detached
 from .model import (
     ColumnPlacement,
     FrameChange,
@@ -56,7 +57,7 @@ def add_column(frames: Frames, request: SchemaMaintenanceRequest) -> SchemaMaint
         return _blocked(frames, request, placement_failure)
 
     out = _copy_frames(frames)
-    updated = frame.copy()
+    updated = detached(frame)
     insert_at = _insert_index(updated, placement)
     updated.insert(insert_at, target_column, request.default_value)
     out[request.target_frame] = updated
@@ -104,7 +105,7 @@ def drop_column(frames: Frames, request: SchemaMaintenanceRequest) -> SchemaMain
         )
 
     out = _copy_frames(frames)
-    out[request.target_frame] = frame.drop(columns=[source_column]).copy()
+    out[request.target_frame] = detached(frame.drop(columns=[source_column]))
     return _success(
         out,
         request,
@@ -171,7 +172,7 @@ def rename_column(frames: Frames, request: SchemaMaintenanceRequest) -> SchemaMa
         )
 
     out = _copy_frames(frames)
-    out[request.target_frame] = frame.rename(columns={source_column: target_column}).copy()
+    out[request.target_frame] = detached(frame.rename(columns={source_column: target_column}))
     return _success(
         out,
         request,
@@ -209,7 +210,7 @@ def reorder_columns(frames: Frames, request: SchemaMaintenanceRequest) -> Schema
 
     ordered_columns = _ordered_columns(frame, reorder)
     out = _copy_frames(frames)
-    out[request.target_frame] = frame.loc[:, ordered_columns].copy()
+    out[request.target_frame] = detached(frame.loc[:, ordered_columns])
     return _success(
         out,
         request,
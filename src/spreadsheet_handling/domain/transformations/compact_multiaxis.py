@@ -11,6 +11,7 @@ from typing import Any
 
 import pandas as pd
 
+from ...core.copy_on_write import detached
 from ._legend_blocks import _read_legend_block
 from .cell_codec import decode_cell_values, encode_cell_values
 from .xref_crosstable import contract_xref, expand_xref
@@ -235,7 +236,7 @@ def _with_group_column(
         normalize_case=normalize_case,
         strip=strip,
     )
-    out = frame.copy()
+    out = detached(frame)
     out[group] = [
         lookup.get(_normalize_key(value, normalize_case=normalize_case, strip=strip), "")
         for value in out[code].tolist()
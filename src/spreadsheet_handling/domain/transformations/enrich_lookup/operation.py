@@ -9,6 +9,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.core.formulas import lookup_formula
 
 from .policy import (
@@ -294,9 +295,9 @@ def _build_helper_projection(
     fields: list[str] | None,
 ) -> pd.DataFrame:
     if fields is None:
-        return lookup_df.loc[:, join_keys].copy()
+        return detached(lookup_df.loc[:, join_keys])
     cols = list(dict.fromkeys(join_keys + fields))
-    return lookup_df.loc[:, cols].copy()
+    return detached(lookup_df.loc[:, cols])
 
 
 def _build_formula_enrichment(
@@ -307,7 +308,7 @@ def _build_formula_enrichment(
     missing_mode: str,
 ) -> pd.DataFrame:
     """Build an enriched frame with LookupFormulaSpec objects as cell values."""
-    enriched = source_df.copy()
+    enriched = detached(source_df)
     source_key = join_keys[0]
     for field in fields:
         formula = lookup_formula(
@@ -350,12 +351,18 @@ def _write_provenance(
 ) -> None:
     if fields is None:
         return
+    # Copy along the written path: the input ``_meta`` subtrees stay untouched.
     meta: dict[str, Any] = dict(out.get("_meta") or {})
-    derived: dict[str, Any] = meta.setdefault("derived", {})
-    derived_sheets: dict[str, Any] = derived.setdefault("sheets", {})
-    derived_sheets.setdefault(output, {})["enrich_lookup"] = {
-        "lookup": lookup,
-        "on": join_keys,
-        "helper_columns": list(fields),
+    derived: dict[str, Any] = dict(meta.get("derived") or {})
+    derived_sheets: dict[str, Any] = dict(derived.get("sheets") or {})
+    derived_sheets[output] = {
+        **(derived_sheets.get(output) or {}),
+        "enrich_lookup": {
+            "lookup": lookup,
+            "on": join_keys,
+            "helper_columns": list(fields),
+        },
     }
+    derived["sheets"] = derived_sheets
+    meta["derived"] = derived
     out["_meta"] = meta
@@ -13,6 +13,7 @@ from typing import Any
 
 import pandas as pd
 
+from ....core.copy_on_write import detached
 from ....core.fk import apply_fk_helpers, build_id_value_maps
 from ....frame_keys import copy_reserved_frames, iter_data_frames
 
@@ -155,7 +156,7 @@ def _preserve_source_flatness(
     if _columns_are_flat(enriched_df.columns):
         return enriched_df
     flattened = [_visible_label(column) for column in enriched_df.columns]
-    result = enriched_df.copy()
+    result = detached(enriched_df)
     result.columns = flattened
     return result
 
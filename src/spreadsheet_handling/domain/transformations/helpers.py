@@ -5,6 +5,7 @@ from typing import Callable, Dict, Iterable, Optional
 
 import pandas as pd
 
+from ...core.copy_on_write import detached
 from ...frame_keys import copy_reserved_frames, iter_data_frames
 from .fk_helpers import (
     derived_helper_columns_by_sheet,
@@ -104,7 +105,7 @@ def _flatten_header_to_level0(df: pd.DataFrame) -> pd.DataFrame:
     cols_out = [(c[0] if isinstance(c, tuple) and len(c) else c) for c in cols_in]
     if cols_in == cols_out:
         return df
-    out = df.copy()
+    out = detached(df)
     out.columns = cols_out
     return out
 
@@ -136,7 +137,7 @@ def flatten_headers(
             else:
                 new = [next((str(x) for x in t if str(x)), "") for t in tuples]
 
-            nd = df.copy()
+            nd = detached(df)
             nd.columns = new
             out[name] = nd
         return out  # type: ignore[return-value]
@@ -175,7 +176,7 @@ def unflatten_headers(sheet: Optional[str] = None, *, sep: str = ".") -> Step:
             max_levels = max((len(p) for p in parts), default=1)
             tuples = [tuple(p + [""] * (max_levels - len(p))) for p in parts]
 
-            nd = df.copy()
+            nd = detached(df)
             nd.columns = pd.MultiIndex.from_tuples(tuples)
             out[name] = nd
         return out  # type: ignore[return-value]
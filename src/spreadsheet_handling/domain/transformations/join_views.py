@@ -8,6 +8,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.domain._cell_primitives import _is_empty_cell
 from spreadsheet_handling.domain._where_predicates import (
     _apply_where,
@@ -129,7 +130,7 @@ def join_frames(
         )
         filtered = _apply_where(merged, where, frame_name=output)
         output_columns = [spec.output for spec in [*left_outputs, *right_outputs]]
-        result = filtered.loc[:, output_columns].copy()
+        result = detached(filtered.loc[:, output_columns])
 
     result = result.reset_index(drop=True)
     result = result.where(pd.notnull(result), "")
@@ -217,7 +218,7 @@ def _side_work_frame(
 ) -> tuple[pd.DataFrame, list[_ColumnSpec]]:
     rename_map = _rename_map(rename, selected_columns, side_name=side_name, prefix=prefix)
     carry_columns = list(dict.fromkeys([*join_keys, *selected_columns]))
-    work = source.loc[:, carry_columns].copy()
+    work = detached(source.loc[:, carry_columns])
     for index, join_key in enumerate(join_keys):
         work[temp_keys[index]] = [_join_token(value) for value in source[join_key].tolist()]
 
@@ -234,7 +235,7 @@ def _side_work_frame(
         raise ValueError(f"{prefix}_rename creates duplicate output column(s): {duplicates!r}")
 
     keep_columns = [*temp_keys, *selected_columns]
-    return work.loc[:, keep_columns].copy(), output_specs
+    return detached(work.loc[:, keep_columns]), output_specs
 
 
 def _rename_map(
@@ -325,12 +326,12 @@ def _semi_join(
     output: str,
 ) -> pd.DataFrame:
     row_id = _temp_column("__join_frames_left_row", left_work, right_work)
-    left_numbered = left_work.copy()
+    left_numbered = detached(left_work)
     left_numbered[row_id] = range(len(left_numbered))
     candidate = left_numbered.merge(right_work, on=temp_keys, how="inner", sort=False)
     filtered = _apply_where(candidate, where, frame_name=output)
     keep_ids = set(filtered[row_id].tolist())
-    result = left_numbered.loc[left_numbered[row_id].isin(keep_ids)].copy()
+    result = detached(left_numbered.loc[left_numbered[row_id].isin(keep_ids)])
     return result.drop(columns=[row_id, *temp_keys])
 
 
@@ -19,6 +19,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.domain.column_roles import (
     ROLE_DISPLAY_HELPER,
     ROLE_MATRIX_VALUE,
@@ -158,4 +159,4 @@ def _inbound_columns(roles: ColumnRoles, order: Sequence[str]) -> list[str]:
 
 def _reorder_dataframe(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
     ordered = [str(column) for column in columns]
-    return df.loc[:, ordered].copy()
+    return detached(df.loc[:, ordered])
@@ -8,6 +8,8 @@ import warnings
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
+
 Frames = dict[str, Any]
 
 _META_KEY = "sparse_defaults"
@@ -45,7 +47,7 @@ def sparse_collapse(
         on_conflict=on_conflict,
     )
 
-    sparse = source.copy()
+    sparse = detached(source)
     for column in target_columns:
         sparse[column] = [
             blank_value if _values_equal(value, default_value) else value
@@ -91,7 +93,7 @@ def sparse_expand(
         meta=meta,
     )
 
-    dense = source.copy()
+    dense = detached(source)
     for column in target_columns:
         dense[column] = [
             resolved_default if _is_blank_value(value, resolved_blank) else value
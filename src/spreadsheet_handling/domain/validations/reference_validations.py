@@ -10,6 +10,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.domain._cell_primitives import _is_empty_cell
 from spreadsheet_handling.domain.finding_frame import findings_to_frame as _serialize_findings
 
@@ -446,8 +447,8 @@ def _apply_when(
     assert mask is not None
     skipped_count = int((~mask).sum())
     if skipped_count == 0:
-        return frame.loc[mask].copy(), []
-    return frame.loc[mask].copy(), [
+        return detached(frame.loc[mask]), []
+    return detached(frame.loc[mask]), [
         ReferenceFinding(
             rule_type=rule_type,
             frame=frame_name,
@@ -27,8 +27,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
-
+from ..core import yaml_codec
 from .meta_bootstrap import deep_merge, get_meta, set_meta
 
 
@@ -41,7 +40,7 @@ def load_overrides(path: str | Path) -> Dict[str, Any]:
     if not p.exists():
         raise FileNotFoundError(f"Overrides file not found: {p}")
     with p.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml_codec.safe_load(f) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"Overrides file must be a YAML mapping, got {type(raw).__name__}")
     return raw
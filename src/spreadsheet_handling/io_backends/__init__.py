@@ -1,6 +1,9 @@
 from .base import BackendBase, BackendOptions
 from .csv_backend import CSVBackend
 from .json_backend import JSONBackend
+from .jsonl_backend import JSONLinesBackend
+from .lazy_frames import LazyFrames
+from .sqlite_backend import SQLiteBackend
 from .xml_backend import XMLBackend
 from .errors import DeprecatedAdapterError
 from .router import get_backend_factory as _get_backend_factory
@@ -10,6 +13,8 @@ from .spreadsheet_contract import SpreadsheetParser, SpreadsheetRenderer
 _EXPORT_SPECS = {
     'ExcelBackend': ('spreadsheet_handling.io_backends.xlsx.xlsx_backend', 'ExcelBackend'),
     'OdsBackend': ('spreadsheet_handling.io_backends.ods.ods_backend', 'OdsBackend'),
+    'ParquetBackend': ('spreadsheet_handling.io_backends.columnar_backend', 'ParquetBackend'),
+    'FeatherBackend': ('spreadsheet_handling.io_backends.columnar_backend', 'FeatherBackend'),
 }
 
 
@@ -39,8 +44,13 @@ __all__ = [
     'CSVBackend',
     'DeprecatedAdapterError',
     'ExcelBackend',
+    'FeatherBackend',
     'JSONBackend',
+    'JSONLinesBackend',
+    'LazyFrames',
     'OdsBackend',
+    'ParquetBackend',
+    'SQLiteBackend',
     'SpreadsheetParser',
     'SpreadsheetRenderer',
     'XMLBackend',
@@ -43,6 +43,20 @@ def coerce_backend_options(
     return cast(BackendOptions, dict(opts))
 
 
+def backend_option(options: BackendOptions | Mapping[str, Any] | None, key: str) -> Any:
+    """Return a backend-specific option from either options shape, or None."""
+    if options is None:
+        return None
+    if isinstance(options, BackendOptions):
+        return options.extra.get(key)
+    return options.get(key)
+
+
+def streaming_requested(options: BackendOptions | Mapping[str, Any] | None) -> bool:
+    """Return the ``streaming`` read/write option of the spreadsheet backends."""
+    return bool(backend_option(options, "streaming"))
+
+
 class BackendBase:
     def write(
         self,
@@ -0,0 +1,181 @@
+"""Columnar sheet directories (``parquet_dir`` / ``feather_dir``) backed by pyarrow.
+
+Each sheet is one binary columnar file that keeps column dtypes and
+MultiIndex headers, so an intermediate result between pipeline stages is
+loaded without re-parsing text. ``_meta`` is stored in the ``_meta.yaml``
+sidecar exactly as for ``json_dir``. pyarrow is an optional dependency that
+is only imported when one of these kinds is used.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import partial
+import os
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Dict
+
+import pandas as pd
+
+from .base import BackendBase, BackendOptions, backend_option, coerce_backend_options
+from .json_backend import _read_meta_sidecar, _write_meta_sidecar
+from .lazy_frames import LazyFrames
+from .sheet_files import map_sheet_files
+
+Frames = Dict[str, pd.DataFrame]
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for the parquet_dir and feather_dir backends. "
+            "Install the optional extra with: pip install -e '.[columnar]'"
+        ) from exc
+
+
+def _read_parquet(p: Path) -> pd.DataFrame:
+    from pyarrow import parquet
+
+    return parquet.read_table(p).to_pandas()
+
+
+def _write_parquet(p: Path, df: pd.DataFrame, compression: str | None) -> None:
+    import pyarrow
+    from pyarrow import parquet
+
+    parquet.write_table(pyarrow.Table.from_pandas(df), p, compression=compression or "snappy")
+
+
+def _read_feather(p: Path) -> pd.DataFrame:
+    from pyarrow import feather
+
+    return feather.read_feather(p)
+
+
+def _write_feather(p: Path, df: pd.DataFrame, compression: str | None) -> None:
+    from pyarrow import feather
+
+    feather.write_feather(df, p, compression=compression)
+
+
+class _ColumnarDirBackend(BackendBase):
+    """One columnar file per sheet plus the ``_meta.yaml`` sidecar."""
+
+    suffix: ClassVar[str]
+    format_name: ClassVar[str]
+    _read_file: ClassVar[Callable[[Path], pd.DataFrame]]
+    _write_file: ClassVar[Callable[[Path, pd.DataFrame, str | None], None]]
+
+    def read_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> Frames:
+        _require_pyarrow()
+        in_dir = Path(path)
+        files = sorted(in_dir.glob(f"*{self.suffix}"))
+        frames = map_sheet_files(self._read_file, files, options=options)
+        out: Frames = {p.stem: df for p, df in zip(files, frames)}
+
+        meta = _read_meta_sidecar(in_dir)
+        if meta is not None:
+            out["_meta"] = meta  # type: ignore[assignment]
+        return out
+
+    def open_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> LazyFrames:
+        _require_pyarrow()
+        in_dir = Path(path)
+        files = sorted(in_dir.glob(f"*{self.suffix}"))
+        return LazyFrames({p.stem: partial(self._read_file, p) for p in files}, meta=_read_meta_sidecar(in_dir))
+
+    def write_multi(self, frames: Frames, path: str, options: BackendOptions | None = None) -> None:
+        _require_pyarrow()
+        out_dir = Path(os.fspath(path))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        compression = backend_option(options, "compression")
+
+        def write_sheet(item: tuple[str, pd.DataFrame]) -> None:
+            name, df = item
+            try:
+                self._write_file(out_dir / f"{name}{self.suffix}", df, compression)
+            except (TypeError, ValueError) as exc:
+                # e.g. object columns mixing str and numbers, duplicate column names
+                raise ValueError(f"Sheet {name!r} cannot be stored as {self.format_name}: {exc}") from exc
+
+        sheets = [(name, df) for name, df in frames.items() if name != "_meta"]
+        map_sheet_files(write_sheet, sheets, options=options)
+        _write_meta_sidecar(out_dir, frames.get("_meta"))
+
+
+class ParquetBackend(_ColumnarDirBackend):
+    """
+    Backend for a directory of Parquet files, one file per sheet (e.g. products.parquet).
+    """
+
+    suffix = ".parquet"
+    format_name = "Parquet"
+    _read_file = staticmethod(_read_parquet)
+    _write_file = staticmethod(_write_parquet)
+
+
+class FeatherBackend(_ColumnarDirBackend):
+    """
+    Backend for a directory of Feather (Arrow IPC) files, one file per sheet (e.g. products.feather).
+    """
+
+    suffix = ".feather"
+    format_name = "Feather"
+    _read_file = staticmethod(_read_feather)
+    _write_file = staticmethod(_write_feather)
+
+
+# ---- Router-facing convenience wrappers ----
+
+def read_parquet_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> Frames:
+    """
+    Read a directory of ``.parquet`` files, one per sheet.
+    """
+    return ParquetBackend().read_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def open_parquet_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> LazyFrames:
+    """
+    Open a directory of ``.parquet`` files; each sheet is read on first access.
+    """
+    return ParquetBackend().open_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def write_parquet_dir(
+    frames: Frames,
+    path: str | os.PathLike[str],
+    *,
+    options: Mapping[str, Any] | BackendOptions | None = None,
+) -> None:
+    """
+    Write frames to a directory of Parquet files, one per sheet.
+    """
+    ParquetBackend().write_multi(frames, os.fspath(path), options=coerce_backend_options(options))
+
+
+def read_feather_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> Frames:
+    """
+    Read a directory of ``.feather`` files, one per sheet.
+    """
+    return FeatherBackend().read_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def open_feather_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> LazyFrames:
+    """
+    Open a directory of ``.feather`` files; each sheet is read on first access.
+    """
+    return FeatherBackend().open_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def write_feather_dir(
+    frames: Frames,
+    path: str | os.PathLike[str],
+    *,
+    options: Mapping[str, Any] | BackendOptions | None = None,
+) -> None:
+    """
+    Write frames to a directory of Feather files, one per sheet.
+    """
+    FeatherBackend().write_multi(frames, os.fspath(path), options=coerce_backend_options(options))
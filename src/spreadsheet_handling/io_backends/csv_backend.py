@@ -1,17 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+import csv
+from functools import partial
+import importlib.util
 from pathlib import Path
+from typing import Any, NamedTuple, TextIO
 
 import pandas as pd
+from pandas.api.types import union_categoricals
 
-from .base import BackendBase, BackendOptions
+from ..core.copy_on_write import detached
+from .base import BackendBase, BackendOptions, backend_option
+from .lazy_frames import LazyFrames
+from .sheet_files import map_sheet_files
 
 
-def _escape_csv_cell(v) -> str:
-    s = "" if v is None else str(v)
-    if any(ch in s for ch in [",", '"', "\n", "\r"]):
-        s = '"' + s.replace('"', '""') + '"'
-    return s
+class _LineFeedRecords:
+    """File adapter that lets ``csv.writer`` emit this backend's dialect.
+
+    The writer runs with ``\\r\\n`` as line terminator so that a field holding
+    a bare ``\\r`` is quoted just like one holding ``\\n`` (``csv`` only quotes
+    line-break characters that occur in the terminator). Every record arrives
+    in a single ``write`` call and is re-terminated with ``\\n`` here. ``csv``
+    writes a record made of one empty field as ``""``; the backend has always
+    written an empty line for it.
+    """
+
+    def __init__(self, handle: TextIO) -> None:
+        self._handle = handle
+
+    def write(self, record: str) -> int:
+        line = "\n" if record == '""\r\n' else record[:-2] + "\n"
+        return self._handle.write(line)
+
+
+def _cells(column: pd.Series) -> list[Any]:
+    values = column.astype(object)
+    return values.where(values.notna(), "").tolist()
 
 
 class CSVBackend(BackendBase):
@@ -30,7 +56,7 @@ class CSVBackend(BackendBase):
         options: BackendOptions | None = None,
     ) -> None:
         if not isinstance(df.columns, pd.MultiIndex):
-            df = df.copy()
+            df = detached(df)
             df.columns = pd.MultiIndex.from_arrays([df.columns], names=[None])
 
         header_rows = []
@@ -39,13 +65,17 @@ class CSVBackend(BackendBase):
                 [str(col[lvl]) if col[lvl] is not None else "" for col in df.columns]
             )
 
-        body_rows = df.astype(object).where(pd.notnull(df), "").values.tolist()
+        # Missing values become "" column by column; rows are zipped from the
+        # column lists instead of materializing one object grid of the frame.
+        columns = [_cells(df.iloc[:, position]) for position in range(df.shape[1])]
+        body_rows = zip(*columns) if columns else [[]] * len(df)
 
+        # Quoting and joining run in the C ``csv`` writer instead of per cell
+        # in Python; the output bytes are unchanged (see ``_LineFeedRecords``).
         with open(path, "w", encoding="utf-8", newline="") as f:
-            for row in header_rows:
-                f.write(",".join(_escape_csv_cell(v) for v in row) + "\n")
-            for row in body_rows:
-                f.write(",".join(_escape_csv_cell(v) for v in row) + "\n")
+            writer = csv.writer(_LineFeedRecords(f), lineterminator="\r\n")
+            writer.writerows(header_rows)
+            writer.writerows(body_rows)
 
     def read(
         self,
@@ -71,17 +101,173 @@ class CSVBackend(BackendBase):
         options: BackendOptions | None = None,
     ) -> dict[str, pd.DataFrame]:
         folder = Path(path)
-        out: dict[str, pd.DataFrame] = {}
-        for p in sorted(folder.glob("*.csv")):
-            df = pd.read_csv(p, header=0, encoding="utf-8")
-            tuples = [(c,) + ("",) * (header_levels - 1) for c in list(df.columns)]
-            df = df.copy()
-            df.columns = pd.MultiIndex.from_tuples(tuples)
-            out[p.stem] = df
+        files = sorted(folder.glob("*.csv"))
+        read = _CsvReadOptions.from_options(options)
+        frames = map_sheet_files(
+            partial(_read_csv_sheet, header_levels=header_levels, read=read), files, options=options
+        )
+        out = {p.stem: df for p, df in zip(files, frames)}
         if not out:
             raise FileNotFoundError(f"No *.csv files found in {folder}.")
         return out
 
+    def open_multi(
+        self,
+        path: str,
+        header_levels: int,
+        options: BackendOptions | None = None,
+    ) -> LazyFrames:
+        folder = Path(path)
+        files = sorted(folder.glob("*.csv"))
+        if not files:
+            raise FileNotFoundError(f"No *.csv files found in {folder}.")
+        read = _CsvReadOptions.from_options(options)
+        return LazyFrames(
+            {p.stem: partial(_read_csv_sheet, p, header_levels=header_levels, read=read) for p in files}
+        )
+
+
+_CSV_ENGINES = ("c", "python", "pyarrow", "auto")
+_DEFAULT_CATEGORICAL_RATIO = 0.5
+
+
+class _CsvReadOptions(NamedTuple):
+    """``csv_dir`` read options; all default to plain ``pd.read_csv`` behaviour."""
+
+    dtype: Any = None
+    usecols: tuple[str, ...] | Mapping[str, tuple[str, ...]] | None = None
+    engine: str | None = None
+    categorical: float | None = None  # max distinct/rows ratio for a category column
+    chunk_rows: int | None = None
+
+    @classmethod
+    def from_options(cls, options: BackendOptions | Mapping[str, Any] | None) -> _CsvReadOptions:
+        engine = backend_option(options, "engine")
+        if engine not in (None, *_CSV_ENGINES):
+            raise ValueError(f"Unknown CSV engine {engine!r}; expected one of {', '.join(_CSV_ENGINES)}")
+        if engine == "auto":
+            engine = "pyarrow" if importlib.util.find_spec("pyarrow") else None
+        chunk_rows = backend_option(options, "chunk_rows")
+        if chunk_rows is not None:
+            if isinstance(chunk_rows, bool) or not isinstance(chunk_rows, int) or chunk_rows < 1:
+                raise ValueError(f"chunk_rows must be a positive integer, got {chunk_rows!r}")
+            if engine == "pyarrow":
+                raise ValueError("chunk_rows is not supported by the pyarrow CSV engine")
+        return cls(
+            dtype=backend_option(options, "dtype"),
+            usecols=_usecols(backend_option(options, "usecols")),
+            engine=engine,
+            categorical=_categorical_ratio(backend_option(options, "categorical")),
+            chunk_rows=chunk_rows,
+        )
+
+    def read_csv_kwargs(self, sheet: str) -> dict[str, Any]:
+        """``pd.read_csv`` keyword arguments for the sheet stored as ``<sheet>.csv``.
+
+        A ``usecols`` list projects every sheet onto the listed columns it has;
+        a ``{sheet: [columns]}`` mapping projects only the sheets it names, and
+        each of those must have all of its listed columns.
+        """
+        kwargs: dict[str, Any] = {"dtype": self.dtype}
+        if isinstance(self.usecols, Mapping):
+            if sheet in self.usecols:
+                kwargs["usecols"] = list(self.usecols[sheet])
+        elif self.usecols is not None:
+            kwargs["usecols"] = frozenset(self.usecols).__contains__
+        if self.engine is not None:
+            kwargs["engine"] = self.engine
+        return kwargs
+
+
+def _column_names(value: Any, field_name: str) -> tuple[str, ...]:
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, Iterable) and not isinstance(value, Mapping):
+        names = tuple(value)
+        if all(isinstance(name, str) for name in names):
+            return names
+    raise ValueError(f"{field_name} must be a column name or a list of column names, got {value!r}")
+
+
+def _usecols(value: Any) -> tuple[str, ...] | dict[str, tuple[str, ...]] | None:
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        return {str(sheet): _column_names(columns, f"usecols.{sheet}") for sheet, columns in value.items()}
+    return _column_names(value, "usecols")
+
+
+def _categorical_ratio(value: Any) -> float | None:
+    if value is None or value is False:
+        return None
+    if value is True:
+        return _DEFAULT_CATEGORICAL_RATIO
+    if isinstance(value, (int, float)) and 0 < value <= 1:
+        return float(value)
+    raise ValueError(f"categorical must be true/false or a ratio in (0, 1], got {value!r}")
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
+
+def _categorize(df: pd.DataFrame, ratio: float) -> pd.DataFrame:
+    limit = ratio * len(df)
+    for name in df.columns:
+        column = df[name]
+        if _is_text_column(column) and column.nunique() <= limit:
+            df[name] = column.astype("category")
+    return df
+
+
+def _concat_categorized_chunks(chunks: Iterable[pd.DataFrame], ratio: float) -> pd.DataFrame:
+    """Concatenate chunks whose text columns are categorized chunk by chunk.
+
+    Only codes and distinct values of each chunk are kept while reading.
+    Columns that turn out not to be low-cardinality revert to plain text.
+    """
+    parts: list[pd.DataFrame] = []
+    for chunk in chunks:
+        for name in chunk.columns:
+            if _is_text_column(chunk[name]):
+                chunk[name] = chunk[name].astype("category")
+        parts.append(chunk)
+    if not parts:
+        return pd.DataFrame()
+    rows = sum(len(part) for part in parts)
+    columns: dict[Any, Any] = {}
+    for position, name in enumerate(parts[0].columns):
+        pieces = [part.iloc[:, position] for part in parts]
+        if all(isinstance(piece.dtype, pd.CategoricalDtype) for piece in pieces):
+            merged = union_categoricals([piece.array for piece in pieces])
+            if len(merged.categories) > ratio * rows:
+                merged = merged.astype(merged.categories.dtype)
+            columns[name] = merged
+        else:
+            columns[name] = pd.concat(pieces, ignore_index=True).array
+    return pd.DataFrame(columns, index=pd.RangeIndex(rows), copy=False)
+
+
+def _read_csv_frame(p: Path, read: _CsvReadOptions) -> pd.DataFrame:
+    kwargs = read.read_csv_kwargs(p.stem)
+    if read.chunk_rows is None:
+        df = pd.read_csv(p, header=0, encoding="utf-8", **kwargs)
+        return _categorize(df, read.categorical) if read.categorical else df
+    chunks = pd.read_csv(p, header=0, encoding="utf-8", chunksize=read.chunk_rows, **kwargs)
+    with chunks:
+        if read.categorical:
+            return _concat_categorized_chunks(chunks, read.categorical)
+        return pd.concat(list(chunks), ignore_index=True)
+
+
+def _read_csv_sheet(p: Path, *, header_levels: int, read: _CsvReadOptions = _CsvReadOptions()) -> pd.DataFrame:
+    df = _read_csv_frame(p, read)
+    # The frame is freshly parsed and owned here: relabel it in place, no copy.
+    df.columns = pd.MultiIndex.from_tuples(
+        [(c,) + ("",) * (header_levels - 1) for c in df.columns]
+    )
+    return df
+
 
 def load_csv_dir(
     path: str,
@@ -92,6 +278,15 @@ def load_csv_dir(
     return CSVBackend().read_multi(path, header_levels=header_levels, options=options)
 
 
+def open_csv_dir(
+    path: str,
+    options: BackendOptions | None = None,
+    *,
+    header_levels: int = 1,
+) -> LazyFrames:
+    return CSVBackend().open_multi(path, header_levels=header_levels, options=options)
+
+
 def save_csv_dir(
     frames: dict[str, pd.DataFrame],
     path: str,
@@ -101,7 +296,10 @@ def save_csv_dir(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     backend = CSVBackend()
-    for sheet_name, df in frames.items():
-        if sheet_name == "_meta":
-            continue
+
+    def write_sheet(item: tuple[str, pd.DataFrame]) -> None:
+        sheet_name, df = item
         backend.write(df, str(out_dir / f"{sheet_name}.csv"), options=options)
+
+    sheets = [(name, df) for name, df in frames.items() if name != "_meta"]
+    map_sheet_files(write_sheet, sheets, options=options)
@@ -1,69 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any
+from functools import partial
 import json
 import os
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 import yaml
 
+from ..core import yaml_codec
+from ..core.unflatten import build_nested_records, plan_nested_columns
 from .base import BackendBase, BackendOptions, coerce_backend_options
+from .lazy_frames import LazyFrames
+from .sheet_files import map_sheet_files
 
 Frames = Dict[str, pd.DataFrame]
 
-_JSON_FORMAT_KEYS = ("pretty", "indent", "sort_keys", "ensure_ascii")
-
-
-def _is_empty_header_segment(x: Any) -> bool:
-    if x is None:
-        return True
-    s = str(x).strip()
-    return s == "" or s.lower() in ("nan", "none") or s.startswith("Unnamed:")
-
-
-def _set_nested(d: dict[str, Any], segs: list[str], value: Any) -> None:
-    cur = d
-    for i, s in enumerate(segs):
-        last = i == len(segs) - 1
-        if last:
-            cur[s] = value
-        else:
-            nxt = cur.get(s)
-            if not isinstance(nxt, dict):
-                nxt = {}
-                cur[s] = nxt
-            cur = nxt
-
-
-def _records_nested_from_multiindex(df: pd.DataFrame) -> list[dict[str, Any]]:
-    paths: list[list[str] | None] = []
-    for col in df.columns:
-        if isinstance(col, tuple):
-            segs = [str(s) for s in col if not _is_empty_header_segment(s)]
-        else:
-            segs = [str(col)] if not _is_empty_header_segment(col) else []
-        if not segs or segs[0].startswith("_"):
-            paths.append(None)
-        else:
-            paths.append(segs)
-
-    out: list[dict[str, Any]] = []
-    for _, row in df.iterrows():
-        obj: dict[str, Any] = {}
-        for idx, segs in enumerate(paths):
-            if segs is None:
-                continue
-            v = row.iloc[idx]
-            if v is None:
-                continue
-            if isinstance(v, str) and v.strip() == "":
-                continue
-            _set_nested(obj, segs, v)
-        out.append(obj)
-    return out
+_JSON_FORMAT_KEYS = ("pretty", "indent", "sort_keys", "ensure_ascii", "engine")
+_JSON_ENGINES = ("json", "orjson")
+# Rows turned into record dicts at a time; bounds the Python object copy of a sheet.
+_JSON_CHUNK_ROWS = 2048
 
 
 def _json_format_overrides(options: BackendOptions | Mapping[str, Any] | None) -> dict[str, Any]:
@@ -74,6 +34,121 @@ def _json_format_overrides(options: BackendOptions | Mapping[str, Any] | None) -
     return {key: options[key] for key in _JSON_FORMAT_KEYS if key in options}
 
 
+def _read_json_sheet(p: Path) -> pd.DataFrame:
+    df = pd.read_json(p, dtype=str, convert_dates=False)
+    return df.where(pd.notnull(df), "")  # normalize empties as ""
+
+
+def _flat_records(chunk: pd.DataFrame) -> list[dict[str, Any]]:
+    """``to_dict(orient="records")`` assembled from column lists instead of row tuples."""
+    keys = chunk.columns.tolist()
+    columns = []
+    for position, dtype in enumerate(chunk.dtypes):
+        values = chunk.iloc[:, position].tolist()
+        if dtype.kind == "O":
+            # Unbox NumPy scalars held in object columns, as ``to_dict`` does.
+            values = [v.item() if isinstance(v, np.generic) else v for v in values]
+        columns.append(values)
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def _iter_record_chunks(df: pd.DataFrame) -> Iterator[list[dict[str, Any]]]:
+    # Normalize NaNs to ""; order follows the DataFrame columns.
+    clean = df.where(pd.notnull(df), "")
+    plan = None
+    if isinstance(clean.columns, pd.MultiIndex):
+        # FTR-MULTIHEADER-P2 default: MultiIndex headers become nested JSON objects.
+        plan = plan_nested_columns(clean.columns)
+    for start in range(0, len(clean), _JSON_CHUNK_ROWS):
+        chunk = clean.iloc[start:start + _JSON_CHUNK_ROWS]
+        if plan is None:
+            yield _flat_records(chunk)
+        else:
+            # A nested header replaces a scalar one it conflicts with (``a`` vs ``a/b``).
+            yield build_nested_records(chunk, plan, replace_scalars=True)
+
+
+def _orjson_encoder(fmt: Mapping[str, Any]) -> Callable[[Any], str]:
+    try:
+        import orjson
+    except ImportError as exc:
+        raise ImportError(
+            "orjson is required for the JSON 'engine: orjson' option. "
+            "Install the optional extra with: pip install -e '.[json]'"
+        ) from exc
+    if fmt["ensure_ascii"]:
+        raise ValueError("engine 'orjson' always writes UTF-8; it does not support ensure_ascii")
+    option = orjson.OPT_SORT_KEYS if fmt["sort_keys"] else 0
+    if fmt["pretty"]:
+        if fmt["indent"] != 2:
+            raise ValueError("engine 'orjson' only supports pretty output with indent 2")
+        option |= orjson.OPT_INDENT_2
+    return lambda obj: orjson.dumps(obj, option=option).decode("utf-8")
+
+
+def _json_encoder(fmt: Mapping[str, Any]) -> tuple[Callable[[Any], str], str]:
+    """Return ``(encode, item_separator)`` for the configured engine and format."""
+    engine = fmt.get("engine", "json")
+    if engine not in _JSON_ENGINES:
+        raise ValueError(f"Unknown JSON engine {engine!r}; expected one of {', '.join(_JSON_ENGINES)}")
+    indent = fmt["indent"] if fmt["pretty"] else None
+    item_separator = ", " if fmt["pretty"] and indent is None else ","
+    if engine == "orjson":
+        return _orjson_encoder(fmt), item_separator
+    encoder = json.JSONEncoder(
+        ensure_ascii=fmt["ensure_ascii"],
+        indent=indent,
+        sort_keys=fmt["sort_keys"],
+        separators=(item_separator, ": " if fmt["pretty"] else ":"),
+    )
+    return encoder.encode, item_separator
+
+
+def _iter_json_array(
+    chunks: Iterable[list[Any]],
+    encode: Callable[[Any], str],
+    item_separator: str,
+) -> Iterator[str]:
+    """Yield the text of one JSON array, encoding it a chunk at a time.
+
+    Each chunk is encoded as a list of its own; without its brackets it is
+    exactly the run of items ``json.dump`` writes for the whole array, so the
+    runs only need joining with the item separator.
+    """
+    closing = "]"
+    first = True
+    for chunk in chunks:
+        text = encode(chunk)
+        closing = "\n]" if text.endswith("\n]") else "]"
+        yield ("[" if first else item_separator) + text[1:-len(closing)]
+        first = False
+    yield "[]" if first else closing
+
+
+def _write_json_sheet(p: Path, df: pd.DataFrame, fmt: Mapping[str, Any]) -> None:
+    encode, item_separator = _json_encoder(fmt)
+    # Stream records chunk by chunk instead of materializing the whole list.
+    with open(p, "w", encoding="utf-8", newline="\n") as fh:
+        fh.writelines(_iter_json_array(_iter_record_chunks(df), encode, item_separator))
+        fh.write("\n")  # keep Git diffs tidy
+
+
+def _read_meta_sidecar(in_dir: Path) -> dict[str, Any] | None:
+    sidecar = in_dir / "_meta.yaml"
+    if not sidecar.exists():
+        return None
+    with open(sidecar, encoding="utf-8") as fh:
+        meta = yaml_codec.safe_load(fh)
+    return meta if isinstance(meta, dict) else None
+
+
+def _write_meta_sidecar(out_dir: Path, meta: Any) -> None:
+    if meta is None or not isinstance(meta, dict):
+        return
+    with open(out_dir / "_meta.yaml", "w", encoding="utf-8", newline="\n") as fh:
+        yaml.safe_dump(meta, fh, default_flow_style=False, allow_unicode=True)
+
+
 class JSONBackend(BackendBase):
     """
     Backend for a directory of JSON files, one file per sheet (e.g. products.json).
@@ -87,22 +162,22 @@ class JSONBackend(BackendBase):
                 "Use 'input: { kind: json_dir, path: ./in, options: {...} }'."
             )
         in_dir = Path(path)
-        out: Frames = {}
-        for p in sorted(in_dir.glob("*.json")):
-            df = pd.read_json(p, dtype=str, convert_dates=False)
-            df = df.where(pd.notnull(df), "")  # normalize empties as ""
-            out[p.stem] = df
+        files = sorted(in_dir.glob("*.json"))
+        frames = map_sheet_files(_read_json_sheet, files, options=options)
+        out: Frames = {p.stem: df for p, df in zip(files, frames)}
 
         # --- read optional _meta sidecar ------------------------------------
-        sidecar = in_dir / "_meta.yaml"
-        if sidecar.exists():
-            with open(sidecar, encoding="utf-8") as fh:
-                meta = yaml.safe_load(fh)
-            if isinstance(meta, dict):
-                out["_meta"] = meta  # type: ignore[assignment]
+        meta = _read_meta_sidecar(in_dir)
+        if meta is not None:
+            out["_meta"] = meta  # type: ignore[assignment]
 
         return out
 
+    def open_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> LazyFrames:
+        in_dir = Path(path)
+        files = sorted(in_dir.glob("*.json"))
+        return LazyFrames({p.stem: partial(_read_json_sheet, p) for p in files}, meta=_read_meta_sidecar(in_dir))
+
     def write_multi(self, frames: Frames, path: str, options: BackendOptions | None = None) -> None:
 
         if isinstance(path, dict):
@@ -120,39 +195,20 @@ class JSONBackend(BackendBase):
                 "indent": 2,
                 "sort_keys": False,     # preserve DataFrame column order
                 "ensure_ascii": False,
+                "engine": "json",       # or "orjson" (optional dependency)
         }
         fmt.update(_json_format_overrides(options))
 
-        for name, df in frames.items():
-            if name == "_meta":
-                continue  # handled separately as sidecar below
-            p = out_dir / f"{name}.json"
-            # Normalize NaNs to ""; order follows the DataFrame columns.
-            clean = df.where(pd.notnull(df), "")
-            if isinstance(clean.columns, pd.MultiIndex):
-                # FTR-MULTIHEADER-P2 default: MultiIndex headers become nested JSON objects.
-                records = _records_nested_from_multiindex(clean)
-            else:
-                records = clean.to_dict(orient="records")
-            # Write records.
-            with open(p, "w", encoding="utf-8", newline="\n") as fh:
-                if fmt["pretty"]:
-                    json.dump(records, fh, ensure_ascii=fmt["ensure_ascii"],
-                              indent=fmt["indent"],
-                              sort_keys=fmt["sort_keys"])
-                    fh.write("\n")  # keep Git diffs tidy
-                else:
-                    json.dump(records, fh, ensure_ascii=fmt["ensure_ascii"],
-                              separators=(",", ":"),  # compact
-                              sort_keys=fmt["sort_keys"])
-                    fh.write("\n")
+        # _meta is handled separately as sidecar below.
+        sheets = [(name, df) for name, df in frames.items() if name != "_meta"]
+        map_sheet_files(
+            lambda item: _write_json_sheet(out_dir / f"{item[0]}.json", item[1], fmt),
+            sheets,
+            options=options,
+        )
 
         # --- write optional _meta sidecar -----------------------------------
-        meta = frames.get("_meta")
-        if meta is not None and isinstance(meta, dict):
-            sidecar = out_dir / "_meta.yaml"
-            with open(sidecar, "w", encoding="utf-8", newline="\n") as fh:
-                yaml.safe_dump(meta, fh, default_flow_style=False, allow_unicode=True)
+        _write_meta_sidecar(out_dir, frames.get("_meta"))
 
 # ---- Test-facing convenience wrappers (kept for compatibility) ----
 
@@ -164,6 +220,13 @@ def read_json_dir(path: str, *, header_levels: int = 1, options: Mapping[str, An
     return JSONBackend().read_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
 
 
+def open_json_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> LazyFrames:
+    """
+    Open a directory of ``.json`` files; each sheet is read on first access.
+    """
+    return JSONBackend().open_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
 def write_json_dir(
     frames: Frames,
     path: str | os.PathLike[str],
@@ -0,0 +1,219 @@
+"""Directory of JSON Lines files, one file per sheet and one record per line.
+
+Unlike ``json_dir`` (one JSON array per sheet) a ``.jsonl`` file can be read
+and written a chunk of records at a time and appended to line by line. Files
+may be gzip-compressed (``<sheet>.jsonl.gz``); the ``_meta.yaml`` sidecar
+follows the ``json_dir`` convention.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from functools import partial
+import gzip
+from itertools import islice
+import io
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Dict
+
+import pandas as pd
+
+from .base import BackendBase, BackendOptions, backend_option, coerce_backend_options
+from .json_backend import (
+    _iter_record_chunks,
+    _json_encoder,
+    _json_format_overrides,
+    _read_meta_sidecar,
+    _write_meta_sidecar,
+)
+from .lazy_frames import LazyFrames
+from .sheet_files import map_sheet_files
+
+Frames = Dict[str, pd.DataFrame]
+
+JSONL_SUFFIX = ".jsonl"
+GZIP_SUFFIX = ".jsonl.gz"
+DEFAULT_CHUNK_ROWS = 50_000
+_COMPRESSIONS = (None, "gzip")
+
+
+def _chunk_rows(options: BackendOptions | Mapping[str, Any] | None) -> int:
+    chunk_rows = backend_option(options, "chunk_rows")
+    if chunk_rows is None:
+        return DEFAULT_CHUNK_ROWS
+    if isinstance(chunk_rows, bool) or not isinstance(chunk_rows, int) or chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be a positive integer, got {chunk_rows!r}")
+    return chunk_rows
+
+
+def _compression(options: BackendOptions | Mapping[str, Any] | None) -> str | None:
+    compression = backend_option(options, "compression")
+    if compression not in _COMPRESSIONS:
+        raise ValueError(f"Unsupported jsonl compression {compression!r}; expected 'gzip' or none")
+    return compression
+
+
+def _sheet_name(p: Path) -> str:
+    return p.name[: -len(GZIP_SUFFIX)] if p.name.endswith(GZIP_SUFFIX) else p.stem
+
+
+def _sheet_files(in_dir: Path) -> dict[str, Path]:
+    files: dict[str, Path] = {}
+    for p in sorted([*in_dir.glob(f"*{JSONL_SUFFIX}"), *in_dir.glob(f"*{GZIP_SUFFIX}")]):
+        name = _sheet_name(p)
+        if name in files:
+            raise ValueError(f"Sheet {name!r} exists both plain and gzip-compressed in {in_dir}")
+        files[name] = p
+    return files
+
+
+def _open_text(p: Path, mode: str) -> IO[str]:
+    if p.name.endswith(GZIP_SUFFIX):
+        # mtime=0 keeps compressed output byte-stable across runs.
+        binary = gzip.GzipFile(p, mode + "b", mtime=0)
+        return io.TextIOWrapper(binary, encoding="utf-8", newline="\n")
+    return open(p, mode, encoding="utf-8", newline="\n")
+
+
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _cell_texts(values: list[Any]) -> list[str]:
+    # Same cell text as ``json_dir`` (``pd.read_json(dtype=str)``); null is empty.
+    return [v if type(v) is str else _cell_text(v) for v in values]
+
+
+def _records_frame(records: list[dict[str, Any]]) -> pd.DataFrame:
+    columns: dict[str, None] = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    return pd.DataFrame(
+        {key: _cell_texts([record.get(key) for record in records]) for key in columns},
+        index=range(len(records)),
+    )
+
+
+def _decode_lines(p: Path, numbered_lines: list[tuple[int, str]]) -> list[dict[str, Any]]:
+    lines = [(line_no, line) for line_no, line in numbered_lines if line.strip()]
+    try:
+        # One decoder call per chunk instead of one per line.
+        records = json.loads("[" + ",".join(line for _, line in lines) + "]")
+    except json.JSONDecodeError:
+        records = []
+    if len(records) != len(lines) or not all(isinstance(record, dict) for record in records):
+        for line_no, line in lines:  # locate the offending line
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{p}:{line_no}: invalid JSON: {exc.msg}") from exc
+            if not isinstance(record, dict):
+                raise ValueError(f"{p}:{line_no}: expected a JSON object per line")
+    return records
+
+
+def iter_jsonl_sheet(path: str | os.PathLike[str], *, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield a ``.jsonl`` / ``.jsonl.gz`` sheet as DataFrames of ``chunk_rows`` records.
+
+    Cells are strings as in ``json_dir``; keys missing from a record read as
+    ``""``. Blank lines are skipped.
+    """
+    p = Path(path)
+    with _open_text(p, "r") as fh:
+        lines = enumerate(fh, start=1)
+        while chunk := list(islice(lines, chunk_rows)):
+            records = _decode_lines(p, chunk)
+            if records:
+                yield _records_frame(records)
+
+
+def _read_jsonl_sheet(p: Path, chunk_rows: int) -> pd.DataFrame:
+    chunks = list(iter_jsonl_sheet(p, chunk_rows=chunk_rows))
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    df = pd.concat(chunks, ignore_index=True)
+    return df.where(pd.notnull(df), "")  # keys absent from a whole chunk
+
+
+def _write_jsonl_sheet(p: Path, df: pd.DataFrame, fmt: Mapping[str, Any]) -> None:
+    encode, _ = _json_encoder({**fmt, "pretty": False})
+    with _open_text(p, "w") as fh:
+        for chunk in _iter_record_chunks(df):
+            fh.writelines(encode(record) + "\n" for record in chunk)
+
+
+class JSONLinesBackend(BackendBase):
+    """
+    Backend for a directory of JSON Lines files, one file per sheet (e.g. products.jsonl).
+    """
+
+    def read_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> Frames:
+        in_dir = Path(path)
+        files = _sheet_files(in_dir)
+        chunk_rows = _chunk_rows(options)
+        frames = map_sheet_files(lambda p: _read_jsonl_sheet(p, chunk_rows), files.values(), options=options)
+        out: Frames = dict(zip(files, frames))
+
+        meta = _read_meta_sidecar(in_dir)
+        if meta is not None:
+            out["_meta"] = meta  # type: ignore[assignment]
+        return out
+
+    def open_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> LazyFrames:
+        in_dir = Path(path)
+        chunk_rows = _chunk_rows(options)
+        return LazyFrames(
+            {name: partial(_read_jsonl_sheet, p, chunk_rows) for name, p in _sheet_files(in_dir).items()},
+            meta=_read_meta_sidecar(in_dir),
+        )
+
+    def write_multi(self, frames: Frames, path: str, options: BackendOptions | None = None) -> None:
+        out_dir = Path(os.fspath(path))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        suffix = GZIP_SUFFIX if _compression(options) == "gzip" else JSONL_SUFFIX
+        fmt = {
+                "sort_keys": False,     # preserve DataFrame column order
+                "ensure_ascii": False,
+                "engine": "json",
+        }
+        fmt.update(_json_format_overrides(options))
+
+        sheets = [(name, df) for name, df in frames.items() if name != "_meta"]
+        map_sheet_files(
+            lambda item: _write_jsonl_sheet(out_dir / f"{item[0]}{suffix}", item[1], fmt),
+            sheets,
+            options=options,
+        )
+        _write_meta_sidecar(out_dir, frames.get("_meta"))
+
+
+# ---- Router-facing convenience wrappers ----
+
+def read_jsonl_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> Frames:
+    """
+    Read a directory of ``.jsonl`` / ``.jsonl.gz`` files, one per sheet.
+    """
+    return JSONLinesBackend().read_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def open_jsonl_dir(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> LazyFrames:
+    """
+    Open a directory of ``.jsonl`` / ``.jsonl.gz`` files; each sheet is read on first access.
+    """
+    return JSONLinesBackend().open_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def write_jsonl_dir(
+    frames: Frames,
+    path: str | os.PathLike[str],
+    *,
+    options: Mapping[str, Any] | BackendOptions | None = None,
+) -> None:
+    """
+    Write frames to a directory of JSON Lines files, one per sheet.
+    """
+    JSONLinesBackend().write_multi(frames, os.fspath(path), options=coerce_backend_options(options))
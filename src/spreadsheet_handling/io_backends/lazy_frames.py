@@ -0,0 +1,128 @@
+"""Frames mapping whose sheets are read from the backend on first access.
+
+A directory or database backend can list its sheets without parsing them.
+``LazyFrames`` keeps one loader per sheet and calls it the first time the
+sheet's frame is requested, so sheets that a run never touches (or removes
+before touching) are never read. It is a plain ``dict`` to every consumer:
+membership, order and ``len`` work without loading, while any access to a
+value -- ``frames[name]``, ``get``, ``items``, ``values``, ``dict(frames)``,
+``{**frames}`` -- loads the sheets involved and caches them. ``copy()``
+returns another ``LazyFrames`` sharing the loaders, so a sheet is read once
+however many copies ask for it, and concurrent first accesses (scheduled
+steps run on threads) wait for a single load.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+import pandas as pd
+
+SheetLoader = Callable[[], pd.DataFrame]
+
+
+class _Pending:
+    __slots__ = ("_load", "_lock", "_frame")
+
+    def __init__(self, load: SheetLoader) -> None:
+        self._load = load
+        self._lock = threading.Lock()
+        self._frame: pd.DataFrame | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._frame is not None
+
+    def load(self) -> pd.DataFrame:
+        with self._lock:
+            if self._frame is None:
+                self._frame = self._load()
+            return self._frame
+
+    def __repr__(self) -> str:
+        return "<loaded>" if self.loaded else "<not loaded>"
+
+
+class LazyFrames(dict):
+    """``dict`` of frames where unread sheets are materialized on first access."""
+
+    def __init__(
+        self,
+        loaders: Mapping[str, SheetLoader] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__()
+        for name, load in (loaders or {}).items():
+            dict.__setitem__(self, name, _Pending(load))
+        if meta is not None:
+            dict.__setitem__(self, "_meta", meta)
+
+    def _materialize(self, key: Any, value: Any) -> Any:
+        if isinstance(value, _Pending):
+            value = value.load()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def pending(self) -> list[str]:
+        """Names of the sheets that have not been loaded yet."""
+        return [key for key, value in dict.items(self) if isinstance(value, _Pending) and not value.loaded]
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._materialize(key, dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    # Overriding __iter__ makes dict(), {**x} and dict.update() copy through
+    # keys() and __getitem__ instead of the raw storage.
+    def __iter__(self) -> Iterator[Any]:
+        return dict.__iter__(self)
+
+    def items(self) -> Any:
+        for key in list(dict.keys(self)):
+            self[key]
+        return dict.items(self)
+
+    def values(self) -> Any:
+        self.items()
+        return dict.values(self)
+
+    def copy(self) -> LazyFrames:
+        """Shallow copy that leaves unread sheets unread."""
+        copied = LazyFrames()
+        dict.update(copied, dict.items(self))
+        return copied
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = dict.popitem(self)
+        if isinstance(value, _Pending):
+            value = value.load()
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def __eq__(self, other: object) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return dict, (dict(self.items()),)
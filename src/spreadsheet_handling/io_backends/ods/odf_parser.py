@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import ast
-from collections import defaultdict
 import csv
 import json
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, NamedTuple, Sequence
 
 from odf.element import Element
-from odf.namespaces import FONS, OFFICENS, STYLENS, TABLENS, TEXTNS
+from odf.namespaces import FONS, STYLENS, TABLENS, TEXTNS
 from odf.opendocument import load
 from odf.style import (
     ParagraphProperties,
@@ -20,11 +19,9 @@ from odf.style import (
 )
 from odf.table import (
     ContentValidation as OdfContentValidation,
-    CoveredTableCell,
     DatabaseRange,
     NamedRange as OdfNamedRange,
     Table,
-    TableCell,
     TableColumn,
     TableRow,
 )
@@ -33,15 +30,30 @@ from odf.text import S
 from spreadsheet_handling.io_backends.presentation_meta import (
     apply_cell_addressed_presentation_meta,
 )
+from spreadsheet_handling.io_backends.ods.odf_stream_reader import read_ods_package
 from spreadsheet_handling.io_backends.ods.parser_interpretation import (
     ParsedTable,
     build_sheet_meta_hints,
     build_visible_sheet_ir,
 )
+from spreadsheet_handling.io_backends.ods.table_source import (
+    OdsCell,
+    OdsColumn,
+    OdsPackage,
+    OdsTableSource,
+    StyleBlock,
+    StyleRecord,
+    TableFilter,
+    TableGridBuilder,
+    iter_column_blocks,
+    iter_style_blocks,
+    typed_cell_value,
+)
 from spreadsheet_handling.io_backends.parser_limits import (
     DEFAULT_LIMITS,
     ParserLimits,
 )
+from spreadsheet_handling.io_backends.sheet_selection import SheetSelection
 from spreadsheet_handling.rendering.ir import (
     DataValidationSpec,
     NamedRange,
@@ -87,20 +99,7 @@ def _cell_value(cell: Element) -> str:
     text = _cell_text(cell)
     if text:
         return text
-
-    value_type = cell.attributes.get((OFFICENS, "value-type"))
-    if value_type == "string":
-        return str(cell.attributes.get((OFFICENS, "string-value"), ""))
-    if value_type == "float":
-        return str(cell.attributes.get((OFFICENS, "value"), ""))
-    if value_type == "boolean":
-        value = str(cell.attributes.get((OFFICENS, "boolean-value"), "false"))
-        return "TRUE" if value == "true" else "FALSE"
-    if value_type == "date":
-        return str(cell.attributes.get((OFFICENS, "date-value"), ""))
-    if value_type == "time":
-        return str(cell.attributes.get((OFFICENS, "time-value"), ""))
-    return ""
+    return typed_cell_value(lambda namespace, local: cell.attributes.get((namespace, local)))
 
 
 _CM_RE = re.compile(r"([\d.]+)\s*(cm|mm|in|pt|px)")
@@ -139,106 +138,24 @@ def _ods_rotation_to_xlsx(ods_rotation: int) -> int:
     return min(90 + cw, 180)
 
 
-def _build_column_style_map(doc) -> dict[str, str]:
+def _build_column_style_map(styles: Sequence[StyleRecord]) -> dict[str, str]:
     """Return mapping {style_name -> column-width CSS string} for table-column styles."""
     result: dict[str, str] = {}
     col_props_name = TableColumnProperties().qname
-    for style in doc.getElementsByType(Style):
-        if style.attributes.get((STYLENS, "family")) != "table-column":
+    for style in styles:
+        if style.family != "table-column":
             continue
-        name = style.attributes.get((STYLENS, "name"))
-        if not name:
+        if not style.name:
             continue
-        for child in style.childNodes:
-            if not isinstance(child, Element) or child.qname != col_props_name:
+        for qname, attributes in style.children:
+            if qname != col_props_name:
                 continue
-            width = child.attributes.get(
+            width = attributes.get(
                 (STYLENS, "column-width"),
-                child.attributes.get((TABLENS, "column-width"), ""),
+                attributes.get((TABLENS, "column-width"), ""),
             )
             if width:
-                result[str(name)] = str(width)
-    return result
-
-
-def _extract_ods_column_widths(
-    table: Element,
-    col_style_map: dict[str, str],
-    *,
-    max_col: int,
-    limits: ParserLimits = DEFAULT_LIMITS,
-) -> dict[str, dict] | None:
-    """Return {col_letter: {width, source}} for explicitly styled table columns.
-
-    Iteration is clipped to ``max_col`` (the parsed content extent) so that
-    sheet-wide LibreOffice column-width fillers (a styled table-column with a
-    huge ``number-columns-repeated``) do not produce one metadata entry per
-    filler column. ``limits`` is honoured on a per-axis basis as
-    defense-in-depth against inputs that still declare implausible repeats
-    within the content extent.
-    """
-    if max_col <= 0:
-        return None
-    result: dict[str, dict] = {}
-    table_col_name = TableColumn().qname
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}' column widths"
-    col_index = 1
-    for child in table.childNodes:
-        if not isinstance(child, Element) or child.qname != table_col_name:
-            continue
-        if col_index > max_col:
-            break
-        repeat = int(child.attributes.get((TABLENS, "number-columns-repeated"), 1))
-        limits.enforce(context=context, cols=col_index + repeat - 1)
-        effective_repeat = min(repeat, max_col - col_index + 1)
-        style_name = child.attributes.get((TABLENS, "style-name"))
-        if style_name and effective_repeat > 0:
-            width_str = col_style_map.get(str(style_name))
-            if width_str:
-                cm = _ods_length_to_cm(width_str)
-                if cm is not None:
-                    excel_width = _ods_cm_to_excel_chars(cm)
-                    for i in range(effective_repeat):
-                        letter = _column_letters(col_index + i)
-                        result[letter] = {"width": excel_width, "source": "workbook"}
-        col_index += repeat
-    return result if result else None
-
-
-def _build_ods_column_default_cell_style_map(
-    table: Element,
-    *,
-    max_col: int,
-    limits: ParserLimits = DEFAULT_LIMITS,
-) -> dict[int, str]:
-    """Return {col_index: default_cell_style_name} for table-column elements within max_col.
-
-    Used as a fallback by alignment and rotation extractors: when a cell carries no
-    explicit ``table:style-name``, the containing column's ``table:default-cell-style-name``
-    provides the style to resolve.  Clipped to ``max_col`` so that LibreOffice sheet-wide
-    column fillers do not produce one entry per theoretical column position.
-    """
-    if max_col <= 0:
-        return {}
-    result: dict[int, str] = {}
-    table_col_name = TableColumn().qname
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}' column default cell styles"
-    col_index = 1
-    for child in table.childNodes:
-        if not isinstance(child, Element) or child.qname != table_col_name:
-            continue
-        if col_index > max_col:
-            break
-        repeat = int(child.attributes.get((TABLENS, "number-columns-repeated"), 1))
-        limits.enforce(context=context, cols=col_index + repeat - 1)
-        effective_repeat = min(repeat, max_col - col_index + 1)
-        default_style = child.attributes.get((TABLENS, "default-cell-style-name"))
-        if default_style and effective_repeat > 0:
-            for i in range(effective_repeat):
-                result[col_index + i] = str(default_style)
-        col_index += repeat
+                result[str(style.name)] = str(width)
     return result
 
 
@@ -255,7 +172,7 @@ _ODS_HORIZONTAL_ALIGNMENT_MAP: dict[str, str] = {
 }
 
 
-def _build_cell_horizontal_alignment_map(doc) -> dict[str, str]:
+def _build_cell_horizontal_alignment_map(styles: Sequence[StyleRecord]) -> dict[str, str]:
     """Return mapping {style_name -> canonical horizontal alignment}.
 
     Reads ``fo:text-align`` from any ``style:paragraph-properties`` child of
@@ -264,130 +181,24 @@ def _build_cell_horizontal_alignment_map(doc) -> dict[str, str]:
     """
     result: dict[str, str] = {}
     para_props_name = ParagraphProperties().qname
-    for style in doc.getElementsByType(Style):
-        if style.attributes.get((STYLENS, "family")) != "table-cell":
+    for style in styles:
+        if style.family != "table-cell":
             continue
-        name = style.attributes.get((STYLENS, "name"))
-        if not name:
+        if not style.name:
             continue
-        for child in style.childNodes:
-            if not isinstance(child, Element) or child.qname != para_props_name:
+        for qname, attributes in style.children:
+            if qname != para_props_name:
                 continue
-            raw = child.attributes.get((FONS, "text-align"))
+            raw = attributes.get((FONS, "text-align"))
             if raw is None:
                 continue
             canonical = _ODS_HORIZONTAL_ALIGNMENT_MAP.get(str(raw).strip().lower())
             if canonical:
-                result[str(name)] = canonical
+                result[str(style.name)] = canonical
                 break
     return result
 
 
-def _extract_ods_horizontal_alignments(
-    table: Element,
-    alignment_map: dict[str, str],
-    *,
-    max_row: int,
-    max_col: int,
-    limits: ParserLimits = DEFAULT_LIMITS,
-) -> dict[str, dict] | None:
-    """Return {cell_address: {horizontal, source}} for cells with a canonical
-    horizontal alignment style.
-
-    Iteration is clipped to ``max_row`` x ``max_col`` (the parsed content
-    extent) so that LibreOffice "select all + left-align" filler patterns do
-    not expand ``row_repeat`` x ``col_repeat`` into one metadata entry per
-    implied address. ``limits`` is honoured on per-axis and per-cell bases as
-    defense-in-depth against inputs that still declare implausible repeats
-    within the content extent.  When a cell carries no explicit style the
-    column's ``table:default-cell-style-name`` is used as a fallback.
-    """
-    if max_row <= 0 or max_col <= 0:
-        return None
-    result: dict[str, dict] = {}
-    col_default_style_map = _build_ods_column_default_cell_style_map(
-        table, max_col=max_col, limits=limits
-    )
-    table_row_name = TableRow().qname
-    table_cell_name = TableCell().qname
-    covered_cell_name = CoveredTableCell().qname
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}' horizontal alignments"
-
-    row_index = 1
-    for child in table.childNodes:
-        if not isinstance(child, Element) or child.qname != table_row_name:
-            continue
-        if row_index > max_row:
-            break
-        row_repeat = int(child.attributes.get((TABLENS, "number-rows-repeated"), 1))
-        limits.enforce(context=context, rows=row_index + row_repeat - 1)
-        effective_row_repeat = min(row_repeat, max_row - row_index + 1)
-        col_index = 1
-        for cell in child.childNodes:
-            if not isinstance(cell, Element) or cell.qname not in (table_cell_name, covered_cell_name):
-                continue
-            if col_index > max_col:
-                break
-            col_repeat = int(cell.attributes.get((TABLENS, "number-columns-repeated"), 1))
-            limits.enforce(context=context, cols=col_index + col_repeat - 1)
-            effective_col_repeat = min(col_repeat, max_col - col_index + 1)
-            if (
-                cell.qname != covered_cell_name
-                and effective_row_repeat > 0
-                and effective_col_repeat > 0
-            ):
-                cell_style_name = (
-                    cell.attributes.get((TABLENS, "style-name"))
-                    or cell.attributes.get((STYLENS, "style-name"))
-                )
-                if cell_style_name:
-                    canonical = alignment_map.get(str(cell_style_name))
-                    if canonical:
-                        limits.enforce(
-                            context=context,
-                            cells=len(result)
-                            + effective_row_repeat * effective_col_repeat,
-                        )
-                        for r_off in range(effective_row_repeat):
-                            for c_off in range(effective_col_repeat):
-                                addr = (
-                                    f"{_column_letters(col_index + c_off)}"
-                                    f"{row_index + r_off}"
-                                )
-                                result[addr] = {
-                                    "horizontal": canonical,
-                                    "source": "workbook",
-                                }
-                elif col_default_style_map:
-                    # Per-column fallback: each column in a repeated span may
-                    # carry a different default-cell-style-name.
-                    limits.enforce(
-                        context=context,
-                        cells=len(result)
-                        + effective_row_repeat * effective_col_repeat,
-                    )
-                    for r_off in range(effective_row_repeat):
-                        for c_off in range(effective_col_repeat):
-                            fallback_style = col_default_style_map.get(col_index + c_off)
-                            if not fallback_style:
-                                continue
-                            canonical = alignment_map.get(str(fallback_style))
-                            if not canonical:
-                                continue
-                            addr = (
-                                f"{_column_letters(col_index + c_off)}"
-                                f"{row_index + r_off}"
-                            )
-                            result[addr] = {
-                                "horizontal": canonical,
-                                "source": "workbook",
-                            }
-            col_index += col_repeat
-        row_index += row_repeat
-    return result if result else None
-
-
 _ODS_VERTICAL_ALIGNMENT_MAP: dict[str, str] = {
     "top": "top",
     "middle": "center",  # the one intrinsic ODF ↔ OOXML vocabulary remap.
@@ -398,7 +209,7 @@ _ODS_VERTICAL_ALIGNMENT_MAP: dict[str, str] = {
 }
 
 
-def _build_cell_vertical_alignment_map(doc) -> dict[str, str]:
+def _build_cell_vertical_alignment_map(styles: Sequence[StyleRecord]) -> dict[str, str]:
     """Return mapping {style_name -> canonical vertical alignment}.
 
     Reads ``style:vertical-align`` from any ``style:table-cell-properties``
@@ -407,258 +218,229 @@ def _build_cell_vertical_alignment_map(doc) -> dict[str, str]:
     """
     result: dict[str, str] = {}
     cell_props_name = TableCellProperties().qname
-    for style in doc.getElementsByType(Style):
-        if style.attributes.get((STYLENS, "family")) != "table-cell":
+    for style in styles:
+        if style.family != "table-cell":
             continue
-        name = style.attributes.get((STYLENS, "name"))
-        if not name:
+        if not style.name:
             continue
-        for child in style.childNodes:
-            if not isinstance(child, Element) or child.qname != cell_props_name:
+        for qname, attributes in style.children:
+            if qname != cell_props_name:
                 continue
-            raw = child.attributes.get((STYLENS, "vertical-align"))
+            raw = attributes.get((STYLENS, "vertical-align"))
             if raw is None:
                 continue
             canonical = _ODS_VERTICAL_ALIGNMENT_MAP.get(str(raw).strip().lower())
             if canonical:
-                result[str(name)] = canonical
+                result[str(style.name)] = canonical
                 break
     return result
 
 
-def _extract_ods_vertical_alignments(
-    table: Element,
-    alignment_map: dict[str, str],
-    *,
-    max_row: int,
-    max_col: int,
-    limits: ParserLimits = DEFAULT_LIMITS,
-) -> dict[str, dict] | None:
-    """Return {cell_address: {vertical, source}} for cells with a canonical
-    vertical alignment style.
-
-    Iteration is clipped to ``max_row`` x ``max_col`` (the parsed content
-    extent) so that LibreOffice "select all + vertical-center" filler
-    patterns do not expand ``row_repeat`` x ``col_repeat`` into one metadata
-    entry per implied address. ``limits`` is honoured on per-axis and per-cell
-    bases as defense-in-depth against inputs that still declare implausible
-    repeats within the content extent.  When a cell carries no explicit style
-    the column's ``table:default-cell-style-name`` is used as a fallback.
-    """
-    if max_row <= 0 or max_col <= 0:
-        return None
-    result: dict[str, dict] = {}
-    col_default_style_map = _build_ods_column_default_cell_style_map(
-        table, max_col=max_col, limits=limits
-    )
-    table_row_name = TableRow().qname
-    table_cell_name = TableCell().qname
-    covered_cell_name = CoveredTableCell().qname
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}' vertical alignments"
-
-    row_index = 1
-    for child in table.childNodes:
-        if not isinstance(child, Element) or child.qname != table_row_name:
-            continue
-        if row_index > max_row:
-            break
-        row_repeat = int(child.attributes.get((TABLENS, "number-rows-repeated"), 1))
-        limits.enforce(context=context, rows=row_index + row_repeat - 1)
-        effective_row_repeat = min(row_repeat, max_row - row_index + 1)
-        col_index = 1
-        for cell in child.childNodes:
-            if not isinstance(cell, Element) or cell.qname not in (table_cell_name, covered_cell_name):
-                continue
-            if col_index > max_col:
-                break
-            col_repeat = int(cell.attributes.get((TABLENS, "number-columns-repeated"), 1))
-            limits.enforce(context=context, cols=col_index + col_repeat - 1)
-            effective_col_repeat = min(col_repeat, max_col - col_index + 1)
-            if (
-                cell.qname != covered_cell_name
-                and effective_row_repeat > 0
-                and effective_col_repeat > 0
-            ):
-                cell_style_name = (
-                    cell.attributes.get((TABLENS, "style-name"))
-                    or cell.attributes.get((STYLENS, "style-name"))
-                )
-                if cell_style_name:
-                    canonical = alignment_map.get(str(cell_style_name))
-                    if canonical:
-                        limits.enforce(
-                            context=context,
-                            cells=len(result)
-                            + effective_row_repeat * effective_col_repeat,
-                        )
-                        for r_off in range(effective_row_repeat):
-                            for c_off in range(effective_col_repeat):
-                                addr = (
-                                    f"{_column_letters(col_index + c_off)}"
-                                    f"{row_index + r_off}"
-                                )
-                                result[addr] = {
-                                    "vertical": canonical,
-                                    "source": "workbook",
-                                }
-                elif col_default_style_map:
-                    # Per-column fallback: each column in a repeated span may
-                    # carry a different default-cell-style-name.
-                    limits.enforce(
-                        context=context,
-                        cells=len(result)
-                        + effective_row_repeat * effective_col_repeat,
-                    )
-                    for r_off in range(effective_row_repeat):
-                        for c_off in range(effective_col_repeat):
-                            fallback_style = col_default_style_map.get(col_index + c_off)
-                            if not fallback_style:
-                                continue
-                            canonical = alignment_map.get(str(fallback_style))
-                            if not canonical:
-                                continue
-                            addr = (
-                                f"{_column_letters(col_index + c_off)}"
-                                f"{row_index + r_off}"
-                            )
-                            result[addr] = {
-                                "vertical": canonical,
-                                "source": "workbook",
-                            }
-            col_index += col_repeat
-        row_index += row_repeat
-    return result if result else None
-
-
-def _build_cell_rotation_map(doc) -> dict[str, int]:
+def _build_cell_rotation_map(styles: Sequence[StyleRecord]) -> dict[str, int]:
     """Return mapping {style_name -> ods_rotation_angle} for table-cell styles with rotation."""
     result: dict[str, int] = {}
-    for style in doc.getElementsByType(Style):
-        if style.attributes.get((STYLENS, "family")) != "table-cell":
+    for style in styles:
+        if style.family != "table-cell":
             continue
-        name = style.attributes.get((STYLENS, "name"))
-        if not name:
+        if not style.name:
             continue
-        for child in style.childNodes:
-            if not isinstance(child, Element):
-                continue
-            rotation = child.attributes.get((STYLENS, "rotation-angle"))
+        for _, attributes in style.children:
+            rotation = attributes.get((STYLENS, "rotation-angle"))
             if rotation is not None:
                 try:
-                    result[str(name)] = int(rotation)
+                    result[str(style.name)] = int(rotation)
                 except (TypeError, ValueError):
                     pass
     return result
 
 
-def _extract_ods_text_orientations(
-    table: Element,
-    rotation_map: dict[str, int],
+# Cell-addressed presentation families as (limit-context label, value key),
+# in the order of the ``CellPresentation`` tuple.
+_CELL_PRESENTATION_FAMILIES: tuple[tuple[str, str], ...] = (
+    ("text orientations", "rotation"),
+    ("horizontal alignments", "horizontal"),
+    ("vertical alignments", "vertical"),
+)
+
+# (XLSX rotation, horizontal alignment, vertical alignment) of one table-cell
+# style; None where the style carries no canonical value for that family.
+CellPresentation = tuple[int | None, str | None, str | None]
+
+
+def _build_cell_presentation_map(styles: Sequence[StyleRecord]) -> dict[str, CellPresentation]:
+    """Return mapping {style_name -> CellPresentation} for table-cell styles.
+
+    Rotations that do not map to a positive XLSX rotation are dropped, like
+    out-of-vocabulary alignment values, so a style only appears here when it
+    contributes to at least one family.
+    """
+    rotation_map = _build_cell_rotation_map(styles)
+    horizontal_map = _build_cell_horizontal_alignment_map(styles)
+    vertical_map = _build_cell_vertical_alignment_map(styles)
+    result: dict[str, CellPresentation] = {}
+    for style_name in {*rotation_map, *horizontal_map, *vertical_map}:
+        ods_rotation = rotation_map.get(style_name)
+        xlsx_rotation = _ods_rotation_to_xlsx(ods_rotation) if ods_rotation else 0
+        presentation = (
+            xlsx_rotation if xlsx_rotation > 0 else None,
+            horizontal_map.get(style_name),
+            vertical_map.get(style_name),
+        )
+        if any(value is not None for value in presentation):
+            result[style_name] = presentation
+    return result
+
+
+class OdsPresentation(NamedTuple):
+    """Presentation metadata of one table, keyed like the ``_meta`` carriers."""
+
+    column_widths: dict[str, dict] | None
+    text_orientations: dict[str, dict] | None
+    horizontal_alignments: dict[str, dict] | None
+    vertical_alignments: dict[str, dict] | None
+
+
+class _PresentationWalk:
+    """Collect every presentation family of one table in a single pass.
+
+    ``source.columns`` is walked once for column widths and the per-column
+    ``table:default-cell-style-name`` fallback; ``source.style_rows`` is walked
+    once for text orientations and horizontal / vertical alignments. Both
+    walks are clipped to the parsed content extent (see ``iter_column_blocks``
+    / ``iter_style_blocks``) and ``limits`` additionally caps the number of
+    addresses per family.
+    """
+
+    def __init__(
+        self,
+        source: OdsTableSource,
+        *,
+        max_row: int,
+        max_col: int,
+        limits: ParserLimits,
+    ) -> None:
+        self.source = source
+        self.max_row = max_row
+        self.max_col = max_col
+        self.limits = limits
+        self.context = f"ODS sheet '{_table_context_name(source)}'"
+        self.column_defaults: dict[int, str] = {}
+        self.cell_results: tuple[dict[str, dict], ...] = tuple(
+            {} for _ in _CELL_PRESENTATION_FAMILIES
+        )
+
+    def walk_columns(self, col_style_map: dict[str, str]) -> dict[str, dict]:
+        widths: dict[str, dict] = {}
+        for block in iter_column_blocks(
+            self.source.columns,
+            max_col=self.max_col,
+            limits=self.limits,
+            context=f"{self.context} column widths",
+        ):
+            column = block.column
+            if column.default_cell_style:
+                for offset in range(block.repeat):
+                    self.column_defaults[block.col + offset] = column.default_cell_style
+            width_str = col_style_map.get(column.style_name) if column.style_name else None
+            cm = _ods_length_to_cm(width_str) if width_str else None
+            if cm is None:
+                continue
+            excel_width = _ods_cm_to_excel_chars(cm)
+            for offset in range(block.repeat):
+                widths[_column_letters(block.col + offset)] = {
+                    "width": excel_width,
+                    "source": "workbook",
+                }
+        return widths
+
+    def walk_cells(self, cell_styles: dict[str, CellPresentation]) -> None:
+        for block in iter_style_blocks(
+            self.source.style_rows,
+            max_row=self.max_row,
+            max_col=self.max_col,
+            limits=self.limits,
+            context=f"{self.context} cell styles",
+        ):
+            if block.style_name:
+                presentation = cell_styles.get(block.style_name)
+                if presentation:
+                    self._add_styled_block(block, presentation)
+            elif self.column_defaults:
+                self._add_column_default_block(block, cell_styles)
+
+    def _enforce_cells(self, family: int, block: StyleBlock) -> None:
+        self.limits.enforce(
+            context=f"{self.context} {_CELL_PRESENTATION_FAMILIES[family][0]}",
+            cells=len(self.cell_results[family]) + block.row_repeat * block.col_repeat,
+        )
+
+    def _add_styled_block(self, block: StyleBlock, presentation: CellPresentation) -> None:
+        addresses: list[str] = []
+        for family, value in enumerate(presentation):
+            if value is None:
+                continue
+            self._enforce_cells(family, block)
+            if not addresses:
+                letters = [_column_letters(block.col + c_off) for c_off in range(block.col_repeat)]
+                addresses = [
+                    f"{letter}{block.row + r_off}"
+                    for r_off in range(block.row_repeat)
+                    for letter in letters
+                ]
+            key = _CELL_PRESENTATION_FAMILIES[family][1]
+            result = self.cell_results[family]
+            for addr in addresses:
+                result[addr] = {key: value, "source": "workbook"}
+
+    def _add_column_default_block(
+        self, block: StyleBlock, cell_styles: dict[str, CellPresentation]
+    ) -> None:
+        # Per-column fallback: each column in a repeated span may carry a
+        # different default-cell-style-name.
+        for family in range(len(_CELL_PRESENTATION_FAMILIES)):
+            self._enforce_cells(family, block)
+        for r_off in range(block.row_repeat):
+            for c_off in range(block.col_repeat):
+                fallback_style = self.column_defaults.get(block.col + c_off)
+                presentation = cell_styles.get(fallback_style) if fallback_style else None
+                if not presentation:
+                    continue
+                addr = f"{_column_letters(block.col + c_off)}{block.row + r_off}"
+                for family, value in enumerate(presentation):
+                    if value is not None:
+                        key = _CELL_PRESENTATION_FAMILIES[family][1]
+                        self.cell_results[family][addr] = {key: value, "source": "workbook"}
+
+
+def _extract_ods_presentation(
+    source: OdsTableSource,
+    col_style_map: dict[str, str],
+    cell_styles: dict[str, CellPresentation],
     *,
     max_row: int,
     max_col: int,
     limits: ParserLimits = DEFAULT_LIMITS,
-) -> dict[str, dict] | None:
-    """Return {cell_address: {rotation, source}} for cells with non-zero XLSX rotation.
+) -> OdsPresentation:
+    """Return column widths and cell-addressed presentation metadata of one table.
 
     Iteration is clipped to ``max_row`` x ``max_col`` (the parsed content
-    extent) so that LibreOffice "select all + rotate" filler patterns do not
+    extent) so that LibreOffice "select all + format" filler patterns do not
     expand ``row_repeat`` x ``col_repeat`` into one metadata entry per implied
-    address. ``limits`` is honoured on per-axis and per-cell bases as
-    defense-in-depth against inputs that still declare implausible repeats
-    within the content extent.  When a cell carries no explicit style the
-    column's ``table:default-cell-style-name`` is used as a fallback.
+    address. When a cell carries no explicit style the column's
+    ``table:default-cell-style-name`` is used as a fallback.
     """
-    if max_row <= 0 or max_col <= 0:
-        return None
-    result: dict[str, dict] = {}
-    col_default_style_map = _build_ods_column_default_cell_style_map(
-        table, max_col=max_col, limits=limits
+    walk = _PresentationWalk(source, max_row=max_row, max_col=max_col, limits=limits)
+    column_widths = walk.walk_columns(col_style_map)
+    walk.walk_cells(cell_styles)
+    text_orientations, horizontal_alignments, vertical_alignments = (
+        result or None for result in walk.cell_results
+    )
+    return OdsPresentation(
+        column_widths=column_widths or None,
+        text_orientations=text_orientations,
+        horizontal_alignments=horizontal_alignments,
+        vertical_alignments=vertical_alignments,
     )
-    table_row_name = TableRow().qname
-    table_cell_name = TableCell().qname
-    covered_cell_name = CoveredTableCell().qname
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}' text orientations"
-
-    row_index = 1
-    for child in table.childNodes:
-        if not isinstance(child, Element) or child.qname != table_row_name:
-            continue
-        if row_index > max_row:
-            break
-        row_repeat = int(child.attributes.get((TABLENS, "number-rows-repeated"), 1))
-        limits.enforce(context=context, rows=row_index + row_repeat - 1)
-        effective_row_repeat = min(row_repeat, max_row - row_index + 1)
-        col_index = 1
-        for cell in child.childNodes:
-            if not isinstance(cell, Element) or cell.qname not in (table_cell_name, covered_cell_name):
-                continue
-            if col_index > max_col:
-                break
-            col_repeat = int(cell.attributes.get((TABLENS, "number-columns-repeated"), 1))
-            limits.enforce(context=context, cols=col_index + col_repeat - 1)
-            effective_col_repeat = min(col_repeat, max_col - col_index + 1)
-            if (
-                cell.qname != covered_cell_name
-                and effective_row_repeat > 0
-                and effective_col_repeat > 0
-            ):
-                cell_style_name = (
-                    cell.attributes.get((TABLENS, "style-name"))
-                    or cell.attributes.get((STYLENS, "style-name"))
-                )
-                if cell_style_name:
-                    ods_rotation = rotation_map.get(str(cell_style_name))
-                    if ods_rotation:
-                        xlsx_rotation = _ods_rotation_to_xlsx(ods_rotation)
-                        if xlsx_rotation > 0:
-                            limits.enforce(
-                                context=context,
-                                cells=len(result)
-                                + effective_row_repeat * effective_col_repeat,
-                            )
-                            for r_off in range(effective_row_repeat):
-                                for c_off in range(effective_col_repeat):
-                                    addr = (
-                                        f"{_column_letters(col_index + c_off)}"
-                                        f"{row_index + r_off}"
-                                    )
-                                    result[addr] = {
-                                        "rotation": xlsx_rotation,
-                                        "source": "workbook",
-                                    }
-                elif col_default_style_map:
-                    # Per-column fallback: each column in a repeated span may
-                    # carry a different default-cell-style-name.
-                    limits.enforce(
-                        context=context,
-                        cells=len(result)
-                        + effective_row_repeat * effective_col_repeat,
-                    )
-                    for r_off in range(effective_row_repeat):
-                        for c_off in range(effective_col_repeat):
-                            fallback_style = col_default_style_map.get(col_index + c_off)
-                            if not fallback_style:
-                                continue
-                            ods_rotation = rotation_map.get(str(fallback_style))
-                            if not ods_rotation:
-                                continue
-                            xlsx_rotation = _ods_rotation_to_xlsx(ods_rotation)
-                            if xlsx_rotation <= 0:
-                                continue
-                            addr = (
-                                f"{_column_letters(col_index + c_off)}"
-                                f"{row_index + r_off}"
-                            )
-                            result[addr] = {
-                                "rotation": xlsx_rotation,
-                                "source": "workbook",
-                            }
-            col_index += col_repeat
-        row_index += row_repeat
-    return result if result else None
 
 
 def _store_workbook_meta(ir: WorkbookIR, workbook_meta: dict[str, Any]) -> None:
@@ -669,172 +451,203 @@ def _store_workbook_meta(ir: WorkbookIR, workbook_meta: dict[str, Any]) -> None:
     )
 
 
-def _parse_hidden_style_names(doc) -> set[str]:
+def _parse_hidden_style_names(styles: Sequence[StyleRecord]) -> set[str]:
     hidden_names: set[str] = set()
     table_properties_name = TableProperties().qname
 
-    for style in doc.getElementsByType(Style):
-        if style.attributes.get((STYLENS, "family")) != "table":
+    for style in styles:
+        if style.family != "table":
             continue
-        for child in style.childNodes:
-            if not isinstance(child, Element) or child.qname != table_properties_name:
+        for qname, attributes in style.children:
+            if qname != table_properties_name:
                 continue
-            if str(child.attributes.get((TABLENS, "display"), "true")).lower() == "false":
-                name = style.attributes.get((STYLENS, "name"))
-                if name:
-                    hidden_names.add(str(name))
+            if str(attributes.get((TABLENS, "display"), "true")).lower() == "false":
+                if style.name:
+                    hidden_names.add(str(style.name))
     return hidden_names
 
 
-def _table_is_hidden(table: Element, hidden_style_names: set[str]) -> bool:
-    style_name = table.attributes.get((TABLENS, "style-name"))
-    if style_name and str(style_name) in hidden_style_names:
+def _table_is_hidden(source: OdsTableSource, hidden_style_names: set[str]) -> bool:
+    return _is_hidden_table(source.name, source.style_name, hidden_style_names)
+
+
+def _is_hidden_table(name: str | None, style_name: str | None, hidden_style_names: set[str]) -> bool:
+    if style_name and style_name in hidden_style_names:
         return True
-    return str(table.attributes.get((TABLENS, "name"), "")) == "_meta"
+    return (name or "") == "_meta"
 
 
-def _parse_table_grid(
-    table: Element,
-    limits: ParserLimits = DEFAULT_LIMITS,
-) -> ParsedTable:
-    values: dict[tuple[int, int], str] = {}
-    merges: list[tuple[int, int, int, int]] = []
-    validation_cells: dict[str, list[tuple[int, int]]] = defaultdict(list)
+class _SelectedTables:
+    """``TableFilter`` keeping selected and hidden tables; records every table name."""
 
-    table_row_name = TableRow().qname
-    table_cell_name = TableCell().qname
-    covered_cell_name = CoveredTableCell().qname
+    def __init__(self, sheets: SheetSelection) -> None:
+        self.sheets = sheets
+        self.seen: list[str] = []
 
-    row_index = 1
-    max_row = 0
-    max_col = 0
-    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
-    context = f"ODS sheet '{table_name}'"
+    def __call__(self, name: str | None, style_name: str | None, styles: Sequence[StyleRecord]) -> bool:
+        self.seen.append(name or "Sheet1")
+        if self.sheets.selects(name or "Sheet1"):
+            return True
+        return _is_hidden_table(name, style_name, _parse_hidden_style_names(styles))
+
+
+def _table_context_name(source: OdsTableSource) -> str:
+    return source.name or "<unnamed>"
+
+
+_TABLE_CELL_QNAME = (TABLENS, "table-cell")
+_COVERED_TABLE_CELL_QNAME = (TABLENS, "covered-table-cell")
+
+
+def _dom_cell(cell: Element) -> OdsCell:
+    col_repeat = int(cell.attributes.get((TABLENS, "number-columns-repeated"), 1))
+    if cell.qname == _COVERED_TABLE_CELL_QNAME:
+        return OdsCell(True, "", 1, 1, None, col_repeat)
+    validation_name = cell.attributes.get((TABLENS, "content-validation-name"))
+    style_name = cell.attributes.get((TABLENS, "style-name")) or cell.attributes.get(
+        (STYLENS, "style-name")
+    )
+    return OdsCell(
+        False,
+        _cell_value(cell),
+        int(cell.attributes.get((TABLENS, "number-rows-spanned"), 1)),
+        int(cell.attributes.get((TABLENS, "number-columns-spanned"), 1)),
+        str(validation_name) if validation_name else None,
+        col_repeat,
+        str(style_name) if style_name else None,
+    )
+
+
+def _dom_row_cells(row: Element) -> list[OdsCell]:
+    # Keep col_repeat as a descriptor — never expand here, so a row of
+    # empty-but-styled filler cells stays O(cell_count_in_row), not
+    # O(sum_of_col_repeats).
+    return [
+        _dom_cell(cell)
+        for cell in row.childNodes
+        if isinstance(cell, Element)
+        and cell.qname in (_TABLE_CELL_QNAME, _COVERED_TABLE_CELL_QNAME)
+    ]
 
-    for row in [
+
+def _dom_table_rows(table: Element) -> list[Element]:
+    table_row_name = TableRow().qname
+    return [
         child
         for child in table.childNodes
         if isinstance(child, Element) and child.qname == table_row_name
-    ]:
+    ]
+
+
+def _parse_table_grid(
+    table: Element,
+    limits: ParserLimits = DEFAULT_LIMITS,
+) -> ParsedTable:
+    table_name = str(table.attributes.get((TABLENS, "name"), "<unnamed>"))
+    builder = TableGridBuilder(table_name, limits)
+    for row in _dom_table_rows(table):
         row_repeat = int(row.attributes.get((TABLENS, "number-rows-repeated"), 1))
-        # Keep col_repeat as a descriptor — never expand here, so a row of
-        # empty-but-styled filler cells stays O(cell_count_in_row), not
-        # O(sum_of_col_repeats).
-        row_cells: list[tuple[bool, str, int, int, str | None, int]] = []
-
-        for cell in row.childNodes:
-            if not isinstance(cell, Element) or cell.qname not in (
-                table_cell_name,
-                covered_cell_name,
-            ):
-                continue
-            col_repeat = int(cell.attributes.get((TABLENS, "number-columns-repeated"), 1))
-            if cell.qname == covered_cell_name:
-                row_cells.append((True, "", 1, 1, None, col_repeat))
-            else:
-                row_span = int(cell.attributes.get((TABLENS, "number-rows-spanned"), 1))
-                col_span = int(cell.attributes.get((TABLENS, "number-columns-spanned"), 1))
-                validation_name = cell.attributes.get((TABLENS, "content-validation-name"))
-                row_cells.append(
-                    (
-                        False,
-                        _cell_value(cell),
-                        row_span,
-                        col_span,
-                        str(validation_name) if validation_name else None,
-                        col_repeat,
-                    )
-                )
+        builder.add_row(row_repeat, _dom_row_cells(row))
+    return builder.parsed()
 
-        row_has_content = any(
-            (not covered)
-            and (value != "" or row_span > 1 or col_span > 1 or validation_name is not None)
-            for covered, value, row_span, col_span, validation_name, _ in row_cells
-        )
 
-        if not row_has_content:
-            # Repeated empty filler block — skip materialization entirely.
-            # No values, no merges, no validations, and no extension of
-            # max_row / max_col so downstream extent scans do not iterate the
-            # full theoretical sheet either.
-            row_index += row_repeat
+def _dom_table_source(table: Element, limits: ParserLimits = DEFAULT_LIMITS) -> OdsTableSource:
+    name = table.attributes.get((TABLENS, "name"))
+    style_name = table.attributes.get((TABLENS, "style-name"))
+    builder = TableGridBuilder(str(name) if name else "<unnamed>", limits)
+    columns: list[OdsColumn] = []
+    table_col_name = TableColumn().qname
+    table_row_name = TableRow().qname
+    for child in table.childNodes:
+        if not isinstance(child, Element):
             continue
+        if child.qname == table_col_name:
+            col_style = child.attributes.get((TABLENS, "style-name"))
+            default_style = child.attributes.get((TABLENS, "default-cell-style-name"))
+            columns.append(
+                OdsColumn(
+                    int(child.attributes.get((TABLENS, "number-columns-repeated"), 1)),
+                    str(col_style) if col_style else None,
+                    str(default_style) if default_style else None,
+                )
+            )
+        elif child.qname == table_row_name:
+            row_repeat = int(child.attributes.get((TABLENS, "number-rows-repeated"), 1))
+            builder.add_row(row_repeat, _dom_row_cells(child))
 
-        # Defense-in-depth: confirm the declared block dimensions are within
-        # configured limits before iterating. The local skip above already
-        # neutralizes the common LibreOffice "select-all + format" pattern;
-        # this check protects against inputs that declare implausibly large
-        # repeats on rows that do carry content.
-        projected_row = row_index + row_repeat - 1
-        projected_col = 0
-        projected_content_cols_per_row = 0
-        running_col = 1
-        for covered, value, row_span, col_span, validation_name, col_repeat in row_cells:
-            has_cell_content = (not covered) and (
-                value != "" or row_span > 1 or col_span > 1 or validation_name is not None
+    named_ranges: list[tuple[str, str]] = []
+    for named_range in table.getElementsByType(OdfNamedRange):
+        range_name = named_range.attributes.get((TABLENS, "name"))
+        address = named_range.attributes.get((TABLENS, "cell-range-address"))
+        if range_name and address:
+            named_ranges.append((str(range_name), str(address)))
+
+    return OdsTableSource(
+        name=str(name) if name else None,
+        style_name=str(style_name) if style_name else None,
+        parsed=builder.parsed(),
+        columns=columns,
+        style_rows=builder.style_rows,
+        named_ranges=named_ranges,
+    )
+
+
+def _dom_style_records(doc) -> list[StyleRecord]:
+    records: list[StyleRecord] = []
+    for style in doc.getElementsByType(Style):
+        name = style.attributes.get((STYLENS, "name"))
+        family = style.attributes.get((STYLENS, "family"))
+        records.append(
+            StyleRecord(
+                name=str(name) if name else None,
+                family=str(family) if family else None,
+                children=tuple(
+                    (child.qname, child.attributes)
+                    for child in style.childNodes
+                    if isinstance(child, Element)
+                ),
             )
-            if has_cell_content:
-                cell_right = running_col + col_repeat - 1 + (col_span - 1 if col_span > 1 else 0)
-                if cell_right > projected_col:
-                    projected_col = cell_right
-                projected_content_cols_per_row += col_repeat
-            running_col += col_repeat
-        limits.enforce(
-            context=context,
-            rows=projected_row,
-            cols=projected_col,
-            cells=len(values) + row_repeat * projected_content_cols_per_row,
         )
+    return records
 
-        for repeated_row in range(row_repeat):
-            absolute_row = row_index + repeated_row
-            col_index = 1
-            for covered, value, row_span, col_span, validation_name, col_repeat in row_cells:
-                has_cell_content = (not covered) and (
-                    value != "" or row_span > 1 or col_span > 1 or validation_name is not None
-                )
-                if not has_cell_content:
-                    col_index += col_repeat
-                    continue
-                for offset in range(col_repeat):
-                    absolute_col = col_index + offset
-                    values[(absolute_row, absolute_col)] = value
-                    if row_span > 1 or col_span > 1:
-                        merges.append(
-                            (
-                                absolute_row,
-                                absolute_col,
-                                absolute_row + row_span - 1,
-                                absolute_col + col_span - 1,
-                            )
-                        )
-                    if validation_name:
-                        validation_cells[validation_name].append((absolute_row, absolute_col))
-                    # Bounds must include the full span of an explicit merge:
-                    # downstream extent scans and header-merge extraction rely
-                    # on max_col / max_row reaching the right/bottom edge of
-                    # the merge, not just its anchor.
-                    span_right = absolute_col + col_span - 1
-                    if span_right > max_col:
-                        max_col = span_right
-                    span_bottom = absolute_row + row_span - 1
-                    if span_bottom > max_row:
-                        max_row = span_bottom
-                col_index += col_repeat
-        row_index += row_repeat
-
-    return ParsedTable(
-        values=values,
-        merges=merges,
-        validation_cells=dict(validation_cells),
-        max_row=max_row,
-        max_col=max_col,
-    )
 
+def _load_ods_package(
+    path: str | Path,
+    limits: ParserLimits = DEFAULT_LIMITS,
+    keep_table: TableFilter | None = None,
+) -> OdsPackage:
+    """Load the whole package with odfpy and reduce it to an ``OdsPackage``.
+
+    Tables rejected by ``keep_table`` are not reduced to a grid.
+    """
+    doc = load(str(path))
+    package = OdsPackage(styles=_dom_style_records(doc))
+    for validation in doc.spreadsheet.getElementsByType(OdfContentValidation):
+        name = validation.attributes.get((TABLENS, "name"))
+        condition = validation.attributes.get((TABLENS, "condition"))
+        if name and condition:
+            package.validation_defs[str(name)] = str(condition)
+    for database_range in doc.spreadsheet.getElementsByType(DatabaseRange):
+        address = database_range.attributes.get((TABLENS, "target-range-address"))
+        if address:
+            package.database_range_addresses.append(str(address))
+    for table in doc.getElementsByType(Table):
+        if table.parentNode == doc.spreadsheet and _dom_table_kept(table, keep_table, package.styles):
+            package.tables.append(_dom_table_source(table, limits=limits))
+    return package
 
-def _parse_hidden_sheet(table: Element, limits: ParserLimits = DEFAULT_LIMITS) -> SheetIR:
-    parsed = _parse_table_grid(table, limits=limits)
-    sheet = SheetIR(name=str(table.attributes.get((TABLENS, "name"), "_meta")))
+
+def _dom_table_kept(table: Element, keep_table: TableFilter | None, styles: Sequence[StyleRecord]) -> bool:
+    if keep_table is None:
+        return True
+    name = table.attributes.get((TABLENS, "name"))
+    style_name = table.attributes.get((TABLENS, "style-name"))
+    return keep_table(str(name) if name else None, str(style_name) if style_name else None, styles)
+
+
+def _parse_hidden_sheet(source: OdsTableSource) -> SheetIR:
+    parsed = source.parsed
+    sheet = SheetIR(name=source.name or "_meta")
     sheet.meta["_hidden"] = True
     for row in range(1, parsed.max_row + 1):
         key = str(parsed.values.get((row, 1), "") or "")
@@ -979,30 +792,23 @@ def _extract_validations(
     return validations
 
 
-def _extract_named_ranges(table: Element, *, sheet_name: str) -> list[NamedRange]:
+def _extract_named_ranges(source: OdsTableSource, *, sheet_name: str) -> list[NamedRange]:
     named_ranges: list[NamedRange] = []
-    for named_range in table.getElementsByType(OdfNamedRange):
-        name = named_range.attributes.get((TABLENS, "name"))
-        address = named_range.attributes.get((TABLENS, "cell-range-address"))
-        if not name or not address:
-            continue
+    for name, address in source.named_ranges:
         try:
-            range_sheet, r1, c1, r2, c2 = _parse_range_address(str(address))
+            range_sheet, r1, c1, r2, c2 = _parse_range_address(address)
         except ValueError:
             continue
         if range_sheet != sheet_name:
             continue
-        named_ranges.append(NamedRange(name=str(name), sheet=sheet_name, area=(r1, c1, r2, c2)))
+        named_ranges.append(NamedRange(name=name, sheet=sheet_name, area=(r1, c1, r2, c2)))
     return named_ranges
 
 
-def _extract_autofilter_ref(database_ranges: list[Element], *, sheet_name: str) -> str | None:
-    for database_range in database_ranges:
-        address = database_range.attributes.get((TABLENS, "target-range-address"))
-        if not address:
-            continue
+def _extract_autofilter_ref(database_range_addresses: list[str], *, sheet_name: str) -> str | None:
+    for address in database_range_addresses:
         try:
-            range_sheet, r1, c1, r2, c2 = _parse_range_address(str(address))
+            range_sheet, r1, c1, r2, c2 = _parse_range_address(address)
         except ValueError:
             continue
         if range_sheet != sheet_name:
@@ -1015,51 +821,56 @@ def parse_workbook(
     path: str | Path,
     *,
     limits: ParserLimits = DEFAULT_LIMITS,
+    streaming: bool = False,
+    sheets: SheetSelection | None = None,
 ) -> WorkbookIR:
-    """Parse an ODS workbook into WorkbookIR."""
-    doc = load(str(path))
-    ir = WorkbookIR()
+    """Parse an ODS workbook into WorkbookIR.
+
+    ``streaming=True`` reads ``styles.xml`` / ``content.xml`` incrementally
+    instead of loading the odfpy document tree; the result is identical.
+    ``sheets`` restricts the visible tables that are parsed; hidden tables
+    are always read.
+    """
+    keep_table = None if sheets is None else _SelectedTables(sheets)
+    if streaming:
+        package = read_ods_package(path, limits=limits, keep_table=keep_table)
+    else:
+        package = _load_ods_package(path, limits=limits, keep_table=keep_table)
+    if keep_table is not None:
+        keep_table.sheets.check_available(keep_table.seen)
+    return _build_workbook_ir(package, limits=limits)
 
-    hidden_style_names = _parse_hidden_style_names(doc)
-    tables = [
-        table for table in doc.getElementsByType(Table) if table.parentNode == doc.spreadsheet
-    ]
-    validation_defs: dict[str, str] = {}
-    for validation in doc.spreadsheet.getElementsByType(OdfContentValidation):
-        name = validation.attributes.get((TABLENS, "name"))
-        condition = validation.attributes.get((TABLENS, "condition"))
-        if name and condition:
-            validation_defs[str(name)] = str(condition)
-    database_ranges = [
-        database_range for database_range in doc.spreadsheet.getElementsByType(DatabaseRange)
-    ]
 
+def _build_workbook_ir(package: OdsPackage, *, limits: ParserLimits) -> WorkbookIR:
+    ir = WorkbookIR()
+
+    hidden_style_names = _parse_hidden_style_names(package.styles)
     meta_payload: dict[str, Any] = {}
 
-    for table in tables:
-        name = str(table.attributes.get((TABLENS, "name"), "Sheet1"))
-        if _table_is_hidden(table, hidden_style_names):
-            hidden_sheet = _parse_hidden_sheet(table, limits=limits)
+    for source in package.tables:
+        name = source.name or "Sheet1"
+        if _table_is_hidden(source, hidden_style_names):
+            hidden_sheet = _parse_hidden_sheet(source)
             ir.hidden_sheets[name] = hidden_sheet
             if name == "_meta":
                 meta_payload = _read_meta_payload(hidden_sheet)
             continue
 
-    col_style_map = _build_column_style_map(doc)
-    rotation_map = _build_cell_rotation_map(doc)
-    horizontal_alignment_map = _build_cell_horizontal_alignment_map(doc)
-    vertical_alignment_map = _build_cell_vertical_alignment_map(doc)
+    col_style_map = _build_column_style_map(package.styles)
+    cell_styles = _build_cell_presentation_map(package.styles)
     meta_changed = False
 
-    for table in tables:
-        name = str(table.attributes.get((TABLENS, "name"), "Sheet1"))
+    for source in package.tables:
+        name = source.name or "Sheet1"
         if name in ir.hidden_sheets:
             continue
 
-        parsed = _parse_table_grid(table, limits=limits)
+        parsed = source.parsed
         meta_hints = build_sheet_meta_hints(meta_payload, sheet_name=name)
-        validations = _extract_validations(parsed, validation_defs)
-        autofilter_ref = _extract_autofilter_ref(database_ranges, sheet_name=name)
+        validations = _extract_validations(parsed, package.validation_defs)
+        autofilter_ref = _extract_autofilter_ref(
+            package.database_range_addresses, sheet_name=name
+        )
         legend_hints = _legend_table_hints(meta_payload, sheet_name=name)
         legend_anchors = [
             (hint["top"], hint["left"])
@@ -1076,65 +887,26 @@ def parse_workbook(
             stop_on_empty_col=bool(legend_anchors),
         )
         _apply_legend_table_hints(sheet, legend_hints)
-        sheet.named_ranges = _extract_named_ranges(table, sheet_name=name)
-
-        column_widths = _extract_ods_column_widths(
-            table, col_style_map, max_col=parsed.max_col, limits=limits
-        )
-        if column_widths:
-            sheet.meta["__column_widths"] = column_widths
-
-        text_orientations = _extract_ods_text_orientations(
-            table,
-            rotation_map,
-            max_row=parsed.max_row,
-            max_col=parsed.max_col,
-            limits=limits,
-        )
-        if text_orientations:
-            sheet.meta["__text_orientations"] = text_orientations
+        sheet.named_ranges = _extract_named_ranges(source, sheet_name=name)
 
-        horizontal_alignments = _extract_ods_horizontal_alignments(
-            table,
-            horizontal_alignment_map,
+        presentation = _extract_ods_presentation(
+            source,
+            col_style_map,
+            cell_styles,
             max_row=parsed.max_row,
             max_col=parsed.max_col,
             limits=limits,
         )
-        if horizontal_alignments:
-            sheet.meta["__horizontal_alignments"] = horizontal_alignments
-
-        vertical_alignments = _extract_ods_vertical_alignments(
-            table,
-            vertical_alignment_map,
-            max_row=parsed.max_row,
-            max_col=parsed.max_col,
-            limits=limits,
-        )
-        if vertical_alignments:
-            sheet.meta["__vertical_alignments"] = vertical_alignments
-
-        # Carrier is authoritative for all four presentation-metadata
-        # families: empty extraction must clear any persisted entry for
-        # that sheet so the next roundtrip cannot silently reapply
-        # formatting the user has just removed. The shared helper is
-        # invoked unconditionally per family for that reason.
-        if apply_cell_addressed_presentation_meta(
-            meta_payload, name, "column_widths", column_widths
-        ):
-            meta_changed = True
-        if apply_cell_addressed_presentation_meta(
-            meta_payload, name, "text_orientations", text_orientations
-        ):
-            meta_changed = True
-        if apply_cell_addressed_presentation_meta(
-            meta_payload, name, "horizontal_alignments", horizontal_alignments
-        ):
-            meta_changed = True
-        if apply_cell_addressed_presentation_meta(
-            meta_payload, name, "vertical_alignments", vertical_alignments
-        ):
-            meta_changed = True
+        for family, values in presentation._asdict().items():
+            if values:
+                sheet.meta[f"__{family}"] = values
+            # Carrier is authoritative for all four presentation-metadata
+            # families: empty extraction must clear any persisted entry for
+            # that sheet so the next roundtrip cannot silently reapply
+            # formatting the user has just removed. The shared helper is
+            # invoked unconditionally per family for that reason.
+            if apply_cell_addressed_presentation_meta(meta_payload, name, family, values):
+                meta_changed = True
 
         ir.sheets[name] = sheet
 
@@ -3,9 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, NamedTuple, Sequence
 
-from odf.namespaces import FONS, STYLENS
+from odf.namespaces import FONS, OFFICENS, STYLENS, TABLENS
 from odf.opendocument import OpenDocumentSpreadsheet
 from odf.style import (
     ParagraphProperties,
@@ -63,25 +63,36 @@ _ODS_VERTICAL_ALIGNMENT_WRITE_MAP: dict[str, str] = {
 _EXCEL_CHAR_TO_CM = 0.254
 
 
-@dataclass
-class _BufferedCell:
-    value: Any = ""
+class _CellStyle(NamedTuple):
     bold: bool = False
     fill_rgb: str | None = None
-    row_span: int = 1
-    col_span: int = 1
-    covered: bool = False
-    validation_name: str | None = None
     rotation: int = 0
     horizontal_alignment: str | None = None
     vertical_alignment: str | None = None
 
 
+_PLAIN_STYLE = _CellStyle()
+
+
 @dataclass
 class _BufferedSheet:
+    """Compact cell buffer for one sheet.
+
+    Values live in one dense list per row (padded with ``""``, which is also
+    what an unaddressed position renders as). Everything else is sparse and
+    keyed by ``(row, col)``: styles are interned per sheet so a cell carries a
+    small integer id, and spans, merge-covered positions and validation names
+    are only stored where they occur.
+    """
+
     name: str
     hidden: bool = False
-    cells: dict[tuple[int, int], _BufferedCell] = field(default_factory=dict)
+    rows: dict[int, list[Any]] = field(default_factory=dict)
+    style_ids: dict[tuple[int, int], int] = field(default_factory=dict)
+    styles: list[_CellStyle] = field(default_factory=lambda: [_PLAIN_STYLE])
+    spans: dict[tuple[int, int], tuple[int, int]] = field(default_factory=dict)
+    covered: set[tuple[int, int]] = field(default_factory=set)
+    validation_names: dict[tuple[int, int], str] = field(default_factory=dict)
     headers: dict[str, int] = field(default_factory=dict)
     named_ranges: list[DefineNamedRange] = field(default_factory=list)
     validations: list[AddValidation] = field(default_factory=list)
@@ -91,11 +102,43 @@ class _BufferedSheet:
     max_row: int = 0
     max_col: int = 0
     column_widths: dict[int, float] = field(default_factory=dict)
+    _style_index: dict[_CellStyle, int] = field(default_factory=lambda: {_PLAIN_STYLE: 0})
 
-    def ensure_cell(self, row: int, col: int) -> _BufferedCell:
+    def extend_bounds(self, row: int, col: int) -> None:
         self.max_row = max(self.max_row, row)
         self.max_col = max(self.max_col, col)
-        return self.cells.setdefault((row, col), _BufferedCell())
+
+    def write_values(self, row: int, col: int, values: Sequence[Any]) -> None:
+        """Write ``values`` into ``row`` starting at ``col`` (1-based)."""
+        if not values:
+            return
+        end = col + len(values) - 1
+        self.extend_bounds(row, end)
+        row_values = self.rows.setdefault(row, [])
+        if len(row_values) < end:
+            row_values.extend([""] * (end - len(row_values)))
+        row_values[col - 1:end] = values
+
+    def value(self, row: int, col: int) -> Any:
+        row_values = self.rows.get(row)
+        if row_values is None or col > len(row_values):
+            return ""
+        return row_values[col - 1]
+
+    def cell_style(self, row: int, col: int) -> _CellStyle:
+        return self.styles[self.style_ids.get((row, col), 0)]
+
+    def set_cell_style(self, row: int, col: int, style: _CellStyle) -> None:
+        self.extend_bounds(row, col)
+        style_id = self._style_index.get(style)
+        if style_id is None:
+            style_id = len(self.styles)
+            self.styles.append(style)
+            self._style_index[style] = style_id
+        if style_id:
+            self.style_ids[(row, col)] = style_id
+        else:
+            self.style_ids.pop((row, col), None)
 
 
 def _column_letters(index: int) -> str:
@@ -127,6 +170,7 @@ def _sheet_validation_name(sheet: str, index: int) -> str:
 
 
 CellStyleKey = tuple[bool, str | None, int, str | None, str | None]
+QName = tuple[str, str]
 
 
 def _style_key(
@@ -204,8 +248,10 @@ def _register_cell_style(
         # by LibreOffice / Calc. Absolute `left`/`right`/`center` survive
         # locale changes on re-import; locale-neutral `start`/`end` are
         # accepted on read but not emitted on write.
+        # ``setAttrNS`` (not the raw attribute dict) registers the ``fo``
+        # prefix on the element so content.xml declares it.
         para_props = ParagraphProperties()
-        para_props.attributes[(FONS, "text-align")] = horizontal_alignment
+        para_props.setAttrNS(FONS, "text-align", horizontal_alignment)
         style.addElement(para_props)
     if bold:
         style.addElement(TextProperties(fontweight="bold"))
@@ -316,6 +362,84 @@ def _ods_lookup_formula(
     return f"of:=XLOOKUP({source_ref};{key_range};{value_range};{missing})"
 
 
+def _ods_cell_content(
+    value: Any,
+    *,
+    current_sheet: str,
+    row: int,
+    sheet_headers: dict[str, dict[str, int]],
+    sheet_data_bounds: dict[str, tuple[int, int]],
+) -> tuple[dict[QName, Any], str | None]:
+    """Return the value attributes and the paragraph text (if any) of one cell."""
+    if isinstance(value, LookupFormulaSpec):
+        formula = _ods_lookup_formula(
+            value,
+            current_sheet=current_sheet,
+            row=row,
+            sheet_headers=sheet_headers,
+            sheet_data_bounds=sheet_data_bounds,
+        )
+        return {
+            (TABLENS, "formula"): formula,
+            (OFFICENS, "value-type"): "string",
+            (OFFICENS, "string-value"): "",
+        }, None
+    if value in (None, ""):
+        return {}, None
+    if isinstance(value, bool):
+        return {
+            (OFFICENS, "value-type"): "boolean",
+            (OFFICENS, "boolean-value"): str(value).lower(),
+        }, "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return {(OFFICENS, "value-type"): "float", (OFFICENS, "value"): value}, str(value)
+    text = str(value)
+    return {(OFFICENS, "value-type"): "string", (OFFICENS, "string-value"): text}, text
+
+
+def _content_validation(
+    sheet_name: str,
+    validation_name: str,
+    validation: AddValidation,
+) -> ContentValidation:
+    return ContentValidation(
+        name=validation_name,
+        basecelladdress=_cell_address(sheet_name, validation.r1, validation.c1),
+        allowemptycell=str(bool(validation.allow_empty)).lower(),
+        displaylist="unsorted",
+        condition=_ods_validation_condition(validation.formula),
+    )
+
+
+def _database_range(sheet_name: str, area: tuple[int, int, int, int]) -> DatabaseRange:
+    r1, c1, r2, c2 = area
+    return DatabaseRange(
+        name=f"{re.sub(r'[^A-Za-z0-9_]', '_', sheet_name) or 'sheet'}_filter",
+        targetrangeaddress=_range_address(sheet_name, r1, c1, r2, c2),
+        containsheader="true",
+        displayfilterbuttons="true",
+    )
+
+
+def _named_expressions(sheet_name: str, named_ranges: list[DefineNamedRange]) -> NamedExpressions:
+    named_expressions = NamedExpressions()
+    for named_range in named_ranges:
+        named_expressions.addElement(
+            NamedRange(
+                name=named_range.name,
+                basecelladdress=_cell_address(sheet_name, named_range.r1, named_range.c1),
+                cellrangeaddress=_range_address(
+                    sheet_name,
+                    named_range.r1,
+                    named_range.c1,
+                    named_range.r2,
+                    named_range.c2,
+                ),
+            )
+        )
+    return named_expressions
+
+
 def _collect_sheets(plan: RenderPlan) -> list[_BufferedSheet]:
     sheets: dict[str, _BufferedSheet] = {}
     ordered_names: list[str] = []
@@ -339,8 +463,7 @@ def _collect_sheets(plan: RenderPlan) -> list[_BufferedSheet]:
             sheet = ensure_sheet(op.sheet or "_meta", hidden=bool(op.hidden))
             row = 1
             for key, value in op.kv.items():
-                sheet.ensure_cell(row, 1).value = str(key)
-                sheet.ensure_cell(row, 2).value = str(value)
+                sheet.write_values(row, 1, (str(key), str(value)))
                 row += 1
             continue
 
@@ -351,7 +474,7 @@ def _collect_sheets(plan: RenderPlan) -> list[_BufferedSheet]:
 
         if isinstance(op, SetHeader):
             sheet.headers.setdefault(op.text, op.col)
-            sheet.ensure_cell(op.row, op.col).value = op.text
+            sheet.write_values(op.row, op.col, (op.text,))
             continue
 
         if isinstance(op, WriteDataBlock):
@@ -364,32 +487,35 @@ def _collect_sheets(plan: RenderPlan) -> list[_BufferedSheet]:
                     old_start, old_end = sheet.data_bounds
                     sheet.data_bounds = (min(old_start, start), max(old_end, end))
             for row_offset, row_data in enumerate(op.data):
-                for col_offset, value in enumerate(row_data):
-                    sheet.ensure_cell(op.r1 + row_offset, op.c1 + col_offset).value = value
+                sheet.write_values(op.r1 + row_offset, op.c1, row_data)
             continue
 
         if isinstance(op, ApplyHeaderStyle):
-            cell = sheet.ensure_cell(op.row, op.col)
-            cell.bold = cell.bold or bool(op.bold)
-            cell.fill_rgb = op.fill_rgb or cell.fill_rgb
+            style = sheet.cell_style(op.row, op.col)
+            sheet.set_cell_style(
+                op.row,
+                op.col,
+                style._replace(bold=style.bold or bool(op.bold), fill_rgb=op.fill_rgb or style.fill_rgb),
+            )
             continue
 
         if isinstance(op, ApplyColumnStyle):
             for row in range(op.from_row, op.to_row + 1):
-                cell = sheet.ensure_cell(row, op.col)
-                cell.fill_rgb = op.fill_rgb or cell.fill_rgb
+                style = sheet.cell_style(row, op.col)
+                sheet.set_cell_style(row, op.col, style._replace(fill_rgb=op.fill_rgb or style.fill_rgb))
             continue
 
         if isinstance(op, MergeCells):
-            anchor = sheet.ensure_cell(op.r1, op.c1)
-            anchor.row_span = max(anchor.row_span, op.r2 - op.r1 + 1)
-            anchor.col_span = max(anchor.col_span, op.c2 - op.c1 + 1)
+            row_span, col_span = sheet.spans.get((op.r1, op.c1), (1, 1))
+            sheet.spans[(op.r1, op.c1)] = (
+                max(row_span, op.r2 - op.r1 + 1),
+                max(col_span, op.c2 - op.c1 + 1),
+            )
+            sheet.extend_bounds(op.r2, op.c2)
             for row in range(op.r1, op.r2 + 1):
                 for col in range(op.c1, op.c2 + 1):
-                    if (row, col) == (op.r1, op.c1):
-                        continue
-                    covered = sheet.ensure_cell(row, col)
-                    covered.covered = True
+                    if (row, col) != (op.r1, op.c1):
+                        sheet.covered.add((row, col))
             continue
 
         if isinstance(op, AddValidation):
@@ -419,15 +545,17 @@ def _collect_sheets(plan: RenderPlan) -> list[_BufferedSheet]:
             continue
 
         if isinstance(op, SetTextOrientation):
-            sheet.ensure_cell(op.row, op.col).rotation = op.rotation
+            sheet.set_cell_style(op.row, op.col, sheet.cell_style(op.row, op.col)._replace(rotation=op.rotation))
             continue
 
         if isinstance(op, SetHorizontalAlignment):
-            sheet.ensure_cell(op.row, op.col).horizontal_alignment = op.horizontal
+            style = sheet.cell_style(op.row, op.col)
+            sheet.set_cell_style(op.row, op.col, style._replace(horizontal_alignment=op.horizontal))
             continue
 
         if isinstance(op, SetVerticalAlignment):
-            sheet.ensure_cell(op.row, op.col).vertical_alignment = op.vertical
+            style = sheet.cell_style(op.row, op.col)
+            sheet.set_cell_style(op.row, op.col, style._replace(vertical_alignment=op.vertical))
             continue
 
     return [sheets[name] for name in ordered_names]
@@ -454,46 +582,18 @@ def _build_table(
         for index, validation in enumerate(sheet.validations, start=1):
             validation_name = _sheet_validation_name(sheet.name, index)
             spreadsheet_validations.addElement(
-                ContentValidation(
-                    name=validation_name,
-                    basecelladdress=_cell_address(sheet.name, validation.r1, validation.c1),
-                    allowemptycell=str(bool(validation.allow_empty)).lower(),
-                    displaylist="unsorted",
-                    condition=_ods_validation_condition(validation.formula),
-                )
+                _content_validation(sheet.name, validation_name, validation)
             )
+            sheet.extend_bounds(validation.r2, validation.c2)
             for row in range(validation.r1, validation.r2 + 1):
                 for col in range(validation.c1, validation.c2 + 1):
-                    sheet.ensure_cell(row, col).validation_name = validation_name
+                    sheet.validation_names[(row, col)] = validation_name
 
     if sheet.autofilter and spreadsheet_database_ranges is not None:
-        r1, c1, r2, c2 = sheet.autofilter
-        spreadsheet_database_ranges.addElement(
-            DatabaseRange(
-                name=f"{re.sub(r'[^A-Za-z0-9_]', '_', sheet.name) or 'sheet'}_filter",
-                targetrangeaddress=_range_address(sheet.name, r1, c1, r2, c2),
-                containsheader="true",
-                displayfilterbuttons="true",
-            )
-        )
+        spreadsheet_database_ranges.addElement(_database_range(sheet.name, sheet.autofilter))
 
     if sheet.named_ranges:
-        named_expressions = NamedExpressions()
-        for named_range in sheet.named_ranges:
-            named_expressions.addElement(
-                NamedRange(
-                    name=named_range.name,
-                    basecelladdress=_cell_address(sheet.name, named_range.r1, named_range.c1),
-                    cellrangeaddress=_range_address(
-                        sheet.name,
-                        named_range.r1,
-                        named_range.c1,
-                        named_range.r2,
-                        named_range.c2,
-                    ),
-                )
-            )
-        table.addElement(named_expressions)
+        table.addElement(_named_expressions(sheet.name, sheet.named_ranges))
 
     max_row = max(sheet.max_row, 1)
     max_col = max(sheet.max_col, 1)
@@ -512,74 +612,36 @@ def _build_table(
     for row_index in range(1, max_row + 1):
         row = TableRow()
         for col_index in range(1, max_col + 1):
-            cell = sheet.cells.get((row_index, col_index))
-            if cell and cell.covered:
+            position = (row_index, col_index)
+            if position in sheet.covered:
                 row.addElement(CoveredTableCell())
                 continue
 
             attributes: dict[str, Any] = {}
-            if cell:
-                style_name = _register_cell_style(
-                    doc,
-                    cell_style_cache,
-                    bold=cell.bold,
-                    fill_rgb=cell.fill_rgb,
-                    rotation=cell.rotation,
-                    horizontal_alignment=cell.horizontal_alignment,
-                    vertical_alignment=cell.vertical_alignment,
-                )
+            style_id = sheet.style_ids.get(position)
+            if style_id:
+                style_name = _register_cell_style(doc, cell_style_cache, **sheet.styles[style_id]._asdict())
                 if style_name:
                     attributes["stylename"] = style_name
-                if cell.validation_name:
-                    attributes["contentvalidationname"] = cell.validation_name
-                if cell.row_span > 1:
-                    attributes["numberrowsspanned"] = cell.row_span
-                if cell.col_span > 1:
-                    attributes["numbercolumnsspanned"] = cell.col_span
-
-            value = "" if cell is None else cell.value
-            if isinstance(value, LookupFormulaSpec):
-                formula = _ods_lookup_formula(
-                    value,
-                    current_sheet=sheet.name,
-                    row=row_index,
-                    sheet_headers=sheet_headers,
-                    sheet_data_bounds=sheet_data_bounds,
-                )
-                table_cell = TableCell(
-                    formula=formula,
-                    valuetype="string",
-                    stringvalue="",
-                    attributes=attributes,
-                )
-                row.addElement(table_cell)
-                continue
-            if value in (None, ""):
-                table_cell = TableCell(attributes=attributes)
-            elif isinstance(value, bool):
-                display = "TRUE" if value else "FALSE"
-                table_cell = TableCell(
-                    valuetype="boolean",
-                    booleanvalue=str(value).lower(),
-                    attributes=attributes,
-                )
-                table_cell.addElement(P(text=display))
-            elif isinstance(value, (int, float)) and not isinstance(value, bool):
-                table_cell = TableCell(
-                    valuetype="float",
-                    value=value,
-                    attributes=attributes,
-                )
-                table_cell.addElement(P(text=str(value)))
-            else:
-                text = str(value)
-                table_cell = TableCell(
-                    valuetype="string",
-                    stringvalue=text,
-                    attributes=attributes,
-                )
+            validation_name = sheet.validation_names.get(position)
+            if validation_name:
+                attributes["contentvalidationname"] = validation_name
+            row_span, col_span = sheet.spans.get(position, (1, 1))
+            if row_span > 1:
+                attributes["numberrowsspanned"] = row_span
+            if col_span > 1:
+                attributes["numbercolumnsspanned"] = col_span
+
+            content, text = _ods_cell_content(
+                sheet.value(row_index, col_index),
+                current_sheet=sheet.name,
+                row=row_index,
+                sheet_headers=sheet_headers,
+                sheet_data_bounds=sheet_data_bounds,
+            )
+            table_cell = TableCell(attributes=attributes, qattributes=content)
+            if text is not None:
                 table_cell.addElement(P(text=text))
-
             row.addElement(table_cell)
         table.addElement(row)
 
@@ -0,0 +1,288 @@
+"""Streaming ``content.xml`` / ``styles.xml`` reader for the ODS read path.
+
+``odf.opendocument.load`` materializes the complete odfpy element tree (one
+``Element`` with attribute dict, child list and text nodes per cell and per
+paragraph) before the parser looks at a single value. For large
+``content.xml`` parts that tree dominates both memory and parse time.
+
+``read_ods_package`` opens the zip container (a memory-mapped
+``ZipContainer``) and walks both XML parts once with
+``xml.etree.ElementTree.iterparse``:
+
+* ``style:style`` elements become ``StyleRecord`` entries (``styles.xml``
+  first, then the automatic styles of ``content.xml``),
+* every top-level ``table:table`` is fed row by row into a
+  ``TableGridBuilder``; a row element is dropped as soon as it has been
+  consumed, so at most one row of cells is alive at a time,
+* ``table:table-column`` elements, named ranges, content validations and
+  database ranges are collected on the way.
+
+The result is the same ``OdsPackage`` the odfpy loader produces, so the
+``WorkbookIR`` assembly downstream is shared and ``ParserLimits`` are
+enforced by the same grid builder.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO
+from xml.etree.ElementTree import Element, iterparse
+
+from odf.namespaces import OFFICENS, STYLENS, TABLENS, TEXTNS
+
+from spreadsheet_handling.io_backends.ods.table_source import (
+    OdsCell,
+    OdsColumn,
+    OdsPackage,
+    OdsTableSource,
+    QName,
+    StyleRecord,
+    TableFilter,
+    TableGridBuilder,
+    typed_cell_value,
+)
+from spreadsheet_handling.io_backends.parser_limits import DEFAULT_LIMITS, ParserLimits
+from spreadsheet_handling.io_backends.zip_container import ZipContainer
+
+
+def _tag(namespace: str, local: str) -> str:
+    return f"{{{namespace}}}{local}"
+
+
+_SPREADSHEET = _tag(OFFICENS, "spreadsheet")
+_STYLE = _tag(STYLENS, "style")
+_TABLE = _tag(TABLENS, "table")
+_TABLE_COLUMN = _tag(TABLENS, "table-column")
+_TABLE_ROW = _tag(TABLENS, "table-row")
+_TABLE_CELL = _tag(TABLENS, "table-cell")
+_COVERED_TABLE_CELL = _tag(TABLENS, "covered-table-cell")
+_NAMED_RANGE = _tag(TABLENS, "named-range")
+_CONTENT_VALIDATION = _tag(TABLENS, "content-validation")
+_DATABASE_RANGE = _tag(TABLENS, "database-range")
+_TEXT_S = _tag(TEXTNS, "s")
+
+
+def _qname(tag: str) -> QName:
+    """Split ``{namespace}local`` into odfpy's ``(namespace, local)`` form."""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return "", tag
+
+
+def _cell_text(node: Element) -> str:
+    """Mirror ``odf_parser._cell_text`` on an ElementTree element."""
+    parts: list[str] = []
+    if node.text:
+        parts.append(node.text.strip("\n"))
+    for child in node:
+        if child.tag == _TEXT_S:
+            parts.append(" " * int(child.get(_tag(TEXTNS, "c"), 1)))
+        else:
+            parts.append(_cell_text(child))
+        if child.tail:
+            parts.append(child.tail.strip("\n"))
+    return "".join(parts)
+
+
+def _cell_value(cell: Element) -> str:
+    text = _cell_text(cell)
+    if text:
+        return text
+    return typed_cell_value(lambda namespace, local: cell.get(_tag(namespace, local)))
+
+
+def _row_cells(row: Element) -> list[OdsCell]:
+    cells: list[OdsCell] = []
+    for cell in row:
+        if cell.tag not in (_TABLE_CELL, _COVERED_TABLE_CELL):
+            continue
+        col_repeat = int(cell.get(_tag(TABLENS, "number-columns-repeated"), 1))
+        if cell.tag == _COVERED_TABLE_CELL:
+            cells.append(OdsCell(True, "", 1, 1, None, col_repeat))
+            continue
+        style_name = cell.get(_tag(TABLENS, "style-name")) or cell.get(_tag(STYLENS, "style-name"))
+        cells.append(
+            OdsCell(
+                False,
+                _cell_value(cell),
+                int(cell.get(_tag(TABLENS, "number-rows-spanned"), 1)),
+                int(cell.get(_tag(TABLENS, "number-columns-spanned"), 1)),
+                cell.get(_tag(TABLENS, "content-validation-name")) or None,
+                col_repeat,
+                style_name or None,
+            )
+        )
+    return cells
+
+
+def _style_record(style: Element) -> StyleRecord:
+    return StyleRecord(
+        name=style.get(_tag(STYLENS, "name")) or None,
+        family=style.get(_tag(STYLENS, "family")) or None,
+        children=tuple(
+            (_qname(child.tag), {_qname(key): value for key, value in child.attrib.items()})
+            for child in style
+        ),
+    )
+
+
+class _TableStream:
+    """Accumulates one top-level ``table:table`` while its rows stream past."""
+
+    def __init__(self, element: Element, limits: ParserLimits) -> None:
+        self.element = element
+        self.name = element.get(_tag(TABLENS, "name")) or None
+        self.style_name = element.get(_tag(TABLENS, "style-name")) or None
+        self.builder = TableGridBuilder(self.name or "<unnamed>", limits)
+        self.columns: list[OdsColumn] = []
+        self.named_ranges: list[tuple[str, str]] = []
+
+    def add_column(self, column: Element) -> None:
+        self.columns.append(
+            OdsColumn(
+                int(column.get(_tag(TABLENS, "number-columns-repeated"), 1)),
+                column.get(_tag(TABLENS, "style-name")) or None,
+                column.get(_tag(TABLENS, "default-cell-style-name")) or None,
+            )
+        )
+
+    def add_row(self, row: Element) -> None:
+        row_repeat = int(row.get(_tag(TABLENS, "number-rows-repeated"), 1))
+        self.builder.add_row(row_repeat, _row_cells(row))
+
+    def source(self) -> OdsTableSource:
+        return OdsTableSource(
+            name=self.name,
+            style_name=self.style_name,
+            parsed=self.builder.parsed(),
+            columns=self.columns,
+            style_rows=self.builder.style_rows,
+            named_ranges=self.named_ranges,
+        )
+
+
+class _ContentReader:
+    """Single-pass ``content.xml`` walk that fills an ``OdsPackage``."""
+
+    def __init__(self, package: OdsPackage, limits: ParserLimits, keep_table: TableFilter | None = None) -> None:
+        self.package = package
+        self.limits = limits
+        self.keep_table = keep_table
+        self.table: _TableStream | None = None
+        self.skipped: Element | None = None
+        self.in_spreadsheet = False
+
+    def read(self, stream: IO[bytes]) -> None:
+        parents: list[Element] = []
+        for event, element in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                self._start(element, parents[-1] if parents else None)
+                parents.append(element)
+                continue
+            parents.pop()
+            self._end(element, parents[-1] if parents else None)
+
+    def _start(self, element: Element, parent: Element | None) -> None:
+        if element.tag == _SPREADSHEET:
+            self.in_spreadsheet = True
+        elif element.tag == _TABLE and parent is not None and parent.tag == _SPREADSHEET:
+            if self._keeps(element):
+                self.table = _TableStream(element, self.limits)
+            else:
+                self.skipped = element
+
+    def _keeps(self, table: Element) -> bool:
+        if self.keep_table is None:
+            return True
+        name = table.get(_tag(TABLENS, "name")) or None
+        style_name = table.get(_tag(TABLENS, "style-name")) or None
+        return self.keep_table(name, style_name, self.package.styles)
+
+    def _end(self, element: Element, parent: Element | None) -> None:
+        if self.skipped is not None:
+            # An unselected table and its rows are dropped without building a grid.
+            if parent is not None and (parent is self.skipped or element is self.skipped):
+                parent.remove(element)
+            if element is self.skipped:
+                self.skipped = None
+            return
+        tag = element.tag
+        if self.table is not None and self._end_in_table(self.table, element, parent):
+            return
+        if tag == _STYLE:
+            self.package.styles.append(_style_record(element))
+        elif self.in_spreadsheet and tag in (_CONTENT_VALIDATION, _DATABASE_RANGE):
+            self._add_spreadsheet_declaration(element)
+        elif tag == _SPREADSHEET:
+            self.in_spreadsheet = False
+
+    def _end_in_table(self, table: _TableStream, element: Element, parent: Element | None) -> bool:
+        """Consume elements of the open top-level table; return True when handled."""
+        tag = element.tag
+        if parent is table.element and tag == _TABLE_ROW:
+            table.add_row(element)
+            parent.remove(element)
+        elif parent is table.element and tag == _TABLE_COLUMN:
+            table.add_column(element)
+            parent.remove(element)
+        elif element is table.element:
+            self.package.tables.append(table.source())
+            self.table = None
+            if parent is not None:
+                parent.remove(element)
+        elif tag == _NAMED_RANGE:
+            self._add_named_range(table, element)
+        else:
+            return False
+        return True
+
+    @staticmethod
+    def _add_named_range(table: _TableStream, element: Element) -> None:
+        name = element.get(_tag(TABLENS, "name"))
+        address = element.get(_tag(TABLENS, "cell-range-address"))
+        if name and address:
+            table.named_ranges.append((name, address))
+
+    def _add_spreadsheet_declaration(self, element: Element) -> None:
+        if element.tag == _CONTENT_VALIDATION:
+            name = element.get(_tag(TABLENS, "name"))
+            condition = element.get(_tag(TABLENS, "condition"))
+            if name and condition:
+                self.package.validation_defs[name] = condition
+            return
+        address = element.get(_tag(TABLENS, "target-range-address"))
+        if address:
+            self.package.database_range_addresses.append(address)
+
+
+def _read_style_records(stream: IO[bytes]) -> list[StyleRecord]:
+    records: list[StyleRecord] = []
+    for _, element in iterparse(stream, events=("end",)):
+        if element.tag == _STYLE:
+            records.append(_style_record(element))
+    return records
+
+
+def read_ods_package(
+    path: str | Path,
+    *,
+    limits: ParserLimits = DEFAULT_LIMITS,
+    keep_table: TableFilter | None = None,
+) -> OdsPackage:
+    """Read an ODS package into an ``OdsPackage`` without building a DOM.
+
+    Tables rejected by ``keep_table`` are skipped while streaming.
+    """
+    package = OdsPackage()
+    with ZipContainer(path) as archive:
+        if "styles.xml" in archive.names:
+            with archive.open("styles.xml") as stream:
+                package.styles.extend(_read_style_records(stream))
+        if "content.xml" in archive.names:
+            with archive.open("content.xml") as stream:
+                _ContentReader(package, limits, keep_table).read(stream)
+    return package
+
+
+__all__ = ["read_ods_package"]
@@ -0,0 +1,685 @@
+"""Row-streaming ODS rendering that writes ``content.xml`` straight into the zip.
+
+``odf_renderer.render_workbook`` buffers the sheet values in per-row lists
+and then builds one odfpy ``TableCell`` (plus paragraph and text node) per
+grid position; ``OpenDocument.save`` finally serializes the
+whole tree into one string. Memory therefore grows with the sheet area
+several times over.
+
+``render_workbook_streaming`` keeps the plan as the only full copy of the data:
+
+* ops are indexed per sheet (value and style edits by row, column fills as
+  row ranges, merges and validations as areas, data blocks by reference),
+* every automatic style (cell, column width, hidden table) is registered on
+  an odfpy document up front by walking the styled positions only, so
+  ``office:automatic-styles`` can be written before the first table,
+* ``content.xml`` is then written through ``ZipFile.open(..., "w")`` one row
+  at a time. Runs of identical empty cells collapse into one element with
+  ``table:number-columns-repeated``, runs of identical empty rows into one
+  row with ``table:number-rows-repeated``.
+
+Cell semantics follow ``_collect_sheets``: the later op wins for values and
+rotation / alignment, bold accumulates, the latest non-empty fill wins and
+merge-covered positions become ``table:covered-table-cell``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from io import StringIO, TextIOWrapper
+from pathlib import Path
+import re
+import time
+from typing import IO, Any, Callable, Iterator
+from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from odf.manifest import FileEntry, Manifest
+from odf.namespaces import FONS, OFFICENS, OFNS, STYLENS, TABLENS, TEXTNS
+from odf.office import DocumentContent
+from odf.opendocument import OpenDocumentSpreadsheet
+from odf.table import ContentValidations, DatabaseRanges
+
+from spreadsheet_handling.io_backends.ods.odf_renderer import (
+    CellStyleKey,
+    QName,
+    _EXCEL_CHAR_TO_CM,
+    _add_freeze_settings,
+    _content_validation,
+    _database_range,
+    _named_expressions,
+    _ods_cell_content,
+    _register_cell_style,
+    _register_column_width_style,
+    _register_hidden_table_style,
+    _sheet_validation_name,
+    _style_key,
+)
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    ApplyColumnStyle,
+    ApplyHeaderStyle,
+    DefineNamedRange,
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetAutoFilter,
+    SetColumnWidth,
+    SetFreeze,
+    SetHeader,
+    SetHorizontalAlignment,
+    SetTextOrientation,
+    SetVerticalAlignment,
+    WriteDataBlock,
+    WriteMeta,
+)
+
+_XML_PROLOGUE = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_UNIX_PERMS = 0o100644 << 16
+_CONTENT_NAMESPACES = (OFFICENS, STYLENS, TEXTNS, TABLENS, FONS, OFNS)
+_ATTRIBUTE_PREFIXES = {OFFICENS: "office", TABLENS: "table"}
+_COVERED_CELL = "<table:covered-table-cell/>"
+
+# Characters odfpy's serializer replaces with U+FFFD: XML 1.0 illegal and
+# discouraged code points, including the per-plane non-characters.
+_UNREPRESENTABLE = re.compile(
+    "[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f\ud800-\udfff\ufffe\uffff"
+    + "".join(f"{chr(plane + 0xFFFE)}-{chr(plane + 0xFFFF)}" for plane in range(0x10000, 0x110000, 0x10000))
+    + "]"
+)
+
+# (op index, column, kind, payload); kind is "value", "bold", "fill",
+# "rotation", "horizontal" or "vertical".
+_CellEdit = tuple[int, int, str, Any]
+
+# Position of each style edit kind in the mutable style state of one cell,
+# which mirrors the ``_style_key`` argument order.
+_STYLE_SLOTS = {"bold": 0, "fill": 1, "rotation": 2, "horizontal": 3, "vertical": 4}
+_DEFAULT_STYLE_KEY: CellStyleKey = (False, None, 0, None, None)
+
+
+@dataclass
+class _SheetStream:
+    """All ops of one sheet, regrouped for row-major emission."""
+
+    name: str
+    hidden: bool = False
+    headers: dict[str, int] = field(default_factory=dict)
+    blocks: list[tuple[int, WriteDataBlock]] = field(default_factory=list)
+    cell_edits: dict[int, list[_CellEdit]] = field(default_factory=dict)
+    # (op index, col, from_row, to_row, fill_rgb)
+    column_fills: list[tuple[int, int, int, int, str]] = field(default_factory=list)
+    merges: list[MergeCells] = field(default_factory=list)
+    validations: list[AddValidation] = field(default_factory=list)
+    named_ranges: list[DefineNamedRange] = field(default_factory=list)
+    autofilter: tuple[int, int, int, int] | None = None
+    freeze: tuple[int, int] | None = None
+    data_bounds: tuple[int, int] | None = None
+    column_widths: dict[int, float] = field(default_factory=dict)
+    max_row: int = 0
+    max_col: int = 0
+
+    def extend(self, row: int, col: int) -> None:
+        self.max_row = max(self.max_row, row)
+        self.max_col = max(self.max_col, col)
+
+    def add_cell_edit(self, index: int, row: int, col: int, kind: str, payload: Any) -> None:
+        self.cell_edits.setdefault(row, []).append((index, col, kind, payload))
+        self.extend(row, col)
+
+
+@dataclass
+class _IndexedPlan:
+    sheets: dict[str, _SheetStream] = field(default_factory=dict)
+
+    def sheet(self, name: str, *, hidden: bool = False) -> _SheetStream:
+        stream = self.sheets.get(name)
+        if stream is None:
+            stream = self.sheets[name] = _SheetStream(name)
+        if hidden:
+            stream.hidden = True
+        return stream
+
+    def formula_context(self) -> tuple[dict[str, dict[str, int]], dict[str, tuple[int, int]]]:
+        sheet_headers = {name: stream.headers for name, stream in self.sheets.items()}
+        sheet_data_bounds = {
+            name: stream.data_bounds
+            for name, stream in self.sheets.items()
+            if stream.data_bounds is not None
+        }
+        return sheet_headers, sheet_data_bounds
+
+
+# --------------------------------------------------------------------------------------
+# Plan indexing
+# --------------------------------------------------------------------------------------
+
+def _index_header(stream: _SheetStream, index: int, op: SetHeader) -> None:
+    stream.headers.setdefault(op.text, op.col)
+    stream.add_cell_edit(index, op.row, op.col, "value", op.text)
+
+
+def _index_data_block(stream: _SheetStream, index: int, op: WriteDataBlock) -> None:
+    if not op.data:
+        return
+    end = op.r1 + len(op.data) - 1
+    if stream.data_bounds is None:
+        stream.data_bounds = (op.r1, end)
+    else:
+        old_start, old_end = stream.data_bounds
+        stream.data_bounds = (min(old_start, op.r1), max(old_end, end))
+    stream.blocks.append((index, op))
+    for row_offset, row_data in enumerate(op.data):
+        if len(row_data):
+            stream.extend(op.r1 + row_offset, op.c1 + len(row_data) - 1)
+
+
+def _index_header_style(stream: _SheetStream, index: int, op: ApplyHeaderStyle) -> None:
+    stream.extend(op.row, op.col)
+    if op.bold:
+        stream.add_cell_edit(index, op.row, op.col, "bold", True)
+    if op.fill_rgb:
+        stream.add_cell_edit(index, op.row, op.col, "fill", op.fill_rgb)
+
+
+def _index_column_style(stream: _SheetStream, index: int, op: ApplyColumnStyle) -> None:
+    if op.from_row > op.to_row:
+        return
+    stream.extend(op.to_row, op.col)
+    if op.fill_rgb:
+        stream.column_fills.append((index, op.col, op.from_row, op.to_row, op.fill_rgb))
+
+
+def _index_merge(stream: _SheetStream, index: int, op: MergeCells) -> None:
+    stream.merges.append(op)
+    stream.extend(op.r1, op.c1)
+    if op.r2 >= op.r1 and op.c2 >= op.c1:
+        stream.extend(op.r2, op.c2)
+
+
+def _index_validation(stream: _SheetStream, index: int, op: AddValidation) -> None:
+    stream.validations.append(op)
+    if op.r2 >= op.r1 and op.c2 >= op.c1:
+        stream.extend(op.r2, op.c2)
+
+
+def _index_named_range(stream: _SheetStream, index: int, op: DefineNamedRange) -> None:
+    stream.named_ranges.append(op)
+
+
+def _index_autofilter(stream: _SheetStream, index: int, op: SetAutoFilter) -> None:
+    stream.autofilter = (op.r1, op.c1, op.r2, op.c2)
+
+
+def _index_freeze(stream: _SheetStream, index: int, op: SetFreeze) -> None:
+    stream.freeze = (op.row, op.col)
+
+
+def _index_column_width(stream: _SheetStream, index: int, op: SetColumnWidth) -> None:
+    stream.column_widths[op.col] = op.width
+
+
+def _index_text_orientation(stream: _SheetStream, index: int, op: SetTextOrientation) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "rotation", op.rotation)
+
+
+def _index_horizontal(stream: _SheetStream, index: int, op: SetHorizontalAlignment) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "horizontal", op.horizontal)
+
+
+def _index_vertical(stream: _SheetStream, index: int, op: SetVerticalAlignment) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "vertical", op.vertical)
+
+
+_SHEET_INDEXERS: dict[type, Callable[[_SheetStream, int, Any], None]] = {
+    SetHeader: _index_header,
+    WriteDataBlock: _index_data_block,
+    ApplyHeaderStyle: _index_header_style,
+    ApplyColumnStyle: _index_column_style,
+    MergeCells: _index_merge,
+    AddValidation: _index_validation,
+    DefineNamedRange: _index_named_range,
+    SetAutoFilter: _index_autofilter,
+    SetFreeze: _index_freeze,
+    SetColumnWidth: _index_column_width,
+    SetTextOrientation: _index_text_orientation,
+    SetHorizontalAlignment: _index_horizontal,
+    SetVerticalAlignment: _index_vertical,
+}
+
+
+def _index_plan(plan: RenderPlan) -> _IndexedPlan:
+    """Group plan ops per sheet in first-use order, like ``_collect_sheets``."""
+    indexed = _IndexedPlan()
+    for index, op in enumerate(plan.ops):
+        if isinstance(op, DefineSheet):
+            indexed.sheet(op.sheet)
+            continue
+        if isinstance(op, WriteMeta):
+            stream = indexed.sheet(op.sheet or "_meta", hidden=bool(op.hidden))
+            for row, (key, value) in enumerate(op.kv.items(), start=1):
+                stream.add_cell_edit(index, row, 1, "value", str(key))
+                stream.add_cell_edit(index, row, 2, "value", str(value))
+            continue
+        sheet_name = getattr(op, "sheet", None)
+        if not sheet_name:
+            continue
+        stream = indexed.sheet(sheet_name)
+        # Ops without an ODS representation (protection, cell locks) still
+        # register their sheet, exactly as in the buffered renderer.
+        indexer = _SHEET_INDEXERS.get(type(op))
+        if indexer is not None:
+            indexer(stream, index, op)
+    return indexed
+
+
+# --------------------------------------------------------------------------------------
+# Row assembly
+# --------------------------------------------------------------------------------------
+
+def _merge_layout(merges: list[MergeCells], row: int) -> tuple[set[int], dict[int, tuple[int, int]]]:
+    """Return the covered columns and the anchor spans of ``row``."""
+    covered: set[int] = set()
+    anchors: dict[int, tuple[int, int]] = {}
+    for mr in merges:
+        if not mr.r1 <= row <= mr.r2:
+            continue
+        if row == mr.r1:
+            row_span, col_span = anchors.get(mr.c1, (1, 1))
+            anchors[mr.c1] = (max(row_span, mr.r2 - mr.r1 + 1), max(col_span, mr.c2 - mr.c1 + 1))
+            covered.update(range(mr.c1 + 1, mr.c2 + 1))
+        else:
+            covered.update(range(mr.c1, mr.c2 + 1))
+    return covered, anchors
+
+
+def _fold_style_edits(edits: list[_CellEdit]) -> dict[int, list[Any]]:
+    """Apply style edits in plan order; returns the style state per column."""
+    edits.sort(key=lambda edit: edit[0])
+    states: dict[int, list[Any]] = {}
+    for _, col, kind, payload in edits:
+        state = states.setdefault(col, list(_DEFAULT_STYLE_KEY))
+        if kind == "bold":
+            state[0] = state[0] or bool(payload)
+        elif kind == "fill":
+            state[1] = payload or state[1]
+        else:
+            state[_STYLE_SLOTS[kind]] = payload
+    return states
+
+
+class _RowAssembler:
+    """Resolve values and attributes of one row from the ops touching it."""
+
+    def __init__(self, stream: _SheetStream) -> None:
+        self.stream = stream
+        self.validation_names = [
+            _sheet_validation_name(stream.name, index)
+            for index in range(1, len(stream.validations) + 1)
+        ]
+
+    def style_keys(self, row: int, covered: set[int]) -> dict[int, CellStyleKey]:
+        """Return the non-default style key of every uncovered styled column."""
+        edits = [edit for edit in self.stream.cell_edits.get(row, ()) if edit[2] in _STYLE_SLOTS]
+        for index, col, from_row, to_row, fill_rgb in self.stream.column_fills:
+            if from_row <= row <= to_row:
+                edits.append((index, col, "fill", fill_rgb))
+        if not edits:
+            return {}
+        states = _fold_style_edits(edits)
+        keys: dict[int, CellStyleKey] = {}
+        for col in sorted(states):
+            if col in covered:
+                continue
+            bold, fill_rgb, rotation, horizontal, vertical = states[col]
+            key = _style_key(
+                bold=bold,
+                fill_rgb=fill_rgb,
+                rotation=rotation,
+                horizontal_alignment=horizontal,
+                vertical_alignment=vertical,
+            )
+            if key != _DEFAULT_STYLE_KEY:
+                keys[col] = key
+        return keys
+
+    def values(self, row: int) -> dict[int, Any]:
+        """Return the value of every column of ``row`` some op wrote to, later ops winning."""
+        # (op index, column, row values or None, single value)
+        events: list[tuple[int, int, Any, Any]] = [
+            (index, col, None, payload)
+            for index, col, kind, payload in self.stream.cell_edits.get(row, ())
+            if kind == "value"
+        ]
+        for index, op in self.stream.blocks:
+            if op.r1 <= row < op.r1 + len(op.data):
+                events.append((index, op.c1, op.data[row - op.r1], None))
+        events.sort(key=lambda event: event[0])
+        values: dict[int, Any] = {}
+        for _, col, row_values, value in events:
+            if row_values is None:
+                values[col] = value
+                continue
+            for offset, block_value in enumerate(row_values):
+                values[col + offset] = block_value
+        return values
+
+    def validations(self, row: int) -> dict[int, str]:
+        names: dict[int, str] = {}
+        for name, op in zip(self.validation_names, self.stream.validations):
+            if op.r1 <= row <= op.r2:
+                for col in range(op.c1, op.c2 + 1):
+                    names[col] = name
+        return names
+
+
+# --------------------------------------------------------------------------------------
+# Style registration
+# --------------------------------------------------------------------------------------
+
+@dataclass
+class _StyleCaches:
+    cell: dict[CellStyleKey, str] = field(default_factory=dict)
+    column: dict[str, str] = field(default_factory=dict)
+    table: dict[str, str] = field(default_factory=dict)
+
+
+def _column_width_styles(
+    doc: OpenDocumentSpreadsheet,
+    stream: _SheetStream,
+    caches: _StyleCaches,
+) -> list[str | None]:
+    """Register the column-width styles of ``stream``; one entry per column."""
+    if not stream.column_widths:
+        return []
+    styles: list[str | None] = []
+    for col in range(1, max(stream.max_col, 1) + 1):
+        excel_width = stream.column_widths.get(col)
+        if excel_width is None:
+            styles.append(None)
+            continue
+        width_cm = round(excel_width * _EXCEL_CHAR_TO_CM, 4)
+        styles.append(_register_column_width_style(doc, caches.column, width_cm))
+    return styles
+
+
+def _register_sheet_styles(
+    doc: OpenDocumentSpreadsheet,
+    stream: _SheetStream,
+    caches: _StyleCaches,
+) -> None:
+    """Register every automatic style ``stream`` uses, in row-major order."""
+    if stream.hidden:
+        _register_hidden_table_style(doc, caches.table)
+    _column_width_styles(doc, stream, caches)
+    assembler = _RowAssembler(stream)
+    styled_rows = set(stream.cell_edits)
+    for _, _, from_row, to_row, _ in stream.column_fills:
+        styled_rows.update(range(from_row, to_row + 1))
+    for row in sorted(styled_rows):
+        covered, _ = _merge_layout(stream.merges, row)
+        for key in assembler.style_keys(row, covered).values():
+            bold, fill_rgb, rotation, horizontal, vertical = key
+            _register_cell_style(
+                doc,
+                caches.cell,
+                bold=bold,
+                fill_rgb=fill_rgb,
+                rotation=rotation,
+                horizontal_alignment=horizontal,
+                vertical_alignment=vertical,
+            )
+
+
+# --------------------------------------------------------------------------------------
+# content.xml emission
+# --------------------------------------------------------------------------------------
+
+def _quoteattr(value: str) -> str:
+    return quoteattr(_UNREPRESENTABLE.sub("\ufffd", value))
+
+
+def _sanitize(text: str) -> str:
+    return escape(_UNREPRESENTABLE.sub("\ufffd", text))
+
+
+def _attribute(qname: QName, value: Any) -> str:
+    return f" {_ATTRIBUTE_PREFIXES[qname[0]]}:{qname[1]}={_quoteattr(str(value))}"
+
+
+def _cell_xml(attributes: dict[QName, Any], text: str | None) -> str:
+    attrs = "".join(_attribute(qname, value) for qname, value in attributes.items())
+    if text is None:
+        return f"<table:table-cell{attrs}/>"
+    return f"<table:table-cell{attrs}><text:p>{_sanitize(text)}</text:p></table:table-cell>"
+
+
+def _repeated(element: str, attribute: str, count: int) -> str:
+    """Add ``attribute="count"`` to a self-closing element when ``count > 1``."""
+    if count == 1:
+        return element
+    return f'{element[:-2]} table:{attribute}="{count}"/>'
+
+
+def _run_length_cells(cells: list[str]) -> Iterator[str]:
+    """Collapse runs of identical self-closing cells via ``number-columns-repeated``."""
+    index = 0
+    while index < len(cells):
+        cell = cells[index]
+        run = 1
+        if cell.endswith("/>"):
+            while index + run < len(cells) and cells[index + run] == cell:
+                run += 1
+        yield _repeated(cell, "number-columns-repeated", run)
+        index += run
+
+
+class _TableWriter:
+    """Write one ``table:table`` element row by row."""
+
+    def __init__(
+        self,
+        out: IO[str],
+        stream: _SheetStream,
+        caches: _StyleCaches,
+        formula_context: tuple[dict[str, dict[str, int]], dict[str, tuple[int, int]]],
+    ) -> None:
+        self.out = out
+        self.stream = stream
+        self.caches = caches
+        self.formula_context = formula_context
+        self.assembler = _RowAssembler(stream)
+        self.max_col = max(stream.max_col, 1)
+
+    def write(self, doc: OpenDocumentSpreadsheet) -> None:
+        stream = self.stream
+        out = self.out
+        out.write(f"<table:table table:name={_quoteattr(stream.name)}")
+        if stream.hidden:
+            out.write(f" table:style-name={_quoteattr(self.caches.table['hidden_table'])}")
+        out.write(">")
+        if stream.named_ranges:
+            _named_expressions(stream.name, stream.named_ranges).toXml(3, out)
+        self._write_columns(doc)
+        pending_row: str | None = None
+        pending_repeat = 0
+        for row in range(1, max(stream.max_row, 1) + 1):
+            cells, blank = self._row_cells(row)
+            if blank and cells == pending_row:
+                pending_repeat += 1
+                continue
+            self._write_row(pending_row, pending_repeat)
+            if blank:
+                pending_row, pending_repeat = cells, 1
+            else:
+                pending_row, pending_repeat = None, 0
+                self._write_row(cells, 1)
+        self._write_row(pending_row, pending_repeat)
+        out.write("</table:table>")
+
+    def _write_columns(self, doc: OpenDocumentSpreadsheet) -> None:
+        styles = _column_width_styles(doc, self.stream, self.caches)
+        index = 0
+        while index < len(styles):
+            style = styles[index]
+            run = 1
+            while index + run < len(styles) and styles[index + run] == style:
+                run += 1
+            column = "<table:table-column"
+            if style is not None:
+                column += f" table:style-name={_quoteattr(style)}"
+            self.out.write(_repeated(column + "/>", "number-columns-repeated", run))
+            index += run
+
+    def _write_row(self, cells: str | None, repeat: int) -> None:
+        if cells is None:
+            return
+        if repeat > 1:
+            self.out.write(f'<table:table-row table:number-rows-repeated="{repeat}">')
+        else:
+            self.out.write("<table:table-row>")
+        self.out.write(cells)
+        self.out.write("</table:table-row>")
+
+    def _row_cells(self, row: int) -> tuple[str, bool]:
+        """Return the serialized cells of ``row`` and whether none carries a value."""
+        covered, anchors = _merge_layout(self.stream.merges, row)
+        style_keys = self.assembler.style_keys(row, covered)
+        validations = self.assembler.validations(row)
+        values = self.assembler.values(row)
+        sheet_headers, sheet_data_bounds = self.formula_context
+        cells: list[str] = []
+        blank = True
+        for col in range(1, self.max_col + 1):
+            if col in covered:
+                cells.append(_COVERED_CELL)
+                continue
+            attributes: dict[QName, Any] = {}
+            key = style_keys.get(col)
+            if key is not None:
+                attributes[(TABLENS, "style-name")] = self.caches.cell[key]
+            if col in validations:
+                attributes[(TABLENS, "content-validation-name")] = validations[col]
+            row_span, col_span = anchors.get(col, (1, 1))
+            if row_span > 1:
+                attributes[(TABLENS, "number-rows-spanned")] = row_span
+            if col_span > 1:
+                attributes[(TABLENS, "number-columns-spanned")] = col_span
+            content, text = _ods_cell_content(
+                values.get(col, ""),
+                current_sheet=self.stream.name,
+                row=row,
+                sheet_headers=sheet_headers,
+                sheet_data_bounds=sheet_data_bounds,
+            )
+            if content:
+                blank = False
+                attributes.update(content)
+            cells.append(_cell_xml(attributes, text))
+        return "".join(_run_length_cells(cells)), blank
+
+
+def _spreadsheet_declarations(
+    indexed: _IndexedPlan,
+) -> tuple[ContentValidations | None, DatabaseRanges | None]:
+    streams = list(indexed.sheets.values())
+    validations = ContentValidations() if any(s.validations for s in streams) else None
+    database_ranges = DatabaseRanges() if any(s.autofilter for s in streams) else None
+    for stream in streams:
+        if validations is not None:
+            for index, op in enumerate(stream.validations, start=1):
+                name = _sheet_validation_name(stream.name, index)
+                validations.addElement(_content_validation(stream.name, name, op))
+        if database_ranges is not None and stream.autofilter:
+            database_ranges.addElement(_database_range(stream.name, stream.autofilter))
+    return validations, database_ranges
+
+
+def _write_content(
+    out: IO[str],
+    doc: OpenDocumentSpreadsheet,
+    indexed: _IndexedPlan,
+    caches: _StyleCaches,
+) -> None:
+    validations, database_ranges = _spreadsheet_declarations(indexed)
+    root = DocumentContent()
+    for namespace in _CONTENT_NAMESPACES:
+        # Registers the prefix on odfpy's shared namespace map so the root
+        # tag declares every namespace the streamed tables use.
+        root.get_nsprefix(namespace)
+    out.write(_XML_PROLOGUE)
+    root.write_open_tag(0, out)
+    if doc.fontfacedecls.hasChildNodes():
+        doc.fontfacedecls.toXml(1, out)
+    doc.automaticstyles.toXml(1, out)
+    out.write("<office:body><office:spreadsheet>")
+    for declarations in (validations, database_ranges):
+        if declarations is not None:
+            declarations.toXml(3, out)
+    formula_context = indexed.formula_context()
+    for stream in indexed.sheets.values():
+        _TableWriter(out, stream, caches, formula_context).write(doc)
+    out.write("</office:spreadsheet></office:body>")
+    root.write_close_tag(0, out)
+
+
+def _zip_info(name: str, compress_type: int = ZIP_DEFLATED) -> ZipInfo:
+    info = ZipInfo(name, time.localtime()[:6])
+    info.compress_type = compress_type
+    info.external_attr = _UNIX_PERMS
+    return info
+
+
+def _manifest_xml(parts: list[str], mimetype: str) -> str:
+    manifest = Manifest()
+    manifest.addElement(FileEntry(fullpath="/", mediatype=mimetype))
+    for part in parts:
+        manifest.addElement(FileEntry(fullpath=part, mediatype="text/xml"))
+    xml = StringIO()
+    xml.write(_XML_PROLOGUE)
+    manifest.toXml(0, xml)
+    return xml.getvalue()
+
+
+# --------------------------------------------------------------------------------------
+# Public API
+# --------------------------------------------------------------------------------------
+
+def render_workbook_streaming(plan: RenderPlan, out_path: Path | str) -> None:
+    """Render a *RenderPlan* to ODS, writing ``content.xml`` one row at a time.
+
+    The workbook is equivalent to :func:`odf_renderer.render_workbook`; only
+    empty cell / row runs are written with ``number-*-repeated``.
+    """
+    indexed = _index_plan(plan)
+    doc = OpenDocumentSpreadsheet()
+    caches = _StyleCaches()
+    for stream in indexed.sheets.values():
+        _register_sheet_styles(doc, stream, caches)
+    _add_freeze_settings(
+        doc,
+        {stream.name: stream.freeze for stream in indexed.sheets.values() if stream.freeze},
+    )
+
+    parts = ["styles.xml", "content.xml"]
+    out = Path(out_path).with_suffix(".ods")
+    with ZipFile(out, "w") as archive:
+        archive.writestr(_zip_info("mimetype", ZIP_STORED), doc.mimetype.encode("utf-8"))
+        archive.writestr(_zip_info("styles.xml"), doc.stylesxml().encode("utf-8"))
+        with archive.open(_zip_info("content.xml"), "w") as raw:
+            text = TextIOWrapper(raw, encoding="utf-8", newline="")
+            _write_content(text, doc, indexed, caches)
+            text.flush()
+            text.detach()
+        if doc.settings.hasChildNodes():
+            archive.writestr(_zip_info("settings.xml"), doc.settingsxml().encode("utf-8"))
+            parts.append("settings.xml")
+        archive.writestr(_zip_info("meta.xml"), doc.metaxml().encode("utf-8"))
+        parts.append("meta.xml")
+        archive.writestr(
+            _zip_info("META-INF/manifest.xml"),
+            _manifest_xml(parts, doc.mimetype).encode("utf-8"),
+        )
+
+
+__all__ = ["render_workbook_streaming"]
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Final
 
 import pandas as pd
 
-from spreadsheet_handling.io_backends.base import BackendBase, BackendOptions
+from spreadsheet_handling.io_backends.base import BackendBase, BackendOptions, streaming_requested
 from spreadsheet_handling.io_backends.ods.odf_parser import parse_workbook
 from spreadsheet_handling.io_backends.ods.odf_renderer import render_workbook
+from spreadsheet_handling.io_backends.ods.odf_stream_writer import render_workbook_streaming
+from spreadsheet_handling.io_backends.sheet_selection import SheetSelection
 from spreadsheet_handling.io_backends.spreadsheet_contract import (
     build_spreadsheet_render_plan,
     read_spreadsheet_frames,
@@ -34,7 +37,12 @@ class OdsBackend(BackendBase):
 
         meta = (frames.get("_meta") if isinstance(frames, dict) else {}) or getattr(frames, "meta", {}) or {}
         plan = build_spreadsheet_render_plan(frames, meta)
-        render_workbook(plan, out_path)
+        # ``options: {streaming: true}`` writes content.xml row by row instead
+        # of building the odfpy table tree; the saved workbook is equivalent.
+        renderer = render_workbook
+        if streaming_requested(options):
+            renderer = render_workbook_streaming
+        renderer(plan, out_path)
 
     def read_multi(
         self,
@@ -42,7 +50,20 @@ class OdsBackend(BackendBase):
         header_levels: int,
         options: BackendOptions | None = None,
     ) -> Dict[str, pd.DataFrame]:
-        return read_spreadsheet_frames(Path(path), parser=parse_workbook)
+        """Read all visible sheets from an ODS file via the spreadsheet backend contract.
+
+        ``options: {streaming: true}`` reads ``content.xml`` incrementally
+        instead of loading the odfpy document tree; the frames are identical.
+        ``options: {sheets: [...]}`` (or ``{include: [...], exclude: [...]}``)
+        parses only the selected visible tables; ``_meta`` is always read.
+        """
+        parser = parse_workbook
+        if streaming_requested(options):
+            parser = partial(parse_workbook, streaming=True)
+        sheets = SheetSelection.from_options(options)
+        if sheets is not None:
+            parser = partial(parser, sheets=sheets)
+        return read_spreadsheet_frames(Path(path), parser=parser)
 
 
 def save_ods(
@@ -0,0 +1,316 @@
+"""Reader-neutral raw structure of an ODS package for the ODS read path.
+
+The odfpy DOM loader and the streaming ``content.xml`` reader both reduce a
+package to an ``OdsPackage``: style records, one ``OdsTableSource`` per
+top-level ``table:table`` and the spreadsheet-level validation / database
+range declarations. Everything after that point (grid interpretation,
+presentation extraction, ``WorkbookIR`` assembly) runs on these structures
+only, so both readers yield the same ``WorkbookIR``.
+
+``TableGridBuilder`` consumes one ``table:table-row`` at a time. Cell values
+land in the ``ParsedTable`` grid immediately; for the presentation pass only
+the ``(covered, style_name, col_repeat)`` layout of each row is kept, and
+identical layouts are shared between rows. ``iter_column_blocks`` and
+``iter_style_blocks`` replay those records clipped to the parsed content
+extent without expanding ``number-*-repeated`` attributes.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Mapping, NamedTuple, Sequence
+
+from odf.namespaces import OFFICENS
+
+from spreadsheet_handling.io_backends.ods.parser_interpretation import ParsedTable
+from spreadsheet_handling.io_backends.parser_limits import DEFAULT_LIMITS, ParserLimits
+
+QName = tuple[str, str]
+
+
+class OdsCell(NamedTuple):
+    """One ``table:table-cell`` / ``table:covered-table-cell`` element."""
+
+    covered: bool
+    value: str
+    row_span: int
+    col_span: int
+    validation_name: str | None
+    col_repeat: int
+    style_name: str | None = None
+
+    @property
+    def has_content(self) -> bool:
+        return (not self.covered) and (
+            self.value != ""
+            or self.row_span > 1
+            or self.col_span > 1
+            or self.validation_name is not None
+        )
+
+
+class OdsColumn(NamedTuple):
+    """One ``table:table-column`` element (direct child of the table)."""
+
+    repeat: int
+    style_name: str | None
+    default_cell_style: str | None
+
+
+class StyleRecord(NamedTuple):
+    """A ``style:style`` element with the attributes of its element children."""
+
+    name: str | None
+    family: str | None
+    children: tuple[tuple[QName, Mapping[QName, str]], ...]
+
+
+# Called with (table name, table style name, style records read so far) for
+# every top-level table; readers skip tables for which it returns False.
+TableFilter = Callable[[str | None, str | None, Sequence[StyleRecord]], bool]
+
+# (covered, style_name, col_repeat) per cell; (row_repeat, cells) per row.
+StyleCell = tuple[bool, str | None, int]
+StyleRow = tuple[int, tuple[StyleCell, ...]]
+
+
+class ColumnBlock(NamedTuple):
+    """A ``table:table-column`` clipped to the content extent."""
+
+    col: int
+    repeat: int
+    column: OdsColumn
+
+
+class StyleBlock(NamedTuple):
+    """An uncovered run of identically styled cells clipped to the content extent.
+
+    The block stands for ``row_repeat`` x ``col_repeat`` cells anchored at
+    ``(row, col)``.
+    """
+
+    row: int
+    col: int
+    row_repeat: int
+    col_repeat: int
+    style_name: str | None
+
+
+@dataclass
+class OdsTableSource:
+    name: str
+    style_name: str | None
+    parsed: ParsedTable
+    columns: list[OdsColumn] = field(default_factory=list)
+    style_rows: list[StyleRow] = field(default_factory=list)
+    named_ranges: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class OdsPackage:
+    styles: list[StyleRecord] = field(default_factory=list)
+    tables: list[OdsTableSource] = field(default_factory=list)
+    validation_defs: dict[str, str] = field(default_factory=dict)
+    database_range_addresses: list[str] = field(default_factory=list)
+
+
+def typed_cell_value(attribute: Callable[[str, str], object | None]) -> str:
+    """Return the display value of a cell without text content.
+
+    ``attribute(namespace, local_name)`` reads one attribute of the cell
+    element, so the same fallback applies to odfpy and ElementTree cells.
+    """
+    value_type = attribute(OFFICENS, "value-type")
+    if value_type == "string":
+        return str(attribute(OFFICENS, "string-value") or "")
+    if value_type == "float":
+        return str(attribute(OFFICENS, "value") or "")
+    if value_type == "boolean":
+        value = str(attribute(OFFICENS, "boolean-value") or "false")
+        return "TRUE" if value == "true" else "FALSE"
+    if value_type == "date":
+        return str(attribute(OFFICENS, "date-value") or "")
+    if value_type == "time":
+        return str(attribute(OFFICENS, "time-value") or "")
+    return ""
+
+
+class TableGridBuilder:
+    """Accumulate the ``ParsedTable`` grid of one table row by row."""
+
+    def __init__(self, table_name: str, limits: ParserLimits = DEFAULT_LIMITS) -> None:
+        self.limits = limits
+        self.context = f"ODS sheet '{table_name}'"
+        self.values: dict[tuple[int, int], str] = {}
+        self.merges: list[tuple[int, int, int, int]] = []
+        self.validation_cells: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self.style_rows: list[StyleRow] = []
+        self._style_layouts: dict[tuple[StyleCell, ...], tuple[StyleCell, ...]] = {}
+        self.row_index = 1
+        self.max_row = 0
+        self.max_col = 0
+
+    def add_row(self, row_repeat: int, row_cells: Sequence[OdsCell]) -> None:
+        layout = tuple((cell.covered, cell.style_name, cell.col_repeat) for cell in row_cells)
+        self.style_rows.append((row_repeat, self._style_layouts.setdefault(layout, layout)))
+
+        if not any(cell.has_content for cell in row_cells):
+            # Repeated empty filler block — skip materialization entirely.
+            # No values, no merges, no validations, and no extension of
+            # max_row / max_col so downstream extent scans do not iterate the
+            # full theoretical sheet either.
+            self.row_index += row_repeat
+            return
+
+        self._enforce_row_block(row_repeat, row_cells)
+        for repeated_row in range(row_repeat):
+            self._materialize_row(self.row_index + repeated_row, row_cells)
+        self.row_index += row_repeat
+
+    def _enforce_row_block(self, row_repeat: int, row_cells: Sequence[OdsCell]) -> None:
+        # Defense-in-depth: confirm the declared block dimensions are within
+        # configured limits before iterating. The local skip in ``add_row``
+        # already neutralizes the common LibreOffice "select-all + format"
+        # pattern; this check protects against inputs that declare
+        # implausibly large repeats on rows that do carry content.
+        projected_row = self.row_index + row_repeat - 1
+        projected_col = 0
+        projected_content_cols_per_row = 0
+        running_col = 1
+        for cell in row_cells:
+            if cell.has_content:
+                col_span = cell.col_span
+                cell_right = running_col + cell.col_repeat - 1 + (col_span - 1 if col_span > 1 else 0)
+                if cell_right > projected_col:
+                    projected_col = cell_right
+                projected_content_cols_per_row += cell.col_repeat
+            running_col += cell.col_repeat
+        self.limits.enforce(
+            context=self.context,
+            rows=projected_row,
+            cols=projected_col,
+            cells=len(self.values) + row_repeat * projected_content_cols_per_row,
+        )
+
+    def _materialize_row(self, absolute_row: int, row_cells: Sequence[OdsCell]) -> None:
+        col_index = 1
+        for cell in row_cells:
+            if not cell.has_content:
+                col_index += cell.col_repeat
+                continue
+            for offset in range(cell.col_repeat):
+                absolute_col = col_index + offset
+                self.values[(absolute_row, absolute_col)] = cell.value
+                if cell.row_span > 1 or cell.col_span > 1:
+                    self.merges.append(
+                        (
+                            absolute_row,
+                            absolute_col,
+                            absolute_row + cell.row_span - 1,
+                            absolute_col + cell.col_span - 1,
+                        )
+                    )
+                if cell.validation_name:
+                    self.validation_cells[cell.validation_name].append((absolute_row, absolute_col))
+                # Bounds must include the full span of an explicit merge:
+                # downstream extent scans and header-merge extraction rely
+                # on max_col / max_row reaching the right/bottom edge of
+                # the merge, not just its anchor.
+                span_right = absolute_col + cell.col_span - 1
+                if span_right > self.max_col:
+                    self.max_col = span_right
+                span_bottom = absolute_row + cell.row_span - 1
+                if span_bottom > self.max_row:
+                    self.max_row = span_bottom
+            col_index += cell.col_repeat
+
+    def parsed(self) -> ParsedTable:
+        return ParsedTable(
+            values=self.values,
+            merges=self.merges,
+            validation_cells=dict(self.validation_cells),
+            max_row=self.max_row,
+            max_col=self.max_col,
+        )
+
+
+def iter_column_blocks(
+    columns: Sequence[OdsColumn],
+    *,
+    max_col: int,
+    limits: ParserLimits = DEFAULT_LIMITS,
+    context: str,
+) -> Iterator[ColumnBlock]:
+    """Yield table columns up to ``max_col`` with their repeat clipped to it.
+
+    Clipping keeps sheet-wide LibreOffice column fillers (a styled
+    table-column with a huge ``number-columns-repeated``) from producing one
+    entry per filler column. The declared right edge of every visited column
+    is still checked against ``limits``.
+    """
+    if max_col <= 0:
+        return
+    col_index = 1
+    for column in columns:
+        if col_index > max_col:
+            break
+        limits.enforce(context=context, cols=col_index + column.repeat - 1)
+        effective_repeat = min(column.repeat, max_col - col_index + 1)
+        if effective_repeat > 0:
+            yield ColumnBlock(col_index, effective_repeat, column)
+        col_index += column.repeat
+
+
+def iter_style_blocks(
+    style_rows: Sequence[StyleRow],
+    *,
+    max_row: int,
+    max_col: int,
+    limits: ParserLimits = DEFAULT_LIMITS,
+    context: str,
+) -> Iterator[StyleBlock]:
+    """Yield the uncovered cell runs of ``style_rows`` clipped to ``max_row`` x ``max_col``.
+
+    Repeats are carried on the block instead of being expanded, so a
+    "select all + format" filler costs one block, not one entry per implied
+    address. The declared row / column edges of every visited run are checked
+    against ``limits`` as defense-in-depth.
+    """
+    if max_row <= 0 or max_col <= 0:
+        return
+    row_index = 1
+    for row_repeat, row_cells in style_rows:
+        if row_index > max_row:
+            break
+        limits.enforce(context=context, rows=row_index + row_repeat - 1)
+        effective_row_repeat = min(row_repeat, max_row - row_index + 1)
+        col_index = 1
+        for covered, style_name, col_repeat in row_cells:
+            if col_index > max_col:
+                break
+            limits.enforce(context=context, cols=col_index + col_repeat - 1)
+            effective_col_repeat = min(col_repeat, max_col - col_index + 1)
+            if not covered and effective_row_repeat > 0 and effective_col_repeat > 0:
+                yield StyleBlock(
+                    row_index, col_index, effective_row_repeat, effective_col_repeat, style_name
+                )
+            col_index += col_repeat
+        row_index += row_repeat
+
+
+__all__ = [
+    "ColumnBlock",
+    "OdsCell",
+    "OdsColumn",
+    "OdsPackage",
+    "OdsTableSource",
+    "StyleBlock",
+    "StyleCell",
+    "StyleRecord",
+    "StyleRow",
+    "TableGridBuilder",
+    "iter_column_blocks",
+    "iter_style_blocks",
+    "typed_cell_value",
+]
@@ -6,9 +6,12 @@ from typing import Callable, Dict
 import pandas as pd
 
 from .base import BackendBase
-from .csv_backend import CSVBackend, load_csv_dir, save_csv_dir
+from .csv_backend import CSVBackend, load_csv_dir, open_csv_dir, save_csv_dir
 from .discard_backend import save_discard
-from .json_backend import JSONBackend, read_json_dir, write_json_dir
+from .json_backend import JSONBackend, open_json_dir, read_json_dir, write_json_dir
+from .jsonl_backend import JSONLinesBackend, open_jsonl_dir, read_jsonl_dir, write_jsonl_dir
+from .lazy_frames import LazyFrames
+from .sqlite_backend import SQLiteBackend, open_sqlite, read_sqlite, write_sqlite
 from .xml_backend import XMLBackend, read_xml_dir, write_xml_dir
 from .yaml_backend import load_yaml_dir, save_yaml_dir
 
@@ -39,12 +42,33 @@ LOADERS: Dict[str, Callable[..., Frames]] = {
     "xlsx": _lazy_callable("spreadsheet_handling.io_backends.xlsx.xlsx_backend", "load_xlsx"),
     "json_dir": read_json_dir,
     "json": read_json_dir,
+    "jsonl_dir": read_jsonl_dir,
+    "jsonl": read_jsonl_dir,
+    "parquet_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "read_parquet_dir"),
+    "parquet": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "read_parquet_dir"),
+    "feather_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "read_feather_dir"),
+    "feather": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "read_feather_dir"),
+    "sqlite": read_sqlite,
     "yaml_dir": load_yaml_dir,
     "yaml": load_yaml_dir,
     "xml_dir": read_xml_dir,
     "xml": read_xml_dir,
 }
 
+# Kinds whose sheets can be listed without reading them (``lazy: true`` input option).
+LAZY_LOADERS: Dict[str, Callable[..., LazyFrames]] = {
+    "csv_dir": open_csv_dir,
+    "json_dir": open_json_dir,
+    "json": open_json_dir,
+    "jsonl_dir": open_jsonl_dir,
+    "jsonl": open_jsonl_dir,
+    "parquet_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "open_parquet_dir"),
+    "parquet": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "open_parquet_dir"),
+    "feather_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "open_feather_dir"),
+    "feather": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "open_feather_dir"),
+    "sqlite": open_sqlite,
+}
+
 SAVERS: Dict[str, Callable[..., None]] = {
     "csv_dir": save_csv_dir,
     "discard": save_discard,
@@ -53,6 +77,13 @@ SAVERS: Dict[str, Callable[..., None]] = {
     "xlsx": _lazy_callable("spreadsheet_handling.io_backends.xlsx.xlsx_backend", "save_xlsx"),
     "json_dir": write_json_dir,
     "json": write_json_dir,
+    "jsonl_dir": write_jsonl_dir,
+    "jsonl": write_jsonl_dir,
+    "parquet_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "write_parquet_dir"),
+    "parquet": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "write_parquet_dir"),
+    "feather_dir": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "write_feather_dir"),
+    "feather": _lazy_callable("spreadsheet_handling.io_backends.columnar_backend", "write_feather_dir"),
+    "sqlite": write_sqlite,
     "yaml_dir": save_yaml_dir,
     "yaml": save_yaml_dir,
     "xml_dir": write_xml_dir,
@@ -66,6 +97,10 @@ BACKENDS: Dict[str, BackendSpec] = {
     "calc": ("spreadsheet_handling.io_backends.ods.ods_backend", "OdsBackend"),
     "csv": CSVBackend,
     "json": JSONBackend,
+    "jsonl": JSONLinesBackend,
+    "parquet": ("spreadsheet_handling.io_backends.columnar_backend", "ParquetBackend"),
+    "feather": ("spreadsheet_handling.io_backends.columnar_backend", "FeatherBackend"),
+    "sqlite": SQLiteBackend,
     "xml": XMLBackend,
 }
 
@@ -77,6 +112,13 @@ def get_loader(kind: str) -> Callable[..., Frames]:
     return fn
 
 
+def get_lazy_loader(kind: str) -> Callable[..., LazyFrames]:
+    fn = LAZY_LOADERS.get(kind)
+    if fn is None:
+        raise ValueError(f"Lazy loading is not supported for kind: {kind}")
+    return fn
+
+
 def get_saver(kind: str) -> Callable[..., None]:
     fn = SAVERS.get(kind)
     if fn is None:
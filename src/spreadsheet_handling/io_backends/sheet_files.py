@@ -0,0 +1,75 @@
+"""Optional concurrent per-sheet file I/O for the directory backends.
+
+Directory backends (``csv_dir``, ``json_dir``, ``jsonl_dir``, ``yaml_dir``,
+``xml_dir``, ``parquet_dir``, ``feather_dir``) keep one file per sheet and
+process those files independently. With ``options: {parallel: true}`` or
+``options: {max_workers: N}`` the per-file work runs in a pool: threads for
+file formats whose readers and writers spend their time in I/O or C code,
+processes for pure-Python parsers such as YAML.
+
+``map_sheet_files`` always returns results in input order, so callers merge
+them in the same deterministic sheet order as the sequential loop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from typing import Any, TypeVar
+
+from .base import BackendOptions, backend_option
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parallel_workers(options: BackendOptions | Mapping[str, Any] | None) -> int | None:
+    """Return the requested per-sheet worker count, or ``None`` for sequential I/O.
+
+    ``max_workers`` implies ``parallel`` unless ``parallel`` is explicitly
+    false; ``parallel: true`` alone uses one worker per CPU.
+    """
+    max_workers = backend_option(options, "max_workers")
+    parallel = backend_option(options, "parallel")
+    if parallel is None:
+        parallel = max_workers is not None
+    if not parallel:
+        return None
+    if max_workers is None:
+        return os.cpu_count() or 1
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f"max_workers must be a positive integer, got {max_workers!r}")
+    return max_workers
+
+
+def map_sheet_files(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    options: BackendOptions | Mapping[str, Any] | None,
+    processes: bool = False,
+) -> list[R]:
+    """Apply ``fn`` to every item, concurrently when the options ask for it.
+
+    ``processes=True`` selects a process pool; ``fn`` and the items must then
+    be picklable (module-level functions, paths, frames).
+    """
+    work = list(items)
+    workers = parallel_workers(options)
+    if workers is None or workers == 1 or len(work) < 2:
+        return [fn(item) for item in work]
+
+    workers = min(workers, len(work))
+    executor: Executor
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, len(work) // (workers * 4))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        chunksize = 1
+    with executor:
+        return list(executor.map(fn, work, chunksize=chunksize))
+
+
+__all__ = ["map_sheet_files", "parallel_workers"]
@@ -0,0 +1,62 @@
+"""``sheets:`` input option selecting which visible sheets a spreadsheet parser reads.
+
+.. code-block:: yaml
+
+    options: {sheets: [orders, customers]}       # include list
+    options: {sheets: {exclude: [scratch]}}      # every visible sheet but these
+
+Hidden sheets (the ``_meta`` carrier among them) are always read: they hold
+workbook metadata, not data frames.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+from .base import BackendOptions, backend_option
+
+_SELECTION_KEYS = {"include", "exclude"}
+
+
+def _sheet_names(value: Any, field_name: str) -> tuple[str, ...]:
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, Iterable) and not isinstance(value, Mapping):
+        names = tuple(value)
+        if all(isinstance(name, str) for name in names):
+            return names
+    raise ValueError(f"{field_name} must be a sheet name or a list of sheet names, got {value!r}")
+
+
+class SheetSelection(NamedTuple):
+    include: tuple[str, ...] | None = None
+    exclude: tuple[str, ...] = ()
+
+    @classmethod
+    def from_options(cls, options: BackendOptions | Mapping[str, Any] | None) -> SheetSelection | None:
+        value = backend_option(options, "sheets")
+        if value is None:
+            return None
+        if not isinstance(value, Mapping):
+            return cls(include=_sheet_names(value, "sheets"))
+        unknown = sorted(set(value) - _SELECTION_KEYS)
+        if unknown:
+            raise ValueError(f"sheets supports 'include' and 'exclude', got unknown key(s) {unknown!r}")
+        include = value.get("include")
+        return cls(
+            include=None if include is None else _sheet_names(include, "sheets.include"),
+            exclude=_sheet_names(value.get("exclude") or (), "sheets.exclude"),
+        )
+
+    def selects(self, name: str) -> bool:
+        if name in self.exclude:
+            return False
+        return self.include is None or name in self.include
+
+    def check_available(self, names: Iterable[str]) -> None:
+        """Fail for included sheets the workbook does not contain."""
+        available = set(names)
+        missing = [name for name in self.include or () if name not in available]
+        if missing:
+            raise ValueError(f"Selected sheet(s) not found in workbook: {missing!r}")
@@ -0,0 +1,281 @@
+"""SQLite database as a persistent working store for frames and ``_meta``.
+
+Every sheet becomes one table whose column names are the flattened headers
+(``order.id``), so later runs and ad-hoc tools can query it selectively.
+The catalog table keeps the original header tuples and dtypes, which makes
+the flattening reversible, plus a content fingerprint per sheet. Saving into
+an existing database is incremental: sheets that are not part of the save
+stay untouched and unchanged sheets are not rewritten. ``_meta`` is stored
+as one JSON row and replaced by every save; a save without ``_meta`` removes
+it. A sheet without columns is stored as one ``_empty`` column of NULLs so
+its row count survives.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from contextlib import closing
+from functools import partial
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+import sqlite3
+from typing import Any, Dict, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .base import BackendBase, BackendOptions, backend_option, coerce_backend_options
+from .lazy_frames import LazyFrames
+
+Frames = Dict[str, pd.DataFrame]
+
+CATALOG_TABLE = "_sheets_catalog"
+META_TABLE = "_sheets_meta"
+_RESERVED_TABLES = {CATALOG_TABLE, META_TABLE}
+# Dtypes SQLite has no storage class for; restored from the catalog on read.
+_RESTORED_DTYPE_KINDS = ("b", "M")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} (
+    sheet TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    columns TEXT NOT NULL,
+    fingerprint TEXT
+);
+CREATE TABLE IF NOT EXISTS {META_TABLE} (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class _SheetColumn(NamedTuple):
+    name: str
+    header: list[Any]
+    dtype: str
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _sheet_columns(df: pd.DataFrame) -> list[_SheetColumn]:
+    """Flatten headers to unique SQL column names, keeping the original header."""
+    columns: list[_SheetColumn] = []
+    taken: set[str] = set()
+    for position, (col, dtype) in enumerate(zip(df.columns, df.dtypes)):
+        header = list(col) if isinstance(col, tuple) else [col]
+        name = ".".join(str(level) for level in header if level is not None and str(level) != "")
+        name = name or f"column_{position + 1}"
+        unique, n = name, 1
+        while unique.casefold() in taken:  # SQLite column names are case-insensitive
+            n += 1
+            unique = f"{name}~{n}"
+        taken.add(unique.casefold())
+        columns.append(_SheetColumn(unique, header, str(dtype)))
+    return columns
+
+
+def _sql_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (str, int, bytes)):
+        return value
+    if isinstance(value, float):
+        return None if math.isnan(value) else value
+    if value is pd.NaT or value is pd.NA:
+        return None
+    return str(value)  # timestamps, decimals, ... stored as text
+
+
+def _sheet_rows(df: pd.DataFrame) -> Iterable[tuple[Any, ...]]:
+    values = [
+        [_sql_value(v) for v in df.iloc[:, position].tolist()] for position in range(df.shape[1])
+    ]
+    return zip(*values)
+
+
+def _fingerprint(df: pd.DataFrame, columns_json: str) -> str | None:
+    digest = hashlib.sha256(columns_json.encode("utf-8"))
+    if df.shape[1] == 0:
+        digest.update(str(len(df)).encode("ascii"))
+        return digest.hexdigest()
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except (TypeError, ValueError):  # unhashable cells (lists, dicts): always rewrite
+        return None
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def _restore_header(columns: list[dict[str, Any]]) -> pd.Index:
+    headers = [tuple(column["header"]) for column in columns]
+    if headers and len(headers[0]) > 1:
+        return pd.MultiIndex.from_tuples(headers)
+    return pd.Index([header[0] for header in headers])
+
+
+def _read_sheet(con: sqlite3.Connection, sheet: str, columns: list[dict[str, Any]]) -> pd.DataFrame:
+    cursor = con.execute(f"SELECT * FROM {_quote(sheet)}")
+    rows = cursor.fetchall()
+    data = {position: list(values) for position, values in enumerate(zip(*rows))}
+    df = pd.DataFrame(data, index=range(len(rows)), columns=range(len(columns)))
+    for position, column in enumerate(columns):
+        dtype = pd.api.types.pandas_dtype(column["dtype"])
+        if dtype.kind in _RESTORED_DTYPE_KINDS and rows and df[position].notna().all():
+            df[position] = df[position].astype(dtype)
+    df.columns = _restore_header(columns)
+    return df
+
+
+def _write_sheet(con: sqlite3.Connection, sheet: str, df: pd.DataFrame, columns: list[_SheetColumn]) -> None:
+    table = _quote(sheet)
+    con.execute(f"DROP TABLE IF EXISTS {table}")
+    if not columns:
+        con.execute(f"CREATE TABLE {table} (_empty INTEGER)")
+        con.executemany(f"INSERT INTO {table} VALUES (NULL)", [()] * len(df))
+        return
+    con.execute(f"CREATE TABLE {table} ({', '.join(_quote(c.name) for c in columns)})")
+    placeholders = ", ".join("?" * len(columns))
+    con.executemany(f"INSERT INTO {table} VALUES ({placeholders})", _sheet_rows(df))
+
+
+def _check_sheet_names(sheets: Mapping[str, pd.DataFrame]) -> None:
+    reserved = _RESERVED_TABLES.intersection(sheets)
+    if reserved:
+        raise ValueError(f"Sheet names reserved by the sqlite backend: {sorted(reserved)}")
+    folded: dict[str, str] = {}
+    for sheet in sheets:
+        other = folded.setdefault(sheet.casefold(), sheet)
+        if other != sheet:  # SQLite table names are case-insensitive
+            raise ValueError(f"Sheets {other!r} and {sheet!r} map to the same SQLite table")
+
+
+def _save_sheets(con: sqlite3.Connection, sheets: Mapping[str, pd.DataFrame], *, prune: bool) -> None:
+    known = {
+        sheet: (position, fingerprint)
+        for sheet, position, fingerprint in con.execute(f"SELECT sheet, position, fingerprint FROM {CATALOG_TABLE}")
+    }
+    if prune:
+        for sheet in set(known) - set(sheets):
+            con.execute(f"DROP TABLE IF EXISTS {_quote(sheet)}")
+            con.execute(f"DELETE FROM {CATALOG_TABLE} WHERE sheet = ?", (sheet,))
+    next_position = max((position for position, _ in known.values()), default=-1) + 1
+    for sheet, df in sheets.items():
+        columns = _sheet_columns(df)
+        columns_json = json.dumps([c._asdict() for c in columns], ensure_ascii=False, default=str)
+        fingerprint = _fingerprint(df, columns_json)
+        position, stored = known.get(sheet, (next_position, None))
+        next_position = max(next_position, position + 1)
+        if fingerprint is not None and fingerprint == stored:
+            continue  # unchanged since the last save
+        _write_sheet(con, sheet, df, columns)
+        con.execute(
+            f"INSERT OR REPLACE INTO {CATALOG_TABLE} VALUES (?, ?, ?, ?)",
+            (sheet, position, columns_json, fingerprint),
+        )
+
+
+def _store_path(path: str) -> Path:
+    db = Path(os.fspath(path))
+    if not db.is_file():
+        raise FileNotFoundError(f"SQLite database not found: {db}")
+    return db
+
+
+def _connect_read_only(db: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{db.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _read_catalog(
+    con: sqlite3.Connection, db: Path
+) -> tuple[list[tuple[str, list[dict[str, Any]]]], dict[str, Any] | None]:
+    tables = {name for (name,) in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if not _RESERVED_TABLES <= tables:
+        raise ValueError(f"{db} is not a sheets store: missing {sorted(_RESERVED_TABLES - tables)}")
+    catalog = con.execute(f"SELECT sheet, columns FROM {CATALOG_TABLE} ORDER BY position").fetchall()
+    meta = con.execute(f"SELECT value FROM {META_TABLE} WHERE key = '_meta'").fetchone()
+    sheets = [(sheet, json.loads(columns_json)) for sheet, columns_json in catalog]
+    return sheets, (None if meta is None else json.loads(meta[0]))
+
+
+def _load_sheet(db: Path, sheet: str, columns: list[dict[str, Any]]) -> pd.DataFrame:
+    with closing(_connect_read_only(db)) as con:
+        return _read_sheet(con, sheet, columns)
+
+
+class SQLiteBackend(BackendBase):
+    """
+    Backend for a SQLite database file, one table per sheet plus catalog and _meta tables.
+    """
+
+    def read_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> Frames:
+        db = _store_path(path)
+        with closing(_connect_read_only(db)) as con:
+            catalog, meta = _read_catalog(con, db)
+            out: Frames = {sheet: _read_sheet(con, sheet, columns) for sheet, columns in catalog}
+        if meta is not None:
+            out["_meta"] = meta  # type: ignore[assignment]
+        return out
+
+    def open_multi(self, path: str, header_levels: int, options: BackendOptions | None = None) -> LazyFrames:
+        db = _store_path(path)
+        with closing(_connect_read_only(db)) as con:
+            catalog, meta = _read_catalog(con, db)
+        return LazyFrames({sheet: partial(_load_sheet, db, sheet, columns) for sheet, columns in catalog}, meta=meta)
+
+    def write_multi(self, frames: Frames, path: str, options: BackendOptions | None = None) -> None:
+        db = Path(os.fspath(path))
+        db.parent.mkdir(parents=True, exist_ok=True)
+        sheets = {name: df for name, df in frames.items() if name != "_meta"}
+        _check_sheet_names(sheets)
+
+        # Explicit transaction: sqlite3 would run the DDL outside an implicit one.
+        with closing(sqlite3.connect(db, isolation_level=None)) as con:
+            con.executescript(_SCHEMA)
+            con.execute("BEGIN")
+            try:
+                _save_sheets(con, sheets, prune=bool(backend_option(options, "prune")))
+                meta = frames.get("_meta")
+                if isinstance(meta, Mapping):
+                    con.execute(
+                        f"INSERT OR REPLACE INTO {META_TABLE} VALUES ('_meta', ?)",
+                        (json.dumps(meta, ensure_ascii=False),),
+                    )
+                else:
+                    con.execute(f"DELETE FROM {META_TABLE} WHERE key = '_meta'")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+
+
+# ---- Router-facing convenience wrappers ----
+
+def read_sqlite(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> Frames:
+    """
+    Read all sheets and ``_meta`` from a SQLite working store.
+    """
+    return SQLiteBackend().read_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def open_sqlite(path: str, *, header_levels: int = 1, options: Mapping[str, Any] | BackendOptions | None = None) -> LazyFrames:
+    """
+    Open a SQLite working store; each sheet table is read on first access.
+    """
+    return SQLiteBackend().open_multi(path, header_levels=header_levels, options=coerce_backend_options(options))
+
+
+def write_sqlite(
+    frames: Frames,
+    path: str | os.PathLike[str],
+    *,
+    options: Mapping[str, Any] | BackendOptions | None = None,
+) -> None:
+    """
+    Save frames into a SQLite working store, updating only sheets that changed.
+    """
+    SQLiteBackend().write_multi(frames, os.fspath(path), options=coerce_backend_options(options))
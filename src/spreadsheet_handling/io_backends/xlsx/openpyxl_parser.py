@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+from contextlib import ExitStack
 import csv
 import io
 import json
@@ -15,6 +16,11 @@ from openpyxl.worksheet.worksheet import Worksheet
 from spreadsheet_handling.io_backends.presentation_meta import (
     apply_cell_addressed_presentation_meta,
 )
+from spreadsheet_handling.io_backends.sheet_selection import SheetSelection
+from spreadsheet_handling.io_backends.xlsx.openpyxl_stream_reader import (
+    StreamedWorksheet,
+    WorksheetStream,
+)
 from spreadsheet_handling.io_backends.xlsx.parser_interpretation import (
     build_sheet_meta_hints,
     build_visible_sheet_ir,
@@ -28,7 +34,12 @@ from spreadsheet_handling.rendering.ir import (
 from spreadsheet_handling.core.formulas import ListLiteralFormulaSpec
 
 
-def parse_workbook(path: str | Path) -> WorkbookIR:
+def parse_workbook(
+    path: str | Path,
+    *,
+    streaming: bool = False,
+    sheets: SheetSelection | None = None,
+) -> WorkbookIR:
     """
     Parse an XLSX workbook into ``WorkbookIR`` via openpyxl.
 
@@ -36,9 +47,22 @@ def parse_workbook(path: str | Path) -> WorkbookIR:
       1. Embedded hidden `_meta` payload
       2. Explicit anchors passed by a future caller extension
       3. Heuristic fallback from sheet contents
+
+    ``streaming=True`` opens the workbook in openpyxl read-only mode and reads
+    each visible worksheet in a single pass that keeps only its table blocks
+    and carriers (see ``openpyxl_stream_reader``). The resulting
+    ``WorkbookIR`` is identical to the full-mode parse; memory no longer
+    scales with per-cell objects.
+
+    ``sheets`` restricts the visible sheets that are parsed; hidden sheets are
+    always read. In read-only mode unselected worksheets are never loaded.
     """
-    wb = openpyxl.load_workbook(str(path), data_only=True)
-    try:
+    with ExitStack() as stack:
+        wb = _load_workbook(path, read_only=streaming)
+        stack.callback(wb.close)
+        stream = stack.enter_context(WorksheetStream(path)) if streaming else None
+        if sheets is not None:
+            sheets.check_available(wb.sheetnames)
         ir = WorkbookIR()
 
         embedded_meta = _read_meta_sheet(wb)
@@ -49,73 +73,93 @@ def parse_workbook(path: str | Path) -> WorkbookIR:
             if ws.sheet_state == "hidden":
                 ir.hidden_sheets[ws_name] = _parse_hidden_sheet(ws)
                 continue
-
-            column_widths = _extract_column_widths(ws)
-            text_orientations = _extract_text_orientations(ws)
-            horizontal_alignments = _extract_horizontal_alignments(ws)
-            vertical_alignments = _extract_vertical_alignments(ws)
-            legend_hints = _legend_table_hints(embedded_meta, sheet_name=ws_name)
-            legend_anchors = [
-                (hint["top"], hint["left"])
-                for hint in legend_hints
-                if isinstance(hint.get("top"), int) and isinstance(hint.get("left"), int)
-            ]
-            anchors = [(1, 1), *legend_anchors] if legend_anchors else None
-            meta_hints = build_sheet_meta_hints(embedded_meta, sheet_name=ws_name)
-            sheet_ir = _parse_visible_sheet(
-                ws,
-                sheet_name=ws_name,
-                anchors=anchors,
-                meta_hints=meta_hints,
-                stop_on_empty_row=True,
-                stop_on_empty_col=bool(legend_anchors),
-            )
-            if column_widths:
-                sheet_ir.meta["__column_widths"] = column_widths
-            if text_orientations:
-                sheet_ir.meta["__text_orientations"] = text_orientations
-            if horizontal_alignments:
-                sheet_ir.meta["__horizontal_alignments"] = horizontal_alignments
-            if vertical_alignments:
-                sheet_ir.meta["__vertical_alignments"] = vertical_alignments
-            # Carrier is authoritative for all four presentation-metadata
-            # families: empty extraction must clear any persisted entry for
-            # that sheet so the next roundtrip cannot silently reapply
-            # formatting the user has just removed. The shared helper is
-            # invoked unconditionally per family for that reason.
-            meta_changed = (
-                apply_cell_addressed_presentation_meta(
-                    embedded_meta, ws_name, "column_widths", column_widths
-                )
-                or meta_changed
-            )
-            meta_changed = (
-                apply_cell_addressed_presentation_meta(
-                    embedded_meta, ws_name, "text_orientations", text_orientations
-                )
-                or meta_changed
-            )
-            meta_changed = (
-                apply_cell_addressed_presentation_meta(
-                    embedded_meta, ws_name, "horizontal_alignments", horizontal_alignments
-                )
-                or meta_changed
-            )
-            meta_changed = (
-                apply_cell_addressed_presentation_meta(
-                    embedded_meta, ws_name, "vertical_alignments", vertical_alignments
-                )
-                or meta_changed
-            )
+            if sheets is not None and not sheets.selects(ws_name):
+                continue
+            sheet_ir, sheet_meta_changed = _parse_selected_sheet(ws, embedded_meta, stream)
+            meta_changed = sheet_meta_changed or meta_changed
             ir.sheets[ws_name] = sheet_ir
-            _apply_legend_table_hints(sheet_ir, legend_hints)
 
         _extract_named_ranges(wb, ir)
         if meta_changed:
             _store_workbook_meta(ir, embedded_meta)
         return ir
-    finally:
-        wb.close()
+
+
+def _parse_selected_sheet(
+    ws: Worksheet,
+    embedded_meta: dict[str, Any],
+    stream: WorksheetStream | None,
+) -> tuple[SheetIR, bool]:
+    """Parse one selected visible sheet; also report whether ``embedded_meta`` changed."""
+    ws_name = ws.title
+    legend_hints = _legend_table_hints(embedded_meta, sheet_name=ws_name)
+    legend_anchors = [
+        (hint["top"], hint["left"])
+        for hint in legend_hints
+        if isinstance(hint.get("top"), int) and isinstance(hint.get("left"), int)
+    ]
+    anchors = [(1, 1), *legend_anchors] if legend_anchors else None
+    if stream is not None:
+        sheet: Worksheet | StreamedWorksheet = stream.read(
+            ws, anchors=anchors or [(1, 1)], stop_on_empty_col=bool(legend_anchors)
+        )
+        presentation = _streamed_presentation_meta(sheet)
+    else:
+        sheet = ws
+        presentation = _presentation_meta(ws)
+    sheet_ir = _parse_visible_sheet(
+        sheet,
+        sheet_name=ws_name,
+        anchors=anchors,
+        meta_hints=build_sheet_meta_hints(embedded_meta, sheet_name=ws_name),
+        stop_on_empty_row=True,
+        stop_on_empty_col=bool(legend_anchors),
+    )
+    meta_changed = False
+    for family, values in presentation.items():
+        if values:
+            sheet_ir.meta[f"__{family}"] = values
+    # Carrier is authoritative for all four presentation-metadata
+    # families: empty extraction must clear any persisted entry for
+    # that sheet so the next roundtrip cannot silently reapply
+    # formatting the user has just removed. The shared helper is
+    # invoked unconditionally per family for that reason.
+    for family, values in presentation.items():
+        meta_changed = (
+            apply_cell_addressed_presentation_meta(embedded_meta, ws_name, family, values)
+            or meta_changed
+        )
+    _apply_legend_table_hints(sheet_ir, legend_hints)
+    return sheet_ir, meta_changed
+
+
+def _presentation_meta(ws: Worksheet) -> dict[str, dict[str, dict[str, Any]]]:
+    """Cell-addressed presentation families of a full-mode worksheet, keyed by family."""
+    return {
+        "column_widths": _extract_column_widths(ws),
+        "text_orientations": _extract_text_orientations(ws),
+        "horizontal_alignments": _extract_horizontal_alignments(ws),
+        "vertical_alignments": _extract_vertical_alignments(ws),
+    }
+
+
+def _streamed_presentation_meta(
+    sheet: StreamedWorksheet,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Same as ``_presentation_meta`` for a ``StreamedWorksheet``."""
+    text_orientations, horizontal_alignments, vertical_alignments = (
+        _extract_streamed_alignment_families(sheet)
+    )
+    return {
+        "column_widths": _extract_column_widths(sheet),
+        "text_orientations": text_orientations,
+        "horizontal_alignments": horizontal_alignments,
+        "vertical_alignments": vertical_alignments,
+    }
+
+
+def _load_workbook(path: str | Path, *, read_only: bool) -> openpyxl.Workbook:
+    return openpyxl.load_workbook(str(path), read_only=read_only, data_only=True)
 
 
 def _read_meta_sheet(wb: openpyxl.Workbook) -> dict[str, Any]:
@@ -160,7 +204,7 @@ def _parse_hidden_sheet(ws: Worksheet) -> SheetIR:
     return sh
 
 
-def _extract_column_widths(ws: Worksheet) -> dict[str, dict[str, Any]]:
+def _extract_column_widths(ws: Worksheet | StreamedWorksheet) -> dict[str, dict[str, Any]]:
     """Extract explicitly authored XLSX column widths by Excel column letter."""
     widths: dict[str, dict[str, Any]] = {}
     for key, dim in ws.column_dimensions.items():
@@ -186,7 +230,9 @@ def _extract_column_widths(ws: Worksheet) -> dict[str, dict[str, Any]]:
     return widths
 
 
-def _build_xlsx_column_alignment_fallbacks(ws: Worksheet) -> dict[str, Any]:
+def _build_xlsx_column_alignment_fallbacks(
+    ws: Worksheet | StreamedWorksheet,
+) -> dict[str, Any]:
     """Return {col_letter: Alignment} for columns that carry a column-level alignment value.
 
     Reads from ``ws.column_dimensions`` — the carrier written by Excel and LibreOffice
@@ -250,19 +296,37 @@ def _extract_text_orientations(ws: Worksheet) -> dict[str, dict[str, Any]]:
                 rotation = col_fallbacks[col_letter].text_rotation
             else:
                 rotation = None
-            if rotation is None or rotation == 0:
-                continue
-            try:
-                rotation = int(rotation)
-            except (TypeError, ValueError):
-                continue
-            if rotation <= 0:
+            rotation = _positive_rotation(rotation)
+            if rotation is None:
                 continue
             address = f"{col_letter}{cell.row}"
             orientations[address] = {"rotation": rotation, "source": "workbook"}
     return orientations
 
 
+def _positive_rotation(rotation: Any) -> int | None:
+    """Return a positive integer text rotation, or ``None`` when nothing is rotated."""
+    if rotation is None or rotation == 0:
+        return None
+    try:
+        rotation = int(rotation)
+    except (TypeError, ValueError):
+        return None
+    if rotation <= 0:
+        return None
+    return rotation
+
+
+def _canonical_alignment(value: Any, vocabulary: frozenset[str]) -> str | None:
+    """Normalize an alignment value and keep it only if it is canonical vocabulary."""
+    if not isinstance(value, str):
+        return None
+    canonical = value.strip().lower()
+    if canonical not in vocabulary:
+        return None
+    return canonical
+
+
 _CANONICAL_HORIZONTAL_ALIGNMENTS_XLSX: frozenset[str] = frozenset(
     {"left", "center", "right"}
 )
@@ -294,10 +358,8 @@ def _extract_horizontal_alignments(ws: Worksheet) -> dict[str, dict[str, Any]]:
             horizontal = cell_align.horizontal if cell_align is not None else None
             if horizontal is None and col_letter in col_fallbacks:
                 horizontal = col_fallbacks[col_letter].horizontal
-            if not isinstance(horizontal, str):
-                continue
-            canonical = horizontal.strip().lower()
-            if canonical not in _CANONICAL_HORIZONTAL_ALIGNMENTS_XLSX:
+            canonical = _canonical_alignment(horizontal, _CANONICAL_HORIZONTAL_ALIGNMENTS_XLSX)
+            if canonical is None:
                 continue
             address = f"{col_letter}{cell.row}"
             alignments[address] = {"horizontal": canonical, "source": "workbook"}
@@ -325,16 +387,118 @@ def _extract_vertical_alignments(ws: Worksheet) -> dict[str, dict[str, Any]]:
             vertical = cell_align.vertical if cell_align is not None else None
             if vertical is None and col_letter in col_fallbacks:
                 vertical = col_fallbacks[col_letter].vertical
-            if not isinstance(vertical, str):
-                continue
-            canonical = vertical.strip().lower()
-            if canonical not in _CANONICAL_VERTICAL_ALIGNMENTS_XLSX:
+            canonical = _canonical_alignment(vertical, _CANONICAL_VERTICAL_ALIGNMENTS_XLSX)
+            if canonical is None:
                 continue
             address = f"{col_letter}{cell.row}"
             alignments[address] = {"vertical": canonical, "source": "workbook"}
     return alignments
 
 
+def _extract_streamed_alignment_families(
+    sheet: StreamedWorksheet,
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """Sparse streaming equivalent of the three cell-iterating alignment extractors.
+
+    Returns ``(text_orientations, horizontal_alignments, vertical_alignments)``
+    with the same resolution rules as ``_extract_text_orientations``,
+    ``_extract_horizontal_alignments`` and ``_extract_vertical_alignments``.
+    Positions without an explicit ``<alignment>`` element all resolve to the
+    workbook default alignment plus the column-level fallback, so they are
+    evaluated once per column and only expanded over rows when that column
+    actually yields a value.
+    """
+    col_fallbacks = _build_xlsx_column_alignment_fallbacks(sheet)
+    default = sheet.default_alignment
+    rotations: dict[tuple[int, int], int] = {}
+    horizontals: dict[tuple[int, int], str] = {}
+    verticals: dict[tuple[int, int], str] = {}
+
+    for (row, col), align in sheet.explicit_alignments.items():
+        fallback = col_fallbacks.get(get_column_letter(col))
+        _record_alignment(
+            (row, col),
+            rotation=align.text_rotation,
+            horizontal=_with_fallback(align.horizontal, fallback, "horizontal"),
+            vertical=_with_fallback(align.vertical, fallback, "vertical"),
+            rotations=rotations,
+            horizontals=horizontals,
+            verticals=verticals,
+        )
+
+    for col in range(1, sheet.max_column + 1):
+        fallback = col_fallbacks.get(get_column_letter(col))
+        fallback_rotation = fallback.text_rotation if fallback is not None else None
+        horizontal = _with_fallback(default.horizontal, fallback, "horizontal")
+        vertical = _with_fallback(default.vertical, fallback, "vertical")
+        column_yields_value = (
+            _positive_rotation(fallback_rotation) is not None
+            or _canonical_alignment(horizontal, _CANONICAL_HORIZONTAL_ALIGNMENTS_XLSX) is not None
+            or _canonical_alignment(vertical, _CANONICAL_VERTICAL_ALIGNMENTS_XLSX) is not None
+        )
+        if not column_yields_value:
+            continue
+        for row in range(1, sheet.max_row + 1):
+            if (row, col) in sheet.explicit_alignments:
+                continue
+            _record_alignment(
+                (row, col),
+                rotation=fallback_rotation,
+                horizontal=horizontal,
+                vertical=vertical,
+                rotations=rotations,
+                horizontals=horizontals,
+                verticals=verticals,
+            )
+
+    return (
+        _cell_addressed(rotations, "rotation"),
+        _cell_addressed(horizontals, "horizontal"),
+        _cell_addressed(verticals, "vertical"),
+    )
+
+
+def _with_fallback(value: Any, fallback: Any, attr: str) -> Any:
+    if value is None and fallback is not None:
+        return getattr(fallback, attr)
+    return value
+
+
+def _record_alignment(
+    position: tuple[int, int],
+    *,
+    rotation: Any,
+    horizontal: Any,
+    vertical: Any,
+    rotations: dict[tuple[int, int], int],
+    horizontals: dict[tuple[int, int], str],
+    verticals: dict[tuple[int, int], str],
+) -> None:
+    positive_rotation = _positive_rotation(rotation)
+    if positive_rotation is not None:
+        rotations[position] = positive_rotation
+    canonical_horizontal = _canonical_alignment(horizontal, _CANONICAL_HORIZONTAL_ALIGNMENTS_XLSX)
+    if canonical_horizontal is not None:
+        horizontals[position] = canonical_horizontal
+    canonical_vertical = _canonical_alignment(vertical, _CANONICAL_VERTICAL_ALIGNMENTS_XLSX)
+    if canonical_vertical is not None:
+        verticals[position] = canonical_vertical
+
+
+def _cell_addressed(
+    values: dict[tuple[int, int], Any],
+    key: str,
+) -> dict[str, dict[str, Any]]:
+    """Render ``{(row, col): value}`` as row-major ``{"A1": {key: value, ...}}``."""
+    addressed: dict[str, dict[str, Any]] = {}
+    for row, col in sorted(values):
+        addressed[f"{get_column_letter(col)}{row}"] = {
+            key: values[(row, col)],
+            "source": "workbook",
+        }
+    return addressed
+
+
 def _store_workbook_meta(ir: WorkbookIR, workbook_meta: dict[str, Any]) -> None:
     meta_sheet = ir.hidden_sheets.setdefault("_meta", SheetIR(name="_meta"))
     meta_sheet.meta["_hidden"] = True
@@ -389,7 +553,7 @@ def _apply_legend_table_hints(sheet: SheetIR, hints: list[dict[str, Any]]) -> No
 
 
 def _parse_visible_sheet(
-    ws: Worksheet,
+    ws: Worksheet | StreamedWorksheet,
     *,
     sheet_name: str,
     anchors: list[tuple[int, int]] | None,
@@ -411,7 +575,7 @@ def _parse_visible_sheet(
     )
 
 
-def _extract_validations(ws: Worksheet) -> list[DataValidationSpec]:
+def _extract_validations(ws: Worksheet | StreamedWorksheet) -> list[DataValidationSpec]:
     """Extract list validations from the worksheet into ``DataValidationSpec`` values."""
     specs: list[DataValidationSpec] = []
     for dv in ws.data_validations.dataValidation:
@@ -453,7 +617,7 @@ def _parse_xlsx_list_literal_formula(formula: str) -> ListLiteralFormulaSpec | N
     return ListLiteralFormulaSpec(tuple(values))
 
 
-def _extract_freeze(ws: Worksheet) -> dict[str, int] | None:
+def _extract_freeze(ws: Worksheet | StreamedWorksheet) -> dict[str, int] | None:
     """Parse an openpyxl freeze-pane ref such as ``A3`` into a carrier hint."""
     fp = ws.freeze_panes
     if not fp:
@@ -215,27 +215,70 @@ def _define_plan_sheets(wb: Workbook, plan: RenderPlan) -> None:
         _get_ws(wb, "Sheet1")
 
 
+def _formula_column_offsets(data: tuple) -> frozenset[int]:
+    """Return the block-relative column offsets that hold any ``LookupFormulaSpec``."""
+    offsets: set[int] = set()
+    for row_data in data:
+        for col_off, val in enumerate(row_data):
+            if isinstance(val, LookupFormulaSpec):
+                offsets.add(col_off)
+    return frozenset(offsets)
+
+
+def _appends_at_sheet_tail(ws: Worksheet, op: WriteDataBlock) -> bool:
+    """Return True when ``ws.append`` would place the block's first row at ``op.r1``.
+
+    ``ws.append`` writes below the highest row touched through the cell API
+    (``ws._current_row``). Merge ranges register their cells without moving
+    that marker, so a merge reaching into the block's rows disqualifies the
+    bulk path as well. ``_current_row`` is an openpyxl internal; without it
+    every block takes the per-cell path.
+    """
+    current_row = getattr(ws, "_current_row", None)
+    if current_row is None or current_row != op.r1 - 1:
+        return False
+    return all(mr.max_row < op.r1 for mr in ws.merged_cells.ranges)
+
+
 def _write_data_block(
     op: WriteDataBlock,
     wb: Workbook,
     sheet_headers: dict[str, dict[str, int]],
     sheet_data_bounds: dict[str, tuple[int, int]],
 ) -> None:
+    """Write a data block, dispatching per cell only for formula columns.
+
+    Columns are classified once per block. Plain-scalar rows are passed to
+    openpyxl unchanged; formula columns are translated row by row. When the
+    block starts directly below the sheet's current content, whole rows are
+    appended via ``ws.append`` instead of addressing every cell.
+    """
     ws = _get_ws(wb, op.sheet)
+    formula_offsets = _formula_column_offsets(op.data)
+    use_append = _appends_at_sheet_tail(ws, op)
+
     for row_off, row_data in enumerate(op.data):
-        for col_off, val in enumerate(row_data):
-            row = op.r1 + row_off
-            ws.cell(
-                row=row,
-                column=op.c1 + col_off,
-                value=_xlsx_cell_value(
-                    val,
+        row = op.r1 + row_off
+        values = row_data
+        if formula_offsets:
+            values = list(row_data)
+            for col_off in formula_offsets:
+                if col_off >= len(values):
+                    continue
+                values[col_off] = _xlsx_cell_value(
+                    values[col_off],
                     current_sheet=op.sheet,
                     row=row,
                     sheet_headers=sheet_headers,
                     sheet_data_bounds=sheet_data_bounds,
-                ),
-            )
+                )
+        if use_append and op.c1 == 1:
+            ws.append(values)
+        elif use_append:
+            ws.append({op.c1 + col_off: val for col_off, val in enumerate(values)})
+        else:
+            for col_off, val in enumerate(values):
+                ws.cell(row=row, column=op.c1 + col_off, value=val)
 
 
 def _write_meta(op: WriteMeta, wb: Workbook) -> None:
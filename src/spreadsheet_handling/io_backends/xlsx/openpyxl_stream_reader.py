@@ -0,0 +1,314 @@
+"""Streaming worksheet extraction for the XLSX read path.
+
+Full-mode ``openpyxl.load_workbook`` materializes one ``Cell`` object (with
+its own style array) per populated position before the parser looks at a
+single value. For large data sheets that DOM dominates both memory and parse
+time, while the interpretation layer only ever needs the values of the table
+blocks plus a few sheet-level carriers.
+
+``WorksheetStream`` reads a workbook opened with ``read_only=True`` through
+public openpyxl API only:
+
+* the sheet-level carriers (merges, list validations, freeze pane,
+  autofilter, column dimensions) come from the worksheet part with its
+  ``<sheetData>`` element skipped, and are parsed with the same openpyxl
+  classes full mode binds,
+* the cell rows are read once with ``ReadOnlyWorksheet.iter_rows``. Because
+  the merges are already known, every table block is sized as soon as its
+  anchor row arrives and filled row by row until its first empty row; only
+  those rows (and the values of merge masters) are kept,
+* the alignment of cells whose style carries an explicit ``<alignment>``
+  element is recorded on the same pass, so the presentation extractors run
+  sparsely instead of over every position of the used range.
+
+The result duck-types the worksheet attributes that ``openpyxl_parser``'s
+carrier extractors read and implements ``parser_interpretation.WorksheetCells``
+for table discovery. Blocks end at their first empty row, which is how
+``parse_workbook`` discovers tables (``stop_on_empty_row=True``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import re
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any
+from xml.etree.ElementTree import Element
+
+from openpyxl.cell.read_only import EMPTY_CELL, ReadOnlyCell
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.packaging.workbook import WorkbookPackage
+from openpyxl.styles.alignment import Alignment
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.worksheet.datavalidation import DataValidationList
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.merge import MergeCells
+from openpyxl.worksheet.views import SheetViewList
+from openpyxl.xml.constants import ARC_ROOT_RELS, SHEET_MAIN_NS
+from openpyxl.xml.functions import fromstring
+
+from spreadsheet_handling.io_backends.xlsx.parser_interpretation import (
+    MergeIndex,
+    build_merge_index,
+    row_is_empty,
+    table_block_shape,
+)
+from spreadsheet_handling.io_backends.zip_container import ZipContainer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SHEET_DATA_OPEN = re.compile(rb"<(\w+:)?sheetData[\s/>]")
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class StreamedWorksheet:
+    """Table-block values and sheet-level carriers of one worksheet, read in a single pass.
+
+    ``rows`` maps a row number to ``(first_col, values)`` for the rows table
+    discovery reads: full header rows and the block columns of each data
+    row. ``masters`` holds the value of every merge's top-left cell.
+    """
+
+    title: str
+    sheet_state: str
+    rows: dict[int, tuple[int, tuple[Any, ...]]] = field(default_factory=dict)
+    masters: dict[tuple[int, int], Any] = field(default_factory=dict)
+    merged_cells: MultiCellRange = field(default_factory=MultiCellRange)
+    column_dimensions: dict[str, ColumnDimension] = field(default_factory=dict)
+    data_validations: DataValidationList = field(default_factory=DataValidationList)
+    auto_filter: AutoFilter | None = None
+    freeze_panes: str | None = None
+    explicit_alignments: dict[tuple[int, int], Alignment] = field(default_factory=dict)
+    default_alignment: Alignment = field(default_factory=Alignment)
+    max_row: int = 1
+    max_column: int = 1
+
+    def value(self, row: int, col: int) -> Any:
+        retained = self.rows.get(row)
+        if retained is not None:
+            first_col, values = retained
+            if first_col <= col < first_col + len(values):
+                return values[col - first_col]
+        return self.masters.get((row, col))
+
+    def row_values(self, row: int, left: int, n_cols: int) -> list[Any]:
+        return [self.value(row, col) for col in range(left, left + n_cols)]
+
+
+@dataclass
+class _BlockWindow:
+    """Discovery state of one table block while its worksheet streams past."""
+
+    top: int
+    left: int
+    header_rows: int = 1
+    n_cols: int = 0
+    done: bool = False
+
+    def in_header(self, row: int) -> bool:
+        return self.top <= row < self.top + self.header_rows
+
+    def in_data(self, row: int) -> bool:
+        return not self.done and self.n_cols > 0 and row >= self.top + self.header_rows
+
+
+class WorksheetStream:
+    """Streams the visible worksheets of an XLSX package opened read-only by openpyxl."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._archive = ZipContainer(path)
+        try:
+            self._parts = _worksheet_parts(self._archive)
+        except BaseException:
+            self._archive.close()
+            raise
+
+    def __enter__(self) -> WorksheetStream:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def read(
+        self,
+        ws: Any,
+        *,
+        anchors: list[tuple[int, int]],
+        stop_on_empty_col: bool,
+    ) -> StreamedWorksheet:
+        """Read the carriers and the table blocks anchored at ``anchors`` of read-only ``ws``."""
+        sheet = StreamedWorksheet(title=ws.title, sheet_state=ws.sheet_state)
+        with self._archive.open(self._parts[ws.title]) as source:
+            _bind_sheet_carriers(sheet, fromstring(_without_sheet_data(source)), ws)
+        merges = build_merge_index(sheet.merged_cells.ranges)
+        windows = [_BlockWindow(top, left) for top, left in anchors]
+        master_cols: dict[int, list[int]] = {}
+        for min_row, min_col, _max_row, _max_col in merges.areas:
+            master_cols.setdefault(min_row, []).append(min_col)
+
+        max_row = 0
+        max_col = 0
+        ws.reset_dimensions()  # size from the cells, not the <dimension> element
+        for row, cells in enumerate(ws.iter_rows(), start=1):
+            values = _row_values(cells, merges, row)
+            for col in master_cols.get(row, ()):
+                sheet.masters[(row, col)] = values[col - 1] if col <= len(values) else None
+            _retain_block_row(sheet, windows, row, values)
+            for window in windows:
+                if window.top == row:
+                    window.header_rows, window.n_cols = table_block_shape(
+                        sheet,
+                        merges,
+                        top=row,
+                        left=window.left,
+                        stop_on_empty_col=stop_on_empty_col,
+                    )
+            if cells:
+                _record_explicit_alignments(sheet, cells)
+                max_row = row
+                max_col = max(max_col, cells[-1].column)
+
+        for mr in sheet.merged_cells.ranges:
+            max_row = max(max_row, mr.max_row)
+            max_col = max(max_col, mr.max_col)
+        sheet.max_row = max(max_row, 1)
+        sheet.max_column = max(max_col, 1)
+        return sheet
+
+
+def _row_values(cells: tuple[Any, ...], merges: MergeIndex, row: int) -> list[Any]:
+    """Cell values of ``row``; merged cells other than the master read as empty, as in full mode."""
+    values = [cell.value for cell in cells]
+    for min_row, min_col, _max_row, max_col in merges.by_row.get(row, ()):
+        for col in range(min_col, min(max_col, len(values)) + 1):
+            if (row, col) != (min_row, min_col):
+                values[col - 1] = None
+    return values
+
+
+def _retain_block_row(
+    sheet: StreamedWorksheet,
+    windows: list[_BlockWindow],
+    row: int,
+    values: list[Any],
+) -> None:
+    """Keep ``row`` if a block reads it and close blocks that it ends."""
+    data_windows = [window for window in windows if window.in_data(row)]
+    if any(window.in_header(row) for window in windows):
+        sheet.rows[row] = (1, tuple(values))
+    elif data_windows:
+        first_col = min(window.left for window in data_windows)
+        last_col = max(window.left + window.n_cols for window in data_windows)
+        block_values = tuple(values[first_col - 1:last_col - 1])
+        if any(val is not None for val in block_values):
+            sheet.rows[row] = (first_col, block_values)
+    for window in data_windows:
+        if row_is_empty(sheet, row, window.left, window.n_cols):
+            window.done = True
+
+
+def _record_explicit_alignments(sheet: StreamedWorksheet, cells: tuple[Any, ...]) -> None:
+    """Record cells whose xf carries an explicit ``<alignment>`` element.
+
+    ``alignmentId`` is 0 for xf records without one; those cells resolve to
+    the workbook default alignment, which the extractors handle per column.
+    """
+    for cell in cells:
+        if cell is EMPTY_CELL or not cell.has_style:
+            continue
+        if cell.style_array.alignmentId:
+            sheet.explicit_alignments[(cell.row, cell.column)] = cell.alignment
+
+
+def _worksheet_parts(archive: ZipContainer) -> dict[str, str]:
+    """Map sheet titles to their part names by following the package relationships."""
+    workbook_part = next(
+        rel.target
+        for rel in get_dependents(archive, ARC_ROOT_RELS)
+        if rel.Type.endswith("/officeDocument")
+    )
+    rels = get_dependents(archive, get_rels_path(workbook_part)).to_dict()
+    package = WorkbookPackage.from_tree(fromstring(archive.read(workbook_part)))
+    return {sheet.name: rels[sheet.id].target for sheet in package.sheets if sheet.id in rels}
+
+
+def _without_sheet_data(source: IO[bytes]) -> bytes:
+    """Return a worksheet part with its ``<sheetData>`` element cut out.
+
+    Every carrier the parser reads sits before or after the cell rows, so
+    the rows are skipped with a byte scan instead of being parsed twice.
+    """
+    buffer = b""
+    while True:
+        match = _SHEET_DATA_OPEN.search(buffer)
+        tag_end = buffer.find(b">", match.end() - 1) if match else -1
+        if tag_end >= 0:
+            break
+        chunk = source.read(_CHUNK_SIZE)
+        if not chunk:
+            return buffer
+        buffer += chunk
+
+    head = buffer[:match.start()]
+    rest = buffer[tag_end + 1:]
+    if buffer[tag_end - 1:tag_end] == b"/":
+        return head + rest + source.read()
+    closing = b"</" + (match.group(1) or b"") + b"sheetData>"
+    while (found := rest.find(closing)) < 0:
+        chunk = source.read(_CHUNK_SIZE)
+        if not chunk:
+            return head
+        rest = rest[-len(closing):] + chunk
+    return head + rest[found + len(closing):] + source.read()
+
+
+def _bind_sheet_carriers(sheet: StreamedWorksheet, root: Element, ws: Any) -> None:
+    """Parse the non-cell elements into the objects full-mode openpyxl binds."""
+    merges = root.find(f"{{{SHEET_MAIN_NS}}}mergeCells")
+    if merges is not None:
+        sheet.merged_cells = MultiCellRange(
+            [CellRange(merge.ref) for merge in MergeCells.from_tree(merges).mergeCell]
+        )
+
+    for col in root.iterfind(f"{{{SHEET_MAIN_NS}}}cols/{{{SHEET_MAIN_NS}}}col"):
+        attrs: dict[str, Any] = dict(col.attrib)
+        attrs["index"] = get_column_letter(int(attrs["min"]))
+        if "style" in attrs:
+            # A read-only cell resolves a cellXfs index to its style array.
+            attrs["style"] = ReadOnlyCell(ws, 0, 0, None, style_id=int(attrs["style"])).style_array
+        sheet.column_dimensions[attrs["index"]] = ColumnDimension(ws, **attrs)
+
+    validations = root.find(f"{{{SHEET_MAIN_NS}}}dataValidations")
+    if validations is not None:
+        sheet.data_validations = DataValidationList.from_tree(validations)
+    auto_filter = root.find(f"{{{SHEET_MAIN_NS}}}autoFilter")
+    if auto_filter is not None:
+        sheet.auto_filter = AutoFilter.from_tree(auto_filter)
+    views = root.find(f"{{{SHEET_MAIN_NS}}}sheetViews")
+    if views is not None:
+        sheet.freeze_panes = _freeze_panes(SheetViewList.from_tree(views))
+
+
+def _freeze_panes(views: SheetViewList) -> str | None:
+    """Mirror ``Worksheet.freeze_panes``: the first view's pane top-left cell."""
+    if not views.sheetView:
+        return None
+    pane = views.sheetView[0].pane
+    if pane is None:
+        return None
+    return pane.topLeftCell
+
+
+__all__ = ["StreamedWorksheet", "WorksheetStream"]
@@ -0,0 +1,432 @@
+"""Constant-memory XLSX rendering through an openpyxl write-only workbook.
+
+``openpyxl_renderer.render_workbook`` executes ``RenderPlan`` ops in plan
+order against a full ``Workbook``, which keeps one ``Cell`` object (plus its
+style array) per written position until ``save``. For large exports that DOM
+dominates peak memory.
+
+``render_workbook_streaming`` regroups the ops per sheet instead:
+
+* sheet-level ops (freeze pane, column widths, autofilter, list validations,
+  merges, protection, visibility) are applied to a ``WriteOnlyWorksheet``
+  before its first row is emitted,
+* cell-addressed ops (headers, header styles, alignments, column fills,
+  cell locks, ``_meta`` entries) are indexed by row,
+* ``WriteDataBlock`` rows are read from the plan while the row is emitted,
+
+and then emits every sheet in row-major order. Each row is handed to
+openpyxl, serialized into the sheet's temporary XML stream and dropped, so
+the writer's own footprint stays flat in the row count. When several ops
+touch the same position, the later op in the plan wins, exactly like the
+random-access renderer; values at merge-covered positions are dropped, as
+``Worksheet.merge_cells`` does.
+
+Plans containing op types this module does not index are rendered by the
+default renderer instead.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.styles import Protection as CellProtection
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from spreadsheet_handling.io_backends.xlsx.openpyxl_renderer import (
+    _area_to_ref,
+    _collect_formula_context,
+    _define_named_range,
+    _formula_column_offsets,
+    _xlsx_cell_value,
+    _xlsx_validation_formula,
+    render_workbook,
+)
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    ApplyCellLock,
+    ApplyColumnStyle,
+    ApplyHeaderStyle,
+    DefineNamedRange,
+    DefineSheet,
+    MergeCells,
+    RenderOp,
+    RenderPlan,
+    SetAutoFilter,
+    SetColumnWidth,
+    SetFreeze,
+    SetHeader,
+    SetHorizontalAlignment,
+    SetSheetProtection,
+    SetTextOrientation,
+    SetVerticalAlignment,
+    WriteDataBlock,
+    WriteMeta,
+)
+
+# (op index, column, kind, payload); kind is "value", "font", "fill",
+# "protection", "alignment" (payload: (attribute, value)) or, while a row is
+# assembled, "block" (payload: (WriteDataBlock, formula column offsets)).
+_CellEdit = tuple[int, int, str, Any]
+
+_SheetSetupOp = SetFreeze | SetColumnWidth | SetAutoFilter | AddValidation | SetSheetProtection
+
+
+@dataclass(frozen=True)
+class _ColumnEdit:
+    """A style applied to one column over an inclusive row range."""
+
+    index: int
+    col: int
+    from_row: int
+    to_row: int
+    kind: str
+    payload: Any
+
+
+@dataclass
+class _SheetStream:
+    """All ops of one sheet, regrouped for row-major emission."""
+
+    title: str
+    setup: list[_SheetSetupOp] = field(default_factory=list)
+    merges: list[MergeCells] = field(default_factory=list)
+    blocks: list[tuple[int, WriteDataBlock, frozenset[int]]] = field(default_factory=list)
+    cell_edits: dict[int, list[_CellEdit]] = field(default_factory=dict)
+    column_edits: list[_ColumnEdit] = field(default_factory=list)
+    hidden: bool = False
+    max_row: int = 0
+
+    def add_cell_edit(self, index: int, row: int, col: int, kind: str, payload: Any) -> None:
+        self.cell_edits.setdefault(row, []).append((index, col, kind, payload))
+        self.max_row = max(self.max_row, row)
+
+    def add_column_edit(self, edit: _ColumnEdit) -> None:
+        self.column_edits.append(edit)
+        self.max_row = max(self.max_row, edit.to_row)
+
+
+@dataclass
+class _IndexedPlan:
+    sheets: dict[str, _SheetStream] = field(default_factory=dict)
+    named_ranges: list[DefineNamedRange] = field(default_factory=list)
+
+    def sheet(self, name: str) -> _SheetStream:
+        stream = self.sheets.get(name)
+        if stream is None:
+            stream = self.sheets[name] = _SheetStream(name)
+        return stream
+
+
+# --------------------------------------------------------------------------------------
+# Plan indexing
+# --------------------------------------------------------------------------------------
+
+def _index_setup(stream: _SheetStream, index: int, op: _SheetSetupOp) -> None:
+    stream.setup.append(op)
+
+
+def _index_merge(stream: _SheetStream, index: int, op: MergeCells) -> None:
+    stream.merges.append(op)
+
+
+def _index_header(stream: _SheetStream, index: int, op: SetHeader) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "value", op.text)
+
+
+def _index_header_style(stream: _SheetStream, index: int, op: ApplyHeaderStyle) -> None:
+    if op.bold:
+        stream.add_cell_edit(index, op.row, op.col, "font", Font(bold=True))
+    if op.fill_rgb:
+        fill = PatternFill("solid", fgColor=op.fill_rgb.lstrip("#"))
+        stream.add_cell_edit(index, op.row, op.col, "fill", fill)
+
+
+def _index_column_style(stream: _SheetStream, index: int, op: ApplyColumnStyle) -> None:
+    if op.fill_rgb:
+        fill = PatternFill("solid", fgColor=op.fill_rgb.lstrip("#"))
+        stream.add_column_edit(_ColumnEdit(index, op.col, op.from_row, op.to_row, "fill", fill))
+
+
+def _index_cell_lock(stream: _SheetStream, index: int, op: ApplyCellLock) -> None:
+    prot = CellProtection(locked=op.locked)
+    stream.add_column_edit(_ColumnEdit(index, op.col, op.from_row, op.to_row, "protection", prot))
+
+
+def _index_text_orientation(stream: _SheetStream, index: int, op: SetTextOrientation) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "alignment", ("text_rotation", op.rotation))
+
+
+def _index_horizontal(stream: _SheetStream, index: int, op: SetHorizontalAlignment) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "alignment", ("horizontal", op.horizontal))
+
+
+def _index_vertical(stream: _SheetStream, index: int, op: SetVerticalAlignment) -> None:
+    stream.add_cell_edit(index, op.row, op.col, "alignment", ("vertical", op.vertical))
+
+
+def _index_data_block(stream: _SheetStream, index: int, op: WriteDataBlock) -> None:
+    if not op.data:
+        return
+    stream.blocks.append((index, op, _formula_column_offsets(op.data)))
+    stream.max_row = max(stream.max_row, op.r1 + len(op.data) - 1)
+
+
+def _index_meta(stream: _SheetStream, index: int, op: WriteMeta) -> None:
+    for row, (k, v) in enumerate(op.kv.items(), start=1):
+        stream.add_cell_edit(index, row, 1, "value", str(k))
+        stream.add_cell_edit(index, row, 2, "value", str(v))
+    if op.hidden:
+        stream.hidden = True
+
+
+_SHEET_INDEXERS: dict[type, Callable[[_SheetStream, int, Any], None]] = {
+    SetFreeze: _index_setup,
+    SetColumnWidth: _index_setup,
+    SetAutoFilter: _index_setup,
+    AddValidation: _index_setup,
+    SetSheetProtection: _index_setup,
+    MergeCells: _index_merge,
+    SetHeader: _index_header,
+    ApplyHeaderStyle: _index_header_style,
+    ApplyColumnStyle: _index_column_style,
+    ApplyCellLock: _index_cell_lock,
+    SetTextOrientation: _index_text_orientation,
+    SetHorizontalAlignment: _index_horizontal,
+    SetVerticalAlignment: _index_vertical,
+    WriteDataBlock: _index_data_block,
+    WriteMeta: _index_meta,
+}
+
+
+def _is_streamable(op: RenderOp) -> bool:
+    return type(op) in _SHEET_INDEXERS or isinstance(op, (DefineSheet, DefineNamedRange))
+
+
+def _index_plan(plan: RenderPlan) -> _IndexedPlan:
+    """Group plan ops per sheet, keeping the default renderer's sheet order."""
+    indexed = _IndexedPlan()
+    for op in plan.ops:
+        if isinstance(op, DefineSheet):
+            indexed.sheet(op.sheet)
+    for sheet_name in plan.sheet_order:
+        if sheet_name:
+            indexed.sheet(sheet_name)
+
+    for index, op in enumerate(plan.ops):
+        if isinstance(op, DefineSheet):
+            continue
+        if isinstance(op, DefineNamedRange):
+            indexed.named_ranges.append(op)
+            continue
+        sheet_name = op.sheet
+        if isinstance(op, WriteMeta):
+            sheet_name = op.sheet or "_meta"
+        _SHEET_INDEXERS[type(op)](indexed.sheet(sheet_name), index, op)
+
+    if not indexed.sheets:
+        indexed.sheet("Sheet1")
+    return indexed
+
+
+# --------------------------------------------------------------------------------------
+# Sheet emission
+# --------------------------------------------------------------------------------------
+
+def _apply_sheet_setup(ws: WriteOnlyWorksheet, stream: _SheetStream) -> None:
+    """Apply sheet-level carriers; openpyxl writes columns/views before row one."""
+    for op in stream.setup:
+        if isinstance(op, SetFreeze):
+            ws.freeze_panes = f"{get_column_letter(op.col)}{op.row}"
+        elif isinstance(op, SetColumnWidth):
+            ws.column_dimensions[get_column_letter(op.col)].width = op.width
+        elif isinstance(op, SetAutoFilter):
+            ws.auto_filter.ref = _area_to_ref(op.r1, op.c1, op.r2, op.c2)
+        elif isinstance(op, AddValidation):
+            dv = DataValidation(
+                type="list",
+                formula1=_xlsx_validation_formula(op.formula),
+                allow_blank=op.allow_empty,
+            )
+            dv.add(_area_to_ref(op.r1, op.c1, op.r2, op.c2))
+            ws.data_validations.append(dv)
+        elif isinstance(op, SetSheetProtection):
+            ws.protection.sheet = True
+            if op.password is not None:
+                ws.protection.password = op.password
+    for op in stream.merges:
+        ws.merged_cells.add(CellRange(min_col=op.c1, min_row=op.r1, max_col=op.c2, max_row=op.r2))
+    if stream.hidden:
+        ws.sheet_state = "hidden"
+
+
+def _covered_columns(merges: list[MergeCells], row: int) -> set[int]:
+    """Return the columns of ``row`` hidden under a merge (all but the master cell)."""
+    covered: set[int] = set()
+    for mr in merges:
+        if not mr.r1 <= row <= mr.r2:
+            continue
+        first = mr.c1 + 1 if row == mr.r1 else mr.c1
+        covered.update(range(first, mr.c2 + 1))
+    return covered
+
+
+def _block_row(
+    sheet: str,
+    op: WriteDataBlock,
+    formula_offsets: frozenset[int],
+    row: int,
+    formula_context: tuple[dict[str, dict[str, int]], dict[str, tuple[int, int]]],
+) -> tuple[Any, ...] | list[Any]:
+    values = op.data[row - op.r1]
+    if not formula_offsets:
+        return values
+    sheet_headers, sheet_data_bounds = formula_context
+    translated = list(values)
+    for col_off in formula_offsets:
+        if col_off < len(translated):
+            translated[col_off] = _xlsx_cell_value(
+                translated[col_off],
+                current_sheet=sheet,
+                row=row,
+                sheet_headers=sheet_headers,
+                sheet_data_bounds=sheet_data_bounds,
+            )
+    return translated
+
+
+def _styled_cell(ws: WriteOnlyWorksheet, value: Any, style: dict[str, Any]) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    for kind, payload in style.items():
+        if kind == "alignment":
+            cell.alignment = Alignment(**payload)
+        else:
+            setattr(cell, kind, payload)
+    return cell
+
+
+class _RowAssembler:
+    """Builds each emitted row from the ops that touch it, in plan order."""
+
+    def __init__(
+        self,
+        ws: WriteOnlyWorksheet,
+        stream: _SheetStream,
+        formula_context: tuple[dict[str, dict[str, int]], dict[str, tuple[int, int]]],
+    ) -> None:
+        self.ws = ws
+        self.stream = stream
+        self.formula_context = formula_context
+
+    def _active_blocks(self, row: int) -> list[tuple[int, WriteDataBlock, frozenset[int]]]:
+        return [
+            entry
+            for entry in self.stream.blocks
+            if entry[1].r1 <= row < entry[1].r1 + len(entry[1].data)
+        ]
+
+    def _edits(self, row: int) -> list[_CellEdit]:
+        edits = list(self.stream.cell_edits.get(row, ()))
+        for edit in self.stream.column_edits:
+            if edit.from_row <= row <= edit.to_row:
+                edits.append((edit.index, edit.col, edit.kind, edit.payload))
+        return edits
+
+    def row(self, row: int) -> list[Any]:
+        blocks = self._active_blocks(row)
+        edits = self._edits(row)
+        covered = _covered_columns(self.stream.merges, row)
+        if len(blocks) == 1 and not edits and not covered:
+            _, op, offsets = blocks[0]
+            values = _block_row(self.stream.title, op, offsets, row, self.formula_context)
+            return [None] * (op.c1 - 1) + list(values)
+
+        events: list[_CellEdit] = [(index, op.c1, "block", (op, offsets)) for index, op, offsets in blocks]
+        events.extend(edits)
+        events.sort(key=lambda event: event[0])
+        values: dict[int, Any] = {}
+        styles: dict[int, dict[str, Any]] = {}
+        for _, col, kind, payload in events:
+            if kind == "block":
+                self._overlay_block(values, row, *payload)
+            elif kind == "value":
+                values[col] = payload
+            elif kind == "alignment":
+                attr, value = payload
+                styles.setdefault(col, {}).setdefault("alignment", {})[attr] = value
+            else:
+                styles.setdefault(col, {})[kind] = payload
+        return self._materialize(values, styles, covered)
+
+    def _overlay_block(
+        self,
+        values: dict[int, Any],
+        row: int,
+        op: WriteDataBlock,
+        offsets: frozenset[int],
+    ) -> None:
+        block_values = _block_row(self.stream.title, op, offsets, row, self.formula_context)
+        for col_off, val in enumerate(block_values):
+            # ``Worksheet.cell(value=None)`` leaves an existing value in place.
+            if val is not None:
+                values[op.c1 + col_off] = val
+
+    def _materialize(
+        self,
+        values: dict[int, Any],
+        styles: dict[int, dict[str, Any]],
+        covered: set[int],
+    ) -> list[Any]:
+        width = max([*values, *styles], default=0)
+        cells: list[Any] = [None] * width
+        for col in range(1, width + 1):
+            value = None if col in covered else values.get(col)
+            style = styles.get(col)
+            cells[col - 1] = value if style is None else _styled_cell(self.ws, value, style)
+        return cells
+
+
+def _emit_sheet(
+    wb: Workbook,
+    stream: _SheetStream,
+    formula_context: tuple[dict[str, dict[str, int]], dict[str, tuple[int, int]]],
+) -> None:
+    ws = wb.create_sheet(title=stream.title)
+    _apply_sheet_setup(ws, stream)
+    assembler = _RowAssembler(ws, stream, formula_context)
+    for row in range(1, stream.max_row + 1):
+        ws.append(assembler.row(row))
+
+
+# --------------------------------------------------------------------------------------
+# Public API
+# --------------------------------------------------------------------------------------
+
+def render_workbook_streaming(plan: RenderPlan, out_path: Path | str) -> None:
+    """Render a *RenderPlan* to XLSX row by row through a write-only workbook.
+
+    The output is equivalent to :func:`render_workbook`; plans with ops this
+    writer cannot index are delegated to it unchanged.
+    """
+    if not all(_is_streamable(op) for op in plan.ops):
+        render_workbook(plan, out_path)
+        return
+
+    formula_context = _collect_formula_context(plan)
+    indexed = _index_plan(plan)
+    wb = Workbook(write_only=True)
+    for stream in indexed.sheets.values():
+        _emit_sheet(wb, stream, formula_context)
+    for op in indexed.named_ranges:
+        _define_named_range(op, wb)
+    wb.save(Path(out_path))
+
+
+__all__ = ["render_workbook_streaming"]
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Protocol
 
-from openpyxl.cell.cell import MergedCell
 from openpyxl.worksheet.worksheet import Worksheet
 
 from spreadsheet_handling.rendering.ir import DataValidationSpec, SheetIR, TableBlock
@@ -20,6 +20,78 @@ OPTION_HINT_KEYS = (
 )
 
 
+class WorksheetCells(Protocol):
+    """Cell-level read access the interpretation layer needs from a worksheet carrier.
+
+    Full-mode openpyxl worksheets are adapted via ``_OpenpyxlWorksheetCells``;
+    the streaming read path supplies its own value grid
+    (``openpyxl_stream_reader.StreamedWorksheet``).
+    """
+
+    merged_cells: Any
+
+    def value(self, row: int, col: int) -> Any: ...
+
+    def row_values(self, row: int, left: int, n_cols: int) -> list[Any]: ...
+
+
+class _OpenpyxlWorksheetCells:
+    """Adapt a full-mode openpyxl ``Worksheet`` to ``WorksheetCells``."""
+
+    def __init__(self, ws: Worksheet) -> None:
+        self._ws = ws
+        self.merged_cells = ws.merged_cells
+
+    def value(self, row: int, col: int) -> Any:
+        return self._ws.cell(row=row, column=col).value
+
+    def row_values(self, row: int, left: int, n_cols: int) -> list[Any]:
+        return [self._ws.cell(row=row, column=c).value for c in range(left, left + n_cols)]
+
+
+MergeArea = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class MergeIndex:
+    """Per-worksheet merge lookup, built once and shared by all discovery steps.
+
+    ``areas`` holds every merge as ``(min_row, min_col, max_row, max_col)`` in
+    worksheet order. ``by_row`` maps each covered row to the column
+    intervals merged on it, so resolving a position costs one dict lookup plus
+    a scan of that row's merges instead of a scan of every merged cell.
+    """
+
+    areas: tuple[MergeArea, ...] = ()
+    by_row: dict[int, tuple[MergeArea, ...]] = field(default_factory=dict)
+
+    def master_of(self, row: int, col: int) -> tuple[int, int] | None:
+        """Return the top-left cell of the merge covering ``(row, col)``, if any."""
+        for min_row, min_col, _max_row, max_col in self.by_row.get(row, ()):
+            if min_col <= col <= max_col:
+                return (min_row, min_col)
+        return None
+
+
+def build_merge_index(merged_ranges: Iterable[Any]) -> MergeIndex:
+    """Index openpyxl-style merge ranges (``min_row`` / ``min_col`` / ...)."""
+    areas = [(mr.min_row, mr.min_col, mr.max_row, mr.max_col) for mr in merged_ranges]
+    by_row: dict[int, list[MergeArea]] = {}
+    for area in areas:
+        for row in range(area[0], area[2] + 1):
+            by_row.setdefault(row, []).append(area)
+    return MergeIndex(
+        areas=tuple(areas),
+        by_row={row: tuple(row_areas) for row, row_areas in by_row.items()},
+    )
+
+
+def _worksheet_cells(ws: Worksheet | WorksheetCells) -> WorksheetCells:
+    if isinstance(ws, Worksheet):
+        return _OpenpyxlWorksheetCells(ws)
+    return ws
+
+
 def build_sheet_meta_hints(
     workbook_meta: Mapping[str, Any],
     *,
@@ -36,7 +108,7 @@ def build_sheet_meta_hints(
 
 
 def build_visible_sheet_ir(
-    ws: Worksheet,
+    ws: Worksheet | WorksheetCells,
     *,
     sheet_name: str,
     meta_hints: Mapping[str, Any],
@@ -48,6 +120,8 @@ def build_visible_sheet_ir(
     stop_on_empty_col: bool,
 ) -> SheetIR:
     """Interpret a visible worksheet into spreadsheet-neutral ``SheetIR``."""
+    cells = _worksheet_cells(ws)
+    merges = build_merge_index(cells.merged_cells.ranges)
     sh = SheetIR(name=sheet_name)
 
     options = {}
@@ -61,7 +135,8 @@ def build_visible_sheet_ir(
     for top, left in table_starts:
         sh.tables.append(
             _parse_table_block(
-                ws,
+                cells,
+                merges,
                 frame_name=sheet_name,
                 top=top,
                 left=left,
@@ -70,12 +145,12 @@ def build_visible_sheet_ir(
             )
         )
 
-    header_merges = _extract_header_merges(ws, sh.tables)
+    header_merges = _extract_header_merges(merges, sh.tables)
     if header_merges:
         sh.meta["__header_merges"] = header_merges
 
     for tbl in sh.tables:
-        grid = _extract_header_grid(ws, tbl)
+        grid = _extract_header_grid(cells, merges, tbl)
         if grid and tbl.header_rows > 1:
             sh.meta["__header_grid"] = grid
 
@@ -100,7 +175,8 @@ def build_visible_sheet_ir(
 
 
 def _parse_table_block(
-    ws: Worksheet,
+    ws: WorksheetCells,
+    merges: MergeIndex,
     *,
     frame_name: str,
     top: int,
@@ -109,8 +185,9 @@ def _parse_table_block(
     stop_on_empty_col: bool,
 ) -> TableBlock:
     """Discover a single table starting at ``(top, left)``."""
-    header_rows = _detect_header_rows(ws, top, left)
-    n_cols = _find_col_extent(ws, top, left, stop_on_empty_col)
+    header_rows, n_cols = table_block_shape(
+        ws, merges, top=top, left=left, stop_on_empty_col=stop_on_empty_col
+    )
     data_start_row = top + header_rows
     n_data_rows = _find_row_extent(ws, data_start_row, left, n_cols, stop_on_empty_row)
     n_rows = header_rows + n_data_rows
@@ -118,7 +195,7 @@ def _parse_table_block(
     headers: list[str] = []
     leaf_row = top + header_rows - 1
     for c in range(left, left + n_cols):
-        val = _cell_value(ws, leaf_row, c)
+        val = _cell_value(ws, merges, leaf_row, c)
         headers.append(str(val) if val else "")
 
     if header_rows > 1:
@@ -126,7 +203,7 @@ def _parse_table_block(
         for c in range(left, left + n_cols):
             parts = []
             for r in range(top, top + header_rows):
-                val = _cell_value(ws, r, c)
+                val = _cell_value(ws, merges, r, c)
                 parts.append(str(val) if val else "")
             flat_headers.append(" / ".join(p for p in parts if p))
         headers = flat_headers
@@ -135,11 +212,10 @@ def _parse_table_block(
 
     data: list[list[Any]] = []
     for r in range(data_start_row, data_start_row + n_data_rows):
-        row_vals: list[Any] = []
-        for c in range(left, left + n_cols):
-            val = ws.cell(row=r, column=c).value
-            row_vals.append(str(val) if val is not None else "")
-        data.append(row_vals)
+        data.append([
+            str(val) if val is not None else ""
+            for val in ws.row_values(r, left, n_cols)
+        ])
 
     return TableBlock(
         frame_name=frame_name,
@@ -155,32 +231,44 @@ def _parse_table_block(
     )
 
 
-def _cell_value(ws: Worksheet, row: int, col: int) -> Any:
+def table_block_shape(
+    ws: WorksheetCells,
+    merges: MergeIndex,
+    *,
+    top: int,
+    left: int,
+    stop_on_empty_col: bool,
+) -> tuple[int, int]:
+    """Return ``(header_rows, n_cols)`` of the table anchored at ``(top, left)``.
+
+    Both follow from the merges and the anchor row alone, so a streaming
+    reader can size a block as soon as its first row has been read.
+    """
+    return (
+        _detect_header_rows(merges, top, left),
+        _find_col_extent(ws, merges, top, left, stop_on_empty_col),
+    )
+
+
+def _cell_value(ws: WorksheetCells, merges: MergeIndex, row: int, col: int) -> Any:
     """Get a cell value, resolving merged cells to their master value."""
-    cell = ws.cell(row=row, column=col)
-    if isinstance(cell, MergedCell):
-        for mr in ws.merged_cells.ranges:
-            if (row, col) in [
-                (r, c)
-                for r in range(mr.min_row, mr.max_row + 1)
-                for c in range(mr.min_col, mr.max_col + 1)
-            ]:
-                return ws.cell(row=mr.min_row, column=mr.min_col).value
-        return None
-    return cell.value
+    master = merges.master_of(row, col)
+    if master is not None:
+        return ws.value(*master)
+    return ws.value(row, col)
 
 
-def _detect_header_rows(ws: Worksheet, top: int, left: int) -> int:
+def _detect_header_rows(merges: MergeIndex, top: int, left: int) -> int:
     """Detect header depth by examining merge regions near the table anchor."""
     max_header_row = top
     has_horizontal_merge_at_top = False
 
-    for mr in ws.merged_cells.ranges:
-        if mr.min_row < top or mr.min_col < left:
+    for min_row, min_col, max_row, max_col in merges.areas:
+        if min_row < top or min_col < left:
             continue
-        if mr.max_row > mr.min_row and mr.min_row >= top and mr.max_row > max_header_row:
-            max_header_row = mr.max_row
-        if mr.min_row == top and mr.max_col > mr.min_col and mr.min_row == mr.max_row:
+        if max_row > min_row and max_row > max_header_row:
+            max_header_row = max_row
+        if min_row == top and max_col > min_col and min_row == max_row:
             has_horizontal_merge_at_top = True
 
     if max_header_row > top:
@@ -190,17 +278,23 @@ def _detect_header_rows(ws: Worksheet, top: int, left: int) -> int:
     return 1
 
 
-def _find_col_extent(ws: Worksheet, top: int, left: int, stop_on_empty: bool) -> int:
+def _find_col_extent(
+    ws: WorksheetCells,
+    merges: MergeIndex,
+    top: int,
+    left: int,
+    stop_on_empty: bool,
+) -> int:
     """Find the number of columns by scanning the first header row."""
     n_cols = 0
     for c in range(left, left + 16384):
-        val = _cell_value(ws, top, c)
+        val = _cell_value(ws, merges, top, c)
         if val is None or (isinstance(val, str) and val.strip() == ""):
             if stop_on_empty:
                 break
             has_more = False
             for lookahead in range(1, 4):
-                v2 = _cell_value(ws, top, c + lookahead)
+                v2 = _cell_value(ws, merges, top, c + lookahead)
                 if v2 is not None and str(v2).strip():
                     has_more = True
                     break
@@ -211,7 +305,7 @@ def _find_col_extent(ws: Worksheet, top: int, left: int, stop_on_empty: bool) ->
 
 
 def _find_row_extent(
-    ws: Worksheet,
+    ws: WorksheetCells,
     data_start_row: int,
     left: int,
     n_cols: int,
@@ -220,63 +314,64 @@ def _find_row_extent(
     """Find the number of data rows by scanning down from the first data row."""
     n_data_rows = 0
     for r in range(data_start_row, data_start_row + 1048576):
-        row_empty = True
-        for c in range(left, left + n_cols):
-            val = ws.cell(row=r, column=c).value
-            if val is not None and str(val).strip() != "":
-                row_empty = False
-                break
+        row_empty = row_is_empty(ws, r, left, n_cols)
         if row_empty:
             if stop_on_empty:
                 break
-            lookahead_empty = True
-            for lr in range(1, 3):
-                for c in range(left, left + n_cols):
-                    val = ws.cell(row=r + lr, column=c).value
-                    if val is not None and str(val).strip() != "":
-                        lookahead_empty = False
-                        break
-                if not lookahead_empty:
-                    break
+            lookahead_empty = all(
+                row_is_empty(ws, r + lr, left, n_cols) for lr in range(1, 3)
+            )
             if lookahead_empty:
                 break
         n_data_rows = r - data_start_row + 1
     return n_data_rows
 
 
+def row_is_empty(ws: WorksheetCells, row: int, left: int, n_cols: int) -> bool:
+    """True when ``n_cols`` cells from ``left`` on ``row`` hold no text; ends a table block."""
+    return all(
+        val is None or str(val).strip() == ""
+        for val in ws.row_values(row, left, n_cols)
+    )
+
+
 def _extract_header_merges(
-    ws: Worksheet,
+    merges: MergeIndex,
     tables: list[TableBlock],
 ) -> list[tuple[int, int, int, int]]:
     """Extract merge regions within the header area of tables in relative coordinates."""
-    merges: list[tuple[int, int, int, int]] = []
+    header_merges: list[tuple[int, int, int, int]] = []
     for tbl in tables:
         header_bottom = tbl.top + tbl.header_rows - 1
-        for mr in ws.merged_cells.ranges:
+        for min_row, min_col, max_row, max_col in merges.areas:
             if (
-                mr.min_row >= tbl.top
-                and mr.max_row <= header_bottom
-                and mr.min_col >= tbl.left
-                and mr.max_col <= tbl.left + tbl.n_cols - 1
+                min_row >= tbl.top
+                and max_row <= header_bottom
+                and min_col >= tbl.left
+                and max_col <= tbl.left + tbl.n_cols - 1
             ):
-                merges.append(
+                header_merges.append(
                     (
-                        mr.min_row - tbl.top + 1,
-                        mr.min_col - tbl.left + 1,
-                        mr.max_row - tbl.top + 1,
-                        mr.max_col - tbl.left + 1,
+                        min_row - tbl.top + 1,
+                        min_col - tbl.left + 1,
+                        max_row - tbl.top + 1,
+                        max_col - tbl.left + 1,
                     )
                 )
-    return merges
+    return header_merges
 
 
-def _extract_header_grid(ws: Worksheet, tbl: TableBlock) -> list[list[str]]:
+def _extract_header_grid(
+    ws: WorksheetCells,
+    merges: MergeIndex,
+    tbl: TableBlock,
+) -> list[list[str]]:
     """Extract the header grid as a 2D list of strings."""
     grid: list[list[str]] = []
     for r in range(tbl.top, tbl.top + tbl.header_rows):
         row_vals: list[str] = []
         for c in range(tbl.left, tbl.left + tbl.n_cols):
-            val = _cell_value(ws, r, c)
+            val = _cell_value(ws, merges, r, c)
             row_vals.append(str(val) if val else "")
         grid.append(row_vals)
     return grid
@@ -284,6 +379,11 @@ def _extract_header_grid(ws: Worksheet, tbl: TableBlock) -> list[list[str]]:
 
 __all__ = [
     "OPTION_HINT_KEYS",
+    "MergeIndex",
+    "WorksheetCells",
+    "build_merge_index",
     "build_sheet_meta_hints",
     "build_visible_sheet_ir",
+    "row_is_empty",
+    "table_block_shape",
 ]
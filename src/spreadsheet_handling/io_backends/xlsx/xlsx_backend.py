@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Final
 
 import pandas as pd
 
-from spreadsheet_handling.io_backends.base import BackendBase, BackendOptions
+from spreadsheet_handling.io_backends.base import BackendBase, BackendOptions, streaming_requested
+from spreadsheet_handling.io_backends.sheet_selection import SheetSelection
 from spreadsheet_handling.io_backends.spreadsheet_contract import (
     build_spreadsheet_render_plan,
     read_spreadsheet_frames,
 )
 from spreadsheet_handling.io_backends.xlsx.openpyxl_parser import parse_workbook
 from spreadsheet_handling.io_backends.xlsx.openpyxl_renderer import render_workbook
+from spreadsheet_handling.io_backends.xlsx.openpyxl_stream_writer import render_workbook_streaming
 
 
 log = logging.getLogger('sheets.xlsx')
@@ -37,7 +40,12 @@ class ExcelBackend(BackendBase):
         # compose/pass/plan orchestration lives in spreadsheet_contract so
         # future spreadsheet adapters can reuse it instead of duplicating it.
         plan = build_spreadsheet_render_plan(frames, meta)
-        render_workbook(plan, out_path)
+        # ``options: {streaming: true}`` renders row by row through a
+        # write-only workbook; the saved workbook carries the same content.
+        renderer = render_workbook
+        if streaming_requested(options):
+            renderer = render_workbook_streaming
+        renderer(plan, out_path)
 
     def read_multi(
         self,
@@ -51,8 +59,19 @@ class ExcelBackend(BackendBase):
         Hidden sheets (e.g. ``_meta``) are excluded from data frames.
         If a ``_meta`` sheet is present its key/value pairs are extracted
         and returned as ``frames["_meta"]`` (a plain dict, not a DataFrame).
+
+        ``options: {streaming: true}`` selects the read-only streaming parse
+        mode for large workbooks; the resulting frames are identical.
+        ``options: {sheets: [...]}`` (or ``{include: [...], exclude: [...]}``)
+        parses only the selected visible sheets; ``_meta`` is always read.
         """
-        return read_spreadsheet_frames(Path(path), parser=parse_workbook)
+        parser = parse_workbook
+        if streaming_requested(options):
+            parser = partial(parse_workbook, streaming=True)
+        sheets = SheetSelection.from_options(options)
+        if sheets is not None:
+            parser = partial(parser, sheets=sheets)
+        return read_spreadsheet_frames(Path(path), parser=parser)
 
 
 def save_xlsx(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Iterable, Mapping, NamedTuple
 from pathlib import Path
 import os
 
@@ -8,18 +8,13 @@ import pandas as pd
 from xml.etree.ElementTree import Element, SubElement, ElementTree, indent
 import xml.etree.ElementTree as ET
 
+from ..core.unflatten import frame_column_values, is_blank_value, plan_nested_columns
 from .base import BackendBase, BackendOptions, coerce_backend_options
+from .sheet_files import map_sheet_files
 
 Frames = Dict[str, pd.DataFrame]
 
 
-def _is_empty_header_segment(x: Any) -> bool:
-    if x is None:
-        return True
-    s = str(x).strip()
-    return s == "" or s.lower() in ("nan", "none") or s.startswith("Unnamed:")
-
-
 # ---------------------------------------------------------------------------
 # Write helpers
 # ---------------------------------------------------------------------------
@@ -32,45 +27,48 @@ def _sanitize_tag(name: str) -> str:
     return tag
 
 
-def _row_to_nested_xml(parent: Element, col_paths: list[list[str] | None], row: pd.Series) -> None:
-    """Build nested XML elements from a single row using MultiIndex column paths."""
-    # Track sub-elements by first segment so siblings share a parent
+class _XmlPath(NamedTuple):
+    """Sanitized element path of one column: shared parents plus the leaf tag."""
+
+    parents: tuple[tuple[str, str], ...]  # (tag trail, tag)
+    leaf: str
+
+
+def _xml_path(segs: tuple[str, ...]) -> _XmlPath:
+    tags = [_sanitize_tag(seg) for seg in segs]
+    trails = ["/" + "/".join(tags[: i + 1]) for i in range(len(tags) - 1)]
+    return _XmlPath(tuple(zip(trails, tags)), tags[-1])
+
+
+def _row_values(df: pd.DataFrame, positions: list[int]) -> Iterable[tuple[Any, ...]]:
+    columns = frame_column_values(df, positions)
+    if not columns:
+        return [()] * len(df)
+    return zip(*columns)
+
+
+def _row_to_nested_xml(parent: Element, xml_paths: list[_XmlPath], values: tuple[Any, ...]) -> None:
+    """Build nested XML elements from one row using MultiIndex column paths."""
+    # Track sub-elements by tag trail so siblings share a parent
     subs: dict[str, Element] = {}
-    for idx, segs in enumerate(col_paths):
-        if segs is None:
-            continue
-        v = row.iloc[idx]
-        if v is None:
+    for xml_path, v in zip(xml_paths, values):
+        if is_blank_value(v):
             continue
-        if isinstance(v, str) and v.strip() == "":
-            continue
-
-        # Walk down the segment path creating sub-elements
         cur = parent
-        key_trail = ""
-        for i, seg in enumerate(segs):
-            tag = _sanitize_tag(seg)
-            last = i == len(segs) - 1
-            key_trail += "/" + tag
-            if last:
-                el = SubElement(cur, tag)
-                el.text = str(v)
-            else:
-                if key_trail not in subs:
-                    el = SubElement(cur, tag)
-                    subs[key_trail] = el
-                cur = subs[key_trail]
-
-
-def _row_to_flat_xml(parent: Element, columns: list[str], row: pd.Series) -> None:
-    """Build flat XML elements from a single row."""
-    for col_name, value in zip(columns, row):
-        if value is None:
-            continue
-        if isinstance(value, str) and value.strip() == "":
+        for trail, tag in xml_path.parents:
+            sub = subs.get(trail)
+            if sub is None:
+                sub = subs[trail] = SubElement(cur, tag)
+            cur = sub
+        SubElement(cur, xml_path.leaf).text = str(v)
+
+
+def _row_to_flat_xml(parent: Element, tags: list[str], values: tuple[Any, ...]) -> None:
+    """Build flat XML elements from one row."""
+    for tag, value in zip(tags, values):
+        if is_blank_value(value):
             continue
-        el = SubElement(parent, _sanitize_tag(str(col_name)))
-        el.text = str(value)
+        SubElement(parent, tag).text = str(value)
 
 
 # ---------------------------------------------------------------------------
@@ -106,6 +104,44 @@ def _flatten_element(el: Element, prefix: list[str], rec: dict[str, Any]) -> Non
             _flatten_element(child, prefix + [child.tag], rec)
 
 
+# ---------------------------------------------------------------------------
+# Per-sheet file I/O
+# ---------------------------------------------------------------------------
+
+def _read_xml_sheet(p: Path) -> pd.DataFrame:
+    tree = ET.parse(p)  # noqa: S314 – trusted local files only
+    root = tree.getroot()
+    records = _xml_element_to_records(root)
+    if records:
+        return pd.DataFrame(records).fillna("")
+    return pd.DataFrame()
+
+
+def _write_xml_sheet(p: Path, name: str, df: pd.DataFrame) -> None:
+    clean = df.where(pd.notnull(df), "")
+    root = Element(_sanitize_tag(name))
+
+    if isinstance(clean.columns, pd.MultiIndex):
+        # Column paths skip empty segments and helper columns.
+        plan = plan_nested_columns(clean.columns)
+        xml_paths = [_xml_path(path) for path in plan.paths]
+        for values in _row_values(clean, plan.positions):
+            _row_to_nested_xml(SubElement(root, "row"), xml_paths, values)
+    else:
+        positions = [i for i, c in enumerate(clean.columns) if not str(c).startswith("_")]
+        tags = [_sanitize_tag(str(clean.columns[i])) for i in positions]
+        for values in _row_values(clean, positions):
+            _row_to_flat_xml(SubElement(root, "row"), tags, values)
+
+    indent(root, space="  ")
+    tree = ElementTree(root)
+    with open(p, "wb") as fh:
+        tree.write(fh, encoding="utf-8", xml_declaration=True)
+    # Ensure trailing newline for git
+    with open(p, "a", encoding="utf-8", newline="\n") as fh:
+        fh.write("\n")
+
+
 # ---------------------------------------------------------------------------
 # Backend class
 # ---------------------------------------------------------------------------
@@ -129,17 +165,9 @@ class XMLBackend(BackendBase):
                 "input.path must be a string/Path, not a dict."
             )
         in_dir = Path(path)
-        out: Frames = {}
-        for p in sorted(in_dir.glob("*.xml")):
-            tree = ET.parse(p)  # noqa: S314 – trusted local files only
-            root = tree.getroot()
-            records = _xml_element_to_records(root)
-            if records:
-                df = pd.DataFrame(records).fillna("")
-            else:
-                df = pd.DataFrame()
-            out[p.stem] = df
-        return out
+        files = sorted(in_dir.glob("*.xml"))
+        frames = map_sheet_files(_read_xml_sheet, files, options=options)
+        return {p.stem: df for p, df in zip(files, frames)}
 
     def write_multi(self, frames: Frames, path: str, options: BackendOptions | None = None) -> None:
         if isinstance(path, dict):
@@ -149,42 +177,12 @@ class XMLBackend(BackendBase):
         out_dir = Path(os.fspath(path))
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        for name, df in frames.items():
-            if name == "_meta":
-                continue
-            p = out_dir / f"{name}.xml"
-            clean = df.where(pd.notnull(df), "")
-            root = Element(_sanitize_tag(name))
-
-            if isinstance(clean.columns, pd.MultiIndex):
-                # Build column paths, skipping helper columns
-                col_paths: list[list[str] | None] = []
-                for col in clean.columns:
-                    if isinstance(col, tuple):
-                        segs = [str(s) for s in col if not _is_empty_header_segment(s)]
-                    else:
-                        segs = [str(col)] if not _is_empty_header_segment(col) else []
-                    if not segs or segs[0].startswith("_"):
-                        col_paths.append(None)
-                    else:
-                        col_paths.append(segs)
-
-                for _, row in clean.iterrows():
-                    row_el = SubElement(root, "row")
-                    _row_to_nested_xml(row_el, col_paths, row)
-            else:
-                columns = [str(c) for c in clean.columns if not str(c).startswith("_")]
-                for _, row in clean.iterrows():
-                    row_el = SubElement(root, "row")
-                    _row_to_flat_xml(row_el, columns, row)
-
-            indent(root, space="  ")
-            tree = ElementTree(root)
-            with open(p, "wb") as fh:
-                tree.write(fh, encoding="utf-8", xml_declaration=True)
-            # Ensure trailing newline for git
-            with open(p, "a", encoding="utf-8", newline="\n") as fh:
-                fh.write("\n")
+        sheets = [(name, df) for name, df in frames.items() if name != "_meta"]
+        map_sheet_files(
+            lambda item: _write_xml_sheet(out_dir / f"{item[0]}.xml", item[0], item[1]),
+            sheets,
+            options=options,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -6,7 +6,9 @@ from typing import Dict, Iterable, List
 import pandas as pd
 import yaml
 
+from ..core import yaml_codec
 from .base import BackendOptions
+from .sheet_files import map_sheet_files
 
 Frames = Dict[str, pd.DataFrame]
 
@@ -17,6 +19,44 @@ def _glob_yaml_files(root: Path) -> Iterable[Path]:
     yield from root.glob("*.yaml")
 
 
+def _load_yaml_sheet(file: Path) -> pd.DataFrame:
+    with file.open("r", encoding="utf-8") as f:
+        data = yaml_codec.safe_load(f)  # may be None, list, or dict
+    if data is None:
+        df = pd.DataFrame()
+    elif isinstance(data, list):
+        df = pd.DataFrame(data)
+    elif isinstance(data, dict):
+        # If a file contains a mapping instead of a list, use homogeneous
+        # dict values as rows; otherwise wrap the mapping as one row.
+        values = list(data.values())
+        if all(isinstance(x, dict) for x in values):
+            df = pd.DataFrame(values)  # type: ignore[arg-type]
+        else:
+            df = pd.DataFrame([data])
+    else:
+        # Fallback: wrap scalars in a "value" column.
+        df = pd.DataFrame([{"value": data}])
+
+    # Normalize missing values to "" like the JSON backend.
+    return df.where(pd.notnull(df), "")
+
+
+def _save_yaml_sheet(item: tuple[Path, pd.DataFrame]) -> None:
+    file, df = item
+    records: List[dict] = (
+        df.to_dict(orient="records") if not df.empty else []
+    )
+    with file.open("w", encoding="utf-8") as f:
+        yaml.safe_dump(
+            records,
+            f,
+            sort_keys=False,
+            allow_unicode=True,
+            default_flow_style=False,
+        )
+
+
 def load_yaml_dir(
     path: str,
     options: BackendOptions | None = None,
@@ -29,38 +69,17 @@ def load_yaml_dir(
       - each file contains a list of objects (List[Dict[str, Any]])
       - empty files/lists become empty DataFrames with 0 columns
       - header_levels is accepted for router compatibility; YAML has no header rows
+      - ``parallel`` / ``max_workers`` options parse files in a process pool
     """
     in_dir = Path(path)
-    frames: Frames = {}
 
     if not in_dir.exists():
         raise FileNotFoundError(f"YAML input folder not found: {in_dir}")
 
-    for file in _glob_yaml_files(in_dir):
-        sheet_name = file.stem
-        with file.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)  # may be None, list, or dict
-        if data is None:
-            df = pd.DataFrame()
-        elif isinstance(data, list):
-            df = pd.DataFrame(data)
-        elif isinstance(data, dict):
-            # If a file contains a mapping instead of a list, use homogeneous
-            # dict values as rows; otherwise wrap the mapping as one row.
-            values = list(data.values())
-            if all(isinstance(x, dict) for x in values):
-                df = pd.DataFrame(values)  # type: ignore[arg-type]
-            else:
-                df = pd.DataFrame([data])
-        else:
-            # Fallback: wrap scalars in a "value" column.
-            df = pd.DataFrame([{"value": data}])
-
-        # Normalize missing values to "" like the JSON backend.
-        df = df.where(pd.notnull(df), "")
-        frames[sheet_name] = df
-
-    return frames
+    # YAML parsing is pure Python and CPU-bound, hence processes, not threads.
+    files = list(_glob_yaml_files(in_dir))
+    frames = map_sheet_files(_load_yaml_sheet, files, options=options, processes=True)
+    return {file.stem: df for file, df in zip(files, frames)}
 
 
 def save_yaml_dir(
@@ -72,22 +91,10 @@ def save_yaml_dir(
     Write frames as YAML files, one file per sheet:
       - record lists (List[Dict[str, Any]])
       - empty DataFrames become empty lists
+      - ``parallel`` / ``max_workers`` options emit files in a process pool
     """
     out_dir = Path(path)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for sheet, df in frames.items():
-        if sheet == "_meta":
-            continue
-        file = out_dir / f"{sheet}.yml"
-        records: List[dict] = (
-            df.to_dict(orient="records") if not df.empty else []
-        )
-        with file.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                records,
-                f,
-                sort_keys=False,
-                allow_unicode=True,
-                default_flow_style=False,
-            )
+    sheets = [(out_dir / f"{sheet}.yml", df) for sheet, df in frames.items() if sheet != "_meta"]
+    map_sheet_files(_save_yaml_sheet, sheets, options=options, processes=True)
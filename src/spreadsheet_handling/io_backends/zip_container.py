@@ -0,0 +1,71 @@
+"""Memory-mapped member access for zip-packaged spreadsheets.
+
+XLSX and ODS inputs are zip containers. ``ZipContainer`` is a read-only
+``ZipFile`` over a memory map of the archive, so member streams read the
+compressed bytes straight from the page cache instead of seeking and reading
+through a file object. The central directory is parsed once on construction
+and the member names are cached.
+
+Members are inflated on every ``open``; nothing is kept in memory, so a
+single-pass reader such as the streaming ODS reader stays bounded by its own
+buffers.
+"""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import IO
+from zipfile import BadZipFile, ZipFile, ZipInfo
+
+
+class _Mapping(mmap.mmap):
+    """Read-only memory map usable as the ``ZipFile`` file object."""
+
+    def seekable(self) -> bool:  # ``mmap`` grows ``seekable`` only in Python 3.13
+        return True
+
+
+class ZipContainer(ZipFile):
+    """Read-only zip archive over a memory map of the file."""
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as fh:
+            try:
+                mapping = _Mapping(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file: nothing to map
+                raise BadZipFile("File is not a zip file") from exc
+        self._mapping = mapping
+        try:
+            super().__init__(mapping)
+        except BaseException:
+            mapping.close()
+            raise
+        self.filename = str(path)
+        self._names = frozenset(self.namelist())
+
+    @property
+    def names(self) -> frozenset[str]:
+        """Member names of the archive."""
+        return self._names
+
+    def open(  # type: ignore[override]
+        self,
+        name: str | ZipInfo,
+        mode: str = "r",
+        pwd: bytes | None = None,
+        *,
+        force_zip64: bool = False,
+    ) -> IO[bytes]:
+        if mode != "r":
+            raise ValueError("ZipContainer is read-only")
+        return super().open(name, "r", pwd)
+
+    def close(self) -> None:
+        super().close()
+        mapping = getattr(self, "_mapping", None)
+        if mapping is not None:
+            mapping.close()
+
+
+__all__ = ["ZipContainer"]
@@ -1,6 +1,8 @@
 from .config import AppConfig, load_app_config
 from .build import build_steps_from_config, build_steps_from_yaml
 from .execution import run_pipeline
+from .profiling import StepProfiler
+from .step_cache import StepCache
 from .registry import REGISTRY
 from .runner import run_app
 from .steps import (
@@ -17,6 +19,8 @@ __all__ = [
     "BoundStep",
     "Step",
     "StepRegistration",
+    "StepCache",
+    "StepProfiler",
     "run_pipeline",
     "run_app",
     "build_steps_from_config",
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import fields, replace
 from typing import Any, Iterable, Mapping
 
 from .registry import REGISTRY, resolve_registration
-from .types import BoundStep
+from .types import BoundStep, StepRegistration
 
 
 def build_steps_from_config(step_specs: Iterable[Mapping[str, Any]]) -> list[BoundStep]:
@@ -48,10 +49,28 @@ def build_steps_from_config(step_specs: Iterable[Mapping[str, Any]]) -> list[Bou
                 bound = BoundStep(name=name, config=tmp.config, fn=tmp.fn)
             else:
                 raise
-        steps.append(bound)
+        steps.append(_with_registration_flags(bound, registration))
     return steps
 
 
+_UNDECLARED = {
+    field.name: field.default
+    for field in fields(StepRegistration)
+    if field.name in {"frame_inputs", "frame_outputs", "meta_inputs", "meta_outputs", "path_outputs"}
+}
+
+
+def _with_registration_flags(bound: BoundStep, registration: StepRegistration) -> BoundStep:
+    declared: dict[str, Any] = {
+        name: getattr(registration, name)
+        for name, default in _UNDECLARED.items()
+        if getattr(registration, name) != default and getattr(bound, name) == default
+    }
+    if registration.cacheable and not bound.cacheable:
+        declared["cacheable"] = True
+    return replace(bound, **declared) if declared else bound
+
+
 def _ensure_string_parameter_keys(step_id: str, spec: Mapping[Any, Any]) -> None:
     non_string_keys = [key for key in spec if not isinstance(key, str)]
     if not non_string_keys:
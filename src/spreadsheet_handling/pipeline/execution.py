@@ -1,30 +1,123 @@
-"""Linear pipeline execution for already-bound steps."""
+"""Pipeline execution for already-bound steps: linear, cached or scheduled."""
 
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterable
 
+from ..core.copy_on_write import copy_on_write
 from ._meta_change_trace import MetaSnapshot, diff_meta, format_meta_diff, snapshot_meta
+from .fingerprint import frames_fingerprint
+from .profiling import StepProfiler
+from .scheduling import dependency_barriers, merge_step_result, step_footprint
+from .step_cache import StepCache, StepDelta, step_key
 from .types import Frames, Step
 
 log = logging.getLogger("sheets.pipeline")
 
 
-def run_pipeline(frames: Frames, steps: Iterable[Step]) -> Frames:
+def run_pipeline(
+    frames: Frames,
+    steps: Iterable[Step],
+    *,
+    profiler: StepProfiler | None = None,
+    cache: StepCache | None = None,
+    workers: int | None = None,
+) -> Frames:
+    """Apply ``steps`` in order.
+
+    ``profiler`` records each executed step's cost; with ``cache`` cached step
+    results are replayed instead of running the steps (see ``step_cache``).
+    ``workers`` > 1 runs steps with disjoint declared footprints concurrently
+    on that many threads, with the same result as a linear run (see
+    ``scheduling``). Steps run with pandas copy-on-write enabled (see
+    ``core.copy_on_write``).
+    """
+    if workers is not None and workers <= 1:
+        workers = None
+    if workers is not None and (profiler is not None or cache is not None):
+        raise ValueError("workers cannot be combined with a profiler or a step cache")
+    with copy_on_write():
+        if workers is not None:
+            return _run_scheduled(frames, list(steps), workers)
+        if cache is not None:
+            return _run_cached(frames, list(steps), cache, profiler)
+        out = frames
+        for step in steps:
+            out = _run_step(step, out, profiler)
+        return out
+
+
+def _run_step(step: Step, frames: Frames, profiler: StepProfiler | None) -> Frames:
+    step_name = getattr(step, "name", "<unnamed>")
+    log.debug(
+        "-> step: %s config=%s",
+        step_name,
+        getattr(step, "config", {}),
+    )
+    trace_enabled = log.isEnabledFor(logging.DEBUG)
+    before = _snapshot_before_step(frames) if trace_enabled else None
+    if profiler is None:
+        out = step(frames)
+    else:
+        out = profiler.measure(str(step_name), "step", step, frames)
+    if trace_enabled:
+        _log_meta_change(step_name, before, out)
+    return out
+
+
+def _run_cached(
+    frames: Frames,
+    steps: list[Step],
+    cache: StepCache,
+    profiler: StepProfiler | None,
+) -> Frames:
     out = frames
+    input_key = frames_fingerprint(out)
+    replayed = 0
     for step in steps:
-        step_name = getattr(step, "name", "<unnamed>")
-        log.debug(
-            "-> step: %s config=%s",
-            step_name,
-            getattr(step, "config", {}),
-        )
-        trace_enabled = log.isEnabledFor(logging.DEBUG)
-        before = _snapshot_before_step(out) if trace_enabled else None
-        out = step(out)
-        if trace_enabled:
-            _log_meta_change(step_name, before, out)
+        key = step_key(step, input_key)
+        delta = cache.load(key) if key is not None and key in cache else None
+        restored = delta.apply(out) if delta is not None else None
+        if restored is not None:
+            out = restored
+            replayed += 1
+        else:
+            result = _run_step(step, out, profiler)
+            if key is not None:
+                cache.store(key, StepDelta.between(out, result))
+            out = result
+        input_key = key if key is not None else frames_fingerprint(out)
+    log.info("step cache: replayed %d of %d step(s)", replayed, len(steps))
+    return out
+
+
+def _run_scheduled(frames: Frames, steps: list[Step], workers: int) -> Frames:
+    footprints = [step_footprint(step) for step in steps]
+    barriers = dependency_barriers(footprints)
+    waiting = list(range(len(steps)))
+    running: dict[int, tuple[Frames, Future[Frames]]] = {}
+    out = frames
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sheets-step") as pool:
+        for index, step in enumerate(steps):
+            # Everything before ``index`` is merged: start each step whose
+            # last overlapping predecessor is among them.
+            for ready in [position for position in waiting if barriers[position] < index]:
+                running[ready] = (out, pool.submit(_run_step, steps[ready], out, None))
+            waiting = [position for position in waiting if position not in running]
+            before, future = running.pop(index)
+            try:
+                after = future.result()
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+            out = merge_step_result(out, before, after, step, footprints[index])
+    log.info(
+        "step scheduler: %d step(s), %d without declared footprint",
+        len(steps),
+        footprints.count(None),
+    )
     return out
 
 
@@ -0,0 +1,192 @@
+"""Stable content fingerprints of ``Frames`` for caching and change detection.
+
+``frames_fingerprint`` hashes a whole mapping, ``frame_fingerprint`` one
+DataFrame and ``meta_fingerprint`` the ``_meta`` payload. All digests are
+SHA-256 hex strings that are deterministic across processes and machines.
+
+DataFrames are hashed column by column with ``pd.util.hash_pandas_object``
+(vectorized, fixed hash key), together with dtypes, the row index (hashed the
+same way, one column per level) and the header. Header labels, including
+MultiIndex tuples and level names, are hashed by ``repr`` so ``1`` and ``"1"``
+stay distinct; object columns that mix value types also hash the type of
+every cell, and cells pandas cannot hash (lists, dicts) fall back to their
+``repr``.
+
+``_meta`` is hashed from its ``snapshot_meta`` normalization: scalars by
+exact type and value, sets in any order, mappings and sequences in order
+(writers preserve key order), nested DataFrames by content.
+
+A ``FingerprintMemo`` remembers frame digests by object identity and a
+version token (shape, header and index objects, column arrays). Replacing a
+column, reassigning a frame or any copy-on-write write changes the token; an
+in-place write into a column array that no other object shares does not, so
+only pass a memo where frames are treated as immutable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import weakref
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ._meta_change_trace import (
+    _MappingSnapshot,
+    _OpaqueSnapshot,
+    _ScalarSnapshot,
+    _SequenceSnapshot,
+    _SetSnapshot,
+    _SnapshotNode,
+    snapshot_meta,
+)
+
+_UNIFORM_OBJECT_KINDS = {"string", "empty"}
+_CARDINALITY_SAMPLE = 1024
+
+
+def _mostly_repeated(values: pd.Series | pd.Index) -> bool:
+    # Factorizing first (pandas' ``categorize``) pays off for low-cardinality
+    # columns and costs several times more on unique ones. The choice depends
+    # on content only, so equal columns still hash alike.
+    sample = values[:_CARDINALITY_SAMPLE]
+    return len(sample) > 0 and sample.nunique(dropna=False) * 2 <= len(sample)
+
+
+def _hash_values(values: pd.Series | pd.Index) -> bytes:
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False, categorize=_mostly_repeated(values)).to_numpy()
+    except TypeError:
+        hashed = pd.util.hash_array(np.array([repr(value) for value in values], dtype=object))
+    if values.dtype != object or pd.api.types.infer_dtype(values, skipna=False) in _UNIFORM_OBJECT_KINDS:
+        return hashed.tobytes()
+    kinds = np.array([type(value).__qualname__ for value in values], dtype=object)
+    return hashed.tobytes() + pd.util.hash_array(kinds).tobytes()
+
+
+def _update_columns(digest: Any, frame: pd.DataFrame) -> None:
+    for position in range(frame.shape[1]):
+        column = frame.iloc[:, position]
+        digest.update(repr(column.dtype).encode())
+        digest.update(_hash_values(column))
+
+
+def _update_index(digest: Any, index: pd.Index) -> None:
+    digest.update(repr(list(index.names)).encode())
+    if isinstance(index, pd.RangeIndex):
+        digest.update(repr(index).encode())
+        return
+    for level in range(index.nlevels):
+        values = index.get_level_values(level)
+        digest.update(repr(values.dtype).encode())
+        digest.update(_hash_values(values))
+
+
+def _compute_frame_fingerprint(frame: pd.DataFrame) -> str:
+    digest = hashlib.sha256()
+    digest.update(repr(list(frame.columns)).encode())
+    digest.update(repr(list(frame.columns.names)).encode())
+    _update_index(digest, frame.index)
+    _update_columns(digest, frame)
+    return digest.hexdigest()
+
+
+def _version_token(frame: pd.DataFrame) -> tuple[Any, ...]:
+    arrays = getattr(getattr(frame, "_mgr", None), "arrays", ())
+    return (frame.shape, id(frame.columns), id(frame.index), tuple(id(array) for array in arrays))
+
+
+class FingerprintMemo:
+    """Frame digests keyed by object identity and version (see module docstring)."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[pd.DataFrame], tuple[Any, ...], str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, frame: pd.DataFrame) -> str | None:
+        entry = self._entries.get(id(frame))
+        if entry is None:
+            return None
+        ref, token, fingerprint = entry
+        if ref() is not frame or token != _version_token(frame):
+            return None
+        return fingerprint
+
+    def remember(self, frame: pd.DataFrame, fingerprint: str) -> None:
+        key = id(frame)
+        ref = weakref.ref(frame, lambda _ref: self._entries.pop(key, None))
+        self._entries[key] = (ref, _version_token(frame), fingerprint)
+
+
+def frame_fingerprint(frame: pd.DataFrame, *, memo: FingerprintMemo | None = None) -> str:
+    """Content digest of one DataFrame: header, dtypes, index and values."""
+    if memo is not None:
+        cached = memo.lookup(frame)
+        if cached is not None:
+            return cached
+    fingerprint = _compute_frame_fingerprint(frame)
+    if memo is not None:
+        memo.remember(frame, fingerprint)
+    return fingerprint
+
+
+def _update_node(digest: Any, node: _SnapshotNode) -> None:
+    if isinstance(node, _ScalarSnapshot):
+        digest.update(f"s:{node.value_type.__qualname__}:{node.value!r};".encode())
+    elif isinstance(node, _MappingSnapshot):
+        digest.update(f"m:{len(node.items)}:{len(node.unsafe_entries)};".encode())
+        for key, child in node.items:
+            digest.update(f"k:{key!r};".encode())
+            _update_node(digest, child)
+        for entry in node.unsafe_entries:
+            digest.update(f"u:{entry.key!r};".encode())
+            _update_node(digest, entry.value)
+    elif isinstance(node, _SequenceSnapshot):
+        digest.update(f"l:{node.value_type.__qualname__}:{len(node.items)};".encode())
+        for child in node.items:
+            _update_node(digest, child)
+    elif isinstance(node, _SetSnapshot):
+        members = sorted(f"{item.value_type.__qualname__}:{item.value!r}" for item in node.items)
+        digest.update(f"t:{node.value_type.__qualname__}:{members!r};".encode())
+    else:
+        _update_opaque(digest, node)
+
+
+def _update_opaque(digest: Any, node: _OpaqueSnapshot) -> None:
+    value = node.value
+    if isinstance(value, pd.DataFrame):
+        digest.update(f"f:{frame_fingerprint(value)};".encode())
+    else:
+        digest.update(f"o:{type(value).__qualname__}:{value!r};".encode())
+
+
+def meta_fingerprint(meta: Any) -> str:
+    """Canonical digest of a ``_meta`` payload."""
+    digest = hashlib.sha256()
+    _update_node(digest, snapshot_meta({"_meta": meta}).root)
+    return digest.hexdigest()
+
+
+def frames_fingerprint(frames: Mapping[str, Any], *, memo: FingerprintMemo | None = None) -> str:
+    """Digest of a whole ``Frames`` mapping, frame order included."""
+    digest = hashlib.sha256()
+    for name, value in frames.items():
+        digest.update(f"{name!r}=".encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(frame_fingerprint(value, memo=memo).encode())
+        else:
+            digest.update(meta_fingerprint(value).encode())
+        digest.update(b";")
+    return digest.hexdigest()
+
+
+__all__ = [
+    "FingerprintMemo",
+    "frame_fingerprint",
+    "frames_fingerprint",
+    "meta_fingerprint",
+]
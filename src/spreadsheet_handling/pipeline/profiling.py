@@ -0,0 +1,170 @@
+"""Opt-in per-step and per-phase profiling for pipeline runs.
+
+``StepProfiler`` is the programmatic hook behind ``sheets-run
+--profile-steps``. Pass one to ``run_pipeline`` (or ``orchestrate``) and it
+records, for every step and orchestrator phase:
+
+* wall and CPU time,
+* the process peak RSS after the call (``ru_maxrss``, kilobytes on Linux),
+* ``(rows, columns)`` of every frame before and after the call,
+* the tracemalloc peak and net allocation of the call, only while tracing.
+
+Tracing slows allocation-heavy pandas and Python code by a large and uneven
+factor, so it is off by default: ``StepProfiler(trace_allocations=True)``
+traces for the lifetime of the profiler used as a context manager
+(``sheets-run --profile-memory``). Time columns of a traced run measure the
+tracing overhead too and should not be compared with untraced runs.
+
+Shapes are only taken of frames that are already in memory: sheets a lazy
+input has not read yet are not loaded for the report.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Mapping
+
+import pandas as pd
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+FrameShapes = dict[str, tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    """Measurements of one step or orchestrator phase."""
+
+    name: str
+    kind: str
+    wall_s: float
+    cpu_s: float
+    alloc_peak_bytes: int | None
+    alloc_delta_bytes: int | None
+    max_rss_kb: int | None
+    shapes_before: FrameShapes
+    shapes_after: FrameShapes
+
+
+def frame_shapes(frames: Any) -> FrameShapes:
+    """``(rows, columns)`` per loaded DataFrame; never loads pending lazy sheets."""
+    if not isinstance(frames, Mapping):
+        return {}
+    pending = set(frames.pending()) if hasattr(frames, "pending") else set()
+    shapes: FrameShapes = {}
+    for name in frames:
+        if name in pending:
+            continue
+        frame = frames[name]
+        if isinstance(frame, pd.DataFrame):
+            shapes[str(name)] = frame.shape
+    return shapes
+
+
+def _max_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+class StepProfiler:
+    """Collects ``ProfileRecord`` entries; see the module docstring."""
+
+    def __init__(self, *, trace_allocations: bool = False) -> None:
+        self.records: list[ProfileRecord] = []
+        self.trace_allocations = trace_allocations
+        self._started_tracing = False
+
+    def __enter__(self) -> StepProfiler:
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def measure(self, name: str, kind: str, fn: Callable[[Any], Any], frames: Any) -> Any:
+        """Call ``fn(frames)`` and record its cost; returns ``fn``'s result."""
+        tracing = tracemalloc.is_tracing()
+        shapes_before = frame_shapes(frames)
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = fn(frames)
+        cpu_s = time.process_time() - cpu_start
+        wall_s = time.perf_counter() - wall_start
+        alloc_peak = alloc_delta = None
+        if tracing:
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            alloc_peak = traced_peak - traced_before
+            alloc_delta = traced_after - traced_before
+        self.records.append(
+            ProfileRecord(
+                name=name,
+                kind=kind,
+                wall_s=wall_s,
+                cpu_s=cpu_s,
+                alloc_peak_bytes=alloc_peak,
+                alloc_delta_bytes=alloc_delta,
+                max_rss_kb=_max_rss_kb(),
+                shapes_before=shapes_before,
+                shapes_after=frame_shapes(result),
+            )
+        )
+        return result
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "total_wall_s": sum(record.wall_s for record in self.records),
+            "total_cpu_s": sum(record.cpu_s for record in self.records),
+            "records": [asdict(record) for record in self.records],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2)
+
+    def format_table(self) -> str:
+        """Human-readable table, one line per record, slowest steps easy to spot."""
+        header = f"{'kind':<6} {'name':<32} {'wall ms':>9} {'cpu ms':>9} {'alloc MiB':>10} {'frames':>9} {'rows':>19}"
+        lines = [header, "-" * len(header)]
+        for record in self.records:
+            lines.append(
+                f"{record.kind:<6} {record.name[:32]:<32} {record.wall_s * 1000:>9.1f} "
+                f"{record.cpu_s * 1000:>9.1f} {_mib(record.alloc_peak_bytes):>10} "
+                f"{_transition(len(record.shapes_before), len(record.shapes_after)):>9} "
+                f"{_transition(_rows(record.shapes_before), _rows(record.shapes_after)):>19}"
+            )
+        report = self.report()
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'total':<6} {'':<32} {report['total_wall_s'] * 1000:>9.1f} {report['total_cpu_s'] * 1000:>9.1f}"
+        )
+        return "\n".join(lines)
+
+
+def _mib(size: int | None) -> str:
+    if size is None:
+        return "-"
+    return f"{size / (1024 * 1024):.2f}"
+
+
+def _rows(shapes: FrameShapes) -> int:
+    return sum(rows for rows, _ in shapes.values())
+
+
+def _transition(before: int, after: int) -> str:
+    return f"{before}->{after}"
+
+
+__all__ = ["FrameShapes", "ProfileRecord", "StepProfiler", "frame_shapes"]
@@ -48,10 +48,15 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "validate_references": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.validations.reference_validations:validate_references",
+        frame_inputs=("rules.*.frame", "rules.*.target", "rules.*.enabled_when.frame", "findings"),
+        frame_outputs=("findings",),
+        meta_inputs=("sheets",),
+        cacheable=False,
     ),
     "validate_graph": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.validations.graph_validations:validate_graph",
+        cacheable=False,
     ),
     "configure_workbook_view": StepRegistration(
         factory=make_frames_target_step,
@@ -60,6 +65,9 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "configure_pipeline_cleanup": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.pipeline_cleanup:configure_pipeline_cleanup",
+        frame_inputs=("drop_frames", "keep_frames"),
+        frame_outputs=(),
+        meta_outputs=("pipeline_cleanup",),
     ),
     "apply_workbook_view_sheet_mappings": StepRegistration(
         factory=make_frames_target_step,
@@ -84,10 +92,12 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "apply_overrides": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.yaml_overrides:load_and_apply_overrides",
+        cacheable=False,
     ),
     "write_structured_yaml": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.structured_yaml:write_structured_yaml",
+        cacheable=False,
     ),
     "split_by_discriminator": StepRegistration(
         factory=make_frames_target_step,
@@ -100,18 +110,28 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "extract_frame": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.extractions.frame_extract:extract_frame",
+        frame_inputs=("source", "output"),
+        frame_outputs=("output",),
     ),
     "pivot_frame": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.tabular_views:pivot_frame",
+        frame_inputs=("source", "output"),
+        frame_outputs=("output",),
     ),
     "join_frames": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.join_views:join_frames",
+        frame_inputs=("left", "right", "output"),
+        frame_outputs=("output",),
     ),
     "expand_xref": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.xref_crosstable:expand_xref",
+        frame_inputs=("matrix", "base_relation", "output"),
+        frame_outputs=("output",),
+        meta_inputs=("xref_crosstable",),
+        meta_outputs=("xref_crosstable", "pipeline_cleanup"),
     ),
     "contract_xref": StepRegistration(
         factory=make_frames_target_step,
@@ -120,10 +140,16 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "sparse_collapse": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.sparse_defaults:sparse_collapse",
+        frame_inputs=("frame",),
+        meta_inputs=("xref_crosstable",),
+        meta_outputs=("sparse_defaults.{frame}",),
     ),
     "sparse_expand": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.sparse_defaults:sparse_expand",
+        frame_inputs=("frame",),
+        meta_inputs=("xref_crosstable",),
+        meta_outputs=("sparse_defaults.{frame}",),
     ),
     "normalize_resource_overrides": StepRegistration(
         factory=make_frames_target_step,
@@ -151,6 +177,10 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
     "add_lookup_helpers": StepRegistration(
         factory=make_frames_target_step,
         target="spreadsheet_handling.domain.transformations.enrich_lookup:enrich_lookup",
+        frame_inputs=("source", "lookup", "output"),
+        frame_outputs=("output",),
+        meta_inputs=("helper_policies.lookup.{lookup}",),
+        meta_outputs=("derived.sheets.{output}",),
     ),
     "write_key_value_resources": StepRegistration(
         factory=make_frames_target_step,
@@ -158,6 +188,10 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
             "spreadsheet_handling.domain.key_value_writer:"
             "write_key_value_resources"
         ),
+        frame_inputs=("source", "report_frame"),
+        frame_outputs=("report_frame",),
+        path_outputs=("output_dir",),
+        cacheable=False,
     ),
     "write_artifact_manifest": StepRegistration(
         factory=make_frames_target_step,
@@ -165,6 +199,7 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
             "spreadsheet_handling.domain.artifact_manifest:"
             "write_artifact_manifest"
         ),
+        cacheable=False,
     ),
     "apply_derived_column_policy": StepRegistration(
         factory=make_frames_target_step,
@@ -186,12 +221,15 @@ REGISTRY: Dict[str, StepRegistration | StepFactory] = {
 def resolve_registration(step_id: str) -> StepRegistration | None:
     entry = REGISTRY.get(step_id)
     if entry:
-        return entry if isinstance(entry, StepRegistration) else StepRegistration(factory=entry)
+        if isinstance(entry, StepRegistration):
+            return entry
+        # Plain factories decide cacheability on the BoundStep they return.
+        return StepRegistration(factory=entry, cacheable=False)
     if ":" in step_id:
         mod_name, func_name = step_id.split(":", 1)
         mod = importlib.import_module(mod_name)
         factory = getattr(mod, func_name, None)
         if factory is None:
             raise AttributeError(f"Factory '{func_name}' not found in module '{mod_name}'")
-        return StepRegistration(factory=factory)
+        return StepRegistration(factory=factory, cacheable=False)
     return None
@@ -0,0 +1,228 @@
+"""Dependency analysis for running independent pipeline steps concurrently.
+
+A step's footprint is what it reads and writes, derived from its declarations
+(``BoundStep.frame_inputs``, ``frame_outputs``, ``meta_inputs``,
+``meta_outputs`` and ``path_outputs``) and its config. Resources are paths:
+``("frame", name)``, ``("meta", *subtree)`` and ``("path", *parts)``; two
+resources overlap when one is a prefix of the other. A step without
+``frame_inputs`` has no footprint and is a barrier for every other step.
+
+``run_pipeline(..., workers=N)`` starts a step as soon as every earlier step
+it overlaps with has finished, and merges results in step order: only the
+declared frames and ``_meta`` subtrees are taken from a step's result, so the
+final frames equal those of a linear run. A step that adds, removes or
+replaces an undeclared frame, or changes undeclared ``_meta``, raises instead
+of being merged silently.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .steps import _resolve_callable
+from .types import Frames, Step
+
+Resource = tuple[str, ...]
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class StepFootprint:
+    """Resources a step reads (including everything it writes) and writes."""
+
+    reads: frozenset[Resource]
+    writes: frozenset[Resource]
+
+    def overlaps(self, other: StepFootprint) -> bool:
+        return (
+            _intersects(self.writes, other.reads)
+            or _intersects(self.reads, other.writes)
+        )
+
+
+def _intersects(left: frozenset[Resource], right: frozenset[Resource]) -> bool:
+    return any(a[: len(b)] == b or b[: len(a)] == a for a in left for b in right)
+
+
+@lru_cache(maxsize=None)
+def _target_defaults(target: str) -> Mapping[str, Any]:
+    try:
+        parameters = inspect.signature(_resolve_callable(target)).parameters
+    except (ImportError, AttributeError, TypeError, ValueError):
+        return {}
+    return {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+
+def _config_values(step: Step, key: str) -> list[Any]:
+    config = getattr(step, "config", None) or {}
+    head, *rest = key.split(".")
+    if head in config:
+        values = [config[head]]
+    elif isinstance(config.get("target"), str):
+        values = [_target_defaults(config["target"]).get(head)]
+    else:
+        values = []
+    for segment in rest:
+        if segment == "*":
+            values = [item for value in values if isinstance(value, (list, tuple)) for item in value]
+        else:
+            values = [value.get(segment) for value in values if isinstance(value, Mapping)]
+    return values
+
+
+def _names(value: Any) -> set[str]:
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, (list, tuple)):
+        return {name for name in value if isinstance(name, str)}
+    return set()
+
+
+def declared_frames(step: Step, keys: Iterable[str]) -> set[str]:
+    """Frame names that ``step``'s config holds under the declared ``keys``."""
+    names: set[str] = set()
+    for key in keys:
+        for value in _config_values(step, key):
+            names |= _names(value)
+    return names
+
+
+def _meta_path(step: Step, dotted: str) -> Resource:
+    segments: list[str] = []
+    for segment in dotted.split("."):
+        if segment.startswith("{") and segment.endswith("}"):
+            values = _config_values(step, segment[1:-1])
+            if len(values) != 1 or not isinstance(values[0], str):
+                break
+            segment = values[0]
+        segments.append(segment)
+    return ("meta", *segments)
+
+
+def _path_resources(step: Step, keys: Iterable[str]) -> set[Resource]:
+    resources: set[Resource] = set()
+    for key in keys:
+        for value in _config_values(step, key):
+            if isinstance(value, (str, os.PathLike)):
+                resources.add(("path", *Path(os.path.abspath(value)).parts))
+    return resources
+
+
+def step_footprint(step: Step) -> StepFootprint | None:
+    """Declared footprint of ``step``; None when it may touch anything."""
+    frame_inputs = getattr(step, "frame_inputs", None)
+    if frame_inputs is None:
+        return None
+    frame_outputs = getattr(step, "frame_outputs", None)
+    if frame_outputs is None:
+        frame_outputs = frame_inputs
+    writes = {("frame", name) for name in declared_frames(step, frame_outputs)}
+    writes |= {_meta_path(step, dotted) for dotted in getattr(step, "meta_outputs", ())}
+    writes |= _path_resources(step, getattr(step, "path_outputs", ()))
+    reads = {("frame", name) for name in declared_frames(step, frame_inputs)}
+    reads |= {_meta_path(step, dotted) for dotted in getattr(step, "meta_inputs", ())}
+    return StepFootprint(reads=frozenset(reads | writes), writes=frozenset(writes))
+
+
+def dependency_barriers(footprints: Sequence[StepFootprint | None]) -> list[int]:
+    """Per step, the last earlier step it must wait for (-1 for none)."""
+    barriers: list[int] = []
+    for index, footprint in enumerate(footprints):
+        barrier = -1
+        for earlier in range(index - 1, -1, -1):
+            other = footprints[earlier]
+            if footprint is None or other is None or footprint.overlaps(other):
+                barrier = earlier
+                break
+        barriers.append(barrier)
+    return barriers
+
+
+def _lookup(node: Any, path: Sequence[str]) -> Any:
+    for segment in path:
+        if not isinstance(node, Mapping) or segment not in node:
+            return _MISSING
+        node = node[segment]
+    return node
+
+
+def _assign(node: Any, path: Sequence[str], value: Any) -> Any:
+    if not path:
+        return value
+    if value is _MISSING and _lookup(node, path) is _MISSING:
+        return node
+    updated = dict(node) if isinstance(node, Mapping) else {}
+    child = _assign(updated.get(path[0], _MISSING), path[1:], value)
+    if child is _MISSING:
+        updated.pop(path[0], None)
+    else:
+        updated[path[0]] = child
+    return updated
+
+
+def _ensure_within_footprint(step: Step, footprint: StepFootprint, before: Frames, after: Frames) -> None:
+    written = {resource[1] for resource in footprint.writes if resource[0] == "frame"}
+    changed = set(after) ^ set(before)
+    changed |= {name for name in set(after) & set(before) if after[name] is not before[name]}
+    if any(resource[0] == "meta" for resource in footprint.writes):
+        written.add("_meta")
+    changed -= written
+    if changed:
+        raise RuntimeError(
+            f"Step {getattr(step, 'name', '<unnamed>')!r} changed {sorted(changed)!r} "
+            "outside its declared frame_outputs/meta_outputs"
+        )
+
+
+def _merge_meta(merged: Frames, after: Frames, paths: Sequence[Resource]) -> None:
+    meta = merged.get("_meta", _MISSING)
+    for path in paths:
+        meta = _assign(meta, path, _lookup(after.get("_meta", _MISSING), path))
+    if meta is not _MISSING:
+        merged["_meta"] = meta
+
+
+def merge_step_result(
+    state: Frames,
+    before: Frames,
+    after: Frames,
+    step: Step,
+    footprint: StepFootprint | None,
+) -> Frames:
+    """Apply ``step``'s declared writes (``before`` -> ``after``) to ``state``."""
+    if footprint is None:
+        return after
+    _ensure_within_footprint(step, footprint, before, after)
+    written = {resource[1] for resource in footprint.writes if resource[0] == "frame"}
+    meta_paths = sorted(resource[1:] for resource in footprint.writes if resource[0] == "meta")
+    if not written and not meta_paths:
+        return state
+    merged = state.copy()  # keeps a lazily loaded state lazy
+    for name in after:
+        if name in written:
+            merged[name] = after[name]
+    for name in sorted(written - set(after)):
+        merged.pop(name, None)
+    if meta_paths:
+        _merge_meta(merged, after, meta_paths)
+    return merged
+
+
+__all__ = [
+    "StepFootprint",
+    "declared_frames",
+    "dependency_barriers",
+    "merge_step_result",
+    "step_footprint",
+]
@@ -0,0 +1,197 @@
+"""Content-addressed on-disk cache for pipeline step results.
+
+A step result is keyed by the step's name, config and callable, the package
+version, a digest of the source of the modules the step runs (its callable
+and, for registry steps, its ``target``), and the key of its input frames.
+Only the frames entering the pipeline are hashed
+(``fingerprint.frames_fingerprint``): a cacheable step's output is a pure
+function of its key, so the next step's input key is chained from it without
+hashing again. Steps that are not cacheable (writers, validations reporting
+findings, file or plugin inputs; see ``BoundStep.cacheable``) always run, and
+the chain restarts from a hash of their output.
+
+An entry holds a ``StepDelta``: only the frames the step replaced or added,
+plus the order of the result's keys. Frames a step passes through unchanged
+are not stored again, so ``run_pipeline(..., cache=StepCache(...))`` replays
+cached steps one after the other, applying each delta to the frames at hand.
+Entries are pickled; reads refresh their modification time and the least
+recently used entries are evicted once the directory grows beyond
+``max_bytes``. Only point the cache at a directory you control: entries are
+unpickled on a hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Sequence
+
+from .. import __version__
+from .types import Frames, Step
+
+log = logging.getLogger("sheets.pipeline.cache")
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+_SUFFIX = ".pkl"
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def _callable_label(step: Step) -> str:
+    fn = getattr(step, "fn", step)
+    return f"{getattr(fn, '__module__', '')}:{getattr(fn, '__qualname__', type(fn).__qualname__)}"
+
+
+def _target_path(step: Step) -> str | None:
+    target = (getattr(step, "config", None) or {}).get("target")
+    return target if isinstance(target, str) else None
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _module_digest(module_name: str) -> str | None:
+    try:
+        path = getattr(importlib.import_module(module_name), "__file__", None)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _code_digests(step: Step, target: str | None) -> dict[str, str | None]:
+    """Source digests of the modules ``step`` runs, so editing them misses the cache."""
+    modules = {getattr(getattr(step, "fn", step), "__module__", None)}
+    if target is not None:
+        modules.add(target.split(":", 1)[0] if ":" in target else target.rsplit(".", 1)[0])
+    return {name: _module_digest(name) for name in sorted(m for m in modules if m)}
+
+
+def step_key(step: Step, input_key: str) -> str | None:
+    """Cache key of ``step`` applied to frames with ``input_key``; None if not cacheable."""
+    if not getattr(step, "cacheable", False):
+        return None
+    target = _target_path(step)
+    payload = {
+        "name": getattr(step, "name", None),
+        "config": getattr(step, "config", {}),
+        "callable": _callable_label(step),
+        "target": target,
+        "code": _code_digests(step, target),
+        "version": __version__,
+        "input": input_key,
+    }
+    return hashlib.sha256(_canonical_json(payload).encode()).hexdigest()
+
+
+def chain_keys(steps: Sequence[Step], input_key: str) -> list[str]:
+    """Keys of the leading cacheable ``steps``, each chained from the previous one."""
+    keys: list[str] = []
+    key: str | None = input_key
+    for step in steps:
+        key = step_key(step, key)
+        if key is None:
+            break
+        keys.append(key)
+    return keys
+
+
+@dataclass(frozen=True)
+class StepDelta:
+    """What a step changed: the frames it replaced or added, and the result's key order."""
+
+    order: tuple[str, ...]
+    changed: Frames
+
+    @classmethod
+    def between(cls, before: Frames, after: Frames) -> StepDelta:
+        changed = {
+            name: value
+            for name, value in after.items()
+            if name not in before or before[name] is not value
+        }
+        return cls(order=tuple(after), changed=changed)
+
+    def apply(self, frames: Frames) -> Frames | None:
+        """The step result for input ``frames``; None if the delta does not fit them."""
+        if any(name not in self.changed and name not in frames for name in self.order):
+            return None
+        return {name: self.changed[name] if name in self.changed else frames[name] for name in self.order}
+
+
+class StepCache:
+    """Directory of pickled step results with size-bounded LRU eviction."""
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def load(self, key: str) -> StepDelta | None:
+        """The entry under ``key``; None, after deleting it, if it cannot be read back."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as fh:
+                delta = pickle.load(fh)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as exc:
+            log.debug("step cache: dropping unreadable entry %s (%s)", key, type(exc).__name__)
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(delta, StepDelta):
+            path.unlink(missing_ok=True)
+            return None
+        return delta
+
+    def store(self, key: str, delta: StepDelta) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            with tmp.open("wb") as fh:
+                pickle.dump(delta, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            tmp.unlink(missing_ok=True)
+            log.debug("step cache: result not stored (%s)", type(exc).__name__)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+__all__ = ["DEFAULT_MAX_BYTES", "StepCache", "StepDelta", "chain_keys", "step_key"]
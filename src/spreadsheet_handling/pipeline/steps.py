@@ -111,7 +111,7 @@ def make_identity_step(name: str = "identity") -> BoundStep:
     cfg: Dict[str, Any] = {}
     def run(fr: Frames) -> Frames:
         return fr
-    return BoundStep(name=name, config=cfg, fn=run)
+    return BoundStep(name=name, config=cfg, fn=run, frame_inputs=(), cacheable=True)
 
 
 def make_validate_step(
@@ -171,7 +171,7 @@ def make_apply_fks_step(
     def run(fr: Frames) -> Frames:
         return enrich_helpers(fr, cfg["defaults"])
 
-    return BoundStep(name=name, config=cfg, fn=run)
+    return BoundStep(name=name, config=cfg, fn=run, cacheable=True)
 
 
 def make_drop_helpers_step(
@@ -195,7 +195,7 @@ def make_drop_helpers_step(
     def run(fr: Frames) -> Frames:
         return drop_helpers(fr, prefix=cfg["prefix"])
 
-    return BoundStep(name=name, config=cfg, fn=run)
+    return BoundStep(name=name, config=cfg, fn=run, cacheable=True)
 
 
 def make_reorder_helpers_step(*, sheet: str | None = None, helper_prefix: str = "_", name: str = "reorder_fk_helpers") -> BoundStep:
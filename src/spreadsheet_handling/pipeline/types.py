@@ -35,10 +35,28 @@ class BoundStep:
     Bound step (Name + Config + Callable).
     name/config are useful for logging, debugging, and introspection.
     fn encapsulates the actual logic (typically a closure from a factory).
+    frame_inputs names the config keys that hold every frame the step reads
+    or writes; None means the step may touch any frame. A key may descend
+    into the config with dots, "*" standing for every list item
+    ("rules.*.frame"); a missing key falls back to the target's default.
+    frame_outputs names the subset of those keys whose frames the step
+    writes; None means any of them.
+    meta_inputs / meta_outputs list the dotted ``_meta`` subtrees the step
+    reads / writes; "{key}" segments are filled from the config.
+    path_outputs names the config keys holding files or directories the
+    step writes outside the frames.
+    cacheable marks the result as a pure function of name, config and input
+    frames, so a step result cache may replay it instead of running fn.
     """
     name: str
     config: Dict[str, Any]
     fn: Callable[[Frames], Frames]
+    frame_inputs: tuple[str, ...] | None = None
+    frame_outputs: tuple[str, ...] | None = None
+    meta_inputs: tuple[str, ...] = ()
+    meta_outputs: tuple[str, ...] = ()
+    path_outputs: tuple[str, ...] = ()
+    cacheable: bool = False
 
     def __call__(self, frames: Frames) -> Frames:
         return self.fn(frames)
@@ -56,9 +74,23 @@ class StepRegistration:
     factory remains the extension point for how a step is bound.
     target optionally identifies the underlying domain callable when a generic
     binding path is used.
+    frame_inputs declares the config keys naming the only frames the step
+    touches; frame_outputs, meta_inputs, meta_outputs and path_outputs
+    narrow that down to what it writes and which ``_meta`` subtrees and
+    files it uses (see BoundStep). The step scheduler runs steps whose
+    declarations do not overlap concurrently.
+    cacheable is cleared for steps with side effects, findings to report, or
+    inputs beyond their config and frames (files, plugin code); see
+    BoundStep.cacheable.
     """
     factory: StepFactory
     target: StepTarget | None = None
+    frame_inputs: tuple[str, ...] | None = None
+    frame_outputs: tuple[str, ...] | None = None
+    meta_inputs: tuple[str, ...] = ()
+    meta_outputs: tuple[str, ...] = ()
+    path_outputs: tuple[str, ...] = ()
+    cacheable: bool = True
 
 
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from typing import Any
 
 import pandas as pd
 
+from spreadsheet_handling.core.copy_on_write import detached
 from spreadsheet_handling.core.formulas import LookupFormulaSpec, lookup_formula
 
 RESERVED_FRAME_KEYS = {"_meta"}
@@ -115,7 +116,7 @@ def _resolve_formula_sheet_names(
             if first.lookup_sheet not in frame_to_sheet:
                 continue
             if not copied:
-                value = value.copy()
+                value = detached(value)
                 selected[sheet_name] = value
                 copied = True
             new_sheet = frame_to_sheet[first.lookup_sheet]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.application.orchestrator import orchestrate
+from spreadsheet_handling.io_backends import json_backend
+from spreadsheet_handling.io_backends.json_backend import write_json_dir
+from spreadsheet_handling.pipeline.build import build_steps_from_config
+from spreadsheet_handling.pipeline.types import BoundStep, Frames
+
+pytestmark = pytest.mark.ftr("FTR-LAZY-FRAMES")
+
+
+@pytest.fixture
+def input_dir(tmp_path: Path) -> Path:
+    frames = {
+        f"sheet_{index}": pd.DataFrame({"id": [f"{index}-1", f"{index}-2"], "value": ["x", ""]})
+        for index in range(5)
+    }
+    write_json_dir({**frames, "_meta": {"version": "1.0"}}, tmp_path / "input")
+    return tmp_path / "input"
+
+
+@pytest.fixture
+def sheets_read(monkeypatch) -> list[str]:
+    read: list[str] = []
+    original = json_backend._read_json_sheet
+
+    def counting(p: Path) -> pd.DataFrame:
+        read.append(p.stem)
+        return original(p)
+
+    monkeypatch.setattr(json_backend, "_read_json_sheet", counting)
+    return read
+
+
+def _steps() -> list[BoundStep]:
+    return build_steps_from_config(
+        [
+            {"step": "extract_frame", "source": "sheet_1", "output": "ids", "columns": ["id"]},
+            {"step": "configure_pipeline_cleanup", "keep_frames": ["ids", "sheet_3"]},
+        ]
+    )
+
+
+def _run(input_dir: Path, output_dir: Path, steps: list[BoundStep], *, lazy: bool) -> Frames:
+    return orchestrate(
+        input={"kind": "json_dir", "path": str(input_dir), "options": {"lazy": lazy}},
+        output={"kind": "json_dir", "path": str(output_dir)},
+        steps=steps,
+    )
+
+
+def test_lazy_input_reads_only_touched_and_kept_sheets(tmp_path: Path, input_dir: Path, sheets_read):
+    result = _run(input_dir, tmp_path / "lazy", _steps(), lazy=True)
+
+    assert sorted(sheets_read) == ["sheet_1", "sheet_3"]
+    assert list(result) == ["sheet_3", "_meta", "ids"]
+
+
+def test_lazy_input_writes_same_output_as_eager(tmp_path: Path, input_dir: Path):
+    _run(input_dir, tmp_path / "eager", _steps(), lazy=False)
+    _run(input_dir, tmp_path / "lazy", _steps(), lazy=True)
+
+    eager_files = sorted(p.name for p in (tmp_path / "eager").iterdir())
+    assert sorted(p.name for p in (tmp_path / "lazy").iterdir()) == eager_files
+    for name in eager_files:
+        assert (tmp_path / "lazy" / name).read_bytes() == (tmp_path / "eager" / name).read_bytes()
+
+
+def test_declared_steps_see_only_their_frames(tmp_path: Path, input_dir: Path, sheets_read):
+    seen: list[list[str]] = []
+
+    def probe(frames: Frames) -> Frames:
+        seen.append(list(frames))
+        return frames
+
+    steps = [
+        *build_steps_from_config([{"step": "extract_frame", "source": "sheet_1", "output": "ids", "columns": ["id"]}]),
+        BoundStep(name="probe", config={}, fn=probe, frame_inputs=()),
+    ]
+
+    result = orchestrate(
+        input={"kind": "json_dir", "path": str(input_dir), "options": {"lazy": True}},
+        output={"kind": "discard", "path": str(tmp_path / "out")},
+        steps=steps,
+    )
+
+    assert seen == [["_meta"]]
+    assert sheets_read == ["sheet_1"]
+    assert result["ids"]["id"].tolist() == ["1-1", "1-2"]
+
+
+def test_undeclared_step_keeps_every_sheet(tmp_path: Path, input_dir: Path, sheets_read):
+    def count_sheets(frames: Frames) -> Frames:
+        out = dict(frames)
+        out["ids"] = pd.DataFrame({"sheets": [len(out) - 1]})
+        return out
+
+    steps = [BoundStep(name="count_sheets", config={}, fn=count_sheets), *_steps()[1:]]
+
+    result = _run(input_dir, tmp_path / "out", steps, lazy=True)
+
+    assert len(sheets_read) == 5
+    assert result["ids"]["sheets"].tolist() == [5]
+
+
+def test_lazy_input_rejects_kinds_without_lazy_loader(tmp_path: Path):
+    with pytest.raises(ValueError, match="does not support lazy loading"):
+        orchestrate(
+            input={"kind": "xlsx", "path": str(tmp_path / "in.xlsx"), "options": {"lazy": True}},
+            output={"kind": "discard", "path": str(tmp_path / "out")},
+        )
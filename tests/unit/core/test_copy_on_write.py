@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.core.copy_on_write import copy_on_write, copy_on_write_enabled, detached
+from spreadsheet_handling.domain.transformations.sparse_defaults import sparse_collapse
+from spreadsheet_handling.pipeline import run_pipeline
+from spreadsheet_handling.pipeline.types import BoundStep, Frames
+
+pytestmark = pytest.mark.ftr("FTR-COPY-ON-WRITE")
+
+
+def _orders() -> pd.DataFrame:
+    return pd.DataFrame({"id": ["O-1", "O-2", "O-3"], "status": ["open", "shipped", "open"], "amount": [1.0, 2.0, 3.0]})
+
+
+def test_detached_frame_writes_leave_source_untouched():
+    source = _orders()
+
+    copy = detached(source)
+    copy.loc[0, "amount"] = 99.0
+    copy["status"] = "closed"
+
+    pd.testing.assert_frame_equal(source, _orders())
+
+
+def test_step_shares_columns_it_does_not_write():
+    frames = {"orders": _orders(), "_meta": {"version": "1.0"}}
+
+    with copy_on_write():
+        assert copy_on_write_enabled()
+        out = sparse_collapse(frames, frame="orders", default_value="open", columns=["status"])
+
+    assert out["orders"]["status"].tolist() == ["", "shipped", ""]
+    assert np.shares_memory(out["orders"]["amount"].to_numpy(), frames["orders"]["amount"].to_numpy())
+    pd.testing.assert_frame_equal(frames["orders"], _orders())
+
+
+def test_pipeline_scopes_copy_on_write_to_the_run():
+    seen: list[bool] = []
+
+    def record(frames: Frames) -> Frames:
+        seen.append(copy_on_write_enabled())
+        return frames
+
+    run_pipeline({}, [BoundStep(name="record", config={}, fn=record)])
+
+    assert seen == [True]
+    assert copy_on_write_enabled() is (int(pd.__version__.split(".")[0]) >= 3)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.core.unflatten import (
+    build_nested_records,
+    df_to_objects,
+    frame_column_values,
+    plan_nested_columns,
+    row_to_obj,
+)
+
+pytestmark = pytest.mark.ftr("FTR-NESTED-RECORD-BUILDER")
+
+
+def _frame() -> pd.DataFrame:
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("id", ""),
+            ("kunde", "name"),
+            ("_helper", "x"),
+            ("", "Unnamed: 3"),
+            ("kunde", "adresse.stadt"),
+        ]
+    )
+    return pd.DataFrame(
+        [["K1", "Rexi", "h", "u", "Dinohausen"], ["K2", "  ", "h", "u", ""]],
+        columns=columns,
+    )
+
+
+def test_plan_resolves_paths_once_and_skips_helper_and_empty_headers():
+    plan = plan_nested_columns(_frame().columns)
+
+    assert plan.positions == [0, 1, 4]
+    assert plan.paths == [("id",), ("kunde", "name"), ("kunde", "adresse.stadt")]
+    assert plan_nested_columns(_frame().columns, split_dotted=True).paths[-1] == (
+        "kunde",
+        "adresse",
+        "stadt",
+    )
+
+
+def test_records_are_built_column_wise_in_column_order_without_blank_cells():
+    df = _frame()
+    records = build_nested_records(df, plan_nested_columns(df.columns))
+
+    assert records == [
+        {"id": "K1", "kunde": {"name": "Rexi", "adresse.stadt": "Dinohausen"}},
+        {"id": "K2"},
+    ]
+    assert list(records[0]) == ["id", "kunde"]
+    assert list(records[0]["kunde"]) == ["name", "adresse.stadt"]
+
+
+def test_conflicting_headers_raise_unless_scalars_may_be_replaced():
+    df = pd.DataFrame([["flat", "nested"]], columns=pd.MultiIndex.from_tuples([("a", ""), ("a", "b")]))
+    plan = plan_nested_columns(df.columns)
+
+    with pytest.raises(TypeError, match="'a' already holds a value"):
+        build_nested_records(df, plan)
+    assert build_nested_records(df, plan, replace_scalars=True) == [{"a": {"b": "nested"}}]
+
+
+def test_df_to_objects_and_row_to_obj_reject_conflicting_headers():
+    with pytest.raises(TypeError, match="'a.b'"):
+        df_to_objects(pd.DataFrame([["flat", "nested"]], columns=["a", "a.b"]))
+    with pytest.raises(TypeError, match="'a.b'"):
+        row_to_obj(["a", "a.b"], ["flat", "nested"])
+
+
+def test_column_values_keep_row_wise_value_semantics():
+    df = pd.DataFrame({"i": [1, 2], "f": [0.5, 1.5], "t": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+
+    ints, floats = frame_column_values(df[["i", "f"]], [0, 1])
+    assert ints == [1.0, 2.0]  # interleaved float64, as iterrows would yield
+    assert floats == [0.5, 1.5]
+    assert frame_column_values(df[["t"]], [0]) == [[pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02")]]
+    ints, _, stamps = frame_column_values(df, [0, 1, 2])
+    assert ints == [1, 2] and stamps[0] == pd.Timestamp("2024-01-01")  # mixed frame: object, no upcast
+
+
+def test_df_to_objects_splits_dotted_paths_and_drops_empty_rows():
+    df = _frame()
+    df.iloc[1, 0] = ""
+
+    assert df_to_objects(df) == [{"id": "K1", "kunde": {"name": "Rexi", "adresse": {"stadt": "Dinohausen"}}}]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from spreadsheet_handling.core import yaml_codec
+from spreadsheet_handling.io_backends.yaml_backend import load_yaml_dir
+
+pytestmark = pytest.mark.ftr("FTR-YAML-LIBYAML-CODEC")
+
+
+# Leading BOM, escapes, anchors/merge keys, block scalars and implicit dates.
+_DOCUMENT = "\ufeff" + """\
+- id: K-1
+  name: "Rexi \\U0001F996"
+  since: 2020-01-02
+  tags: [a, b]
+  base: &base {city: Dinohausen}
+- id: K-2
+  name: 'it''s'
+  note: |
+    multi
+    line
+  extra:
+    <<: *base
+    zip: 01234
+"""
+
+
+def test_safe_load_matches_pure_python_safe_loader():
+    assert yaml_codec.safe_load(_DOCUMENT) == yaml.load(_DOCUMENT, Loader=yaml.SafeLoader)
+
+
+def test_safe_load_uses_libyaml_when_available():
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert yaml_codec._SafeLoader is expected
+    assert yaml_codec.LIBYAML_AVAILABLE is hasattr(yaml, "CSafeLoader")
+
+
+def test_safe_load_raises_yaml_errors():
+    with pytest.raises(yaml.YAMLError):
+        yaml_codec.safe_load("key: [1, 2\n")
+
+
+def test_yaml_dir_frames_do_not_depend_on_loader(tmp_path: Path, monkeypatch):
+    (tmp_path / "customers.yml").write_text(_DOCUMENT, encoding="utf-8")
+    fast = load_yaml_dir(str(tmp_path))
+
+    monkeypatch.setattr(yaml_codec, "_SafeLoader", yaml.SafeLoader)
+    pure = load_yaml_dir(str(tmp_path))
+
+    assert fast.keys() == pure.keys()
+    assert fast["customers"].equals(pure["customers"])
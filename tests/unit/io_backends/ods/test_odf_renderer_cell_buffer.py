@@ -0,0 +1,82 @@
+"""Focused unit tests for the compact ODS renderer cell buffer.
+
+``_collect_sheets`` keeps values in dense per-row lists and every other cell
+attribute in sparse side tables, with styles interned per sheet. These tests
+pin that the compact layout keeps the op semantics of the former per-cell
+buffer: later values win, bold accumulates, the latest non-empty fill wins,
+and merges / validations extend the rendered bounds.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from spreadsheet_handling.core.formulas import ListLiteralFormulaSpec
+from spreadsheet_handling.io_backends.ods.odf_renderer import _CellStyle, _collect_sheets
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    ApplyColumnStyle,
+    ApplyHeaderStyle,
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetHeader,
+    SetTextOrientation,
+    WriteDataBlock,
+)
+
+
+pytestmark = pytest.mark.ftr("FTR-ODS-COMPACT-CELL-BUFFER")
+
+
+def test_values_are_dense_per_row_and_later_writes_win():
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(SetHeader("Data", 1, 3, "c"))
+    plan.add(WriteDataBlock("Data", 2, 1, (("a", 1, None), ("b", 2, 3.5))))
+    plan.add(SetHeader("Data", 2, 2, "override"))
+
+    (sheet,) = _collect_sheets(plan)
+
+    assert sheet.rows == {1: ["", "", "c"], 2: ["a", "override", None], 3: ["b", 2, 3.5]}
+    assert sheet.value(1, 1) == ""
+    assert sheet.value(4, 1) == ""
+    assert (sheet.max_row, sheet.max_col) == (3, 3)
+    assert sheet.data_bounds == (2, 3)
+
+
+def test_styles_are_interned_and_keep_accumulation_rules():
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(ApplyColumnStyle("Data", 1, 2, 200, fill_rgb="#EEEEEE"))
+    plan.add(ApplyHeaderStyle("Data", 2, 1, bold=True, fill_rgb="#DDDDDD"))
+    plan.add(ApplyHeaderStyle("Data", 2, 1, bold=False, fill_rgb=None))
+    plan.add(SetTextOrientation("Data", 3, 4, 90))
+    plan.add(SetTextOrientation("Data", 3, 4, 0))
+
+    (sheet,) = _collect_sheets(plan)
+
+    assert sheet.cell_style(2, 1) == _CellStyle(bold=True, fill_rgb="#DDDDDD")
+    assert sheet.cell_style(150, 1) == _CellStyle(fill_rgb="#EEEEEE")
+    # 199 filled cells share one interned id; the reset rotation is dropped.
+    assert len(sheet.styles) == 4
+    assert len(set(sheet.style_ids.values())) == 2
+    assert (3, 4) not in sheet.style_ids
+    assert sheet.rows == {}
+    assert (sheet.max_row, sheet.max_col) == (200, 4)
+
+
+def test_merges_and_validations_live_in_sparse_side_tables():
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(SetHeader("Data", 1, 1, "merged"))
+    plan.add(MergeCells("Data", 1, 1, 2, 3))
+    plan.add(AddValidation("Data", "list", 3, 4, 5, 4, ListLiteralFormulaSpec(("x",))))
+
+    (sheet,) = _collect_sheets(plan)
+
+    assert sheet.spans == {(1, 1): (2, 3)}
+    assert sheet.covered == {(1, 2), (1, 3), (2, 1), (2, 2), (2, 3)}
+    # Validation cells are only bound when the table is built.
+    assert sheet.validation_names == {}
+    assert (sheet.max_row, sheet.max_col) == (2, 3)
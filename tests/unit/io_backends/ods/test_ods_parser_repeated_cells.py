@@ -1064,3 +1064,49 @@ def test_ods_repeated_cell_uses_per_column_fallback_styles(
     aligns = ir.sheets["Sheet1"].meta["__horizontal_alignments"]
     assert aligns["A1"]["horizontal"] == "left"
     assert aligns["B1"]["horizontal"] == "right"
+
+
+def test_one_cell_style_feeds_all_presentation_families_in_one_walk(
+    tmp_path: Path,
+) -> None:
+    # A single table-cell style may carry rotation, horizontal and vertical
+    # alignment at once. The fused presentation walk must emit every family
+    # for both the explicitly styled filler and the column-default fallback,
+    # still clipped to the parsed content extent.
+    styles_inner = (
+        '<style:style style:name="all" style:family="table-cell">'
+        '<style:table-cell-properties style:rotation-angle="90" style:vertical-align="middle"/>'
+        '<style:paragraph-properties fo:text-align="end"/>'
+        "</style:style>"
+    )
+    spreadsheet_inner = (
+        '<table:table table:name="Sheet1">'
+        '<table:table-column table:number-columns-repeated="2"/>'
+        '<table:table-column table:default-cell-style-name="all"/>'
+        "<table:table-row>"
+        '<table:table-cell table:style-name="all" table:number-columns-repeated="2">'
+        "<text:p>x</text:p></table:table-cell>"
+        "<table:table-cell><text:p>y</text:p></table:table-cell>"
+        "</table:table-row>"
+        '<table:table-row table:number-rows-repeated="1048575">'
+        '<table:table-cell table:style-name="all" table:number-columns-repeated="16384"/>'
+        "</table:table-row>"
+        "</table:table>"
+    )
+    out = _write_ods_with_styles(
+        tmp_path, "all_families.ods", styles_inner, spreadsheet_inner
+    )
+
+    meta = parse_workbook(out).sheets["Sheet1"].meta
+
+    cells = ("A1", "B1", "C1")
+    assert meta["__text_orientations"] == {
+        cell: {"rotation": 90, "source": "workbook"} for cell in cells
+    }
+    assert meta["__horizontal_alignments"] == {
+        cell: {"horizontal": "right", "source": "workbook"} for cell in cells
+    }
+    assert meta["__vertical_alignments"] == {
+        cell: {"vertical": "center", "source": "workbook"} for cell in cells
+    }
+    assert parse_workbook(out, streaming=True).sheets["Sheet1"].meta == meta
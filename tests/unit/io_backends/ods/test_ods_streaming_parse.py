@@ -0,0 +1,211 @@
+"""Streaming (iterparse) ODS parse mode must produce the odfpy-mode ``WorkbookIR``.
+
+The streaming reader replaces the odfpy document tree with a single pass over
+``styles.xml`` / ``content.xml``; these tests pin that the swap is invisible
+to everything downstream of ``parse_workbook``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.core.formulas import ListLiteralFormulaSpec
+from spreadsheet_handling.io_backends.ods.odf_parser import parse_workbook
+from spreadsheet_handling.io_backends.ods.odf_renderer import render_workbook
+from spreadsheet_handling.io_backends.ods.ods_backend import OdsBackend, load_ods
+from spreadsheet_handling.io_backends.parser_limits import (
+    ParserLimits,
+    SpreadsheetTooLargeError,
+)
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    DefineNamedRange,
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetAutoFilter,
+    SetColumnWidth,
+    SetHeader,
+    SetHorizontalAlignment,
+    SetTextOrientation,
+    SetVerticalAlignment,
+    WriteDataBlock,
+    WriteMeta,
+)
+
+pytestmark = pytest.mark.ftr("FTR-ODS-STREAMING-READ")
+
+
+_NAMESPACES = (
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+    'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+    'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0"'
+)
+
+_MANIFEST_XML = (
+    "<?xml version='1.0' encoding='UTF-8'?>"
+    "<manifest:manifest "
+    'xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">'
+    '<manifest:file-entry manifest:full-path="/" '
+    'manifest:media-type="application/vnd.oasis.opendocument.spreadsheet"/>'
+    '<manifest:file-entry manifest:full-path="styles.xml" manifest:media-type="text/xml"/>'
+    '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+    "</manifest:manifest>"
+)
+
+
+def _write_package(
+    tmp_path: Path,
+    name: str,
+    *,
+    spreadsheet_inner: str,
+    automatic_styles: str = "",
+    common_styles: str = "",
+) -> Path:
+    out = tmp_path / name
+    content_xml = (
+        f"<?xml version='1.0' encoding='UTF-8'?><office:document-content {_NAMESPACES} "
+        f'office:version="1.2"><office:automatic-styles>{automatic_styles}'
+        "</office:automatic-styles><office:body><office:spreadsheet>"
+        f"{spreadsheet_inner}</office:spreadsheet></office:body></office:document-content>"
+    )
+    styles_xml = (
+        f"<?xml version='1.0' encoding='UTF-8'?><office:document-styles {_NAMESPACES} "
+        f'office:version="1.2"><office:styles>{common_styles}</office:styles>'
+        "<office:automatic-styles/></office:document-styles>"
+    )
+    with ZipFile(out, "w") as archive:
+        archive.writestr(
+            "mimetype", "application/vnd.oasis.opendocument.spreadsheet", compress_type=ZIP_STORED
+        )
+        archive.writestr("content.xml", content_xml, compress_type=ZIP_DEFLATED)
+        archive.writestr("styles.xml", styles_xml, compress_type=ZIP_DEFLATED)
+        archive.writestr("META-INF/manifest.xml", _MANIFEST_XML, compress_type=ZIP_DEFLATED)
+    return out
+
+
+def _rendered_plan() -> RenderPlan:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Products", 0))
+    plan.add(SetHeader("Products", 1, 1, "id"))
+    plan.add(SetHeader("Products", 1, 2, "dims"))
+    plan.add(SetHeader("Products", 2, 2, "w"))
+    plan.add(SetHeader("Products", 2, 3, "h"))
+    plan.add(MergeCells("Products", 1, 1, 2, 1))
+    plan.add(MergeCells("Products", 1, 2, 1, 3))
+    plan.add(WriteDataBlock("Products", 3, 1, (("P-1", 10, 20.5), ("P-2", 11, None), ("P-3", "x", 3))))
+    plan.add(SetAutoFilter("Products", 2, 1, 5, 3))
+    plan.add(SetColumnWidth("Products", 3, 22.0))
+    plan.add(SetTextOrientation("Products", 1, 1, 90))
+    plan.add(SetHorizontalAlignment("Products", 3, 2, "right"))
+    plan.add(SetVerticalAlignment("Products", 1, 2, "center"))
+    plan.add(AddValidation("Products", "list", 3, 2, 5, 2, ListLiteralFormulaSpec(("10", "11"))))
+    plan.add(DefineNamedRange("product_ids", "Products", 3, 1, 5, 1))
+    plan.add(DefineSheet("Notes", 1))
+    plan.add(SetHeader("Notes", 1, 1, "note"))
+    plan.add(WriteDataBlock("Notes", 2, 1, (("first",), (None,), ("after gap",))))
+    plan.add(WriteMeta("_meta", {"workbook_meta_blob": '{"sheets": {"Products": {"freeze_header": true}}}'}))
+    return plan
+
+
+def test_streaming_parse_matches_dom_parse_for_rendered_workbook(tmp_path: Path) -> None:
+    out = tmp_path / "rendered.ods"
+    render_workbook(_rendered_plan(), out)
+
+    streamed = parse_workbook(out, streaming=True)
+
+    assert streamed == parse_workbook(out)
+    assert streamed.sheets["Products"].named_ranges[0].area == (3, 1, 5, 1)
+    assert streamed.sheets["Products"].meta["__text_orientations"] == {
+        "A1": {"rotation": 90, "source": "workbook"}
+    }
+
+
+def test_streaming_parse_matches_dom_parse_for_hand_written_package(tmp_path: Path) -> None:
+    common_styles = (
+        '<style:style style:name="Centered" style:family="table-cell">'
+        '<style:paragraph-properties fo:text-align="center"/>'
+        "</style:style>"
+    )
+    automatic_styles = (
+        '<style:style style:name="co1" style:family="table-column">'
+        '<style:table-column-properties style:column-width="2.5cm"/>'
+        "</style:style>"
+        '<style:style style:name="top" style:family="table-cell">'
+        '<style:table-cell-properties style:vertical-align="top"/>'
+        "</style:style>"
+    )
+    spreadsheet_inner = (
+        '<table:table table:name="Sheet1">'
+        '<table:table-column table:style-name="co1" table:default-cell-style-name="Centered"/>'
+        '<table:table-column table:number-columns-repeated="2"/>'
+        "<table:table-row>"
+        '<table:table-cell table:number-columns-spanned="2"><text:p>a<text:s text:c="2"/>b</text:p>'
+        "</table:table-cell><table:covered-table-cell/>"
+        '<table:table-cell table:style-name="top"><text:p>c</text:p><text:p>d</text:p>'
+        "</table:table-cell>"
+        "</table:table-row>"
+        "<table:table-row>"
+        '<table:table-cell office:value-type="float" office:value="1.5"/>'
+        '<table:table-cell office:value-type="boolean" office:boolean-value="true"/>'
+        "<table:table-cell><text:p><text:span>x</text:span>y</text:p></table:table-cell>"
+        "</table:table-row>"
+        '<table:table-row table:number-rows-repeated="1000"><table:table-cell '
+        'table:number-columns-repeated="1024"/></table:table-row>'
+        "</table:table>"
+    )
+    out = _write_package(
+        tmp_path,
+        "manual.ods",
+        spreadsheet_inner=spreadsheet_inner,
+        automatic_styles=automatic_styles,
+        common_styles=common_styles,
+    )
+
+    streamed = parse_workbook(out, streaming=True)
+
+    assert streamed == parse_workbook(out)
+    meta = streamed.sheets["Sheet1"].meta
+    assert meta["__header_grid"] == [["a  b", "a  b", "cd"], ["1.5", "TRUE", "xy"]]
+    assert meta["__vertical_alignments"] == {"C1": {"vertical": "top", "source": "workbook"}}
+    assert meta["__horizontal_alignments"] == {
+        "A1": {"horizontal": "center", "source": "workbook"},
+        "A2": {"horizontal": "center", "source": "workbook"},
+    }
+
+
+def test_streaming_parse_enforces_parser_limits(tmp_path: Path) -> None:
+    spreadsheet_inner = (
+        '<table:table table:name="Sheet1">'
+        '<table:table-row table:number-rows-repeated="500">'
+        "<table:table-cell><text:p>data</text:p></table:table-cell>"
+        "</table:table-row>"
+        "</table:table>"
+    )
+    out = _write_package(tmp_path, "huge_row_block.ods", spreadsheet_inner=spreadsheet_inner)
+
+    limits = ParserLimits(max_rows=100, max_cols=100, max_cells=100_000)
+    with pytest.raises(SpreadsheetTooLargeError, match="row count 500"):
+        parse_workbook(out, limits=limits, streaming=True)
+
+
+def test_ods_backend_streaming_option_reads_identical_frames(tmp_path: Path) -> None:
+    out = tmp_path / "frames.ods"
+    frames = {
+        "Data": pd.DataFrame({"id": ["a", "b"], "value": ["1", "2"]}),
+        "_meta": {"sheets": {"Data": {"auto_filter": True}}},
+    }
+    OdsBackend().write_multi(frames, str(out))
+
+    full = load_ods(str(out))
+    streamed = load_ods(str(out), options={"streaming": True})
+
+    assert streamed.keys() == full.keys()
+    pd.testing.assert_frame_equal(streamed["Data"], full["Data"])
+    assert streamed["_meta"] == full["_meta"]
@@ -0,0 +1,144 @@
+"""Row-streaming ODS rendering must produce the buffered renderer's workbook.
+
+``render_workbook_streaming`` writes ``content.xml`` without an odfpy table
+tree and run-length encodes empty cells and rows; these tests pin that the
+saved workbook reads back exactly like the buffered renderer's output.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.core.formulas import ListLiteralFormulaSpec, lookup_formula
+from spreadsheet_handling.io_backends.ods.odf_parser import parse_workbook
+from spreadsheet_handling.io_backends.ods.odf_renderer import render_workbook
+from spreadsheet_handling.io_backends.ods.odf_stream_writer import render_workbook_streaming
+from spreadsheet_handling.io_backends.ods.ods_backend import OdsBackend, load_ods
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    ApplyColumnStyle,
+    ApplyHeaderStyle,
+    DefineNamedRange,
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetAutoFilter,
+    SetColumnWidth,
+    SetFreeze,
+    SetHeader,
+    SetHorizontalAlignment,
+    SetTextOrientation,
+    SetVerticalAlignment,
+    WriteDataBlock,
+    WriteMeta,
+)
+
+pytestmark = pytest.mark.ftr("FTR-ODS-STREAMING-WRITE")
+
+
+def _rich_plan() -> RenderPlan:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Orders", 0))
+    plan.add(SetHeader("Orders", 1, 1, "id"))
+    plan.add(SetHeader("Orders", 1, 2, "customer"))
+    plan.add(SetHeader("Orders", 1, 3, "customer"))
+    plan.add(SetHeader("Orders", 2, 2, "id_(Customers)"))
+    plan.add(SetHeader("Orders", 2, 3, "_Customers_name"))
+    plan.add(MergeCells("Orders", 1, 1, 2, 1))
+    plan.add(MergeCells("Orders", 1, 2, 1, 3))
+    plan.add(ApplyHeaderStyle("Orders", 1, 1, bold=True, fill_rgb="#DDDDDD"))
+    plan.add(ApplyHeaderStyle("Orders", 1, 2, bold=True))
+    formula = lookup_formula(
+        source_key_column="id_(Customers)",
+        lookup_sheet="Customers",
+        lookup_key_column="id",
+        lookup_value_column="name",
+    )
+    plan.add(
+        WriteDataBlock(
+            "Orders",
+            3,
+            1,
+            (("O-1", "C-1", formula), ("O-2", None, formula), ("O-3", True, 2.5)),
+        )
+    )
+    plan.add(SetAutoFilter("Orders", 2, 1, 5, 3))
+    plan.add(SetFreeze("Orders", 3, 1))
+    plan.add(SetColumnWidth("Orders", 2, 18.0))
+    plan.add(SetTextOrientation("Orders", 1, 1, 90))
+    plan.add(SetHorizontalAlignment("Orders", 1, 1, "center"))
+    plan.add(SetVerticalAlignment("Orders", 3, 2, "top"))
+    plan.add(ApplyColumnStyle("Orders", 3, 3, 5, fill_rgb="#EEEEEE"))
+    plan.add(AddValidation("Orders", "list", 3, 2, 5, 2, ListLiteralFormulaSpec(("C-1", "C-2"))))
+    plan.add(DefineNamedRange("order_ids", "Orders", 3, 1, 5, 1))
+    plan.add(DefineSheet("Customers", 1))
+    plan.add(SetHeader("Customers", 1, 1, "id"))
+    plan.add(SetHeader("Customers", 1, 2, "name"))
+    plan.add(WriteDataBlock("Customers", 2, 1, (("C-1", "Ada <&>"), ("C-2", "Bob"))))
+    plan.add(SetHeader("Customers", 1, 6, "legend"))
+    plan.add(WriteDataBlock("Customers", 2, 6, (("x",), (None,), (None,), (None,), ("y",))))
+    plan.add(WriteMeta("_meta", {"workbook_meta_blob": '{"sheets": {}}'}, hidden=True))
+    return plan
+
+
+def test_streaming_render_matches_buffered_renderer(tmp_path: Path) -> None:
+    plan = _rich_plan()
+    buffered_out = tmp_path / "buffered.ods"
+    streamed_out = tmp_path / "streamed.ods"
+
+    render_workbook(plan, buffered_out)
+    render_workbook_streaming(plan, streamed_out)
+
+    assert parse_workbook(streamed_out) == parse_workbook(buffered_out)
+    assert parse_workbook(streamed_out, streaming=True) == parse_workbook(buffered_out)
+
+
+def test_streaming_render_run_length_encodes_empty_cells_and_rows(tmp_path: Path) -> None:
+    out = tmp_path / "streamed.ods"
+    render_workbook_streaming(_rich_plan(), out)
+
+    with ZipFile(out) as archive:
+        content = archive.read("content.xml").decode("utf-8")
+        names = archive.namelist()
+
+    assert names[0] == "mimetype"
+    assert {"styles.xml", "content.xml", "settings.xml", "meta.xml", "META-INF/manifest.xml"} <= set(names)
+    # Customers!C2:E2 are empty; Customers rows 4-5 only hold empty cells.
+    assert '<table:table-cell table:number-columns-repeated="3"/>' in content
+    assert '<table:table-row table:number-rows-repeated="2">' in content
+    assert "Ada &lt;&amp;&gt;" in content
+
+
+
+def test_streaming_render_escapes_like_odfpy(tmp_path: Path) -> None:
+    plan = RenderPlan()
+    plan.add(DefineSheet('Ada\'s "list"', 0))
+    plan.add(SetHeader('Ada\'s "list"', 1, 1, "note"))
+    plan.add(WriteDataBlock('Ada\'s "list"', 2, 1, (("bell\x07 <b> & \x7f",),)))
+    buffered_out = tmp_path / "buffered.ods"
+    streamed_out = tmp_path / "streamed.ods"
+
+    render_workbook(plan, buffered_out)
+    render_workbook_streaming(plan, streamed_out)
+
+    assert parse_workbook(streamed_out) == parse_workbook(buffered_out)
+
+def test_ods_backend_streaming_option_writes_identical_frames(tmp_path: Path) -> None:
+    frames = {
+        "Data": pd.DataFrame({"id": ["a", "b"], "value": ["1", "2"]}),
+        "_meta": {"sheets": {"Data": {"auto_filter": True, "freeze_header": True}}},
+    }
+    buffered_out = tmp_path / "buffered.ods"
+    streamed_out = tmp_path / "streamed.ods"
+
+    OdsBackend().write_multi(frames, str(buffered_out))
+    OdsBackend().write_multi(frames, str(streamed_out), options={"streaming": True})
+
+    buffered = load_ods(str(buffered_out))
+    streamed = load_ods(str(streamed_out))
+    pd.testing.assert_frame_equal(streamed["Data"], buffered["Data"])
+    assert streamed["_meta"] == buffered["_meta"]
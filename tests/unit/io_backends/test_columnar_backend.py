@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends import make_backend
+from spreadsheet_handling.io_backends.router import get_loader, get_saver
+
+pytestmark = pytest.mark.ftr("FTR-COLUMNAR-DIR-BACKEND")
+
+_KINDS = [("parquet_dir", "products.parquet"), ("feather_dir", "products.feather")]
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    return {
+        "products": pd.DataFrame(
+            {
+                "id": ["P-1", "P-2", "P-3"],
+                "name": ["Rexi 🦖", "line\nbreak", ""],
+                "price": [1.5, None, 3.0],
+                "count": [1, 2, 3],
+            }
+        ),
+        "_meta": {"sheets": {"products": {"freeze_header": True}}},  # type: ignore[dict-item]
+    }
+
+
+@pytest.mark.parametrize(("kind", "filename"), _KINDS)
+def test_roundtrip_keeps_values_dtypes_and_meta_sidecar(tmp_path: Path, kind: str, filename: str):
+    pytest.importorskip("pyarrow")
+    frames = _frames()
+
+    get_saver(kind)(frames, str(tmp_path))
+    loaded = get_loader(kind)(str(tmp_path))
+
+    assert (tmp_path / filename).exists()
+    assert (tmp_path / "_meta.yaml").exists()
+    assert list(loaded) == ["products", "_meta"]
+    assert loaded["_meta"] == frames["_meta"]
+    pd.testing.assert_frame_equal(loaded["products"], frames["products"])
+
+
+@pytest.mark.parametrize("kind", ["parquet", "feather"])
+def test_roundtrip_keeps_multiindex_headers(tmp_path: Path, kind: str):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        [["O1", "2026-01-01", "Alice"], ["O2", "2026-01-02", ""]],
+        columns=pd.MultiIndex.from_tuples([("order", "id"), ("order", "date"), ("customer", "")]),
+    )
+    backend = make_backend(kind)
+
+    backend.write_multi({"orders": df}, str(tmp_path))
+    loaded = backend.read_multi(str(tmp_path), header_levels=2)
+
+    pd.testing.assert_frame_equal(loaded["orders"], df)
+
+
+@pytest.mark.parametrize(("kind", "_"), _KINDS)
+def test_unstorable_sheet_names_the_sheet(tmp_path: Path, kind: str, _):
+    pytest.importorskip("pyarrow")
+    mixed = pd.DataFrame({"value": pd.Series(["x", 1], dtype=object)})
+
+    with pytest.raises(ValueError, match="Sheet 'mixed' cannot be stored"):
+        get_saver(kind)({"mixed": mixed}, str(tmp_path))
+
+
+def test_missing_pyarrow_raises_install_hint(tmp_path: Path):
+    script = textwrap.dedent(
+        f"""
+        import sys
+
+        sys.modules["pyarrow"] = None  # simulate the optional dependency being absent
+
+        from spreadsheet_handling.io_backends.router import get_saver
+
+        try:
+            get_saver("parquet_dir")({{}}, {str(tmp_path)!r})
+        except ImportError as exc:
+            assert "pip install -e '.[columnar]'" in str(exc), exc
+        else:
+            raise AssertionError("expected ImportError")
+        """
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], check=False, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pandas as pd
+
 from spreadsheet_handling.core.flatten import flatten_json
 from spreadsheet_handling.core.df_build import build_df_from_records
 from spreadsheet_handling.core.unflatten import df_to_objects
@@ -40,3 +42,27 @@ def test_csv_roundtrip_unicode_and_multirow(tmp_path: Path):
 
     out = [normalize(x) for x in df_to_objects(df_back)]
     assert out == [normalize(s) for s in samples]
+
+
+def test_csv_write_keeps_minimal_quoting_format(tmp_path: Path):
+    df = pd.DataFrame(
+        {
+            "plain": ["a", "", None, "carriage\rreturn"],
+            'quote"d': ['say "hi"', "x,y", "line\nbreak", 1.5],
+        }
+    )
+    wide = tmp_path / "wide.csv"
+    single = tmp_path / "single.csv"
+
+    CSVBackend().write(df, str(wide))
+    CSVBackend().write(df[["plain"]], str(single))
+
+    assert wide.read_bytes() == (
+        b'plain,"quote""d"\n'
+        b'a,"say ""hi"""\n'
+        b',"x,y"\n'
+        b',"line\nbreak"\n'
+        b'"carriage\rreturn",1.5\n'
+    )
+    # A row with a single empty field stays an empty line.
+    assert single.read_bytes() == b'plain\na\n\n\n"carriage\rreturn"\n'
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends.csv_backend import load_csv_dir
+
+pytestmark = pytest.mark.ftr("FTR-CSV-READ-OPTIONS")
+
+
+def _write_sheet(folder: Path, rows: int = 12) -> None:
+    pd.DataFrame(
+        {
+            "id": [f"P-{row}" for row in range(rows)],
+            "status": ["open" if row % 3 else "done" for row in range(rows)],
+            "amount": [row * 1.5 for row in range(rows)],
+        }
+    ).to_csv(folder / "orders.csv", index=False)
+
+
+def test_default_read_keeps_single_header_level(tmp_path: Path):
+    _write_sheet(tmp_path)
+
+    df = load_csv_dir(str(tmp_path), header_levels=2)["orders"]
+
+    assert df.columns.tolist() == [("id", ""), ("status", ""), ("amount", "")]
+    assert df[("amount", "")].dtype == "float64"
+
+
+def test_usecols_and_dtype_are_passed_to_the_parser(tmp_path: Path):
+    _write_sheet(tmp_path)
+
+    df = load_csv_dir(
+        str(tmp_path), options={"usecols": ["id", "amount"], "dtype": {"amount": "float32"}}
+    )["orders"]
+
+    assert df.columns.get_level_values(0).tolist() == ["id", "amount"]
+    assert df[("amount",)].dtype == "float32"
+
+
+
+def test_usecols_list_skips_columns_a_sheet_does_not_have(tmp_path: Path):
+    _write_sheet(tmp_path)
+    pd.DataFrame({"id": ["C-1"], "name": ["Ada"]}).to_csv(tmp_path / "customers.csv", index=False)
+
+    frames = load_csv_dir(str(tmp_path), options={"usecols": ["id", "amount"]})
+
+    assert frames["orders"].columns.get_level_values(0).tolist() == ["id", "amount"]
+    assert frames["customers"].columns.get_level_values(0).tolist() == ["id"]
+
+
+def test_usecols_mapping_projects_only_the_named_sheets(tmp_path: Path):
+    _write_sheet(tmp_path)
+    pd.DataFrame({"id": ["C-1"], "name": ["Ada"]}).to_csv(tmp_path / "customers.csv", index=False)
+
+    frames = load_csv_dir(str(tmp_path), options={"usecols": {"orders": "status"}})
+
+    assert frames["orders"].columns.get_level_values(0).tolist() == ["status"]
+    assert frames["customers"].columns.get_level_values(0).tolist() == ["id", "name"]
+
+@pytest.mark.parametrize("chunk_rows", [None, 5])
+def test_categorical_converts_low_cardinality_text_only(tmp_path: Path, chunk_rows):
+    _write_sheet(tmp_path)
+    plain = load_csv_dir(str(tmp_path))["orders"]
+
+    options = {"categorical": True}
+    if chunk_rows is not None:
+        options["chunk_rows"] = chunk_rows
+    df = load_csv_dir(str(tmp_path), options=options)["orders"]
+
+    assert isinstance(df[("status",)].dtype, pd.CategoricalDtype)
+    assert not isinstance(df[("id",)].dtype, pd.CategoricalDtype)  # every value distinct
+    assert df[("status",)].astype(str).tolist() == plain[("status",)].tolist()
+    pd.testing.assert_series_equal(df[("id",)], plain[("id",)])
+    pd.testing.assert_series_equal(df[("amount",)], plain[("amount",)])
+
+
+def test_engine_auto_reads_with_or_without_pyarrow(tmp_path: Path):
+    _write_sheet(tmp_path)
+
+    df = load_csv_dir(str(tmp_path), options={"engine": "auto"})["orders"]
+
+    assert df[("id",)].tolist()[:2] == ["P-0", "P-1"]
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"engine": "fast"}, "Unknown CSV engine"),
+        ({"chunk_rows": 0}, "chunk_rows"),
+        ({"categorical": 2}, "categorical"),
+        ({"usecols": {"orders": [1]}}, "usecols.orders"),
+        ({"engine": "pyarrow", "chunk_rows": 10}, "not supported by the pyarrow"),
+    ],
+)
+def test_invalid_read_options_raise(tmp_path: Path, options, message):
+    _write_sheet(tmp_path)
+
+    with pytest.raises(ValueError, match=message):
+        load_csv_dir(str(tmp_path), options=options)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends import json_backend
+from spreadsheet_handling.io_backends.json_backend import write_json_dir
+
+pytestmark = pytest.mark.ftr("FTR-JSON-STREAMING-WRITE")
+
+
+def _frame(rows: int = 7) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [f"P-{row}" for row in range(rows)],
+            "name": ["Rexi 🦖" if row % 2 else "Straße \"A\"" for row in range(rows)],
+            "price": [row * 1.5 if row % 3 else None for row in range(rows)],
+            "count": list(range(rows)),
+        }
+    )
+
+
+def _one_shot(df: pd.DataFrame, **kwargs) -> str:
+    records = df.where(pd.notnull(df), "").to_dict(orient="records")
+    return json.dumps(records, **kwargs) + "\n"
+
+
+@pytest.mark.parametrize(
+    ("options", "dump_kwargs"),
+    [
+        ({}, {"ensure_ascii": False, "indent": 2}),
+        ({"indent": 4, "sort_keys": True}, {"ensure_ascii": False, "indent": 4, "sort_keys": True}),
+        ({"ensure_ascii": True}, {"ensure_ascii": True, "indent": 2}),
+        ({"pretty": False}, {"ensure_ascii": False, "separators": (",", ":")}),
+    ],
+)
+def test_streamed_output_matches_one_shot_dump(tmp_path: Path, monkeypatch, options, dump_kwargs):
+    monkeypatch.setattr(json_backend, "_JSON_CHUNK_ROWS", 3)  # several chunks
+    df = _frame()
+
+    write_json_dir({"products": df}, tmp_path, options=options)
+
+    assert (tmp_path / "products.json").read_text(encoding="utf-8") == _one_shot(df, **dump_kwargs)
+
+
+def test_streamed_nested_output_spans_chunks(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(json_backend, "_JSON_CHUNK_ROWS", 2)
+    df = pd.DataFrame(
+        [["O1", "Alice"], ["O2", ""], ["O3", "Carol"]],
+        columns=pd.MultiIndex.from_tuples([("order", "id"), ("customer", "name")]),
+    )
+
+    write_json_dir({"orders": df}, tmp_path)
+
+    assert json.loads((tmp_path / "orders.json").read_text(encoding="utf-8")) == [
+        {"order": {"id": "O1"}, "customer": {"name": "Alice"}},
+        {"order": {"id": "O2"}},
+        {"order": {"id": "O3"}, "customer": {"name": "Carol"}},
+    ]
+
+
+def test_empty_sheet_writes_empty_array(tmp_path: Path):
+    write_json_dir({"empty": pd.DataFrame(columns=["id"])}, tmp_path)
+
+    assert (tmp_path / "empty.json").read_text(encoding="utf-8") == "[]\n"
+
+
+@pytest.mark.parametrize("options", [{}, {"pretty": False}])
+def test_orjson_engine_writes_same_layout(tmp_path: Path, monkeypatch, options):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(json_backend, "_JSON_CHUNK_ROWS", 3)
+    # orjson formats floats and NaN differently, so compare text columns only.
+    df = _frame()[["id", "name", "count"]]
+
+    write_json_dir({"default": df}, tmp_path / "json", options=options)
+    write_json_dir({"default": df}, tmp_path / "orjson", options={**options, "engine": "orjson"})
+
+    expected = (tmp_path / "json" / "default.json").read_bytes()
+    assert (tmp_path / "orjson" / "default.json").read_bytes() == expected
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"engine": "simdjson"}, "Unknown JSON engine"),
+        ({"engine": "orjson", "indent": 4}, "indent 2"),
+        ({"engine": "orjson", "ensure_ascii": True}, "ensure_ascii"),
+    ],
+)
+def test_unsupported_engine_options_raise(tmp_path: Path, options, message):
+    if options["engine"] == "orjson":
+        pytest.importorskip("orjson")
+
+    with pytest.raises(ValueError, match=message):
+        write_json_dir({"products": _frame()}, tmp_path, options=options)
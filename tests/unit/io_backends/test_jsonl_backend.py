@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends import make_backend
+from spreadsheet_handling.io_backends.json_backend import read_json_dir, write_json_dir
+from spreadsheet_handling.io_backends.jsonl_backend import (
+    JSONLinesBackend,
+    iter_jsonl_sheet,
+    read_jsonl_dir,
+    write_jsonl_dir,
+)
+
+pytestmark = pytest.mark.ftr("FTR-JSONL-DIR-BACKEND")
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    return {
+        "products": pd.DataFrame(
+            {
+                "id": ["P-1", "P-2", "P-3"],
+                "name": ["Rexi 🦖", "line\nbreak", ""],
+                "price": [1.5, None, 3.0],
+            }
+        ),
+        "_meta": {"sheets": {"products": {"freeze_header": True}}},  # type: ignore[dict-item]
+    }
+
+
+def test_writes_one_compact_record_per_line(tmp_path: Path):
+    write_jsonl_dir(_frames(), tmp_path)
+
+    assert (tmp_path / "products.jsonl").read_text(encoding="utf-8") == (
+        '{"id":"P-1","name":"Rexi 🦖","price":1.5}\n'
+        '{"id":"P-2","name":"line\\nbreak","price":""}\n'
+        '{"id":"P-3","name":"","price":3.0}\n'
+    )
+
+
+def test_reads_same_frames_and_sidecar_as_json_dir(tmp_path: Path):
+    write_json_dir(_frames(), tmp_path / "json")
+    write_jsonl_dir(_frames(), tmp_path / "jsonl")
+
+    expected = read_json_dir(str(tmp_path / "json"))
+    loaded = read_jsonl_dir(str(tmp_path / "jsonl"))
+
+    assert (tmp_path / "jsonl" / "_meta.yaml").read_bytes() == (tmp_path / "json" / "_meta.yaml").read_bytes()
+    assert loaded["_meta"] == expected["_meta"]
+    pd.testing.assert_frame_equal(loaded["products"], expected["products"])
+
+
+def test_chunked_reading_fills_keys_missing_from_records(tmp_path: Path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"a": 1}\n\n{"a": 2, "b": true}\n{"c": null}\n', encoding="utf-8")
+
+    chunks = list(iter_jsonl_sheet(path, chunk_rows=2))
+    frames = read_jsonl_dir(str(tmp_path), options={"chunk_rows": 2})
+
+    assert [len(chunk) for chunk in chunks] == [1, 2]
+    assert frames["events"].to_dict(orient="records") == [
+        {"a": "1", "b": "", "c": ""},
+        {"a": "2", "b": "True", "c": ""},
+        {"a": "", "b": "", "c": ""},
+    ]
+
+
+def test_gzip_output_is_stable_and_reads_back(tmp_path: Path):
+    write_jsonl_dir(_frames(), tmp_path / "a", options={"compression": "gzip"})
+    write_jsonl_dir(_frames(), tmp_path / "b", options={"compression": "gzip"})
+
+    archive = tmp_path / "a" / "products.jsonl.gz"
+    assert archive.read_bytes() == (tmp_path / "b" / "products.jsonl.gz").read_bytes()
+    lines = gzip.decompress(archive.read_bytes()).decode("utf-8").splitlines()
+    assert json.loads(lines[0]) == {"id": "P-1", "name": "Rexi 🦖", "price": 1.5}
+
+    loaded = read_jsonl_dir(str(tmp_path / "a"))
+    assert list(loaded) == ["products", "_meta"]
+    assert loaded["products"]["id"].tolist() == ["P-1", "P-2", "P-3"]
+
+
+def test_multiindex_columns_become_nested_objects(tmp_path: Path):
+    df = pd.DataFrame(
+        [["O1", "Alice"]],
+        columns=pd.MultiIndex.from_tuples([("order", "id"), ("customer", "name")]),
+    )
+
+    make_backend("jsonl").write_multi({"orders": df}, str(tmp_path))
+
+    line = (tmp_path / "orders.jsonl").read_text(encoding="utf-8")
+    assert json.loads(line) == {"order": {"id": "O1"}, "customer": {"name": "Alice"}}
+
+
+@pytest.mark.parametrize(
+    ("second_line", "message"),
+    [
+        ("[1, 2]", "expected a JSON object per line"),
+        ('{"b": 2}, {"c": 3}', "invalid JSON: Extra data"),
+        ('{"b": ', "invalid JSON"),
+    ],
+)
+def test_reports_the_offending_line(tmp_path: Path, second_line: str, message: str):
+    (tmp_path / "bad.jsonl").write_text(f'{{"a": 1}}\n{second_line}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match=rf"bad.jsonl:2: {message}"):
+        JSONLinesBackend().read_multi(str(tmp_path), header_levels=1)
+
+
+def test_rejects_invalid_chunk_rows(tmp_path: Path):
+    with pytest.raises(ValueError, match="chunk_rows must be a positive integer"):
+        read_jsonl_dir(str(tmp_path), options={"chunk_rows": 0})
+
+
+def test_rejects_unknown_compression(tmp_path: Path):
+    with pytest.raises(ValueError, match="Unsupported jsonl compression 'zstd'"):
+        write_jsonl_dir(_frames(), tmp_path, options={"compression": "zstd"})
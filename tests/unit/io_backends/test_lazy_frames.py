@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends.lazy_frames import LazyFrames
+from spreadsheet_handling.io_backends.router import get_lazy_loader, get_loader, get_saver
+
+pytestmark = pytest.mark.ftr("FTR-LAZY-FRAMES")
+
+
+def _counting_frames(calls: list[str]) -> LazyFrames:
+    def loader(name: str):
+        def load() -> pd.DataFrame:
+            calls.append(name)
+            return pd.DataFrame({"id": [name]})
+
+        return load
+
+    return LazyFrames({name: loader(name) for name in ("a", "b", "c")}, meta={"version": "1.0"})
+
+
+def test_membership_order_and_length_do_not_load():
+    calls: list[str] = []
+    frames = _counting_frames(calls)
+
+    assert list(frames) == ["a", "b", "c", "_meta"]
+    assert len(frames) == 4 and "b" in frames
+    assert frames.pending() == ["a", "b", "c"]
+    assert calls == []
+
+
+def test_sheet_is_loaded_once_on_first_access():
+    calls: list[str] = []
+    frames = _counting_frames(calls)
+
+    assert frames["b"]["id"].tolist() == ["b"]
+    assert frames.get("b") is frames["b"]
+    assert calls == ["b"]
+    assert frames.pending() == ["a", "c"]
+
+
+def test_removed_sheet_is_never_loaded():
+    calls: list[str] = []
+    frames = _counting_frames(calls)
+
+    del frames["a"]
+    frames.pop("b")
+    copied = dict(frames)
+
+    assert list(copied) == ["c", "_meta"]
+    assert calls == ["b", "c"]
+
+
+@pytest.mark.parametrize("copy", [dict, lambda frames: {**frames}, lambda frames: frames | {}])
+def test_copies_hold_loaded_frames(copy):
+    frames = _counting_frames([])
+
+    copied = copy(frames)
+
+    assert type(copied) is dict
+    assert all(isinstance(copied[name], pd.DataFrame) for name in ("a", "b", "c"))
+    assert copied["_meta"] == {"version": "1.0"}
+
+
+def test_copy_stays_lazy_and_shares_loads():
+    calls: list[str] = []
+    frames = _counting_frames(calls)
+
+    copied = frames.copy()
+    copied["a"] = pd.DataFrame({"id": ["new"]})
+
+    assert isinstance(copied, LazyFrames)
+    assert copied.pending() == ["b", "c"] and calls == []
+    assert copied["b"] is frames["b"]
+    assert calls == ["b"]
+    assert frames["a"]["id"].tolist() == ["a"]
+
+
+def test_concurrent_first_access_loads_once():
+    calls: list[str] = []
+    started = threading.Barrier(4, timeout=10)
+
+    def slow_load() -> pd.DataFrame:
+        calls.append("a")
+        time.sleep(0.05)
+        return pd.DataFrame({"id": ["a"]})
+
+    frames = LazyFrames({"a": slow_load})
+
+    def access() -> pd.DataFrame:
+        started.wait()
+        return frames["a"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        loaded = list(pool.map(lambda _: access(), range(4)))
+
+    assert calls == ["a"]
+    assert all(frame is loaded[0] for frame in loaded)
+
+
+def test_overwritten_sheet_is_not_loaded():
+    calls: list[str] = []
+    frames = _counting_frames(calls)
+    replacement = pd.DataFrame({"id": ["new"]})
+
+    frames.update({"a": replacement})
+
+    assert frames["a"] is replacement
+    assert calls == []
+
+
+@pytest.mark.parametrize("kind", ["csv_dir", "json_dir", "jsonl_dir", "sqlite"])
+def test_lazy_loader_matches_eager_read(tmp_path: Path, kind):
+    frames = {
+        "products": pd.DataFrame({"id": ["P1", "P2"], "name": ["Rexi", ""]}),
+        "orders": pd.DataFrame({"id": ["O1"], "product": ["P1"]}),
+    }
+    if kind != "csv_dir":
+        frames["_meta"] = {"version": "1.0"}  # type: ignore[assignment]
+    path = tmp_path / ("store.sqlite" if kind == "sqlite" else "in")
+    get_saver(kind)(frames, str(path), options=None)
+
+    eager = get_loader(kind)(str(path), options=None)
+    lazy = get_lazy_loader(kind)(str(path), options=None)
+
+    assert isinstance(lazy, LazyFrames)
+    assert list(lazy) == list(eager)
+    assert lazy.pending() == [name for name in eager if name != "_meta"]
+    for name, value in eager.items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(lazy[name], value)
+        else:
+            assert lazy[name] == value
+
+
+def test_get_lazy_loader_rejects_kinds_without_sheet_listing():
+    with pytest.raises(ValueError, match="Lazy loading is not supported for kind: xlsx"):
+        get_lazy_loader("xlsx")
@@ -29,6 +29,7 @@ def test_package_import_does_not_load_spreadsheet_backend_modules():
             or name.startswith("odf.")
             or name.startswith("spreadsheet_handling.io_backends.xlsx")
             or name.startswith("spreadsheet_handling.io_backends.ods")
+            or name == "spreadsheet_handling.io_backends.columnar_backend"
         ]
         assert loaded == [], loaded
         """
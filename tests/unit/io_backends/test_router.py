@@ -11,6 +11,13 @@ from spreadsheet_handling.io_backends.router import get_loader, get_saver
         ("csv_dir", get_loader),
         ("json_dir", get_loader),
         ("json", get_loader),
+        ("jsonl_dir", get_loader),
+        ("jsonl", get_loader),
+        ("parquet_dir", get_loader),
+        ("parquet", get_loader),
+        ("feather_dir", get_loader),
+        ("feather", get_loader),
+        ("sqlite", get_loader),
         ("yaml_dir", get_loader),
         ("yaml", get_loader),
         ("xml_dir", get_loader),
@@ -21,6 +28,13 @@ from spreadsheet_handling.io_backends.router import get_loader, get_saver
         ("csv_dir", get_saver),
         ("json_dir", get_saver),
         ("json", get_saver),
+        ("jsonl_dir", get_saver),
+        ("jsonl", get_saver),
+        ("parquet_dir", get_saver),
+        ("parquet", get_saver),
+        ("feather_dir", get_saver),
+        ("feather", get_saver),
+        ("sqlite", get_saver),
         ("yaml_dir", get_saver),
         ("yaml", get_saver),
         ("xml_dir", get_saver),
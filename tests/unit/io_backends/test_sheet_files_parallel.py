@@ -0,0 +1,79 @@
+"""Parallel per-sheet I/O for the directory backends.
+
+``options: {parallel: true}`` / ``{max_workers: N}`` must only change how the
+per-sheet files are processed, never the frames or their order.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends.base import BackendOptions
+from spreadsheet_handling.io_backends.router import get_loader, get_saver
+from spreadsheet_handling.io_backends.sheet_files import map_sheet_files, parallel_workers
+
+pytestmark = pytest.mark.ftr("FTR-DIRECTORY-BACKEND-PARALLEL-IO")
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        (None, None),
+        ({}, None),
+        ({"parallel": False, "max_workers": 4}, None),
+        ({"max_workers": 3}, 3),
+        ({"parallel": True, "max_workers": 2}, 2),
+        (BackendOptions(extra={"max_workers": 5}), 5),
+    ],
+)
+def test_parallel_workers_reads_both_option_shapes(options, expected):
+    assert parallel_workers(options) == expected
+
+
+def test_parallel_true_without_max_workers_uses_cpu_count(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 6)
+    assert parallel_workers({"parallel": True}) == 6
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, "4", True])
+def test_parallel_workers_rejects_invalid_max_workers(max_workers):
+    with pytest.raises(ValueError, match="max_workers"):
+        parallel_workers({"max_workers": max_workers})
+
+
+def test_map_sheet_files_keeps_input_order_when_work_finishes_out_of_order():
+    def slow_first(index: int) -> int:
+        time.sleep(0.02 * (5 - index))
+        return index * 10
+
+    assert map_sheet_files(slow_first, range(5), options={"max_workers": 5}) == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.parametrize("kind", ["csv_dir", "json_dir", "jsonl_dir", "yaml_dir", "xml_dir"])
+def test_directory_backend_parallel_roundtrip_matches_sequential(tmp_path: Path, kind: str):
+    frames = {
+        f"sheet_{index:02d}": pd.DataFrame(
+            {"id": [f"{index}-a", f"{index}-b"], "name": ["x", f"y{index}"]}
+        )
+        for index in range(6)
+    }
+    sequential_dir = tmp_path / "sequential"
+    parallel_dir = tmp_path / "parallel"
+    options = {"max_workers": 3}
+
+    get_saver(kind)(frames, str(sequential_dir), options=None)
+    get_saver(kind)(frames, str(parallel_dir), options=options)
+
+    for sequential_file in sorted(sequential_dir.iterdir()):
+        assert (parallel_dir / sequential_file.name).read_bytes() == sequential_file.read_bytes()
+
+    sequential = get_loader(kind)(str(sequential_dir), options=None)
+    parallel = get_loader(kind)(str(parallel_dir), options=options)
+
+    assert list(parallel) == list(sequential)
+    for name, df in sequential.items():
+        pd.testing.assert_frame_equal(parallel[name], df)
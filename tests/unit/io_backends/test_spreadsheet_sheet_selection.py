@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends.router import get_loader, get_saver
+from spreadsheet_handling.io_backends.sheet_selection import SheetSelection
+
+pytestmark = pytest.mark.ftr("FTR-SPREADSHEET-SHEET-SELECTION")
+
+
+@pytest.fixture(params=["xlsx", "ods"])
+def workbook(request, tmp_path: Path) -> tuple[str, Path]:
+    kind = request.param
+    frames = {
+        name: pd.DataFrame({"id": [f"{name}-1", f"{name}-2"], "label": ["a", "b"]})
+        for name in ("products", "orders", "customers", "scratch")
+    }
+    frames["_meta"] = {"author": "tests", "version": "3.4"}  # type: ignore[assignment]
+    path = tmp_path / f"book.{kind}"
+    get_saver(kind)(frames, str(path), options=None)
+    return kind, path
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize(
+    ("sheets", "expected"),
+    [
+        (["orders"], ["orders"]),
+        ("customers", ["customers"]),
+        ({"exclude": ["scratch", "products"]}, ["orders", "customers"]),
+        ({"include": ["orders", "scratch"], "exclude": ["scratch"]}, ["orders"]),
+    ],
+)
+def test_selected_sheets_match_full_read(workbook, streaming, sheets, expected):
+    kind, path = workbook
+    full = get_loader(kind)(str(path), options={"streaming": streaming})
+
+    selected = get_loader(kind)(str(path), options={"streaming": streaming, "sheets": sheets})
+
+    assert list(selected) == [*expected, "_meta"]
+    assert selected["_meta"] == full["_meta"]
+    for name in expected:
+        pd.testing.assert_frame_equal(selected[name], full[name])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_unknown_selected_sheet_raises(workbook, streaming):
+    kind, path = workbook
+
+    with pytest.raises(ValueError, match=r"not found in workbook: \['order'\]"):
+        get_loader(kind)(str(path), options={"streaming": streaming, "sheets": ["order"]})
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ({"only": ["orders"]}, "unknown key"),
+        ([1, 2], "list of sheet names"),
+        ({"exclude": "scratch", "include": {"orders": 1}}, "sheets.include"),
+    ],
+)
+def test_invalid_selection_option_raises(value, message):
+    with pytest.raises(ValueError, match=message):
+        SheetSelection.from_options({"sheets": value})
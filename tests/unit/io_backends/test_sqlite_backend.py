@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.io_backends import make_backend
+from spreadsheet_handling.io_backends.sqlite_backend import read_sqlite, write_sqlite
+
+pytestmark = pytest.mark.ftr("FTR-SQLITE-WORKING-STORE")
+
+
+def _products() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": ["P-1", "P-2", "P-3"],
+            "name": ["Rexi 🦖", "", "line\nbreak"],
+            "price": [1.5, None, 3.0],
+            "count": [1, 2, 3],
+            "active": [True, False, True],
+            "since": pd.to_datetime(["2020-01-01", "2021-06-30", "2022-12-31"]),
+        }
+    )
+
+
+def _orders() -> pd.DataFrame:
+    return pd.DataFrame(
+        [["O1", "Alice", "a"], ["O2", "", "b"]],
+        columns=pd.MultiIndex.from_tuples([("order", "id"), ("customer", "name"), ("customer", "NAME")]),
+    )
+
+
+def test_roundtrip_restores_values_dtypes_headers_and_meta(tmp_path: Path):
+    db = tmp_path / "store" / "work.db"
+    meta = {"sheets": {"products": {"freeze_header": True}}, "tags": ["a", 1]}
+
+    write_sqlite({"products": _products(), "orders": _orders(), "_meta": meta}, db)
+    loaded = read_sqlite(str(db))
+
+    assert list(loaded) == ["products", "orders", "_meta"]
+    assert loaded["_meta"] == meta
+    pd.testing.assert_frame_equal(loaded["products"], _products())
+    pd.testing.assert_frame_equal(loaded["orders"], _orders())
+
+
+def test_tables_use_flattened_queryable_column_names(tmp_path: Path):
+    db = tmp_path / "work.db"
+    write_sqlite({"orders": _orders()}, db)
+
+    with sqlite3.connect(db) as con:
+        cursor = con.execute('SELECT * FROM orders WHERE "customer.name" = ?', ("Alice",))
+        names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+
+    assert names == ["order.id", "customer.name", "customer.NAME~2"]
+    assert rows == [("O1", "Alice", "a")]
+
+
+def test_saves_are_incremental(tmp_path: Path):
+    db = tmp_path / "work.db"
+    write_sqlite({"products": _products(), "orders": _orders()}, db)
+    with sqlite3.connect(db) as con:
+        # Marks the stored table; an unchanged frame must not rewrite it.
+        con.execute("UPDATE products SET name = 'kept' WHERE id = 'P-2'")
+
+    changed = _orders()
+    changed.iloc[0, 1] = "Alicia"
+    write_sqlite({"products": _products(), "orders": changed, "extra": pd.DataFrame({"x": ["1"]})}, db)
+    loaded = read_sqlite(str(db))
+
+    assert list(loaded) == ["products", "orders", "extra"]
+    assert loaded["products"]["name"].tolist() == ["Rexi 🦖", "kept", "line\nbreak"]
+    pd.testing.assert_frame_equal(loaded["orders"], changed)
+
+
+
+def test_sheet_without_columns_keeps_its_row_count(tmp_path: Path):
+    db = tmp_path / "work.db"
+    empty = pd.DataFrame(index=range(3))
+
+    write_sqlite({"E": empty}, db)
+    write_sqlite({"E": empty}, db)
+
+    pd.testing.assert_frame_equal(read_sqlite(str(db))["E"], empty, check_column_type=False)
+
+
+def test_save_without_meta_removes_stored_meta(tmp_path: Path):
+    db = tmp_path / "work.db"
+    write_sqlite({"products": _products(), "_meta": {"version": "1"}}, db)
+
+    write_sqlite({"products": _products()}, db)
+
+    assert "_meta" not in read_sqlite(str(db))
+
+def test_prune_drops_sheets_missing_from_the_save(tmp_path: Path):
+    db = tmp_path / "work.db"
+    backend = make_backend("sqlite")
+    backend.write_multi({"products": _products(), "orders": _orders()}, str(db))
+
+    backend.write_multi({"orders": _orders()}, str(db), options={"prune": True})
+
+    assert list(backend.read_multi(str(db), header_levels=1)) == ["orders"]
+    with sqlite3.connect(db) as con:
+        tables = {name for (name,) in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "products" not in tables
+
+
+def test_failed_save_leaves_store_unchanged(tmp_path: Path):
+    db = tmp_path / "work.db"
+    write_sqlite({"products": _products()}, db)
+
+    with pytest.raises(TypeError):
+        write_sqlite({"products": _products().head(1), "_meta": {"bad": object()}}, db)
+
+    pd.testing.assert_frame_equal(read_sqlite(str(db))["products"], _products())
+
+
+@pytest.mark.parametrize(
+    ("sheets", "message"),
+    [
+        ({"_sheets_meta": pd.DataFrame()}, "reserved"),
+        ({"Products": pd.DataFrame(), "products": pd.DataFrame()}, "same SQLite table"),
+    ],
+)
+def test_rejects_conflicting_sheet_names(tmp_path: Path, sheets, message):
+    with pytest.raises(ValueError, match=message):
+        write_sqlite(sheets, tmp_path / "work.db")
+
+
+def test_rejects_foreign_database(tmp_path: Path):
+    db = tmp_path / "other.db"
+    with sqlite3.connect(db) as con:
+        con.execute("CREATE TABLE t (a)")
+
+    with pytest.raises(ValueError, match="not a sheets store"):
+        read_sqlite(str(db))
@@ -92,6 +92,13 @@ class TestMultiIndexToNestedXml:
 
 class TestFlattenThenXml:
 
+    def test_flat_write_skips_helper_columns_without_shifting_values(self, tmp_path: Path) -> None:
+        df = pd.DataFrame([{"id": "P1", "_helper": "hidden", "name": "Widget"}])
+        XMLBackend().write_multi({"products": df}, str(tmp_path))
+
+        row0 = list(ET.parse(tmp_path / "products.xml").getroot())[0]
+        assert [(child.tag, child.text) for child in row0] == [("id", "P1"), ("name", "Widget")]
+
     def test_flatten_then_write_produces_flat_elements(self, tmp_path: Path) -> None:
         frames = _multiindex_frames()
         flat_frames = flatten_headers("orders", mode="join", sep=".")(frames)
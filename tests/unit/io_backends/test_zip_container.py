@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile
+
+import pytest
+
+from spreadsheet_handling.io_backends.zip_container import ZipContainer
+
+pytestmark = pytest.mark.ftr("FTR-ZIP-CONTAINER")
+
+
+@pytest.fixture
+def archive_path(tmp_path: Path) -> Path:
+    path = tmp_path / "package.zip"
+    with ZipFile(path, "w") as archive:
+        archive.writestr("content.xml", b"<content/>" * 100)
+        archive.writestr("styles.xml", b"<styles/>")
+    return path
+
+
+def test_members_are_read_through_the_mapping(archive_path: Path):
+    with ZipContainer(archive_path) as archive:
+        assert archive.names == {"content.xml", "styles.xml"}
+        assert archive.read("content.xml") == b"<content/>" * 100
+        with archive.open(archive.getinfo("styles.xml")) as stream:
+            assert stream.read() == b"<styles/>"
+
+
+def test_container_is_read_only(archive_path: Path):
+    with ZipContainer(archive_path) as archive, pytest.raises(ValueError, match="read-only"):
+        archive.open("extra.xml", "w")
+
+
+def test_empty_file_is_not_a_zip_file(tmp_path: Path):
+    path = tmp_path / "empty.xlsx"
+    path.write_bytes(b"")
+
+    with pytest.raises(BadZipFile):
+        ZipContainer(path)
+
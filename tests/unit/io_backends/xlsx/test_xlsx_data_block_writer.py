@@ -0,0 +1,82 @@
+"""Placement of ``WriteDataBlock`` cells in the openpyxl renderer.
+
+The renderer appends whole rows when a block starts at the sheet tail and
+falls back to cell addressing otherwise; both paths must land every value
+at the position the plan names.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from openpyxl import load_workbook
+
+from spreadsheet_handling.io_backends.xlsx.openpyxl_renderer import _appends_at_sheet_tail, render_workbook
+from spreadsheet_handling.rendering.plan import (
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetHeader,
+    WriteDataBlock,
+)
+
+pytestmark = pytest.mark.ftr("FTR-IR-DATA-CELLS")
+
+
+def _grid(path: Path, sheet: str) -> list[tuple]:
+    wb = load_workbook(path)
+    try:
+        return [tuple(row) for row in wb[sheet].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def test_block_below_headers_is_written_row_by_row(tmp_path: Path) -> None:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(SetHeader("Data", 1, 1, "id"))
+    plan.add(SetHeader("Data", 1, 2, "qty"))
+    plan.add(WriteDataBlock("Data", 2, 1, (("a", 1), ("b", None), ("c", 3.5))))
+
+    out = tmp_path / "tail.xlsx"
+    render_workbook(plan, out)
+
+    assert _grid(out, "Data") == [("id", "qty"), ("a", 1), ("b", None), ("c", 3.5)]
+
+
+def test_offset_block_beside_existing_rows_keeps_its_anchor(tmp_path: Path) -> None:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(SetHeader("Data", 1, 1, "id"))
+    plan.add(WriteDataBlock("Data", 2, 1, (("a",), ("b",))))
+    plan.add(SetHeader("Data", 1, 3, "legend"))
+    plan.add(WriteDataBlock("Data", 2, 3, (("x",), ("y",))))
+
+    out = tmp_path / "side_by_side.xlsx"
+    render_workbook(plan, out)
+
+    assert _grid(out, "Data") == [("id", None, "legend"), ("a", None, "x"), ("b", None, "y")]
+
+
+def test_block_under_a_vertical_header_merge_starts_below_it(tmp_path: Path) -> None:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Data", 0))
+    plan.add(SetHeader("Data", 1, 1, "id"))
+    plan.add(SetHeader("Data", 1, 2, "dims"))
+    plan.add(SetHeader("Data", 2, 2, "w"))
+    plan.add(MergeCells("Data", 1, 1, 2, 1))
+    plan.add(WriteDataBlock("Data", 3, 2, (("a", 1),)))
+
+    out = tmp_path / "merged_header.xlsx"
+    render_workbook(plan, out)
+
+    assert _grid(out, "Data") == [("id", "dims", None), (None, "w", None), (None, "a", 1)]
+
+
+
+def test_block_is_cell_addressed_when_openpyxl_lacks_the_row_marker() -> None:
+    ws = SimpleNamespace(merged_cells=SimpleNamespace(ranges=[]))
+
+    assert not _appends_at_sheet_tail(ws, WriteDataBlock("Data", 2, 1, (("a",),)))
@@ -5,6 +5,7 @@ from openpyxl import Workbook
 import pytest
 
 from spreadsheet_handling.io_backends.xlsx.parser_interpretation import (
+    build_merge_index,
     build_sheet_meta_hints,
     build_visible_sheet_ir,
 )
@@ -75,3 +76,55 @@ def test_build_visible_sheet_ir_combines_interpretation_inputs():
     assert sheet.validations == validations
     assert sheet.tables[0].headers == ["id", "title"]
     assert sheet.tables[0].data == [["P-001", "Alpha"]]
+
+
+def test_merge_index_resolves_every_covered_position_to_its_master():
+    wb = Workbook()
+    ws = wb.active
+    ws.merge_cells("B1:D2")
+    ws.merge_cells("A3:A5")
+
+    index = build_merge_index(ws.merged_cells.ranges)
+
+    assert index.areas == ((1, 2, 2, 4), (3, 1, 5, 1))
+    assert index.master_of(2, 4) == (1, 2)
+    assert index.master_of(1, 2) == (1, 2)
+    assert index.master_of(5, 1) == (3, 1)
+    assert index.master_of(1, 1) is None
+    assert index.master_of(2, 5) is None
+
+
+def test_build_visible_sheet_ir_resolves_wide_merged_header_band():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Pivot"
+    n_groups = 200
+    ws.cell(row=1, column=1, value="key")
+    ws.merge_cells(start_row=1, start_column=1, end_row=2, end_column=1)
+    for group in range(n_groups):
+        col = 2 + group * 2
+        ws.cell(row=1, column=col, value=f"g{group}")
+        ws.merge_cells(start_row=1, start_column=col, end_row=1, end_column=col + 1)
+        ws.cell(row=2, column=col, value="lo")
+        ws.cell(row=2, column=col + 1, value="hi")
+        ws.cell(row=3, column=col, value=group)
+    ws.cell(row=3, column=1, value="k1")
+
+    sheet = build_visible_sheet_ir(
+        ws,
+        sheet_name="Pivot",
+        meta_hints={},
+        validations=[],
+        freeze_hint=None,
+        autofilter_ref=None,
+        anchors=None,
+        stop_on_empty_row=True,
+        stop_on_empty_col=False,
+    )
+
+    table = sheet.tables[0]
+    assert table.header_rows == 2
+    assert table.n_cols == 1 + 2 * n_groups
+    assert table.headers[:3] == ["key / key", "g0 / lo", "g0 / hi"]
+    assert table.headers[-1] == f"g{n_groups - 1} / hi"
+    assert len(sheet.meta["__header_merges"]) == n_groups + 1
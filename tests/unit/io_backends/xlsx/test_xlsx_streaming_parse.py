@@ -0,0 +1,142 @@
+"""Streaming (read-only) XLSX parse mode must produce the full-mode ``WorkbookIR``.
+
+The streaming path replaces openpyxl's cell DOM with the rows of the table
+blocks plus sparse carriers; these tests pin that the swap is invisible to
+everything downstream of ``parse_workbook``.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from spreadsheet_handling.io_backends.xlsx.openpyxl_parser import parse_workbook
+from spreadsheet_handling.io_backends.xlsx.openpyxl_stream_reader import WorksheetStream
+from spreadsheet_handling.io_backends.xlsx.xlsx_backend import ExcelBackend, load_xlsx
+
+pytestmark = pytest.mark.ftr("FTR-XLSX-STREAMING-READ")
+
+
+def _write_rich_workbook(path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Products"
+    ws["A1"] = "id"
+    ws["B1"] = "dims"
+    ws.merge_cells("B1:C1")
+    ws["A2"] = None
+    ws["B2"] = "w"
+    ws["C2"] = "h"
+    ws.merge_cells("A1:A2")
+    for offset, row in enumerate([("P-1", 10, 20.5), ("P-2", 11, None), ("P-3", "x", 3)]):
+        for col, value in enumerate(row, start=1):
+            ws.cell(row=3 + offset, column=col, value=value)
+    ws["A1"].alignment = Alignment(horizontal="center", vertical="top", text_rotation=90)
+    ws["B3"].alignment = Alignment(horizontal="right")
+    ws.column_dimensions["C"].width = 22
+    ws.column_dimensions["C"].alignment = Alignment(vertical="bottom")
+    ws.freeze_panes = "A3"
+    ws.auto_filter.ref = "A2:C5"
+    dv = DataValidation(type="list", formula1='"10,11,12"', allow_blank=True)
+    dv.add("B3:B5")
+    ws.add_data_validation(dv)
+    wb.defined_names["product_ids"] = DefinedName("product_ids", attr_text="Products!$A$3:$A$5")
+
+    other = wb.create_sheet("Notes")
+    other["A1"] = "note"
+    other["A2"] = "first"
+    other["A4"] = "after gap"
+
+    meta = wb.create_sheet("_meta")
+    meta.sheet_state = "hidden"
+    meta["A1"] = "workbook_meta_blob"
+    meta["B1"] = json.dumps({"sheets": {"Products": {"freeze_header": True}}})
+    wb.save(path)
+    wb.close()
+
+
+def test_streaming_parse_matches_full_mode_workbook_ir(tmp_path):
+    source = tmp_path / "rich.xlsx"
+    _write_rich_workbook(source)
+
+    assert parse_workbook(source, streaming=True) == parse_workbook(source)
+
+
+def test_streaming_parse_keeps_sheet_carriers(tmp_path):
+    source = tmp_path / "rich.xlsx"
+    _write_rich_workbook(source)
+
+    sheet = parse_workbook(source, streaming=True).sheets["Products"]
+
+    assert sheet.tables[0].header_rows == 2
+    assert sheet.tables[0].data == [["P-1", "10", "20.5"], ["P-2", "11", ""], ["P-3", "x", "3"]]
+    assert sheet.meta["__freeze"] == {"row": 3, "col": 1}
+    assert sheet.meta["__autofilter_ref"] == "A2:C5"
+    assert sheet.meta["__text_orientations"] == {"A1": {"rotation": 90, "source": "workbook"}}
+    assert sheet.validations[0].area == (3, 2, 5, 2)
+    assert [nr.name for nr in sheet.named_ranges] == ["product_ids"]
+
+
+def test_xlsx_backend_streaming_option_reads_identical_frames(tmp_path):
+    out = tmp_path / "frames.xlsx"
+    frames = {
+        "Data": pd.DataFrame({"id": ["a", "b"], "value": ["1", "2"]}),
+        "_meta": {"sheets": {"Data": {"auto_filter": True}}},
+    }
+    ExcelBackend().write_multi(frames, str(out))
+
+    full = load_xlsx(str(out))
+    streamed = load_xlsx(str(out), options={"streaming": True})
+
+    assert streamed.keys() == full.keys()
+    pd.testing.assert_frame_equal(streamed["Data"], full["Data"])
+    assert streamed["_meta"] == full["_meta"]
+
+
+def test_streaming_parse_matches_full_mode_with_legend_blocks(tmp_path):
+    source = tmp_path / "legend.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Orders"
+    for row in [("id", "status"), ("O-1", "open"), ("O-2", "done"), (None, None), ("note", None)]:
+        ws.append(row)
+    for offset, row in enumerate([("status", "label"), ("open", "Open"), ("done", "Done")]):
+        for col, value in enumerate(row, start=4):
+            ws.cell(row=1 + offset, column=col, value=value)
+    meta = wb.create_sheet("_meta")
+    meta.sheet_state = "hidden"
+    meta["A1"] = "workbook_meta_blob"
+    meta["B1"] = json.dumps({
+        "legend_blocks": {
+            "status": {"resolved": {"sheet": "Orders", "top": 1, "left": 4}},
+        },
+    })
+    wb.save(source)
+    wb.close()
+
+    streamed = parse_workbook(source, streaming=True)
+
+    assert streamed == parse_workbook(source)
+    assert [table.kind for table in streamed.sheets["Orders"].tables] == ["data", "legend"]
+
+
+def test_streaming_keeps_only_the_rows_of_the_table_block(tmp_path):
+    source = tmp_path / "rich.xlsx"
+    _write_rich_workbook(source)
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        with WorksheetStream(source) as stream:
+            notes = stream.read(wb["Notes"], anchors=[(1, 1)], stop_on_empty_col=False)
+    finally:
+        wb.close()
+
+    assert sorted(notes.rows) == [1, 2]
+    assert notes.value(4, 1) is None
+    assert notes.max_row == 4
@@ -0,0 +1,158 @@
+"""Write-only (streaming) XLSX rendering must produce the default renderer's workbook.
+
+``render_workbook_streaming`` regroups plan ops per sheet and emits rows in
+order; these tests pin that the regrouping is invisible in the saved file.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from spreadsheet_handling.core.formulas import ListLiteralFormulaSpec, lookup_formula
+from spreadsheet_handling.io_backends.xlsx.openpyxl_parser import parse_workbook
+from spreadsheet_handling.io_backends.xlsx.openpyxl_renderer import render_workbook
+from spreadsheet_handling.io_backends.xlsx.openpyxl_stream_writer import render_workbook_streaming
+from spreadsheet_handling.io_backends.xlsx.xlsx_backend import ExcelBackend, load_xlsx
+from spreadsheet_handling.rendering.plan import (
+    AddValidation,
+    ApplyCellLock,
+    ApplyColumnStyle,
+    ApplyHeaderStyle,
+    DefineNamedRange,
+    DefineSheet,
+    MergeCells,
+    RenderPlan,
+    SetAutoFilter,
+    SetColumnWidth,
+    SetFreeze,
+    SetHeader,
+    SetHorizontalAlignment,
+    SetSheetProtection,
+    SetTextOrientation,
+    SetVerticalAlignment,
+    WriteDataBlock,
+    WriteMeta,
+)
+
+pytestmark = pytest.mark.ftr("FTR-XLSX-STREAMING-WRITE")
+
+
+def _rich_plan() -> RenderPlan:
+    plan = RenderPlan()
+    plan.add(DefineSheet("Orders", 0))
+    plan.add(SetHeader("Orders", 1, 1, "id"))
+    plan.add(SetHeader("Orders", 1, 2, "customer"))
+    plan.add(SetHeader("Orders", 1, 3, "customer"))
+    plan.add(SetHeader("Orders", 2, 2, "id_(Customers)"))
+    plan.add(SetHeader("Orders", 2, 3, "_Customers_name"))
+    plan.add(MergeCells("Orders", 1, 1, 2, 1))
+    plan.add(MergeCells("Orders", 1, 2, 1, 3))
+    plan.add(ApplyHeaderStyle("Orders", 1, 1, bold=True, fill_rgb="#DDDDDD"))
+    plan.add(ApplyHeaderStyle("Orders", 1, 2, bold=True))
+    formula = lookup_formula(
+        source_key_column="id_(Customers)",
+        lookup_sheet="Customers",
+        lookup_key_column="id",
+        lookup_value_column="name",
+    )
+    plan.add(WriteDataBlock("Orders", 3, 1, (("O-1", "C-1", formula), ("O-2", None, formula))))
+    plan.add(SetAutoFilter("Orders", 2, 1, 4, 3))
+    plan.add(SetFreeze("Orders", 3, 1))
+    plan.add(SetColumnWidth("Orders", 2, 18.0))
+    plan.add(SetTextOrientation("Orders", 1, 1, 90))
+    plan.add(SetHorizontalAlignment("Orders", 1, 1, "center"))
+    plan.add(SetVerticalAlignment("Orders", 3, 2, "top"))
+    plan.add(ApplyColumnStyle("Orders", 3, 3, 4, fill_rgb="#EEEEEE"))
+    plan.add(AddValidation("Orders", "list", 3, 2, 4, 2, ListLiteralFormulaSpec(("C-1", "C-2"))))
+    plan.add(DefineNamedRange("order_ids", "Orders", 3, 1, 4, 1))
+    plan.add(ApplyCellLock("Orders", 2, 3, 4, locked=False))
+    plan.add(SetSheetProtection("Orders"))
+    plan.add(DefineSheet("Customers", 1))
+    plan.add(SetHeader("Customers", 1, 1, "id"))
+    plan.add(SetHeader("Customers", 1, 2, "name"))
+    plan.add(WriteDataBlock("Customers", 2, 1, (("C-1", "Ada"), ("C-2", "Bob"))))
+    plan.add(SetHeader("Customers", 1, 4, "legend"))
+    plan.add(WriteDataBlock("Customers", 2, 4, (("x",), ("y",), ("z",))))
+    plan.add(WriteMeta("_meta", {"workbook_meta_blob": '{"sheets": {}}'}))
+    return plan
+
+
+def _cell_snapshot(path: Path) -> dict[str, list[tuple]]:
+    wb = load_workbook(path)
+    try:
+        snapshot: dict[str, list[tuple]] = {}
+        for ws in wb.worksheets:
+            cells = []
+            for row in ws.iter_rows():
+                for cell in row:
+                    cells.append(
+                        (
+                            cell.coordinate,
+                            cell.value,
+                            cell.font.b,
+                            cell.fill.fgColor.rgb,
+                            cell.alignment.horizontal,
+                            cell.alignment.vertical,
+                            cell.alignment.text_rotation,
+                            cell.protection.locked,
+                        )
+                    )
+            snapshot[ws.title] = [
+                ws.sheet_state,
+                ws.freeze_panes,
+                ws.auto_filter.ref,
+                ws.protection.sheet,
+                sorted(str(mr) for mr in ws.merged_cells.ranges),
+                cells,
+            ]
+        return snapshot
+    finally:
+        wb.close()
+
+
+def test_streaming_render_matches_default_renderer(tmp_path: Path) -> None:
+    plan = _rich_plan()
+    default_out = tmp_path / "default.xlsx"
+    streamed_out = tmp_path / "streamed.xlsx"
+
+    render_workbook(plan, default_out)
+    render_workbook_streaming(plan, streamed_out)
+
+    assert _cell_snapshot(streamed_out) == _cell_snapshot(default_out)
+    assert parse_workbook(streamed_out) == parse_workbook(default_out)
+
+
+def test_streaming_render_keeps_sheet_order_and_named_ranges(tmp_path: Path) -> None:
+    out = tmp_path / "streamed.xlsx"
+    render_workbook_streaming(_rich_plan(), out)
+
+    wb = load_workbook(out)
+    try:
+        assert wb.sheetnames == ["Orders", "Customers", "_meta"]
+        assert wb.defined_names["order_ids"].attr_text == "'Orders'!$A$3:$A$4"
+        assert wb["Orders"]["C3"].value == (
+            "=XLOOKUP($B3,'Customers'!$A$2:$A$4,'Customers'!$B$2:$B$4,\"\")"
+        )
+    finally:
+        wb.close()
+
+
+def test_xlsx_backend_streaming_option_writes_identical_frames(tmp_path: Path) -> None:
+    frames = {
+        "Data": pd.DataFrame({"id": ["a", "b"], "value": ["1", "2"]}),
+        "_meta": {"sheets": {"Data": {"auto_filter": True, "freeze_header": True}}},
+    }
+    default_out = tmp_path / "default.xlsx"
+    streamed_out = tmp_path / "streamed.xlsx"
+
+    ExcelBackend().write_multi(frames, str(default_out))
+    ExcelBackend().write_multi(frames, str(streamed_out), options={"streaming": True})
+
+    default = load_xlsx(str(default_out))
+    streamed = load_xlsx(str(streamed_out))
+    pd.testing.assert_frame_equal(streamed["Data"], default["Data"])
+    assert streamed["_meta"] == default["_meta"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.pipeline.fingerprint import (
+    FingerprintMemo,
+    frame_fingerprint,
+    frames_fingerprint,
+    meta_fingerprint,
+)
+
+pytestmark = pytest.mark.ftr("FTR-FRAME-FINGERPRINT")
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({"id": ["P1", "P2"], "qty": [1, 2], "price": [1.5, None]})
+
+
+def test_equal_content_gives_equal_fingerprint():
+    assert frame_fingerprint(_frame()) == frame_fingerprint(_frame().copy())
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        lambda df: df.assign(qty=[1, 3]),
+        lambda df: df.assign(qty=df["qty"].astype("float64")),
+        lambda df: df.rename(columns={"qty": "count"}),
+        lambda df: df[["qty", "id", "price"]],
+        lambda df: df.set_axis([1, 0]),
+        lambda df: df.set_axis(["id", 1, "price"], axis=1),
+        lambda df: df.set_axis(pd.MultiIndex.from_tuples([("a", "id"), ("a", "qty"), ("b", "price")]), axis=1),
+    ],
+)
+def test_content_header_dtype_and_index_changes_are_detected(changed):
+    assert frame_fingerprint(changed(_frame())) != frame_fingerprint(_frame())
+
+
+def test_low_cardinality_columns_detect_single_cell_edits():
+    frame = pd.DataFrame({"status": ["open", "closed", None] * 1000})
+    edited = frame.copy()
+    edited.loc[2500, "status"] = "open"
+
+    assert frame_fingerprint(frame) == frame_fingerprint(frame.copy())
+    assert frame_fingerprint(edited) != frame_fingerprint(frame)
+
+
+def test_mixed_object_values_keep_their_types():
+    ints_first = pd.DataFrame({"v": pd.Series([1, "2"], dtype=object)})
+    strs_first = pd.DataFrame({"v": pd.Series(["1", 2], dtype=object)})
+
+    assert frame_fingerprint(ints_first) != frame_fingerprint(strs_first)
+
+
+def test_unhashable_cells_are_hashed_by_value():
+    assert frame_fingerprint(pd.DataFrame({"v": [["a"], {"b": 1}]})) == frame_fingerprint(
+        pd.DataFrame({"v": [["a"], {"b": 1}]})
+    )
+    assert frame_fingerprint(pd.DataFrame({"v": [["a"]]})) != frame_fingerprint(pd.DataFrame({"v": [["b"]]}))
+
+
+def test_meta_fingerprint_uses_snapshot_normalization():
+    meta = {"version": "1.0", "tags": {"a", "b"}, "nan": float("nan"), "table": _frame()}
+
+    assert meta_fingerprint(meta) == meta_fingerprint(
+        {"version": "1.0", "tags": {"b", "a"}, "nan": float("nan"), "table": _frame()}
+    )
+    assert meta_fingerprint({"count": 1}) != meta_fingerprint({"count": 1.0})
+    assert meta_fingerprint({"count": 1}) != meta_fingerprint({"count": "1"})
+
+
+def test_frames_fingerprint_covers_names_order_and_meta():
+    frames = {"a": _frame(), "b": _frame(), "_meta": {"version": "1.0"}}
+
+    assert frames_fingerprint(frames) == frames_fingerprint(dict(frames))
+    assert frames_fingerprint(frames) != frames_fingerprint({"b": _frame(), "a": _frame(), "_meta": {"version": "1.0"}})
+    assert frames_fingerprint(frames) != frames_fingerprint({**frames, "_meta": {"version": "1.1"}})
+
+
+def test_memo_reuses_digest_until_the_frame_changes():
+    memo = FingerprintMemo()
+    frame = _frame()
+    digest = frame_fingerprint(frame, memo=memo)
+
+    assert memo.lookup(frame) == digest
+    frame["qty"] = [5, 6]
+    assert memo.lookup(frame) is None
+    assert frame_fingerprint(frame, memo=memo) == frame_fingerprint(frame)
+
+    del frame
+    gc.collect()
+    assert len(memo) == 0
+
+
+def test_fingerprint_is_stable_across_processes():
+    script = (
+        "import pandas as pd\n"
+        "from spreadsheet_handling.pipeline.fingerprint import frames_fingerprint\n"
+        "frames = {'a': pd.DataFrame({'id': ['x', 'y'], 'n': [1, 2]}), "
+        "'_meta': {'tags': {'a', 'b', 'c'}, 'v': 1.5}}\n"
+        "print(frames_fingerprint(frames))\n"
+    )
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2")
+    }
+
+    assert len(digests) == 1
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from spreadsheet_handling.pipeline import StepCache, build_steps_from_config, run_pipeline
+from spreadsheet_handling.pipeline.step_cache import StepDelta, step_key
+from spreadsheet_handling.pipeline.steps import make_frames_target_step
+from spreadsheet_handling.pipeline.types import BoundStep, Frames
+
+pytestmark = pytest.mark.ftr("FTR-STEP-RESULT-CACHE")
+
+
+def _counting_step(name: str, calls: list[str], *, cacheable: bool = True, factor: int = 2) -> BoundStep:
+    def run(frames: Frames) -> Frames:
+        calls.append(name)
+        out = dict(frames)
+        out[name] = out["products"].assign(qty=out["products"]["qty"] * factor)
+        return out
+
+    return BoundStep(name=name, config={"factor": factor}, fn=run, cacheable=cacheable)
+
+
+def _frames(qty: list[int] | None = None) -> Frames:
+    return {
+        "products": pd.DataFrame({"id": ["P1", "P2"], "qty": qty or [1, 2]}),
+        "_meta": {"version": "1.0"},
+    }
+
+
+def _assert_frames_equal(left: Frames, right: Frames) -> None:
+    assert list(left) == list(right)
+    for name, value in left.items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(value, right[name])
+        else:
+            assert value == right[name]
+
+
+def test_unchanged_rerun_replays_every_step(tmp_path: Path):
+    calls: list[str] = []
+    steps = [_counting_step(name, calls) for name in ("a", "b", "c")]
+
+    first = run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+    second = run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+
+    assert calls == ["a", "b", "c"]
+    _assert_frames_equal(second, first)
+
+
+def test_changed_input_misses_and_changed_config_reruns_from_that_step(tmp_path: Path):
+    calls: list[str] = []
+    cache = StepCache(tmp_path)
+    run_pipeline(_frames(), [_counting_step(name, calls) for name in ("a", "b", "c")], cache=cache)
+    calls.clear()
+
+    run_pipeline(_frames([5, 6]), [_counting_step(name, calls) for name in ("a", "b")], cache=cache)
+    assert calls == ["a", "b"]
+    calls.clear()
+
+    steps = [_counting_step("a", calls), _counting_step("b", calls, factor=3), _counting_step("c", calls)]
+    result = run_pipeline(_frames(), steps, cache=cache)
+
+    assert calls == ["b", "c"]
+    assert result["b"]["qty"].tolist() == [3, 6]
+
+
+def test_uncacheable_step_always_runs_and_chain_restarts_after_it(tmp_path: Path):
+    calls: list[str] = []
+    steps = [
+        _counting_step("a", calls),
+        _counting_step("side_effect", calls, cacheable=False),
+        _counting_step("c", calls),
+    ]
+
+    run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+    run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+
+    assert calls == ["a", "side_effect", "c", "side_effect"]
+
+
+def test_frames_with_list_cells_are_cached(tmp_path: Path):
+    calls: list[str] = []
+    frames = _frames()
+    frames["nested"] = pd.DataFrame({"cells": [["x"], ["y"]]})
+    steps = [_counting_step("a", calls)]
+
+    run_pipeline(frames, steps, cache=StepCache(tmp_path))
+    result = run_pipeline(frames, steps, cache=StepCache(tmp_path))
+
+    assert calls == ["a"]
+    assert result["nested"]["cells"].tolist() == [["x"], ["y"]]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path):
+    cache = StepCache(tmp_path)
+    for index, key in enumerate(("old", "used", "new")):
+        cache.store(key, StepDelta.between({}, _frames()))
+        os.utime(tmp_path / f"{key}.pkl", (index, index))
+    assert cache.load("used") is not None
+    entry_size = (tmp_path / "new.pkl").stat().st_size
+
+    cache.max_bytes = 2 * entry_size
+    cache.evict()
+
+    assert "old" not in cache
+    assert "used" in cache and "new" in cache
+
+
+def test_registry_marks_steps_with_side_effects_uncacheable():
+    steps = build_steps_from_config(
+        [
+            {"step": "identity"},
+            {"step": "extract_frame", "source": "a", "output": "b", "columns": ["id"]},
+            {"step": "remove_fk_helpers"},
+            {"step": "validate"},
+            {"step": "validate_references"},
+            {"step": "write_structured_yaml", "output_dir": "out"},
+            {"step": "plugin", "dotted": "spreadsheet_handling.pipeline.steps:make_identity_step"},
+            {"step": "spreadsheet_handling.pipeline.steps:make_identity_step"},
+        ]
+    )
+
+    assert [step.cacheable for step in steps] == [True, True, True, False, False, False, False, True]
+
+
+def test_entries_hold_only_the_frames_a_step_changed(tmp_path: Path):
+    calls: list[str] = []
+    frames = _frames()
+    frames["big"] = pd.DataFrame({"n": range(1000)})
+    cache = StepCache(tmp_path)
+
+    run_pipeline(frames, [_counting_step("a", calls), _counting_step("b", calls)], cache=cache)
+    entries = [cache.load(path.stem) for path in tmp_path.glob("*.pkl")]
+
+    assert sorted(sorted(entry.changed) for entry in entries) == [["a"], ["b"]]
+    assert all(entry.order[:2] == ("products", "_meta") for entry in entries)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"cno_such_module_for_step_cache\nThing\n.", b"cos\nno_such_attribute\n.", b"not a pickle"],
+    ids=["missing-module", "missing-attribute", "garbage"],
+)
+def test_unreadable_entry_is_dropped_and_the_step_reruns(tmp_path: Path, payload: bytes):
+    calls: list[str] = []
+    steps = [_counting_step("a", calls)]
+    run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+    (entry,) = tmp_path.glob("*.pkl")
+    entry.write_bytes(payload)
+
+    assert StepCache(tmp_path).load(entry.stem) is None
+    assert not entry.exists()
+    run_pipeline(_frames(), steps, cache=StepCache(tmp_path))
+    assert calls == ["a", "a"]
+
+
+def test_editing_the_target_module_changes_the_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    module = tmp_path / "cached_step_target.py"
+    module.write_text("def run(frames):\n    return frames\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "cached_step_target", raising=False)
+    step = make_frames_target_step(target="cached_step_target:run", name="target")
+    step = BoundStep(name=step.name, config=step.config, fn=step.fn, cacheable=True)
+    before = step_key(step, "input")
+
+    module.write_text("def run(frames):\n    return dict(frames)\n")
+    os.utime(module, ns=(0, 0))
+
+    assert step_key(step, "input") != before
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import spreadsheet_handling.cli.apps.run as runmod
+from spreadsheet_handling.application.orchestrator import orchestrate
+from spreadsheet_handling.io_backends.json_backend import write_json_dir
+from spreadsheet_handling.io_backends.lazy_frames import LazyFrames
+from spreadsheet_handling.pipeline import StepProfiler, run_pipeline
+from spreadsheet_handling.pipeline.profiling import frame_shapes
+from spreadsheet_handling.pipeline.types import BoundStep, Frames
+
+pytestmark = pytest.mark.ftr("FTR-STEP-PROFILING")
+
+
+def _add_frame(frames: Frames) -> Frames:
+    out = dict(frames)
+    out["extra"] = pd.DataFrame({"a": range(4), "b": range(4)})
+    return out
+
+
+def _drop_rows(frames: Frames) -> Frames:
+    out = dict(frames)
+    out["products"] = out["products"].head(1)
+    return out
+
+
+def _steps() -> list[BoundStep]:
+    return [
+        BoundStep(name="add_frame", config={}, fn=_add_frame),
+        BoundStep(name="drop_rows", config={}, fn=_drop_rows),
+    ]
+
+
+def _frames() -> Frames:
+    return {"products": pd.DataFrame({"id": ["P1", "P2", "P3"]}), "_meta": {"version": "1.0"}}
+
+
+def test_run_pipeline_records_each_step_with_frame_shapes():
+    profiler = StepProfiler()
+
+    result = run_pipeline(_frames(), _steps(), profiler=profiler)
+
+    assert [record.name for record in profiler.records] == ["add_frame", "drop_rows"]
+    assert {record.kind for record in profiler.records} == {"step"}
+    add_frame, drop_rows = profiler.records
+    assert add_frame.shapes_before == {"products": (3, 1)}
+    assert add_frame.shapes_after == {"products": (3, 1), "extra": (4, 2)}
+    assert drop_rows.shapes_after["products"] == (1, 1)
+    assert all(record.wall_s >= 0 and record.cpu_s >= 0 for record in profiler.records)
+    assert add_frame.alloc_peak_bytes is None
+    assert list(result) == ["products", "_meta", "extra"]
+
+
+def test_profiler_context_traces_allocations_only_when_asked():
+    with StepProfiler() as untraced:
+        run_pipeline(_frames(), _steps(), profiler=untraced)
+    with StepProfiler(trace_allocations=True) as traced:
+        run_pipeline(_frames(), _steps(), profiler=traced)
+
+    assert all(record.alloc_peak_bytes is None for record in untraced.records)
+    assert all(isinstance(record.alloc_peak_bytes, int) for record in traced.records)
+    assert traced.records[0].alloc_peak_bytes > 0
+
+
+def test_frame_shapes_skip_unloaded_lazy_sheets():
+    def fail() -> pd.DataFrame:
+        raise AssertionError("pending sheet must not be loaded")
+
+    frames = LazyFrames({"loaded": lambda: pd.DataFrame({"a": [1]}), "pending": fail})
+    frames["loaded"]
+
+    assert frame_shapes(frames) == {"loaded": (1, 1)}
+
+
+def test_orchestrate_records_phases_around_steps(tmp_path: Path):
+    write_json_dir(_frames(), tmp_path / "in")
+    profiler = StepProfiler()
+
+    orchestrate(
+        input={"kind": "json_dir", "path": str(tmp_path / "in")},
+        output={"kind": "json_dir", "path": str(tmp_path / "out")},
+        steps=_steps(),
+        profiler=profiler,
+    )
+
+    assert [(record.kind, record.name) for record in profiler.records] == [
+        ("phase", "load"),
+        ("step", "add_frame"),
+        ("step", "drop_rows"),
+        ("phase", "cleanup"),
+        ("phase", "persistence_boundary"),
+        ("phase", "save"),
+    ]
+    load = profiler.records[0]
+    assert load.shapes_before == {} and load.shapes_after == {"products": (3, 1)}
+
+
+@pytest.mark.parametrize("profile_memory", [False, True])
+def test_cli_profile_steps_prints_table_and_writes_json(tmp_path: Path, monkeypatch, capsys, profile_memory):
+    write_json_dir(_frames(), tmp_path / "in")
+    monkeypatch.setattr(runmod, "build_steps_from_yaml", lambda path: _steps())
+    monkeypatch.setattr(runmod, "_maybe_load_inline_config_from_steps_yaml", lambda path: {})
+    report_path = tmp_path / "profile.json"
+
+    rc = runmod.main(
+        [
+            "--steps", "steps.yml",
+            "--in-kind", "json_dir", "--in-path", str(tmp_path / "in"),
+            "--out-kind", "json_dir", "--out-path", str(tmp_path / "out"),
+            "--profile-json", str(report_path),
+            *(["--profile-memory"] if profile_memory else []),
+        ]
+    )
+
+    assert rc == 0
+    table = capsys.readouterr().err
+    assert "wall ms" in table and "drop_rows" in table and "7->5" in table
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert [record["name"] for record in report["records"]] == [
+        "load", "add_frame", "drop_rows", "cleanup", "persistence_boundary", "save"
+    ]
+    assert report["records"][2]["shapes_after"]["products"] == [1, 1]
+    assert isinstance(report["records"][1]["alloc_peak_bytes"], int) is profile_memory
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import spreadsheet_handling.cli.apps.run as runmod
+from spreadsheet_handling.pipeline import StepCache, build_steps_from_config, run_pipeline
+from spreadsheet_handling.pipeline.scheduling import dependency_barriers, step_footprint
+from spreadsheet_handling.pipeline.types import BoundStep, Frames
+
+pytestmark = pytest.mark.ftr("FTR-STEP-SCHEDULER")
+
+
+def _frames() -> Frames:
+    return {
+        "variables": pd.DataFrame({"ID": ["v1", "v2"], "label": ["Eins", "Zwei"]}),
+        "matrix_raw": pd.DataFrame({"ID": ["v1", "v2"], "col_a": ["x", "y"]}),
+        "other_raw": pd.DataFrame({"ID": ["v2", "v1"], "col_b": ["p", "q"]}),
+        "_meta": {"version": "1.0", "derived": {"sheets": {"kept": {"note": 1}}}},
+    }
+
+
+def _lookup(source: str, output: str) -> dict:
+    return {
+        "step": "add_lookup_helpers",
+        "source": source,
+        "lookup": "variables",
+        "output": output,
+        "key": "ID",
+        "helpers": {"fields": ["label"]},
+    }
+
+
+_SPECS = [
+    _lookup("matrix_raw", "matrix"),
+    _lookup("other_raw", "other"),
+    {"step": "extract_frame", "source": "matrix", "output": "labels", "columns": ["ID", "label"]},
+    {"step": "identity"},
+    {"step": "validate_references", "rules": [{"type": "unique", "frame": "other_raw", "columns": ["ID"]}]},
+    {"step": "validate"},
+    {
+        "step": "join_frames",
+        "left": "other",
+        "right": "labels",
+        "output": "joined",
+        "key": "ID",
+        "right_columns": ["label"],
+        "right_rename": {"label": "matrix_label"},
+    },
+]
+
+
+def test_dependencies_follow_declared_frames_and_meta():
+    footprints = [step_footprint(step) for step in build_steps_from_config(_SPECS)]
+
+    assert footprints[5] is None
+    assert dependency_barriers(footprints) == [-1, -1, 0, -1, -1, 4, 5]
+
+
+def test_scheduled_run_matches_linear_run():
+    steps = build_steps_from_config(_SPECS)
+
+    linear = run_pipeline(_frames(), steps)
+    scheduled = run_pipeline(_frames(), steps, workers=4)
+
+    assert list(scheduled) == list(linear)
+    for name, value in linear.items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(scheduled[name], value)
+    assert scheduled["_meta"] == linear["_meta"]
+    assert set(scheduled["_meta"]["derived"]["sheets"]) == {"kept", "matrix", "other"}
+
+
+def test_lookup_helpers_leave_input_meta_untouched():
+    frames = _frames()
+
+    run_pipeline(frames, build_steps_from_config(_SPECS[:2]), workers=2)
+
+    assert frames["_meta"] == _frames()["_meta"]
+
+
+def _step(name: str, fn, *, reads: tuple[str, ...] = (), writes: tuple[str, ...] = ()) -> BoundStep:
+    config = {key: key for key in reads + writes}
+    return BoundStep(name=name, config=config, fn=fn, frame_inputs=reads + writes, frame_outputs=writes)
+
+
+def test_independent_steps_run_concurrently():
+    both_running = threading.Barrier(2, timeout=10)
+
+    def make(output: str):
+        def run(frames: Frames) -> Frames:
+            both_running.wait()
+            return {**frames, output: pd.DataFrame({"x": [1]})}
+
+        return run
+
+    steps = [_step("a", make("a"), writes=("a",)), _step("b", make("b"), writes=("b",))]
+
+    assert list(run_pipeline({}, steps, workers=2)) == ["a", "b"]
+
+
+def test_undeclared_change_and_step_errors_are_raised():
+    def leak(frames: Frames) -> Frames:
+        return {**frames, "surprise": pd.DataFrame()}
+
+    def fail(frames: Frames) -> Frames:
+        raise ValueError("first failure")
+
+    def replace(frames: Frames) -> Frames:
+        return {**frames, "variables": frames["variables"].assign(label="")}
+
+    with pytest.raises(RuntimeError, match="surprise"):
+        run_pipeline({}, [_step("leak", leak, writes=("a",))], workers=2)
+    with pytest.raises(RuntimeError, match="variables"):
+        run_pipeline(_frames(), [_step("replace", replace, writes=("a",))], workers=2)
+    with pytest.raises(ValueError, match="first failure"):
+        run_pipeline({}, [_step("fail", fail, writes=("a",)), _step("leak", leak, writes=("b",))], workers=2)
+
+
+def test_workers_cannot_be_combined_with_cache(tmp_path: Path):
+    with pytest.raises(ValueError, match="workers"):
+        run_pipeline({}, [], workers=2, cache=StepCache(tmp_path))
+
+
+@pytest.mark.parametrize(
+    ("flags", "message"),
+    [
+        (["--step-workers", "4", "--profile-steps"], "--profile-steps"),
+        (["--step-workers", "4", "--step-cache", "cache"], "--step-cache"),
+        (["--step-workers", "0"], "at least 1"),
+    ],
+)
+def test_cli_rejects_step_workers_conflicts_before_loading(tmp_path: Path, monkeypatch, capsys, flags, message):
+    monkeypatch.setattr(runmod, "_load_config", lambda args: pytest.fail("config must not be loaded"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        runmod.main(["--in-kind", "json_dir", "--in-path", str(tmp_path), *flags])
+
+    assert excinfo.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_cli_rejects_step_workers_without_steps(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setattr(runmod, "orchestrate", lambda **kwargs: pytest.fail("input must not be loaded"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        runmod.main(
+            [
+                "--in-kind", "json_dir", "--in-path", str(tmp_path / "in"),
+                "--out-kind", "json_dir", "--out-path", str(tmp_path / "out"),
+                "--step-workers", "2",
+            ]
+        )
+
+    assert excinfo.value.code == 2
+    assert "needs pipeline steps" in capsys.readouterr().err
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark ``frames_fingerprint`` against the work it lets the cache skip.
+
+Builds synthetic ``Frames`` (an orders sheet with ids, text, numbers, dates,
+a status and empty cells plus a customers lookup sheet) and times a cold fingerprint,
+a memoized fingerprint and the registered ``join_frames`` and ``pivot_frame``
+steps on the same data.
+The fingerprint of a copy is compared so a fast hash never hides a missed
+change.
+
+Usage::
+
+    python tools/bench_frame_fingerprint.py --rows 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import pandas as pd
+
+from spreadsheet_handling.pipeline import build_steps_from_config
+from spreadsheet_handling.pipeline.fingerprint import FingerprintMemo, frames_fingerprint
+
+_STEPS = [
+    {
+        "step": "join_frames",
+        "left": "orders",
+        "right": "customers",
+        "output": "orders_by_customer",
+        "left_key": "customer_id",
+        "right_key": "id",
+        "right_columns": ["name"],
+    },
+    {
+        "step": "pivot_frame",
+        "source": "orders",
+        "output": "notes_by_customer",
+        "index_columns": ["customer_id"],
+        "column_key": "status",
+        "value_column": "amount",
+        "duplicates": "aggregate",
+        "aggregation": "first",
+    },
+]
+
+
+def _synthetic_frames(rows: int) -> dict[str, Any]:
+    customers = max(rows // 20, 1)
+    return {
+        "orders": pd.DataFrame(
+            {
+                "id": [f"O-{row}" for row in range(rows)],
+                "customer_id": [f"C-{row % customers}" for row in range(rows)],
+                "amount": [row * 1.25 for row in range(rows)],
+                "count": list(range(rows)),
+                "placed": pd.date_range("2024-01-01", periods=rows, freq="min"),
+                "status": [("open", "shipped", "returned")[row % 3] for row in range(rows)],
+                "note": ["" if row % 3 else "needs review" for row in range(rows)],
+            }
+        ),
+        "customers": pd.DataFrame(
+            {
+                "id": [f"C-{row}" for row in range(customers)],
+                "name": [f"Kunde {row} Straße" for row in range(customers)],
+            }
+        ),
+        "_meta": {"version": "1.0", "tags": {"bench", "orders"}},
+    }
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="rows in the orders sheet")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args(argv)
+
+    frames = _synthetic_frames(args.rows)
+    copied = {name: value.copy() if isinstance(value, pd.DataFrame) else value for name, value in frames.items()}
+    memo = FingerprintMemo()
+    frames_fingerprint(frames, memo=memo)
+
+    cold_s, digest = _best(lambda: frames_fingerprint(frames), args.repeat)
+    memo_s, memo_digest = _best(lambda: frames_fingerprint(frames, memo=memo), args.repeat)
+    step_times = {
+        step.name: _best(lambda step=step: step(frames), args.repeat)[0] for step in build_steps_from_config(_STEPS)
+    }
+
+    assert digest == memo_digest == frames_fingerprint(copied)
+    copied["orders"].loc[args.rows // 2, "amount"] += 1
+    assert frames_fingerprint(copied) != digest
+
+    print(f"frames: orders {args.rows} rows x {frames['orders'].shape[1]} columns, customers {frames['customers'].shape[0]} rows")
+    print(f"  frames_fingerprint (cold):     {cold_s * 1000:8.1f} ms")
+    print(f"  frames_fingerprint (memo hit): {memo_s * 1000:8.1f} ms")
+    for name, step_s in step_times.items():
+        print(f"  {name + ' step:':<30} {step_s * 1000:8.1f} ms ({step_s / cold_s:.0f}x the fingerprint)")
+    print("  copies agree, single-cell edit detected")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
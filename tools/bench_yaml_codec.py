@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark ``yaml_dir`` loading with the pure-Python and libyaml loaders.
+
+Writes a synthetic ``yaml_dir`` (record lists with ids, text, numbers,
+booleans, empty cells and non-ASCII text, as ``save_yaml_dir`` emits them)
+and times ``load_yaml_dir`` with ``core.yaml_codec`` pinned to each loader.
+The loaded frames are compared so a speedup never hides a semantic change.
+
+Usage::
+
+    python tools/bench_yaml_codec.py --files 400 --rows 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from spreadsheet_handling.core import yaml_codec
+from spreadsheet_handling.io_backends.yaml_backend import load_yaml_dir, save_yaml_dir
+
+
+def _synthetic_frames(files: int, rows: int) -> dict[str, pd.DataFrame]:
+    frames: dict[str, pd.DataFrame] = {}
+    for file_index in range(files):
+        frames[f"sheet_{file_index:04d}"] = pd.DataFrame(
+            {
+                "id": [f"ID-{file_index}-{row}" for row in range(rows)],
+                "name": [f"Kunde {row} Straße 🦖" for row in range(rows)],
+                "amount": [row * 1.25 for row in range(rows)],
+                "count": list(range(rows)),
+                "active": [row % 2 == 0 for row in range(rows)],
+                "note": ["" if row % 3 else "needs review: see #12" for row in range(rows)],
+            }
+        )
+    return frames
+
+
+def _time_load(path: Path, loader: type, repeat: int) -> tuple[float, dict[str, pd.DataFrame]]:
+    original = yaml_codec._SafeLoader
+    yaml_codec._SafeLoader = loader
+    try:
+        best = float("inf")
+        frames: dict[str, pd.DataFrame] = {}
+        for _ in range(repeat):
+            started = time.perf_counter()
+            frames = load_yaml_dir(str(path))
+            best = min(best, time.perf_counter() - started)
+        return best, frames
+    finally:
+        yaml_codec._SafeLoader = original
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=400, help="number of sheet files")
+    parser.add_argument("--rows", type=int, default=200, help="records per file")
+    parser.add_argument("--repeat", type=int, default=1, help="best of N runs")
+    args = parser.parse_args(argv)
+
+    if not yaml_codec.LIBYAML_AVAILABLE:
+        print("PyYAML is built without libyaml; only the pure-Python loader is available.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        save_yaml_dir(_synthetic_frames(args.files, args.rows), str(path))
+        size_mb = sum(f.stat().st_size for f in path.iterdir()) / 1e6
+
+        python_s, python_frames = _time_load(path, yaml.SafeLoader, args.repeat)
+        libyaml_s, libyaml_frames = _time_load(path, yaml.CSafeLoader, args.repeat)
+
+    assert python_frames.keys() == libyaml_frames.keys()
+    for name, frame in python_frames.items():
+        pd.testing.assert_frame_equal(libyaml_frames[name], frame)
+
+    print(f"yaml_dir: {args.files} files x {args.rows} records ({size_mb:.1f} MB)")
+    print(f"  SafeLoader  (pure Python): {python_s:8.2f} s")
+    print(f"  CSafeLoader (libyaml):     {libyaml_s:8.2f} s")
+    print(f"  speedup: {python_s / libyaml_s:.1f}x, frames identical")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())